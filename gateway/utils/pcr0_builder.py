@@ -17,7 +17,8 @@ MONITORED FILES (changes trigger rebuild):
 - validator_tee/enclave/*
 - leadpoet_canonical/*
 - neurons/validator.py
-- validator_models/automated_checks.py
+- validator_models/automated_checks/*
+- validator_models/ modules the automated checks load (VALIDATION_MODULE_FILES)
 """
 
 import asyncio
@@ -30,7 +31,7 @@ import tempfile
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +54,39 @@ PCR0_CHECK_INTERVAL = int(os.environ.get("PCR0_CHECK_INTERVAL", "480"))  # 8 min
 # How many commits to keep PCR0 for
 PCR0_CACHE_SIZE = int(os.environ.get("PCR0_CACHE_SIZE", "3"))
 
+# Modules (and their data files) outside the automated_checks package that the
+# checks import, directly or transitively, plus the gateway geo normalizer the
+# geocoder loads. Kept in sync with the COPY lines in
+# validator_tee/Dockerfile.enclave; tests/test_pcr0_inputs.py checks both
+# against the package's actual imports.
+VALIDATION_MODULE_FILES: Tuple[str, ...] = (
+    "validator_models/__init__.py",
+    "validator_models/artifact_log.py",
+    "validator_models/check_evidence.py",
+    "validator_models/check_scheduler.py",
+    "validator_models/company_store.py",
+    "validator_models/dns_engine.py",
+    "validator_models/domain_index.py",
+    "validator_models/domain_plan.py",
+    "validator_models/geocoder.py",
+    "validator_models/geo_coordinates.csv",
+    "validator_models/http_client.py",
+    "validator_models/industry_taxonomy.py",
+    "validator_models/llm_service.py",
+    "validator_models/pipeline_metrics.py",
+    "validator_models/provider_resilience.py",
+    "validator_models/rate_governor.py",
+    "validator_models/reputation_store.py",
+    "validator_models/serp_cache.py",
+    "validator_models/shared_cache.py",
+    "validator_models/taxonomy_index.py",
+    "validator_models/text_patterns.py",
+    "validator_models/text_patterns_golden.json",
+    "validator_models/ttl_cache.py",
+    "gateway/utils/geo_normalize.py",
+    "gateway/utils/geo_lookup_fast.json",
+)
+
 # Files that affect PCR0 (if any of these change, rebuild)
 MONITORED_FILES: Set[str] = {
     "validator_tee/Dockerfile.enclave",
@@ -61,12 +95,13 @@ MONITORED_FILES: Set[str] = {
     "validator_tee/enclave/nsm_lib.py",
     "validator_tee/enclave/tee_service.py",
     "neurons/validator.py",
-    "validator_models/automated_checks.py",
+    *VALIDATION_MODULE_FILES,
 }
 
 # Directories where any file change triggers rebuild
 MONITORED_DIRS: Set[str] = {
     "leadpoet_canonical/",
+    "validator_models/automated_checks/",
 }
 
 # Working directory for builds
@@ -155,7 +190,8 @@ async def clone_or_update_repo(repo_dir: str) -> bool:
     - validator_tee/ (Dockerfile and enclave code)
     - leadpoet_canonical/ (canonical modules)
     - neurons/validator.py
-    - validator_models/automated_checks.py
+    - validator_models/automated_checks/
+    - VALIDATION_MODULE_FILES
     
     This reduces clone size from ~50MB to ~5MB and time from ~10s to ~2s.
     """
@@ -168,7 +204,8 @@ async def clone_or_update_repo(repo_dir: str) -> bool:
         "validator_tee/",
         "leadpoet_canonical/",
         "neurons/validator.py",
-        "validator_models/automated_checks.py",
+        "validator_models/automated_checks/",
+        *VALIDATION_MODULE_FILES,
     ]
     
     if os.path.exists(os.path.join(repo_dir, ".git")):
@@ -11,6 +11,7 @@ from typing import Dict, List, Optional, Tuple
 import aiohttp
 
 from validator_models.industry_taxonomy import INDUSTRY_TAXONOMY
+from validator_models.taxonomy_index import TAXONOMY_INDEX
 from gateway.api.submit import check_description_sanity
 
 
@@ -62,31 +63,12 @@ def _best_subindustry(text: str) -> Tuple[Optional[str], Optional[str]]:
     """Pick a taxonomy-valid (industry, sub_industry) pair using lightweight matching.
 
     INDUSTRY_TAXONOMY is keyed by sub_industry, with a list of allowed industries.
-    We score by token overlap between (sub_industry + definition) and text.
+    We score by IDF-weighted token overlap between (sub_industry + definition) and
+    text, using the shared precomputed TAXONOMY_INDEX (no per-call re-tokenizing).
     """
     if not text:
         return None, None
-    hay = re.sub(r"\s+", " ", text.lower())
-
-    best = (0, None, None)
-    for sub, meta in INDUSTRY_TAXONOMY.items():
-        definition = (meta.get("definition") or "").lower()
-        needles = f"{sub} {definition}".lower()
-
-        # Token overlap score (fast + robust)
-        tokens = [t for t in re.split(r"[^a-z0-9]+", needles) if len(t) >= 4]
-        if not tokens:
-            continue
-        score = sum(1 for t in set(tokens) if t in hay)
-
-        if score > best[0]:
-            industries = meta.get("industries") or []
-            industry = industries[0] if industries else None
-            best = (score, industry, sub)
-
-    if best[0] <= 0:
-        return None, None
-    return best[1], best[2]
+    return TAXONOMY_INDEX.best_industry_pair(text)
 
 
 def _validate_lead_minimum(lead: Dict) -> Tuple[bool, str]:
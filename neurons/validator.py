@@ -601,6 +601,7 @@ class Validator(BaseValidatorNeuron):
         self.app.add_routes([
             web.post('/api/leads', self.handle_api_request),
             web.get('/api/leads/status/{request_id}', self.handle_status_request),
+            web.get('/status', self.handle_validator_status),
         ])
         
         self.email_regex = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
@@ -1418,6 +1419,36 @@ class Validator(BaseValidatorNeuron):
                 "leads": [],
             }, status=500)
 
+    async def handle_validator_status(self, request):
+        """Report validator health and per-subsystem stats as JSON."""
+        try:
+            from validator_models.ttl_cache import get_all_cache_stats
+            from validator_models.llm_service import get_llm_stats
+            from validator_models.serp_cache import get_serp_cache_stats
+            from validator_models.automated_checks import get_batch_timing
+            from validator_models.pipeline_metrics import get_pipeline_metrics
+            from validator_models.check_scheduler import get_check_scheduler_stats
+            from validator_models.company_store import get_company_store_stats
+            from validator_models.check_evidence import get_check_evidence_stats
+            from validator_models.rate_governor import get_rate_governor_stats
+            from validator_models.provider_resilience import get_provider_resilience_stats
+            return web.json_response({
+                "status": "ok",
+                "caches": get_all_cache_stats(),
+                "llm": get_llm_stats(),
+                "serp_cache": get_serp_cache_stats(),
+                "batch_timing": get_batch_timing(),
+                "pipeline_metrics": get_pipeline_metrics(),
+                "check_scheduler": get_check_scheduler_stats(),
+                "company_store": get_company_store_stats(),
+                "check_evidence": get_check_evidence_stats(),
+                "rate_governor": get_rate_governor_stats(),
+                "provider_resilience": get_provider_resilience_stats(),
+            })
+        except Exception as e:
+            bt.logging.error(f"Error in handle_validator_status: {e}")
+            return web.json_response({"status": "error", "error": str(e)}, status=500)
+
     def check_port_availability(self, port: int) -> bool:
         """Check if a port is available for binding."""
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
@@ -1709,6 +1740,10 @@ class Validator(BaseValidatorNeuron):
                 
                 # Cleanup async subtensor on exit
                 await self.cleanup_async_subtensor()
+                
+                # Close pooled HTTP sessions used by automated checks
+                from validator_models.http_client import close_http_sessions
+                await close_http_sessions()
         
         # Run async main loop
         try:
@@ -1844,10 +1879,36 @@ class Validator(BaseValidatorNeuron):
             if current_epoch <= self._last_processed_epoch:
                 # Already processed this epoch - no need to spam logs
                 print(f"[DEBUG] Skipping epoch {current_epoch} (already processed)")
+
+                # Idle until the next epoch: re-score popular stale reputation signals
+                # (one refresher per host - workers share the coordinator's store),
+                # at most one pass per REPUTATION_REFRESH_INTERVAL_SECONDS
+                if container_mode_check != "worker":
+                    from validator_models.reputation_store import (
+                        REPUTATION_REFRESH_INTERVAL_SECONDS,
+                        refresh_stale_signals,
+                    )
+                    refresh_task = getattr(self, '_reputation_refresh_task', None)
+                    last_refresh = getattr(self, '_reputation_refresh_started', 0.0)
+                    if ((refresh_task is None or refresh_task.done())
+                            and time.time() - last_refresh >= REPUTATION_REFRESH_INTERVAL_SECONDS):
+                        self._reputation_refresh_started = time.time()
+                        self._reputation_refresh_task = asyncio.create_task(refresh_stale_signals())
+
                 await asyncio.sleep(5)
                 return
             
             print(f"[DEBUG] Processing epoch {current_epoch} for the FIRST TIME")
+
+            # Live validation gets the provider quota: stop an idle reputation refresh pass
+            refresh_task = getattr(self, '_reputation_refresh_task', None)
+            if refresh_task is not None and not refresh_task.done():
+                refresh_task.cancel()
+                try:
+                    await refresh_task
+                except (asyncio.CancelledError, Exception):
+                    pass
+                print("   ⏹️ Stopped idle reputation refresh for the new epoch")
             
             # ═══════════════════════════════════════════════════════════════════
             # EPOCH TRANSITION: Clear old epochs from validator_weights file
@@ -1908,17 +1969,24 @@ class Validator(BaseValidatorNeuron):
                 # truelist_results = None indicates "in progress" - workers will poll later
                 # ================================================================
                 leads_file = Path("validator_weights") / f"epoch_{current_epoch}_leads.json"
+                epoch_payload = {
+                    "epoch_id": current_epoch,
+                    "leads": leads, 
+                    "max_leads_per_epoch": max_leads_per_epoch,
+                    "created_at_block": current_block,
+                    "salt": salt_hex,  # CRITICAL: Workers need this to hash results
+                    "truelist_results": None  # None = "in progress", workers will poll after Stage 0-2
+                }
                 with open(leads_file, 'w') as f:
-                    json.dump({
-                        "epoch_id": current_epoch,
-                        "leads": leads, 
-                        "max_leads_per_epoch": max_leads_per_epoch,
-                        "created_at_block": current_block,
-                        "salt": salt_hex,  # CRITICAL: Workers need this to hash results
-                        "truelist_results": None  # None = "in progress", workers will poll after Stage 0-2
-                    }, f)
+                    json.dump(epoch_payload, f)
                 print(f"   💾 Initial file written: {len(leads) if leads else 0} leads + salt (TrueList in progress...)")
                 
+                # Push the same payload to connected workers (the file is the crash-recovery copy)
+                from validator_models.epoch_channel import start_epoch_channel_server
+                epoch_channel_server = await start_epoch_channel_server()
+                if epoch_channel_server.running:
+                    await epoch_channel_server.publish_leads(current_epoch, epoch_payload)
+                
                 # ================================================================
                 # STEP 2: Start centralized TrueList as BACKGROUND TASK
                 # Workers can now start Stage 0-2 while TrueList runs
@@ -1930,7 +1998,14 @@ class Validator(BaseValidatorNeuron):
                     from validator_models.automated_checks import run_centralized_truelist_batch
                     
                     print(f"\n📧 COORDINATOR: Starting centralized TrueList batch for ALL {len(leads)} leads (BACKGROUND)...")
-                    truelist_task = asyncio.create_task(run_centralized_truelist_batch(leads))
+                    
+                    async def publish_partial_truelist(partial_results):
+                        if epoch_channel_server.running:
+                            await epoch_channel_server.publish_email_results(current_epoch, partial_results)
+                    
+                    truelist_task = asyncio.create_task(
+                        run_centralized_truelist_batch(leads, on_partial=publish_partial_truelist)
+                    )
                 
             elif container_mode == "worker":
                 # WORKER: Wait for coordinator to fetch and share
@@ -1942,44 +2017,67 @@ class Validator(BaseValidatorNeuron):
                 log_interval = 300  # Log every 5 minutes
                 check_interval = 5  # Check every 5 seconds
                 
-                while not leads_file.exists():
-                    await asyncio.sleep(check_interval)
-                    waited += check_interval
+                # The coordinator pushes the leads payload over the epoch channel the moment
+                # it is ready; the leads file is only read when the channel is unavailable
+                from validator_models.epoch_channel import EpochSubscriber
+                epoch_channel = EpochSubscriber(current_epoch)
+                data = None
+                
+                try:
+                    while not leads_file.exists():
+                        wait_started = time.monotonic()
+                        if await epoch_channel.connect():
+                            data = await epoch_channel.wait_leads(timeout=check_interval)
+                            if data is not None:
+                                break
+                            # Coordinator dropped the connection: wait out the interval before reconnecting
+                            remaining = check_interval - (time.monotonic() - wait_started)
+                            if remaining > 0:
+                                await asyncio.sleep(remaining)
+                        else:
+                            await asyncio.sleep(check_interval)
+                        waited += check_interval
                     
-                    # CRITICAL: Check current block and epoch from shared file
-                    try:
-                        check_block, check_epoch, blocks_into_epoch = self._read_shared_block_file()
-                    except Exception as e:
-                        # Coordinator hasn't updated file yet, keep waiting
-                        continue
+                        # CRITICAL: Check current block and epoch from shared file
+                        try:
+                            check_block, check_epoch, blocks_into_epoch = self._read_shared_block_file()
+                        except Exception as e:
+                            # Coordinator hasn't updated file yet, keep waiting
+                            continue
                     
-                    # Epoch changed while waiting - abort this epoch
-                    if check_epoch > current_epoch:
-                        print(f"❌ Worker: Epoch changed ({current_epoch} → {check_epoch}) while waiting")
-                        print(f"   Aborting - will process epoch {check_epoch} in next iteration")
-                        await asyncio.sleep(10)
-                        return
+                        # Epoch changed while waiting - abort this epoch
+                        if check_epoch > current_epoch:
+                            print(f"❌ Worker: Epoch changed ({current_epoch} → {check_epoch}) while waiting")
+                            print(f"   Aborting - will process epoch {check_epoch} in next iteration")
+                            await asyncio.sleep(10)
+                            return
                     
-                    # Too late to start validation (block 275+ cutoff)
-                    if blocks_into_epoch >= 275:
-                        print(f"❌ Worker: Too late to start validation (block {blocks_into_epoch}/360)")
-                        print(f"   Cutoff is block 275 - not enough time to complete before epoch end")
-                        print(f"   Skipping epoch {current_epoch}, will process next epoch")
-                        await asyncio.sleep(10)
-                        return
+                        # Too late to start validation (block 275+ cutoff)
+                        if blocks_into_epoch >= 275:
+                            print(f"❌ Worker: Too late to start validation (block {blocks_into_epoch}/360)")
+                            print(f"   Cutoff is block 275 - not enough time to complete before epoch end")
+                            print(f"   Skipping epoch {current_epoch}, will process next epoch")
+                            await asyncio.sleep(10)
+                            return
                     
-                    # Log progress every 5 minutes
-                    if waited % log_interval == 0:
-                        print(f"   ⏳ Still waiting for coordinator... ({waited}s elapsed, block {blocks_into_epoch}/360)")
-                        print(f"      Checking for: {leads_file}")
+                        # Log progress every 5 minutes
+                        if waited % log_interval == 0:
+                            print(f"   ⏳ Still waiting for coordinator... ({waited}s elapsed, block {blocks_into_epoch}/360)")
+                            print(f"      Checking for: {leads_file}")
                 
-                # Read leads from shared file
-                with open(leads_file, 'r') as f:
-                    data = json.load(f)
-                    file_epoch = data.get("epoch_id")
-                    leads = data.get("leads")
-                    max_leads_per_epoch = data.get("max_leads_per_epoch")
-                    centralized_truelist_results = data.get("truelist_results", {})  # Precomputed by coordinator
+                    # Read leads from the channel payload, or from the shared file
+                    await epoch_channel.connect()
+                    if data is None and epoch_channel.connected:
+                        data = await epoch_channel.wait_leads(timeout=2)
+                    if data is None:
+                        with open(leads_file, 'r') as f:
+                            data = json.load(f)
+                finally:
+                    await epoch_channel.close()
+                file_epoch = data.get("epoch_id")
+                leads = data.get("leads")
+                max_leads_per_epoch = data.get("max_leads_per_epoch")
+                centralized_truelist_results = data.get("truelist_results", {})  # Precomputed by coordinator
                 
                 # Verify epoch matches (safety check)
                 if file_epoch != current_epoch:
@@ -2117,6 +2215,8 @@ class Validator(BaseValidatorNeuron):
                             "truelist_results": truelist_results  # NOW POPULATED
                         }, f)
                     print(f"   💾 Background: Updated file with {len(truelist_results)} TrueList results")
+                    if epoch_channel_server.running:
+                        await epoch_channel_server.publish_truelist_done(current_epoch, truelist_results)
                 except Exception as e:
                     print(f"   ❌ Background: TrueList failed: {e}")
                     truelist_results = {}  # Empty = leads fail email verification
@@ -2132,6 +2232,8 @@ class Validator(BaseValidatorNeuron):
                             "truelist_results": {}  # Empty due to failure
                         }, f)
                     print(f"   💾 Background: Updated file with EMPTY TrueList results (failure)")
+                    if epoch_channel_server.running:
+                        await epoch_channel_server.publish_truelist_done(current_epoch, {})
             
             # Start TrueList file updater in background (coordinator only)
             truelist_updater_task = None
@@ -2170,11 +2272,22 @@ class Validator(BaseValidatorNeuron):
             # Path to leads file for polling TrueList results
             leads_file_str = str(Path("validator_weights") / f"epoch_{current_epoch}_leads.json")
             
+            # TrueList results are pushed over the epoch channel; the file is the fallback
+            from validator_models.epoch_channel import EpochSubscriber
+            truelist_channel = EpochSubscriber(current_epoch)
+            await truelist_channel.connect()
+            
+            # Per-check latency histograms for this epoch (report written after the batch)
+            from validator_models import pipeline_metrics
+            batch_container_id = 0 if container_mode == "coordinator" else int(os.environ.get('CONTAINER_ID', 0))
+            pipeline_metrics.start_epoch(current_epoch, batch_container_id)
+            
             try:
                 batch_results = await run_batch_automated_checks(
                     lead_blobs, 
-                    container_id=0 if container_mode == "coordinator" else int(os.environ.get('CONTAINER_ID', 0)),
-                    leads_file_path=leads_file_str  # Poll file for TrueList results after Stage 0-2
+                    container_id=batch_container_id,
+                    leads_file_path=leads_file_str,  # Poll file for TrueList results after Stage 0-2
+                    epoch_channel=truelist_channel
                 )
             except Exception as e:
                 print(f"   ❌ Batch validation failed: {e}")
@@ -2193,6 +2306,8 @@ class Validator(BaseValidatorNeuron):
                     for _ in leads
                 ]
             finally:
+                await truelist_channel.close()
+                pipeline_metrics.write_epoch_report()
                 # Stop the block file updater
                 block_updater_task.cancel()
                 try:
@@ -5045,42 +5160,65 @@ def run_lightweight_worker(config):
                     log_interval = 300  # Log every 5 minutes
                     check_interval = 5  # Check every 5 seconds
                     
-                    while not leads_file.exists():
-                        await asyncio.sleep(check_interval)
-                        waited += check_interval
+                    # Leads are pushed over the epoch channel when the coordinator has them;
+                    # the leads file is only read when the channel is unavailable
+                    from validator_models.epoch_channel import EpochSubscriber
+                    epoch_channel = EpochSubscriber(current_epoch)
+                    data = None
+                    
+                    try:
+                        while not leads_file.exists():
+                            wait_started = time.monotonic()
+                            if await epoch_channel.connect():
+                                data = await epoch_channel.wait_leads(timeout=check_interval)
+                                if data is not None:
+                                    break
+                                # Coordinator dropped the connection: wait out the interval before reconnecting
+                                remaining = check_interval - (time.monotonic() - wait_started)
+                                if remaining > 0:
+                                    await asyncio.sleep(remaining)
+                            else:
+                                await asyncio.sleep(check_interval)
+                            waited += check_interval
                         
-                        # Check current block and epoch from shared file
-                        try:
-                            check_block, check_epoch, blocks_into_epoch = self._read_shared_block_file()
-                        except Exception:
-                            continue
+                            # Check current block and epoch from shared file
+                            try:
+                                check_block, check_epoch, blocks_into_epoch = self._read_shared_block_file()
+                            except Exception:
+                                continue
                         
-                        # Epoch changed while waiting - abort
-                        if check_epoch > current_epoch:
-                            print(f"❌ Worker: Epoch changed ({current_epoch} → {check_epoch}) while waiting")
-                            await asyncio.sleep(10)
-                            break
+                            # Epoch changed while waiting - abort
+                            if check_epoch > current_epoch:
+                                print(f"❌ Worker: Epoch changed ({current_epoch} → {check_epoch}) while waiting")
+                                await asyncio.sleep(10)
+                                break
                         
-                        # Too late to start validation
-                        if blocks_into_epoch >= 275:
-                            print(f"❌ Worker: Too late to start validation (block {blocks_into_epoch}/360)")
-                            await asyncio.sleep(10)
-                            break
+                            # Too late to start validation
+                            if blocks_into_epoch >= 275:
+                                print(f"❌ Worker: Too late to start validation (block {blocks_into_epoch}/360)")
+                                await asyncio.sleep(10)
+                                break
                         
-                        # Log progress
-                        if waited % log_interval == 0 and waited > 0:
-                            print(f"⏳ Worker: Still waiting for coordinator ({waited}s elapsed)...")
+                            # Log progress
+                            if waited % log_interval == 0 and waited > 0:
+                                print(f"⏳ Worker: Still waiting for coordinator ({waited}s elapsed)...")
                     
-                    if not leads_file.exists():
-                        continue  # Epoch changed or too late
+                        if data is None and not leads_file.exists():
+                            continue  # Epoch changed or too late
                     
-                    # Read leads from file (including centralized TrueList results)
-                    with open(leads_file, 'r') as f:
-                        data = json.load(f)
-                        all_leads = data.get('leads', [])
-                        epoch_id = data.get('epoch_id')
-                        salt_hex = data.get('salt')  # CRITICAL: Read shared salt
-                        centralized_truelist = data.get('truelist_results')  # None = in progress, {} = failed, {...} = success
+                        # Read leads from the channel payload, or from the file (including centralized TrueList results)
+                        await epoch_channel.connect()
+                        if data is None and epoch_channel.connected:
+                            data = await epoch_channel.wait_leads(timeout=2)
+                        if data is None:
+                            with open(leads_file, 'r') as f:
+                                data = json.load(f)
+                    finally:
+                        await epoch_channel.close()
+                    all_leads = data.get('leads', [])
+                    epoch_id = data.get('epoch_id')
+                    salt_hex = data.get('salt')  # CRITICAL: Read shared salt
+                    centralized_truelist = data.get('truelist_results')  # None = in progress, {} = failed, {...} = success
                     
                     if epoch_id != current_epoch:
                         print(f"⚠️  Worker: Leads file epoch mismatch ({epoch_id} != {current_epoch})")
@@ -5151,13 +5289,18 @@ def run_lightweight_worker(config):
                     else:
                         print(f"   ⚠️ Worker {container_id}: TrueList returned empty (coordinator may have failed)")
                     
-                    # Run batch validation - polls file for TrueList results after Stage 0-2
+                    # Run batch validation - waits on the epoch channel (or polls the file) for TrueList results after Stage 0-2
                     leads_file_str = str(leads_file)
+                    truelist_channel = EpochSubscriber(current_epoch)
+                    await truelist_channel.connect()
+                    from validator_models import pipeline_metrics
+                    pipeline_metrics.start_epoch(current_epoch, container_id)
                     try:
                         batch_results = await run_batch_automated_checks(
                             lead_blobs, 
                             container_id=container_id,
-                            leads_file_path=leads_file_str  # Poll file for TrueList results after Stage 0-2
+                            leads_file_path=leads_file_str,  # Poll file for TrueList results after Stage 0-2
+                            epoch_channel=truelist_channel
                         )
                     except Exception as e:
                         print(f"   ❌ Batch validation failed: {e}")
@@ -5175,6 +5318,9 @@ def run_lightweight_worker(config):
                             })
                             for _ in lead_blobs
                         ]
+                    finally:
+                        await truelist_channel.close()
+                        pipeline_metrics.write_epoch_report()
                     
                     # Map results back to validated_leads format (SAME ORDER guaranteed)
                     validated_leads = []
@@ -59,6 +59,7 @@ requirements = [
     # Storage and caching
     "redis>=5.0.0",
     "pickle-mixin>=1.0.2",
+    "zstandard>=0.22.0",
     "boto3>=1.40.0",
     "arweave-python-client>=1.0.19",
     
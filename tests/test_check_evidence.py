@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from validator_models import check_evidence
+from validator_models.check_evidence import run_with_evidence
+from validator_models.shared_cache import SharedCache
+
+
+@pytest.fixture(autouse=True)
+def evidence_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_evidence, "CHECK_EVIDENCE_ENABLED", True)
+    monkeypatch.setattr(check_evidence, "_store", SharedCache(path=str(tmp_path / "evidence.sqlite")))
+    monkeypatch.setattr(check_evidence, "_stats", {
+        name: {"reused": 0, "ran": 0, "stored": 0, "not_stored": 0} for name in check_evidence.CHECK_INPUT_FIELDS
+    })
+
+
+def make_check(calls, passed=True):
+    # Named after a fingerprinted check so run_with_evidence stores its evidence
+    async def check_linkedin_gse(lead):
+        calls.append(dict(lead))
+        lead["gse_search_count"] = len(calls)
+        lead["company_linkedin_data"] = {"company_name_from_linkedin": lead["business"]}
+        return (passed, {} if passed else {"message": "no match"})
+    return check_linkedin_gse
+
+
+def make_lead(**overrides):
+    lead = {"full_name": "Ada Lovelace", "business": "Acme", "linkedin": "https://linkedin.com/in/ada"}
+    lead.update(overrides)
+    return lead
+
+
+def test_unchanged_inputs_reuse_stored_evidence():
+    calls = []
+    check = make_check(calls)
+    first, second = make_lead(), make_lead()
+
+    async def run():
+        return await run_with_evidence(check, first), await run_with_evidence(check, second)
+
+    first_result, second_result = asyncio.run(run())
+    assert len(calls) == 1
+    assert first_result == second_result == (True, {})
+    # Reuse writes the same lead fields the check wrote
+    assert second == first
+    counters = check_evidence.get_check_evidence_stats()["checks"]["check_linkedin_gse"]
+    assert (counters["ran"], counters["reused"], counters["stored"]) == (1, 1, 1)
+
+
+def test_changed_inputs_run_the_check_again():
+    calls = []
+    check = make_check(calls)
+
+    async def run():
+        await run_with_evidence(check, make_lead())
+        changed = make_lead(business="Globex")
+        await run_with_evidence(check, changed)
+        # A field the check does not read does not matter
+        await run_with_evidence(check, make_lead(phone="555-0100"))
+        return changed
+
+    changed = asyncio.run(run())
+    assert [call["business"] for call in calls] == ["Acme", "Globex"]
+    assert changed["company_linkedin_data"] == {"company_name_from_linkedin": "Globex"}
+
+
+def test_failed_checks_are_not_stored():
+    calls = []
+    check = make_check(calls, passed=False)
+
+    async def run():
+        for _ in range(2):
+            assert await run_with_evidence(check, make_lead()) == (False, {"message": "no match"})
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_stored_evidence_is_not_shared_with_the_lead():
+    calls = []
+    check = make_check(calls)
+
+    async def run():
+        first = make_lead()
+        await run_with_evidence(check, first)
+        first["company_linkedin_data"]["company_name_from_linkedin"] = "mutated by a later check"
+
+        second = make_lead()
+        await run_with_evidence(check, second)
+        return second
+
+    second = asyncio.run(run())
+    assert len(calls) == 1
+    assert second["company_linkedin_data"] == {"company_name_from_linkedin": "Acme"}
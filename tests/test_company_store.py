@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+from validator_models import company_store
+from validator_models.company_store import CompanyStore
+
+
+@pytest.fixture(autouse=True)
+def no_background_io(monkeypatch):
+    # Tests flush and refresh explicitly; keep timer and refresh threads out of the way
+    monkeypatch.setattr(company_store, "COMPANY_STORE_FLUSH_SECONDS", 3600)
+    monkeypatch.setattr(company_store, "COMPANY_STORE_REFRESH_SECONDS", 3600)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "company_store.json")
+
+
+def open_store(path):
+    return CompanyStore(path, legacy_names_path=None)
+
+
+def test_flushed_writes_reach_another_instance_on_refresh(path):
+    a, b = open_store(path), open_store(path)
+
+    a.set_name("Acme", "Acme Inc")
+    a.set_linkedin("acme", {"company_name_from_linkedin": "Acme Inc"})
+    b.refresh()
+    assert b.get_name("acme") is None  # Still pending in a
+
+    a.flush()
+    b.refresh()
+    assert b.get_name("acme") == "Acme Inc"
+    assert b.get_linkedin("acme", 3600) == {"company_name_from_linkedin": "Acme Inc"}
+    assert open_store(path).names() == {"acme": "Acme Inc"}
+
+
+def test_unflushed_local_writes_win_over_refreshed_ones(path):
+    a, b = open_store(path), open_store(path)
+
+    b.set_name("acme", "Acme (b)")
+    a.set_name("acme", "Acme (a)")
+    a.set_name("globex", "Globex")
+    a.flush()
+
+    b.refresh()
+    assert b.get_name("acme") == "Acme (b)"
+    assert b.get_name("globex") == "Globex"
+
+    # Journal order decides once b flushes too
+    b.flush()
+    a.refresh()
+    assert a.get_name("acme") == "Acme (b)"
+    assert open_store(path).get_name("acme") == "Acme (b)"
+
+
+def test_compaction_by_one_instance_is_picked_up_by_another(path, monkeypatch):
+    a, b = open_store(path), open_store(path)
+    a.set_name("acme", "Acme Inc")
+    a.flush()
+    b.refresh()
+    generation = a.get_stats()["generation"]
+
+    monkeypatch.setattr(company_store, "COMPANY_STORE_COMPACT_BYTES", 1)
+    a.set_name("globex", "Globex")
+    a.flush()
+    assert a.get_stats()["generation"] == generation + 1
+    assert a.get_stats()["compactions"] >= 1
+    journal_size = os.path.getsize(a.journal_path)
+
+    b.set_name("initech", "Initech")
+    b.refresh()
+    assert b.get_stats()["generation"] == generation + 1
+    assert b.names() == {"acme": "Acme Inc", "globex": "Globex", "initech": "Initech"}
+
+    monkeypatch.setattr(company_store, "COMPANY_STORE_COMPACT_BYTES", 8 * 1024 * 1024)
+    b.flush()
+    assert os.path.getsize(b.journal_path) > journal_size
+    assert open_store(path).names() == {"acme": "Acme Inc", "globex": "Globex", "initech": "Initech"}
+
+
+def test_compaction_drops_expired_linkedin_data_but_keeps_names(path, monkeypatch):
+    store = open_store(path)
+    store.set_name("acme", "Acme Inc")
+    store.set_linkedin("acme", {"company_name_from_linkedin": "Acme Inc"})
+    store.set_linkedin("globex", {"company_name_from_linkedin": "Globex"})
+    store.flush()
+
+    monkeypatch.setattr(company_store, "COMPANY_STORE_LINKEDIN_RETENTION_HOURS", -1)
+    store.compact()
+
+    reopened = open_store(path)
+    assert reopened.get("acme") == {"name": "Acme Inc"}
+    assert reopened.get("globex") is None
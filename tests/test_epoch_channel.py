@@ -0,0 +1,168 @@
+import asyncio
+
+import pytest
+
+from validator_models.epoch_channel import (
+    EMAIL_RESULTS,
+    EPOCH_LEADS,
+    EpochChannelServer,
+    EpochSubscriber,
+    encode_frame,
+    read_frame,
+)
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / "epoch.sock")
+
+
+async def _wait_for_subscribers(server, epoch, count):
+    for _ in range(100):
+        if len(server._subscribers.get(epoch, ())) == count:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"expected {count} subscribers for epoch {epoch}")
+
+
+def _reader_for(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+def test_frames_round_trip():
+    async def run():
+        payload = {"leads": [{"email": "a@b.com"}], "salt": "x"}
+        reader = _reader_for(encode_frame(EPOCH_LEADS, 7, payload) + encode_frame(EMAIL_RESULTS, 7))
+        assert await read_frame(reader) == (EPOCH_LEADS, 7, payload)
+        assert await read_frame(reader) == (EMAIL_RESULTS, 7, None)
+        with pytest.raises(asyncio.IncompleteReadError):
+            await read_frame(reader)
+
+    asyncio.run(run())
+
+
+def test_bad_frame_header_is_rejected():
+    async def run():
+        frame = b"XX" + encode_frame(EPOCH_LEADS, 7, {})[2:]
+        with pytest.raises(ConnectionError):
+            await read_frame(_reader_for(frame))
+
+    asyncio.run(run())
+
+
+def test_subscriber_gets_snapshot_then_live_updates(socket_path):
+    async def run():
+        server = EpochChannelServer(socket_path)
+        assert await server.start()
+        await server.publish_leads(7, {"leads": [1, 2]})
+        await server.publish_email_results(7, {"a@b.com": {"passed": True}})
+        await server.publish_leads(8, {"leads": [3]})  # Other epochs are not delivered
+
+        subscriber = EpochSubscriber(7, path=socket_path)
+        deltas = []
+        subscriber.on_email_results(deltas.append)
+        try:
+            assert await subscriber.connect()
+            assert await subscriber.wait_leads(timeout=2) == {"leads": [1, 2]}
+
+            await server.publish_truelist_done(7, {"a@b.com": {"passed": True}, "c@d.com": {"passed": False}})
+            results = await subscriber.wait_truelist(timeout=2)
+        finally:
+            await subscriber.close()
+            await server.close()
+
+        assert results == {"a@b.com": {"passed": True}, "c@d.com": {"passed": False}}
+        # Snapshot first, then only what was still missing
+        assert deltas == [{"a@b.com": {"passed": True}}, {"c@d.com": {"passed": False}}]
+
+    asyncio.run(run())
+
+
+def test_failed_truelist_replaces_partial_results(socket_path):
+    async def run():
+        server = EpochChannelServer(socket_path)
+        assert await server.start()
+        await server.publish_leads(7, {"leads": [1]})
+        await server.publish_email_results(7, {"a@b.com": {"passed": True}})
+
+        subscriber = EpochSubscriber(7, path=socket_path)
+        late = EpochSubscriber(7, path=socket_path)
+        try:
+            assert await subscriber.connect()
+            assert await subscriber.wait_leads(timeout=2) == {"leads": [1]}
+            await _wait_for_subscribers(server, 7, 1)
+
+            # Coordinator's TrueList task failed: the leads file gets {}, and so does the channel
+            await server.publish_truelist_done(7, {})
+            assert await subscriber.wait_truelist(timeout=2) == {}
+            assert subscriber.email_results == {}
+
+            # A late subscriber's snapshot is the final set, not the partials
+            assert await late.connect()
+            assert await late.wait_truelist(timeout=2) == {}
+        finally:
+            await subscriber.close()
+            await late.close()
+            await server.close()
+
+    asyncio.run(run())
+
+
+def test_waits_return_early_when_coordinator_goes_away(socket_path):
+    async def run():
+        server = EpochChannelServer(socket_path)
+        assert await server.start()
+        subscriber = EpochSubscriber(7, path=socket_path)
+        assert await subscriber.connect()
+        await _wait_for_subscribers(server, 7, 1)
+
+        await server.close()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        assert await subscriber.wait_truelist(timeout=5) is None
+        assert await subscriber.wait_leads(timeout=5) is None
+        assert loop.time() - started < 2
+        assert not subscriber.connected
+
+        # Reconnecting after the drop releases the old socket and subscribes again
+        server = EpochChannelServer(socket_path)
+        assert await server.start()
+        await server.publish_leads(7, {"leads": []})
+        try:
+            assert await subscriber.connect()
+            assert await subscriber.wait_leads(timeout=2) == {"leads": []}
+        finally:
+            await subscriber.close()
+            await server.close()
+
+    asyncio.run(run())
+
+
+def test_closed_subscriber_is_dropped_by_server(socket_path):
+    async def run():
+        server = EpochChannelServer(socket_path)
+        assert await server.start()
+        subscriber = EpochSubscriber(7, path=socket_path)
+        try:
+            assert await subscriber.connect()
+            await _wait_for_subscribers(server, 7, 1)
+
+            await subscriber.close()
+            assert not subscriber.connected
+            await _wait_for_subscribers(server, 7, 0)
+        finally:
+            await server.close()
+
+    asyncio.run(run())
+
+
+def test_connect_without_socket_returns_false(socket_path):
+    async def run():
+        subscriber = EpochSubscriber(7, path=socket_path)
+        assert not await subscriber.connect()
+        assert await subscriber.wait_leads(timeout=0.1) is None
+
+    asyncio.run(run())
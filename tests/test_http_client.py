@@ -0,0 +1,39 @@
+import asyncio
+import threading
+
+import aiohttp
+
+from validator_models import http_client
+
+
+def test_close_only_closes_the_running_loops_sessions():
+    async def make(provider):
+        return http_client.get_session(provider)
+
+    # A finished asyncio.run() (CLI) leaves a session on a closed loop
+    old_session = asyncio.run(make("gdelt"))
+
+    # Another live loop in a thread
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+    other_session = asyncio.run_coroutine_threadsafe(make("sec_edgar"), other_loop).result(5)
+
+    async def run():
+        session = http_client.get_session("wayback")
+        assert isinstance(session.cookie_jar, aiohttp.DummyCookieJar)
+        await http_client.close_http_sessions()
+        return session
+
+    own_session = asyncio.run(run())
+    assert own_session.closed
+    assert old_session.closed
+    assert not other_session.closed
+    assert [provider for (_, provider) in http_client._async_sessions] == ["sec_edgar"]
+
+    asyncio.run_coroutine_threadsafe(http_client.close_http_sessions(), other_loop).result(5)
+    assert other_session.closed
+    assert http_client._async_sessions == {}
+    other_loop.call_soon_threadsafe(other_loop.stop)
+    thread.join(5)
+    other_loop.close()
@@ -0,0 +1,59 @@
+import ast
+import re
+from pathlib import Path
+
+from gateway.utils.pcr0_builder import VALIDATION_MODULE_FILES
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "validator_models/automated_checks/"
+ATTESTED_PREFIXES = ("validator_models.", "gateway.")
+
+
+def _module_file(name: str):
+    path = REPO_ROOT / (name.replace(".", "/") + ".py")
+    return path.relative_to(REPO_ROOT).as_posix() if path.exists() else None
+
+
+def _imported_files(path: Path):
+    for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+        names = []
+        if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            # "from pkg import module" imports pkg.module when it is a file
+            names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+        elif isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        for name in names:
+            if name.startswith(ATTESTED_PREFIXES):
+                module_file = _module_file(name)
+                if module_file is not None:
+                    yield module_file
+
+
+def _import_closure():
+    pending = [p.relative_to(REPO_ROOT).as_posix() for p in (REPO_ROOT / PACKAGE).glob("*.py")]
+    seen = set()
+    while pending:
+        module_file = pending.pop()
+        if module_file in seen:
+            continue
+        seen.add(module_file)
+        pending.extend(_imported_files(REPO_ROOT / module_file))
+    return {f for f in seen if not f.startswith(PACKAGE) and not f.endswith("/__init__.py")}
+
+
+def _dockerfile_copies():
+    text = (REPO_ROOT / "validator_tee" / "Dockerfile.enclave").read_text(encoding="utf-8")
+    copied = set()
+    for instruction in re.findall(r"^COPY ((?:.*\\\n)*.*)$", text, flags=re.MULTILINE):
+        copied.update(instruction.replace("\\\n", " ").split()[:-1])
+    return copied
+
+
+def test_attested_files_cover_the_checks_imports():
+    missing = _import_closure() - set(VALIDATION_MODULE_FILES)
+    assert not missing, f"add to VALIDATION_MODULE_FILES and Dockerfile.enclave: {sorted(missing)}"
+
+
+def test_attested_files_exist_and_are_copied_into_the_enclave():
+    assert all((REPO_ROOT / f).exists() for f in VALIDATION_MODULE_FILES)
+    assert set(VALIDATION_MODULE_FILES) <= _dockerfile_copies()
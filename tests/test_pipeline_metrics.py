@@ -0,0 +1,19 @@
+from validator_models import pipeline_metrics
+
+
+def test_epoch_report_write_prunes_old_epochs(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline_metrics, "PIPELINE_METRICS", True)
+    monkeypatch.setattr(pipeline_metrics, "PIPELINE_METRICS_KEEP_EPOCHS", 2)
+    for container_id, epoch in ((0, 7), (1, 7), (0, 8), (1, 9)):
+        (tmp_path / f"container_{container_id}_epoch_{epoch}_metrics.json").write_text("{}")
+    (tmp_path / "epoch_7_leads.json").write_text("{}")
+
+    pipeline_metrics.start_epoch(10, container_id=0)
+    path = pipeline_metrics.write_epoch_report(str(tmp_path))
+
+    assert path == str(tmp_path / "container_0_epoch_10_metrics.json")
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "container_0_epoch_10_metrics.json",
+        "container_1_epoch_9_metrics.json",
+        "epoch_7_leads.json",
+    ]
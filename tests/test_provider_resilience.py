@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from validator_models import provider_resilience
+from validator_models.provider_resilience import ProviderUnavailableError, guarded_call
+
+
+@pytest.fixture(autouse=True)
+def fresh_states(monkeypatch):
+    monkeypatch.setattr(provider_resilience, "_states", {})
+
+
+def test_exceptions_open_breaker_on_warmed_up_hedged_provider():
+    async def ok():
+        return 200
+
+    async def stalled():
+        raise asyncio.TimeoutError()
+
+    async def run():
+        # Enough successes that every further call goes through the hedging race
+        for _ in range(provider_resilience.HEDGE_MIN_SAMPLES):
+            await guarded_call("wayback", ok, hedge=True)
+        assert provider_resilience._state("wayback").hedge_delay() is not None
+
+        for _ in range(provider_resilience.BREAKER_MIN_CALLS):
+            with pytest.raises(asyncio.TimeoutError):
+                await guarded_call("wayback", stalled, hedge=True)
+
+        with pytest.raises(ProviderUnavailableError):
+            await guarded_call("wayback", ok, hedge=True)
+
+    asyncio.run(run())
+    breaker = provider_resilience._state("wayback").breaker
+    assert breaker.state == provider_resilience.OPEN
+    assert list(breaker.outcomes).count(True) == provider_resilience.BREAKER_MIN_CALLS
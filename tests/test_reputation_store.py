@@ -0,0 +1,83 @@
+import sqlite3
+
+import pytest
+
+from validator_models import reputation_store
+from validator_models.reputation_store import ReputationStore
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "reputation.sqlite")
+
+
+def stored_hits(path, source, subject):
+    with sqlite3.connect(path) as conn:
+        return conn.execute(
+            "SELECT hits FROM reputation_signals WHERE source=? AND subject=?", (source, subject)
+        ).fetchone()[0]
+
+
+def test_lookups_do_not_write_until_a_batch_is_full(path, monkeypatch):
+    monkeypatch.setattr(reputation_store, "REPUTATION_HIT_FLUSH_BATCH", 3)
+    store = ReputationStore(path)
+    assert store.put("wayback", "acme.com", 5.0, {"snapshots": 10}, {"website": "acme.com"})
+
+    for _ in range(2):
+        assert store.get("wayback", "acme.com") == (5.0, {"snapshots": 10})
+    assert stored_hits(path, "wayback", "acme.com") == 0
+
+    store.get("wayback", "acme.com")
+    assert stored_hits(path, "wayback", "acme.com") == 3
+
+    # Misses are not counted
+    assert store.get("wayback", "globex.com") is None
+    assert store.flush_hits() == 0
+
+
+def test_stale_scan_sees_pending_lookups(path, monkeypatch):
+    store = ReputationStore(path)
+    store.put("gdelt", "acme", 2.0, {}, {"company": "Acme"})
+    store.put("gdelt", "globex", 1.0, {}, {"company": "Globex"})
+    for subject, lookups in (("acme", 3), ("globex", 1)):
+        for _ in range(lookups):
+            store.get("gdelt", subject)
+
+    monkeypatch.setitem(reputation_store.REPUTATION_FRESHNESS_HOURS, "gdelt", -1)
+    stale = store.stale_entries(min_hits=2)
+    assert [(entry["subject"], entry["hits"]) for entry in stale] == [("acme", 3)]
+    assert stale[0]["inputs"] == {"company": "Acme"}
+
+
+def test_failed_refresh_cools_down_until_the_entry_is_rewritten(path, monkeypatch):
+    store = ReputationStore(path)
+    store.put("sec_edgar", "acme", 1.0, {}, {"company": "Acme"})
+    for _ in range(2):
+        store.get("sec_edgar", "acme")
+    monkeypatch.setitem(reputation_store.REPUTATION_FRESHNESS_HOURS, "sec_edgar", -1)
+    assert [entry["subject"] for entry in store.stale_entries()] == ["acme"]
+
+    store.mark_refresh_failed("sec_edgar", "acme")
+    assert store.stale_entries() == []
+
+    monkeypatch.setattr(reputation_store, "REPUTATION_REFRESH_RETRY_SECONDS", -1)
+    assert [entry["subject"] for entry in store.stale_entries()] == ["acme"]
+
+    # A successful check clears the failure
+    monkeypatch.setattr(reputation_store, "REPUTATION_REFRESH_RETRY_SECONDS", 3600)
+    store.mark_refresh_failed("sec_edgar", "acme")
+    store.put("sec_edgar", "acme", 2.0, {}, {"company": "Acme"})
+    assert [entry["subject"] for entry in store.stale_entries()] == ["acme"]
+
+
+def test_store_created_before_refresh_backoff_is_migrated(path):
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE reputation_signals (source TEXT NOT NULL, subject TEXT NOT NULL, "
+            "score REAL NOT NULL, evidence TEXT NOT NULL, inputs TEXT NOT NULL, checked_at REAL NOT NULL, "
+            "hits INTEGER NOT NULL DEFAULT 0, last_hit_at REAL, PRIMARY KEY (source, subject))"
+        )
+    store = ReputationStore(path)
+    assert store.put("gdelt", "acme", 3.0, {}, {"company": "Acme"})
+    store.mark_refresh_failed("gdelt", "acme")
+    assert store.stats["errors"] == 0
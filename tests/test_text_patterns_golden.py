@@ -0,0 +1,6 @@
+from validator_models.text_patterns import check_golden
+
+
+def test_golden_corpus_is_byte_identical():
+    mismatches = check_golden()
+    assert mismatches == [], f"{len(mismatches)} golden cases differ, first: {mismatches[0]}"
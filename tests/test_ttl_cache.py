@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from validator_models.ttl_cache import TTLCache
+
+
+def test_concurrent_get_or_load_runs_loader_once():
+    cache = TTLCache(max_entries=10)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def run():
+        return await asyncio.gather(*[cache.get_or_load("k", loader) for _ in range(5)])
+
+    assert asyncio.run(run()) == ["value"] * 5
+    assert len(calls) == 1
+    assert cache.stats["coalesced_loads"] == 4
+    assert cache.get("k") == "value"
+
+
+def test_loader_exception_reaches_every_waiter_and_is_not_cached():
+    cache = TTLCache(max_entries=10)
+
+    async def loader():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def run():
+        return await asyncio.gather(
+            *[cache.get_or_load("k", loader) for _ in range(3)], return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert cache.get("k") is None
+
+
+def test_waiter_takes_over_load_when_owner_is_cancelled():
+    cache = TTLCache(max_entries=10)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.05 if len(calls) == 1 else 0)
+        return len(calls)
+
+    async def run():
+        owner = asyncio.ensure_future(cache.get_or_load("k", loader))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(cache.get_or_load("k", loader))
+        await asyncio.sleep(0.01)
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        return await waiter
+
+    assert asyncio.run(run()) == 2
+    assert len(calls) == 2
+    assert cache.get("k") == 2
+
+
+def test_cancelled_waiter_does_not_cancel_owner():
+    cache = TTLCache(max_entries=10)
+
+    async def loader():
+        await asyncio.sleep(0.02)
+        return "value"
+
+    async def run():
+        owner = asyncio.ensure_future(cache.get_or_load("k", loader))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(cache.get_or_load("k", loader))
+        await asyncio.sleep(0.005)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return await owner
+
+    assert asyncio.run(run()) == "value"
@@ -5,7 +5,28 @@ This package contains automated validation models and checks used by validators
 to assess lead quality and compliance.
 
 Modules:
-- automated_checks: Core validation logic for lead assessment
+- automated_checks: Core validation logic for lead assessment (per-stage submodules, loaded on first use)
+- http_client: Shared pooled HTTP sessions used by the automated checks
+- dns_engine: Async DNS resolver with TTL-aware caching for the DNS checks
+- shared_cache: SQLite (WAL) validation cache shared by all containers on a host
+- ttl_cache: O(1) TTL-aware LRU cache with single-flight loading and counters
+- domain_plan: Batch grouping that runs each domain-level check once per domain
+- reputation_store: SQLite store of Rep Score sub-scores with per-source freshness
+- taxonomy_index: Precomputed INDUSTRY_TAXONOMY lookups shared by validator and miners
+- text_patterns: Compiled pattern registry and golden regression for Stage 4/5 extraction
+- geocoder: Offline gazetteer geocoder and vectorized haversine for Stage 5 region matching
+- llm_service: Batched, cached, concurrency-limited OpenRouter calls for Stage 4/5 verification
+- serp_cache: Host-shared, content-addressed ScrapingDog search cache with offline replay
+- epoch_channel: Unix-socket push channel for epoch leads and TrueList results (coordinator -> workers)
+- pipeline_metrics: Per-epoch latency histograms for every check and outbound provider call
+- replay_bench: Record/replay benchmark harness with stand-in provider servers and decision baselines
+- check_scheduler: History-driven ordering of free Stage 0 checks that screens TrueList submissions
+- domain_index: Memory-mapped disposable / free-mail / role-address index for the Stage 0 email checks
+- artifact_log: Append-only zstd-compressed validation artifact log with a sidecar index, range scans and migration
+- company_store: In-memory company-identity store (standardized names + LinkedIn data) with a write-behind journal
+- check_evidence: Input-fingerprinted check evidence so resubmitted leads only re-run checks whose inputs changed
+- rate_governor: Host-wide AIMD token buckets per external provider, shared by every container through an mmap file
+- provider_resilience: Hedged requests and circuit breakers for Stage 4/5 provider calls, with a tail-latency report
 """
 
-__all__ = ['automated_checks']
+__all__ = ['automated_checks', 'http_client', 'dns_engine', 'shared_cache', 'ttl_cache', 'domain_plan', 'reputation_store', 'taxonomy_index', 'text_patterns', 'geocoder', 'llm_service', 'serp_cache', 'epoch_channel', 'pipeline_metrics', 'replay_bench', 'check_scheduler', 'domain_index', 'artifact_log', 'company_store', 'check_evidence', 'rate_governor', 'provider_resilience']
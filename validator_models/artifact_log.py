@@ -0,0 +1,452 @@
+"""
+Append-only, zstd-compressed validation artifact log with a sidecar index.
+
+store_validation_artifact used to write one pretty-printed JSON file per lead
+and stage into validation_artifacts/ (validation_{stage}_{timestamp}_{uuid}.json).
+A busy validator piles up hundreds of thousands of small files - inodes,
+fsync work and slow directory listings - and any analysis has to glob and
+parse every one of them. Artifacts are now appended to segment files:
+
+- segments:  ARTIFACT_LOG_DIR/{created_ms}-{pid}.zlog, one per writer process,
+             rolled by size (ARTIFACT_LOG_SEGMENT_MAX_BYTES) and age
+             (ARTIFACT_LOG_SEGMENT_MAX_AGE_SECONDS)
+- records:   4-byte little-endian length + one zstd frame (with checksum) of the
+             compact JSON artifact, so a torn write only loses the last record
+- index:     a sidecar {created_ms}-{pid}.idx with one JSON line per record:
+             offset, length, ts, stage, lead_id, email_hash, epoch. A record
+             written without its index line is recovered by scanning the tail
+- reading:   ArtifactLogReader.scan() filters on the index (time range, epoch
+             range, stage, lead_id, email / email_hash) and only decompresses
+             the frames that match
+
+    python -m validator_models.artifact_log scan --since 2025-11-01T00:00 --stage email_regex --limit 20
+    python -m validator_models.artifact_log scan --email jane@acme.com
+    python -m validator_models.artifact_log scan --epoch 1200 --epoch-to 1210 --keys-only
+    python -m validator_models.artifact_log stats
+    python -m validator_models.artifact_log migrate --source validation_artifacts --delete
+
+Writes are best-effort like before: store_validation_artifact reports a failed
+append and carries on.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+ARTIFACT_LOG_DIR = os.getenv("VALIDATION_ARTIFACT_LOG_DIR", str(Path("validation_artifacts") / "log"))
+ARTIFACT_LOG_SEGMENT_MAX_BYTES = int(os.getenv("VALIDATION_ARTIFACT_LOG_SEGMENT_MAX_BYTES", str(64 * 1024 * 1024)))
+ARTIFACT_LOG_SEGMENT_MAX_AGE_SECONDS = int(os.getenv("VALIDATION_ARTIFACT_LOG_SEGMENT_MAX_AGE_SECONDS", "3600"))
+ARTIFACT_LOG_ZSTD_LEVEL = int(os.getenv("VALIDATION_ARTIFACT_LOG_ZSTD_LEVEL", "3"))
+
+SEGMENT_SUFFIX = ".zlog"
+INDEX_SUFFIX = ".idx"
+_LENGTH = struct.Struct("<I")
+
+# Index keys a scan can filter on (besides the ts / epoch ranges)
+INDEX_KEYS = ("stage", "lead_id", "email_hash", "epoch")
+
+
+def email_hash(email: str) -> str:
+    """sha256 of the normalized email (same as the gateway's email_hash)."""
+    return hashlib.sha256(email.strip().lower().encode()).hexdigest()
+
+
+def _segment_created_ms(path: str) -> int:
+    try:
+        return int(os.path.basename(path).split("-", 1)[0])
+    except ValueError:
+        return 0
+
+
+def _index_path(segment: str) -> str:
+    return segment[:-len(SEGMENT_SUFFIX)] + INDEX_SUFFIX
+
+
+def artifact_keys(artifact: Dict[str, Any]) -> Dict[str, Any]:
+    """Index keys of an artifact ({"timestamp", "stage", "lead_data", "validation_result"})."""
+    lead = artifact.get("lead_data") or {}
+    result = artifact.get("validation_result") or {}
+    if not isinstance(lead, dict):
+        lead = {}
+    if not isinstance(result, dict):
+        result = {}
+    blob = lead.get("lead_blob") if isinstance(lead.get("lead_blob"), dict) else lead
+    email = blob.get("email") or lead.get("email") or ""
+    epoch = next((v for v in (artifact.get("epoch"), lead.get("epoch_id"), lead.get("epoch"),
+                              result.get("epoch_id"), result.get("epoch")) if v is not None), None)
+    try:
+        epoch = int(epoch) if epoch is not None else None
+    except (TypeError, ValueError):
+        epoch = None
+    ts = artifact.get("timestamp")
+    try:
+        ts = datetime.fromisoformat(ts).timestamp() if isinstance(ts, str) else float(ts)
+    except (TypeError, ValueError):
+        ts = time.time()
+    return {
+        "ts": round(ts, 3),
+        "stage": artifact.get("stage"),
+        "lead_id": lead.get("lead_id") or lead.get("id"),
+        "email_hash": email_hash(email) if email else None,
+        "epoch": epoch,
+    }
+
+
+# ════════════════════════════════════════════════════════════════════
+# Writer
+# ════════════════════════════════════════════════════════════════════
+class ArtifactLogWriter:
+    """Appends records to this process's current segment; rolls by size and age. Thread-safe."""
+
+    def __init__(self, directory: str = ARTIFACT_LOG_DIR,
+                 max_bytes: int = ARTIFACT_LOG_SEGMENT_MAX_BYTES,
+                 max_age_seconds: int = ARTIFACT_LOG_SEGMENT_MAX_AGE_SECONDS,
+                 level: int = ARTIFACT_LOG_ZSTD_LEVEL):
+        import zstandard
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self._compressor = zstandard.ZstdCompressor(level=level, write_checksum=True)
+        self._lock = threading.Lock()
+        self._segment: Optional[str] = None
+        self._data = None
+        self._index = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._pid = 0
+        self.records = 0
+        self.raw_bytes = 0
+        self.stored_bytes = 0
+
+    def _roll(self, now: float) -> None:
+        self._close_files()
+        os.makedirs(self.directory, exist_ok=True)
+        created_ms = int(now * 1000)
+        # Names only need to be unique per writer; bump the timestamp on a same-ms roll
+        while True:
+            segment = os.path.join(self.directory, f"{created_ms:013d}-{os.getpid()}{SEGMENT_SUFFIX}")
+            if not os.path.exists(segment):
+                break
+            created_ms += 1
+        self._segment = segment
+        self._data = open(segment, "ab")
+        self._index = open(_index_path(segment), "a", encoding="utf-8")
+        self._size = 0
+        self._opened_at = now
+        self._pid = os.getpid()
+
+    def _needs_roll(self, now: float) -> bool:
+        return (self._data is None or self._pid != os.getpid()
+                or self._size >= self.max_bytes
+                or now - self._opened_at >= self.max_age_seconds)
+
+    def append(self, record: Dict[str, Any], keys: Optional[Dict[str, Any]] = None) -> Tuple[str, int]:
+        """Append one record; returns (segment path, offset). keys default to artifact_keys(record)."""
+        keys = keys if keys is not None else artifact_keys(record)
+        raw = json.dumps(record, separators=(",", ":"), default=str).encode()
+        with self._lock:
+            now = time.time()
+            if self._needs_roll(now):
+                self._roll(now)
+            frame = self._compressor.compress(raw)
+            offset = self._size
+            self._data.write(_LENGTH.pack(len(frame)) + frame)
+            self._data.flush()
+            entry = {"offset": offset, "length": len(frame), "raw": len(raw)}
+            entry.update(keys)
+            self._index.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self._index.flush()
+            self._size += _LENGTH.size + len(frame)
+            self.records += 1
+            self.raw_bytes += len(raw)
+            self.stored_bytes += _LENGTH.size + len(frame)
+            return self._segment, offset
+
+    def _close_files(self) -> None:
+        for handle in (self._data, self._index):
+            if handle is not None:
+                try:
+                    handle.close()
+                except OSError:
+                    pass
+        self._data = self._index = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_files()
+
+
+_writer: Optional[ArtifactLogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_artifact_log() -> ArtifactLogWriter:
+    """Process-wide writer; the first segment is opened on the first append."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = ArtifactLogWriter()
+    return _writer
+
+
+def append_artifact(artifact: Dict[str, Any]) -> Tuple[str, int]:
+    """Append a validation artifact to the process-wide log; returns (segment path, offset)."""
+    return get_artifact_log().append(artifact)
+
+
+# ════════════════════════════════════════════════════════════════════
+# Reader
+# ════════════════════════════════════════════════════════════════════
+class ArtifactLogReader:
+    """Index-driven range scans over every segment in a log directory (all writers)."""
+
+    def __init__(self, directory: str = ARTIFACT_LOG_DIR):
+        import zstandard
+
+        self.directory = directory
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def segments(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.directory, f"*{SEGMENT_SUFFIX}")),
+                      key=lambda path: (_segment_created_ms(path), path))
+
+    def _read_frame(self, handle, offset: int) -> Optional[bytes]:
+        handle.seek(offset)
+        header = handle.read(_LENGTH.size)
+        if len(header) < _LENGTH.size:
+            return None
+        (length,) = _LENGTH.unpack(header)
+        frame = handle.read(length)
+        return frame if len(frame) == length else None
+
+    def index_entries(self, segment: str) -> Iterator[Dict[str, Any]]:
+        """Index lines of one segment, plus entries recovered from frames the index is missing."""
+        end = 0
+        try:
+            with open(_index_path(segment), encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # Torn last line
+                    end = max(end, entry["offset"] + _LENGTH.size + entry["length"])
+                    yield entry
+        except OSError:
+            pass
+        size = os.path.getsize(segment)
+        if end >= size:
+            return
+        with open(segment, "rb") as handle:
+            offset = end
+            while offset < size:
+                frame = self._read_frame(handle, offset)
+                if frame is None:
+                    return  # Torn last record
+                try:
+                    raw = self._decompressor.decompress(frame)
+                    entry = {"offset": offset, "length": len(frame), "raw": len(raw)}
+                    entry.update(artifact_keys(json.loads(raw)))
+                except Exception:
+                    return
+                yield entry
+                offset += _LENGTH.size + len(frame)
+
+    def entries(self, since: Optional[float] = None, until: Optional[float] = None,
+                epoch_from: Optional[int] = None, epoch_to: Optional[int] = None,
+                **keys: Any) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        (segment, index entry) for every record in [since, until) and [epoch_from, epoch_to]
+        whose INDEX_KEYS equal the given keyword values (None = any).
+        """
+        wanted = {key: value for key, value in keys.items() if value is not None}
+        unknown = set(wanted) - set(INDEX_KEYS)
+        if unknown:
+            raise ValueError(f"unknown index keys: {sorted(unknown)}")
+        # No pruning by segment name: migrated records carry their original timestamps
+        for segment in self.segments():
+            for entry in self.index_entries(segment):
+                if since is not None and entry.get("ts", 0) < since:
+                    continue
+                if until is not None and entry.get("ts", 0) >= until:
+                    continue
+                epoch = entry.get("epoch")
+                if epoch_from is not None and (epoch is None or epoch < epoch_from):
+                    continue
+                if epoch_to is not None and (epoch is None or epoch > epoch_to):
+                    continue
+                if any(entry.get(key) != value for key, value in wanted.items()):
+                    continue
+                yield segment, entry
+
+    def scan(self, limit: Optional[int] = None, **filters: Any) -> Iterator[Dict[str, Any]]:
+        """Decompressed artifacts matching entries(**filters), in segment order."""
+        count = 0
+        handles: Dict[str, Any] = {}
+        try:
+            for segment, entry in self.entries(**filters):
+                if limit is not None and count >= limit:
+                    return
+                handle = handles.get(segment)
+                if handle is None:
+                    for old in handles.values():
+                        old.close()
+                    handles = {segment: open(segment, "rb")}
+                    handle = handles[segment]
+                frame = self._read_frame(handle, entry["offset"])
+                if frame is None:
+                    continue
+                yield json.loads(self._decompressor.decompress(frame))
+                count += 1
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+    def stats(self) -> Dict[str, Any]:
+        segments = self.segments()
+        records = raw = stored = 0
+        stages: Dict[str, int] = {}
+        first_ts = last_ts = None
+        for segment in segments:
+            for entry in self.index_entries(segment):
+                records += 1
+                raw += entry.get("raw", 0)
+                stored += _LENGTH.size + entry["length"]
+                stage = entry.get("stage") or "unknown"
+                stages[stage] = stages.get(stage, 0) + 1
+                ts = entry.get("ts")
+                if ts is not None:
+                    first_ts = ts if first_ts is None else min(first_ts, ts)
+                    last_ts = ts if last_ts is None else max(last_ts, ts)
+        return {
+            "segments": len(segments),
+            "records": records,
+            "raw_bytes": raw,
+            "stored_bytes": stored,
+            "compression_ratio": round(raw / stored, 2) if stored else None,
+            "first": datetime.fromtimestamp(first_ts).isoformat() if first_ts else None,
+            "last": datetime.fromtimestamp(last_ts).isoformat() if last_ts else None,
+            "stages": stages,
+        }
+
+
+# ════════════════════════════════════════════════════════════════════
+# Migration
+# ════════════════════════════════════════════════════════════════════
+def migrate_directory(source: str, writer: ArtifactLogWriter, delete: bool = False) -> Dict[str, int]:
+    """
+    Append every validation_*.json artifact under `source` to the log (oldest first).
+
+    Files that fail to parse are left in place. With delete=True each file is
+    removed once its record is written.
+    """
+    paths = sorted(glob.glob(os.path.join(source, "validation_*.json")), key=lambda p: (os.path.getmtime(p), p))
+    report = {"files": len(paths), "migrated": 0, "failed": 0, "deleted": 0, "file_bytes": 0}
+    for i, path in enumerate(paths, 1):
+        try:
+            size = os.path.getsize(path)
+            with open(path, encoding="utf-8") as f:
+                artifact = json.load(f)
+            if not isinstance(artifact, dict):
+                raise ValueError("not an artifact object")
+            writer.append(artifact)
+        except (OSError, ValueError) as e:
+            report["failed"] += 1
+            print(f"   ⚠️ {os.path.basename(path)}: {e}")
+            continue
+        report["migrated"] += 1
+        report["file_bytes"] += size
+        if delete:
+            try:
+                os.remove(path)
+                report["deleted"] += 1
+            except OSError as e:
+                print(f"   ⚠️ Could not delete {os.path.basename(path)}: {e}")
+        if i % 10000 == 0:
+            print(f"   … {i}/{len(paths)} files")
+    return report
+
+
+# ════════════════════════════════════════════════════════════════════
+# CLI
+# ════════════════════════════════════════════════════════════════════
+def _parse_time(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validation artifact log")
+    parser.add_argument("--dir", default=ARTIFACT_LOG_DIR, help="Log directory (default: %(default)s)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    scan = subparsers.add_parser("scan", help="Print matching artifacts as JSON lines")
+    scan.add_argument("--since", help="Start time (ISO 8601 or unix seconds, inclusive)")
+    scan.add_argument("--until", help="End time (ISO 8601 or unix seconds, exclusive)")
+    scan.add_argument("--epoch", type=int, help="Epoch (or the start of a range with --epoch-to)")
+    scan.add_argument("--epoch-to", type=int, help="Last epoch of the range (inclusive)")
+    scan.add_argument("--stage")
+    scan.add_argument("--lead-id")
+    scan.add_argument("--email", help="Matched through its email_hash")
+    scan.add_argument("--email-hash")
+    scan.add_argument("--limit", type=int)
+    scan.add_argument("--keys-only", action="store_true", help="Print index entries instead of artifacts")
+
+    subparsers.add_parser("stats", help="Segments, records, compression and stage counts")
+
+    migrate = subparsers.add_parser("migrate", help="Append existing validation_*.json files to the log")
+    migrate.add_argument("--source", default="validation_artifacts", help="Directory of per-artifact JSON files")
+    migrate.add_argument("--delete", action="store_true", help="Remove each file once it is in the log")
+
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        writer = ArtifactLogWriter(directory=args.dir)
+        start = time.perf_counter()
+        report = migrate_directory(args.source, writer, delete=args.delete)
+        writer.close()
+        ratio = report["file_bytes"] / writer.stored_bytes if writer.stored_bytes else 0
+        print(f"📦 Migrated {report['migrated']}/{report['files']} artifacts in {time.perf_counter() - start:.1f}s "
+              f"({report['failed']} failed, {report['deleted']} files deleted): "
+              f"{report['file_bytes'] / 1024:.0f} KiB of files → {writer.stored_bytes / 1024:.0f} KiB in {args.dir} "
+              f"({ratio:.1f}x)")
+        sys.exit(1 if report["failed"] else 0)
+
+    reader = ArtifactLogReader(args.dir)
+    if args.command == "stats":
+        print(json.dumps(reader.stats(), indent=2))
+    elif args.command == "scan":
+        epoch_from = args.epoch
+        epoch_to = args.epoch_to if args.epoch_to is not None else args.epoch
+        filters = {
+            "since": _parse_time(args.since), "until": _parse_time(args.until),
+            "epoch_from": epoch_from, "epoch_to": epoch_to,
+            "stage": args.stage, "lead_id": args.lead_id,
+            "email_hash": email_hash(args.email) if args.email else args.email_hash,
+        }
+        if args.keys_only:
+            for count, (segment, entry) in enumerate(reader.entries(**filters)):
+                if args.limit is not None and count >= args.limit:
+                    break
+                print(json.dumps(dict(entry, segment=os.path.basename(segment))))
+        else:
+            for artifact in reader.scan(limit=args.limit, **filters):
+                print(json.dumps(artifact, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Automated lead checks (Stage 0-5) and the batch pipeline that runs them.
+
+The checks used to live in a single 12k-line module whose import pulled in
+every stage's dependencies (WHOIS, dnspython, aiohttp, the taxonomy index,
+the compiled Stage 5 patterns, ...) before the validator could do anything.
+They are now split by stage:
+
+- config:             API keys, proxy, TrueList / concurrency settings, validation_cache
+- common:             shared helpers (hashes, shared-cache keys, artifacts, domain parsing)
+- pipeline:           run_automated_checks, run_batch_automated_checks, validate_lead_list, ...
+- stage0_2:           Stage 0-2 checks (fields, email rules, WHOIS age, MX/SPF/DMARC, DNSBL)
+- email_verification: Stage 3 TrueList inline / batch verification
+- stage4:             Stage 4 LinkedIn verification
+- stage5:             Stage 5 unified verification (role, region, industry, employee count)
+- stage5_matching:    deterministic Stage 5 helpers (geocoding, role/location/size parsing)
+- company_cache:      company LinkedIn / search / standardized-name caches
+- taxonomy:           industry / sub-industry matching
+- icp:                ICP definitions and adjustments
+- rep_score:          Rep Score sources (Wayback, SEC, WHOIS/DNSBL, GDELT, Companies House)
+- provenance:         source provenance and licensed-resale checks
+- legacy:             legacy email cache and pre-pipeline helpers
+
+This package keeps the old flat namespace: every name the module defined
+(plus the lead-field getters) is still importable from
+validator_models.automated_checks, and is loaded from its submodule on first
+access (PEP 562). The pipeline runners import the stage modules when they
+first run, so validator startup only pays for config, common and pipeline.
+
+Import-time benchmark (python -X importtime):
+    python -m validator_models.automated_checks importtime
+"""
+
+import sys
+from typing import Any, Dict, List, Tuple
+
+# Submodule -> names it provides through the package namespace
+_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    "config": (
+        "CACHE_TTLS", "COMPANIES_HOUSE_API_KEY", "dependency_limit", "DEPENDENCY_LIMITS",
+        "_dependency_semaphores", "EMAIL_CACHE_FILE", "EmailVerificationUnavailableError",
+        "get_aiohttp_connector", "HTTP_PROXY_URL", "HTTPS_PROXY_URL", "MAX_REP_SCORE",
+        "MYEMAILVERIFIER_API_KEY", "OPENROUTER_KEY", "PROXY_CONFIG", "SCRAPINGDOG_API_KEY",
+        "STAGE0_2_CONCURRENCY", "STAGE0_2_SEQUENTIAL", "STAGE0_2_STAGGER_DELAY_SECONDS",
+        "STAGE4_5_STREAMING", "TRUELIST_API_KEY", "TRUELIST_BATCH_MAX_RETRIES",
+        "TRUELIST_BATCH_POLL_INTERVAL", "TRUELIST_BATCH_STRATEGY", "TRUELIST_BATCH_TIMEOUT",
+        "VALIDATION_ARTIFACTS_DIR", "validation_cache", "VALIDATION_CACHE_MAX_BYTES",
+    ),
+    "common": (
+        "api_call_with_retry", "compute_validation_hashes", "extract_root_domain", "get_cache_key",
+        "get_lead_dns_domains", "log_validation_metrics", "normalize_accents", "restore_from_shared_cache",
+        "store_in_shared_cache", "store_validation_artifact", "get_email", "get_website", "get_company",
+    ),
+    "pipeline": (
+        "get_batch_timing", "_last_batch_timing", "_poll_leads_file_truelist", "run_automated_checks",
+        "run_batch_automated_checks", "run_stage0_2_checks", "run_stage4_5_repscore",
+        "TRUELIST_WAIT_TIMEOUT", "_TrueListStream", "validate_lead_list",
+    ),
+    "stage0_2": (
+        "check_disposable", "check_dnsbl", "check_domain_age", "check_email_regex",
+        "check_free_email_domain", "check_general_purpose_email", "check_head_request", "check_mx_record",
+        "check_name_email_match", "check_required_fields", "check_spf_dmarc", "is_disposable_email",
+        "get_first_name", "get_last_name",
+    ),
+    "email_verification": (
+        "_build_email_rejection_reason", "delete_all_truelist_batches", "delete_truelist_batch",
+        "_download_and_parse_batch_csv", "_fetch_batch_email_results", "_parse_batch_status_from_response",
+        "parse_truelist_batch_csv", "poll_truelist_batch", "_publish_partial", "retry_truelist_batch",
+        "run_centralized_truelist_batch", "submit_and_poll_truelist", "submit_truelist_batch",
+        "TRUELIST_SCREEN_CHECKS", "verify_emails_inline",
+    ),
+    "stage4": (
+        "check_linkedin_gse", "search_linkedin_gse", "verify_linkedin_with_llm",
+    ),
+    "stage5": (
+        "check_stage5_unified", "_gse_search_employee_count", "_gse_search_employee_count_sync",
+        "_gse_search_stage5", "_gse_search_stage5_sync", "scrape_company_linkedin_gse",
+        "_scrape_company_linkedin_gse_sync", "validate_company_linkedin_url",
+        "verify_company_linkedin_data", "get_location", "get_industry", "get_role", "get_linkedin",
+        "get_field",
+    ),
+    "stage5_matching": (
+        "_ABBREVIATION_GATE", "_ABBREVIATION_SUBSTITUTIONS", "_ASSISTANT_TO_RE", "_C_SUITE_ABBREV_PATTERNS",
+        "C_SUITE_EXPANSIONS", "_C_SUITE_TITLE_PATTERNS", "_CITY_STATE_FORMAT_RE",
+        "_COMPANY_C_SUITE_ABBREVS", "_COMPANY_CONTEXT_RE", "_COUNTRY_SUFFIX_RE", "_DASH_SUFFIX_RE",
+        "_DIRECTOR_TITLE_PATTERNS", "_EDGE_DASH_RE", "_EMPLOYEE_NUMBER_RE", "_EMPLOYEE_PLUS_RE",
+        "_EMPLOYEE_RANGE_RE", "extract_employee_count_from_results", "extract_location_from_text",
+        "extract_person_location_from_linkedin_snippet", "extract_role_from_search_title",
+        "_FAMILY_TERM_RE", "fuzzy_match_employee_count", "fuzzy_match_role",
+        "fuzzy_pre_verification_stage5", "_GARBAGE_PHRASE_RE", "_geocode_location",
+        "_geocode_location_nominatim", "GEOCODER_NOMINATIM_FALLBACK", "_GEOGRAPHIC_ENDING_RE",
+        "_INVALID_TOOL_RE", "_INVALID_TOOLS", "is_valid_employee_count_extraction", "_is_valid_location",
+        "_is_valid_role_extraction", "_JOB_POSTING_RE", "_KEYWORD_ROLE_AT_RE", "_KNOWN_STATE_RE",
+        "_LINKEDIN_DIRECTORY_ROLE_RE", "LINKEDIN_EMPLOYEE_RANGES",
+        "LINKEDIN_LOCATION_COUNTRIES", "_LINKEDIN_SUFFIX_RE", "_LOC_CITY_STATE", "_LOCATION_CONTEXT_RE",
+        "_LOCATION_GARBAGE_RE", "LOCATION_PATTERNS_CASESENSITIVE",
+        "LOCATION_PATTERNS_CASESENSITIVE_COMPILED", "LOCATION_PATTERNS_IGNORECASE",
+        "LOCATION_PATTERNS_IGNORECASE_COMPILED", "locations_match_geopy", "MAJOR_CITIES",
+        "_MAJOR_CITY_ANY_RE", "_MAJOR_CITY_GATE", "_MAJOR_CITY_PATTERNS", "_MAJOR_CITY_TEMPLATE",
+        "_NAME_DASH_REST_RE", "_NAME_ROLE_AT_RE", "_NATIONALITY_GATE", "_NATIONALITY_PATTERNS",
+        "NATIONALITY_TO_COUNTRY", "_nominatim_cache", "normalize_for_comparison",
+        "normalize_to_linkedin_range", "_NUMBER_SPACE_RE", "parse_employee_count",
+        "_PERSON_LOCATION_ABBREV_RE", "_PERSON_LOCATION_FULL_END_RE", "_PERSON_LOCATION_FULL_MIDDLE_RE",
+        "_PERSON_LOCATION_METRO_RE", "_PERSON_LOCATION_PREFIX_RE", "_PERSON_LOCATION_TWO_PART_RE",
+        "_PIPE_SUFFIX_RE", "_ROLE_ABBREV_PATTERNS", "ROLE_ABBREVIATIONS", "ROLE_EQUIVALENCIES",
+        "_ROLE_KEYWORD_ANY_RE", "ROLE_KEYWORDS", "_ROLE_TITLE_KEYWORD_RE",
+        "_SNIPPET_COMPOUND_ROLE_PATTERNS", "_SNIPPET_GARBAGE_RE", "_SNIPPET_KEYWORD_AT_GATE",
+        "_SNIPPET_KEYWORD_AT_PATTERNS", "_SNIPPET_KEYWORD_AT_TEMPLATE", "_SNIPPET_ROLE_PATTERNS",
+        "_SPACED_HYPHEN_RE", "_SPACED_NUMBER_RE", "_STATE_CODE_ONLY_RE", "_SUSPICIOUS_ENDINGS",
+        "_TAGLINE_SENTENCE_RE", "_TITLE_COMPOUND_ROLE_PATTERNS", "_TITLE_KEYWORD_AT_GATE",
+        "_TITLE_KEYWORD_AT_PATTERNS", "_TITLE_KEYWORD_AT_TEMPLATE", "_TRAILING_AT_COMPANY_RE",
+        "_TRAILING_ELLIPSIS_RE", "_TRAILING_IN_LOCATION_RE", "US_STATE_ABBREVS", "validate_role_format",
+        "_WEB_NAV_PHRASE_RE", "_WEB_UI_TEXT_RE", "_WHITESPACE_RUN_RE",
+    ),
+    "company_cache": (
+        "COMPANY_FETCH_STATS", "COMPANY_LINKEDIN_CACHE_TTL_HOURS",
+        "_company_linkedin_inflight", "COMPANY_NAME_CACHE_FILE", "COMPANY_SEARCH_CACHE",
+        "get_company_linkedin_from_cache", "get_standardized_company_name", "load_company_linkedin",
+        "load_company_name_cache", "log_company_fetch_stats", "reset_company_fetch_stats",
+        "save_company_name_cache", "search_company_employee_count", "search_company_industry",
+        "set_company_linkedin_cache", "set_standardized_company_name", "_single_flight_company_search",
+    ),
+    "taxonomy": (
+        "fuzzy_match_sub_industry", "get_all_valid_industries", "get_all_valid_sub_industries",
+        "validate_exact_industry_match", "validate_exact_sub_industry_match",
+        "validate_industry_sub_industry_exact_pairing", "validate_industry_sub_industry_pairing",
+        "verify_sub_industry_with_llm",
+    ),
+    "icp": (
+        "calculate_icp_adjustment", "determine_icp_multiplier", "ICP_DEFINITIONS", "is_enterprise_company",
+        "_matches_icp_definitions", "get_employee_count",
+    ),
+    "rep_score": (
+        "check_companies_house", "check_gdelt_mentions", "check_sec_edgar", "check_uspto_trademarks",
+        "check_wayback_machine", "check_whois_dnsbl_reputation", "REPUTATION_SOURCES", "reputation_subject",
+        "run_reputation_check",
+    ),
+    "provenance": (
+        "check_licensed_resale_proof", "check_source_provenance", "check_terms_attestation",
+    ),
+    "legacy": (
+        "check_domain_existence", "check_duplicates", "EMAIL_CACHE", "load_email_cache", "save_email_cache",
+        "verify_company",
+    ),
+}
+
+_SUBMODULE_BY_NAME = {name: submodule for submodule, names in _EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _SUBMODULE_BY_NAME.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # __import__ rather than importlib.import_module: the latter hides the submodule
+    # (and what it imports) from `python -X importtime`
+    module_name = f"{__name__}.{submodule}"
+    __import__(module_name)
+    value = getattr(sys.modules[module_name], name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_SUBMODULE_BY_NAME))
@@ -0,0 +1,124 @@
+"""
+Import-time benchmark for the automated checks package.
+
+Each scenario is imported in a fresh interpreter under `python -X importtime`,
+after a prelude the validator has already paid for by the time it reaches
+these imports (Leadpoet's lead-field getters, which pull in bittensor). The
+reported cost is the sum of the self time of every module the scenario adds
+on top of the prelude, median of --repeat runs after one warm-up run (so
+both trees are measured with their bytecode cached, as on a validator restart).
+
+    python -m validator_models.automated_checks importtime
+    python -m validator_models.automated_checks importtime --ref HEAD~1   # compare against another commit
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tarfile
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+PRELUDE = "import Leadpoet.utils.utils_lead_extraction"
+
+SCENARIOS = [
+    ("package", "import validator_models.automated_checks"),
+    ("validator", "from validator_models.automated_checks import validate_lead_list, run_automated_checks, MAX_REP_SCORE"),
+    ("batch", "from validator_models.automated_checks import run_batch_automated_checks, get_batch_timing, get_email"),
+    ("stage0_helper", "from validator_models.automated_checks import check_domain_age"),
+    ("all_checks", "from validator_models.automated_checks import run_automated_checks as f; "
+                   "import validator_models.automated_checks as m; [getattr(m, n) for n in dir(m) if not n.startswith('__')]"),
+]
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def _importtime(code: str, cwd: str) -> Dict[str, int]:
+    """{module: self µs} for one cold interpreter running `code`."""
+    env = dict(os.environ, PYTHONPATH=cwd)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # Both trees must be measured from cached bytecode
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit {proc.returncode}")
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            modules[match.group(4)] = int(match.group(1))
+    return modules
+
+
+def measure(code: str, cwd: str, repeat: int) -> Tuple[float, List[Tuple[str, float]]]:
+    """(median ms added on top of the prelude, top modules by self ms in the median run)."""
+    runs = []
+    _importtime(f"{PRELUDE}; {code}", cwd)  # Warm-up: write .pyc files so no run pays for compiling
+    for _ in range(repeat):
+        prelude = _importtime(PRELUDE, cwd)
+        modules = _importtime(f"{PRELUDE}; {code}", cwd)
+        added = {name: us for name, us in modules.items() if name not in prelude}
+        runs.append((sum(added.values()) / 1000, added))
+    runs.sort(key=lambda run: run[0])
+    total_ms, added = runs[len(runs) // 2]
+    top = sorted(((name, us / 1000) for name, us in added.items()), key=lambda item: -item[1])
+    return total_ms, top
+
+
+def _checkout(ref: str) -> str:
+    """Extract `ref` of this repository into a temporary directory (no worktree changes)."""
+    root = subprocess.run(["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True, check=True).stdout.strip()
+    directory = tempfile.mkdtemp(prefix="importtime_")
+    archive = os.path.join(directory, "tree.tar")
+    subprocess.run(["git", "-C", root, "archive", "--format=tar", "-o", archive, ref], check=True)
+    with tarfile.open(archive) as tar:
+        tar.extractall(directory)
+    os.remove(archive)
+    return directory
+
+
+def importtime(args) -> int:
+    cwd = os.getcwd()
+    baseline_dir: Optional[str] = _checkout(args.ref) if args.ref else None
+    print(f"⏱️  Import time on top of `{PRELUDE}` (median of {args.repeat} cold runs)")
+    for name, code in SCENARIOS:
+        if args.scenario and name not in args.scenario:
+            continue
+        try:
+            total_ms, top = measure(code, cwd, args.repeat)
+        except RuntimeError as e:
+            print(f"   ❌ {name}: {e}")
+            continue
+        line = f"   {name:<14} {total_ms:8.1f}ms"
+        if baseline_dir:
+            try:
+                base_ms, _ = measure(code, baseline_dir, args.repeat)
+                line += f"   {args.ref}: {base_ms:8.1f}ms   ({base_ms - total_ms:+.1f}ms saved)"
+            except RuntimeError as e:
+                line += f"   {args.ref}: ❌ {e}"
+        print(line)
+        for module, ms in top[:args.top]:
+            print(f"      {ms:7.1f}ms  {module}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Automated checks package tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    bench = subparsers.add_parser("importtime", help="Cold import cost of the package entry points (python -X importtime)")
+    bench.add_argument("--scenario", action="append", choices=[name for name, _ in SCENARIOS],
+                       help="Only run this scenario (repeatable)")
+    bench.add_argument("--repeat", type=int, default=5, help="Cold runs per scenario (median is reported)")
+    bench.add_argument("--top", type=int, default=8, help="Slowest modules to list per scenario")
+    bench.add_argument("--ref", help="Also measure this git ref (e.g. HEAD~1) for a before/after comparison")
+
+    args = parser.parse_args()
+    sys.exit(importtime(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Helpers shared by the stage modules: accent normalization, validation hashes,
+shared-cache keys, validation artifacts/metrics, API retries and domain parsing.
+"""
+
+import asyncio
+import os
+import json
+import time
+import unicodedata
+from datetime import datetime
+from urllib.parse import urlparse
+from typing import Tuple, Optional
+from Leadpoet.utils.utils_lead_extraction import get_email, get_website, get_company
+from validator_models.shared_cache import get_shared_cache
+from validator_models.artifact_log import append_artifact
+
+from validator_models.automated_checks.config import (
+    HTTP_PROXY_URL,
+    VALIDATION_ARTIFACTS_DIR,
+    validation_cache,
+)
+
+
+def normalize_accents(text: str) -> str:
+    """
+    Remove accents/diacritics from text for name matching.
+    e.g., "José" -> "Jose", "François" -> "Francois"
+    """
+    # Normalize to NFD form (decomposes accented chars into base + combining mark)
+    # Then remove combining marks (category 'Mn')
+    normalized = unicodedata.normalize('NFD', text)
+    return ''.join(char for char in normalized if unicodedata.category(char) != 'Mn')
+
+
+# Commit-Reveal Logic for Trustless Validation
+
+def compute_validation_hashes(decision: str, rep_score: float, evidence: dict, salt: bytes) -> dict:
+    """
+    Compute commit hashes for validation result.
+    
+    Args:
+        decision: "approve" or "reject"
+        rep_score: Reputation score (0-30)
+        evidence: Evidence blob (full automated_checks_data)
+        salt: Random salt for commitment
+    
+    Returns:
+        {
+            "decision_hash": "sha256-hex",
+            "rep_score_hash": "sha256-hex",
+            "evidence_hash": "sha256-hex"
+        }
+    """
+    import hashlib
+    
+    # Canonicalize evidence (sort keys for determinism)
+    evidence_json = json.dumps(evidence, sort_keys=True, default=str)  # Handle datetime objects
+    
+    # Compute hashes
+    decision_hash = hashlib.sha256(salt + decision.encode()).hexdigest()
+    rep_score_hash = hashlib.sha256(salt + str(rep_score).encode()).hexdigest()
+    evidence_hash = hashlib.sha256(salt + evidence_json.encode()).hexdigest()
+    
+    return {
+        "decision_hash": decision_hash,
+        "rep_score_hash": rep_score_hash,
+        "evidence_hash": evidence_hash
+    }
+
+
+def get_cache_key(prefix: str, identifier: str) -> str:
+    """Generate consistent cache key for validation results"""
+    return f"{prefix}_{identifier}"
+
+async def restore_from_shared_cache(namespace: str, key: str, cache_key: str, ttl_hours: int):
+    """
+    Copy a cross-container shared cache entry into validation_cache when the
+    in-memory copy is missing or expired, so the caller's normal cache-hit
+    branch serves it without going to the network. The copy keeps the shared
+    entry's age and expiry; SQLite runs in a thread (a locked database can
+    wait up to busy_timeout and must not stall the event loop).
+    """
+    if not validation_cache.is_expired(cache_key, ttl_hours):
+        return
+    found = await asyncio.to_thread(get_shared_cache().get_entry, namespace, key)
+    if not found:
+        return
+    entry, created_at, expires_at = found
+    ttl_seconds = expires_at - time.time()
+    if not entry or ttl_seconds <= 0:
+        return
+    value = tuple(entry["result"]) if "result" in entry else entry["value"]
+    validation_cache.set(cache_key, value, ttl_seconds=ttl_seconds, inserted_at=created_at)
+    if "data" in entry:
+        validation_cache.set(f"{cache_key}_data", entry["data"], ttl_seconds=ttl_seconds, inserted_at=created_at)
+
+async def store_in_shared_cache(namespace: str, key: str, value, data: Optional[dict] = None):
+    """Write a check result (and its lead side-data) through to the shared cache (in a thread)."""
+    entry = {"result": list(value)} if isinstance(value, tuple) else {"value": value}
+    if data is not None:
+        entry["data"] = data
+    await asyncio.to_thread(get_shared_cache().set, namespace, key, entry)
+
+async def store_validation_artifact(lead_data: dict, validation_result: dict, stage: str):
+    """Append validation result to the artifact log (validator_models.artifact_log) for analysis"""
+    try:
+        timestamp = datetime.now().isoformat()
+        artifact_data = {
+            "timestamp": timestamp,
+            "stage": stage,
+            "lead_data": lead_data,
+            "validation_result": validation_result,
+        }
+
+        segment, offset = append_artifact(artifact_data)
+
+        print(f"✅ Validation artifact stored: {os.path.basename(segment)}@{offset}")
+    except Exception as e:
+        print(f"⚠️ Failed to store validation artifact: {e}")
+
+async def log_validation_metrics(lead_data: dict, validation_result: dict, stage: str):
+    """Log validation metrics for monitoring and analysis"""
+    try:
+        # Extract key metrics
+        email = get_email(lead_data)
+        company = get_company(lead_data)
+        passed = validation_result.get("passed", False)
+        reason = validation_result.get("reason", "Unknown")
+
+        # Log to console for now (can be extended to database/metrics service)
+        status_icon = "✅" if passed else "❌"
+        print(f"{status_icon} Stage {stage}: {email} @ {company} - {reason}")
+
+        # Store metrics in cache for aggregation
+        metrics_key = f"metrics_{stage}_{datetime.now().strftime('%Y%m%d')}"
+        current_metrics = validation_cache.get(metrics_key, {"total": 0, "passed": 0, "failed": 0})
+
+        current_metrics["total"] += 1
+        if passed:
+            current_metrics["passed"] += 1
+        else:
+            current_metrics["failed"] += 1
+
+        validation_cache[metrics_key] = current_metrics
+
+    except Exception as e:
+        print(f"⚠️ Failed to update metrics: {e}")
+
+    try:
+        # Log to file for persistence
+        log_entry = {
+            "timestamp": datetime.now().isoformat(),
+            "stage": stage,
+            "email": get_email(lead_data),
+            "company": get_company(lead_data),
+            "passed": validation_result.get("passed", False),
+            "reason": validation_result.get("reason", "Unknown"),
+        }
+
+        os.makedirs(VALIDATION_ARTIFACTS_DIR, exist_ok=True)
+        log_file = os.path.join(VALIDATION_ARTIFACTS_DIR, "validation_log.jsonl")
+        with open(log_file, "a") as f:
+            f.write(json.dumps(log_entry, default=str) + "\n")  # Handle datetime objects
+
+    except Exception as e:
+        print(f"⚠️ Failed to log validation metrics: {e}")
+
+async def api_call_with_retry(session, url, params=None, max_retries=3, base_delay=1):
+    """Make API call with exponential backoff retry logic"""
+    for attempt in range(max_retries):
+        try:
+            # Pass proxy if configured (aiohttp accepts proxy as string URL)
+            async with session.get(url, params=params, timeout=10, proxy=HTTP_PROXY_URL) as response:
+                return response
+        except Exception as e:
+            if attempt == max_retries - 1:
+                # All retries exhausted, raise descriptive exception
+                context_info = f"URL: {url}"
+                if params:
+                    context_info += f", Params: {params}"
+                raise RuntimeError(
+                    f"API call to {url} failed after {max_retries} attempts. {context_info}"
+                ) from e
+            delay = base_delay * (2**attempt)  # Exponential backoff
+            await asyncio.sleep(delay)
+
+def get_lead_dns_domains(lead: dict) -> Tuple[str, str, str]:
+    """
+    Domains the Stage 1-2 DNS checks query for a lead, derived exactly as each
+    check derives them.
+
+    Returns:
+        (website_root_domain, email_domain, email_root_domain) - "" when missing
+    """
+    website_domain = extract_root_domain(get_website(lead) or "")
+    email = get_email(lead) or ""
+    email_domain = email.split("@")[1].lower() if "@" in email else ""
+    email_root_domain = extract_root_domain(email_domain)
+    return website_domain, email_domain, email_root_domain
+
+def extract_root_domain(website: str) -> str:
+    """Extract the root domain from a website URL, removing www. prefix"""
+    if not website:
+        return ""
+
+    # Parse the URL to get the domain
+    if website.startswith(("http://", "https://")):
+        domain = urlparse(website).netloc
+    else:
+        # Handle bare domains like "firecrawl.dev" or "www.firecrawl.dev"
+        domain = website.strip("/")
+
+    # Remove www. prefix if present
+    if domain.startswith("www."):
+        domain = domain[4:]  # Remove "www."
+
+    return domain
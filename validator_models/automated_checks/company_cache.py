@@ -0,0 +1,254 @@
+"""
+Company LinkedIn, company search and standardized company-name caches used by Stage 4/5.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Dict, Tuple, List, Optional
+from validator_models.ttl_cache import TTLCache
+from validator_models.company_store import LEGACY_COMPANY_NAME_CACHE_FILE, get_company_store, normalize_slug
+
+
+# ========================================================================
+# GLOBAL COMPANY LINKEDIN CACHE
+# ========================================================================
+# Caches company LinkedIn data to avoid re-scraping the same company page.
+# Stored with the standardized company name in the host-shared company store
+# (validator_models.company_store), so restarts and other containers reuse it.
+# Key: company_linkedin slug (e.g., "microsoft")
+# Value: Dict with company_name, industry, description, employee_count, location, timestamp
+# TTL: 24 hours (companies don't change frequently)
+# ========================================================================
+COMPANY_LINKEDIN_CACHE_TTL_HOURS = 24
+
+def get_company_linkedin_from_cache(company_slug: str) -> Optional[Dict]:
+    """
+    Get company LinkedIn data from global cache if not expired.
+    
+    Args:
+        company_slug: The company slug from LinkedIn URL (e.g., "microsoft")
+        
+    Returns:
+        Cached data dict or None if not cached/expired
+    """
+    return get_company_store().get_linkedin(company_slug, COMPANY_LINKEDIN_CACHE_TTL_HOURS * 3600)
+
+def set_company_linkedin_cache(company_slug: str, data: Dict):
+    """
+    Store company LinkedIn data in global cache.
+    
+    Args:
+        company_slug: The company slug from LinkedIn URL
+        data: Dict with company data to cache
+    """
+    # Timestamp kept on the data for logging/debugging (TTL is enforced by the store itself;
+    # isoformat string, not datetime object, to avoid JSON serialization issues)
+    data["timestamp"] = datetime.now().isoformat()
+    get_company_store().set_linkedin(company_slug, data)
+
+# ========================================================================
+# COMPANY-LEVEL SEARCH REUSE
+# ========================================================================
+# Company-level ScrapingDog work is done once per company and reused by every
+# later lead of that company:
+# - company_linkedin: keyed by company slug (Stage 4 scrape), reused through
+#   COMPANY_LINKEDIN_CACHE
+# - employee_count / industry: keyed by their exact search inputs (Stage 5);
+#   non-empty results are kept for COMPANY_LINKEDIN_CACHE_TTL_HOURS
+# run_batch_automated_checks runs Stage 4-5 one lead at a time, so nearly all
+# of the savings are cache reuse. Fetches are also single-flight, which only
+# matters when Stage 4-5 calls overlap (several run_automated_checks callers
+# on one loop): the later caller awaits the in-flight fetch instead of paying
+# for its own. Stats count the two separately ("cached" vs "shared").
+# Each fetch issues at least one paid ScrapingDog query.
+# ========================================================================
+COMPANY_SEARCH_CACHE = TTLCache(
+    max_entries=2000,
+    default_ttl_seconds=COMPANY_LINKEDIN_CACHE_TTL_HOURS * 3600,
+    name="company_search",
+)
+
+COMPANY_FETCH_STATS = {
+    kind: {"requests": 0, "fetched": 0, "cached": 0, "shared": 0}
+    for kind in ("company_linkedin", "employee_count", "industry")
+}
+
+# (loop id, company_slug) -> Future[(claimed_company, scraped_data)]
+_company_linkedin_inflight: Dict[Tuple[int, str], asyncio.Future] = {}
+
+async def load_company_linkedin(company_slug: str, company: str) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """
+    Company LinkedIn data for a slug: COMPANY_LINKEDIN_CACHE first, then a scrape.
+
+    The scrape is single-flight per slug. If another caller is already scraping
+    this slug, wait for it: a successful scrape lands in COMPANY_LINKEDIN_CACHE
+    (returned as cached data); a failed or mismatched scrape is shared when the
+    claimed company is the same, otherwise this lead scrapes with its own
+    company name.
+
+    Returns:
+        (cached_data, scraped_data) - exactly one of them is set
+    """
+    from validator_models.automated_checks.stage5 import scrape_company_linkedin_gse
+    stats = COMPANY_FETCH_STATS["company_linkedin"]
+    stats["requests"] += 1
+    cached_data = get_company_linkedin_from_cache(company_slug)
+    if cached_data:
+        stats["cached"] += 1
+        return cached_data, None
+
+    loop = asyncio.get_running_loop()
+    inflight_key = (id(loop), company_slug)
+
+    future = _company_linkedin_inflight.get(inflight_key)
+    if future is not None and not future.done():
+        print(f"   ⏳ Stage 4: Waiting for in-flight company LinkedIn scrape of '{company_slug}'...")
+        try:
+            leader_company, scraped_data = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+        else:
+            cached_data = get_company_linkedin_from_cache(company_slug)
+            if cached_data:
+                stats["shared"] += 1
+                return cached_data, None
+            if leader_company.lower().strip() == company.lower().strip():
+                stats["shared"] += 1
+                return None, scraped_data
+
+    future = loop.create_future()
+    _company_linkedin_inflight[inflight_key] = future
+    stats["fetched"] += 1
+    try:
+        print(f"   🔍 Stage 4: Scraping company LinkedIn page for '{company_slug}'...")
+        scraped_data = await scrape_company_linkedin_gse(company_slug, company)
+
+        # Cache globally only on success with a verified company name
+        if scraped_data.get("success") and scraped_data.get("company_name_match"):
+            set_company_linkedin_cache(company_slug, scraped_data)
+            print(f"   💾 Stage 4: Cached company LinkedIn data for future leads")
+        future.set_result((company, scraped_data))
+        return None, scraped_data
+    except BaseException:
+        # Cancelled: waiters scrape for themselves
+        future.cancel()
+        raise
+    finally:
+        if _company_linkedin_inflight.get(inflight_key) is future:
+            del _company_linkedin_inflight[inflight_key]
+
+async def _single_flight_company_search(kind: str, key: tuple, search) -> List[Dict]:
+    """Run a company-level search once per key; later and concurrent callers reuse it."""
+    stats = COMPANY_FETCH_STATS[kind]
+    stats["requests"] += 1
+    cache_key = (kind,) + key
+
+    results = COMPANY_SEARCH_CACHE.get(cache_key)
+    if results:
+        stats["cached"] += 1
+        return list(results)
+
+    loaded = False
+
+    async def _load():
+        nonlocal loaded
+        loaded = True
+        stats["fetched"] += 1
+        # Empty results (nothing found / API error) are shared but not cached
+        return (await search()) or None
+
+    results = await COMPANY_SEARCH_CACHE.get_or_load(cache_key, _load)
+    if not loaded:
+        stats["shared"] += 1
+    return list(results) if results else []
+
+async def search_company_employee_count(company: str, company_linkedin_slug: str) -> List[Dict]:
+    """Cached, single-flight _gse_search_employee_count (Stage 5)."""
+    from validator_models.automated_checks.stage5 import _gse_search_employee_count
+    return await _single_flight_company_search(
+        "employee_count",
+        (company, company_linkedin_slug),
+        lambda: _gse_search_employee_count(company=company, company_linkedin_slug=company_linkedin_slug),
+    )
+
+async def search_company_industry(company: str, region_hint: str) -> List[Dict]:
+    """Cached, single-flight Stage 5 industry search."""
+    from validator_models.automated_checks.stage5 import _gse_search_stage5
+    return await _single_flight_company_search(
+        "industry",
+        (company, region_hint),
+        lambda: _gse_search_stage5("industry", company=company, region_hint=region_hint),
+    )
+
+def reset_company_fetch_stats():
+    for stats in COMPANY_FETCH_STATS.values():
+        for field in stats:
+            stats[field] = 0
+
+def log_company_fetch_stats():
+    """Print paid company-level searches avoided by cache reuse and in-flight sharing."""
+    if not any(s["requests"] for s in COMPANY_FETCH_STATS.values()):
+        return
+    cached = sum(s["cached"] for s in COMPANY_FETCH_STATS.values())
+    shared = sum(s["shared"] for s in COMPANY_FETCH_STATS.values())
+    print(f"   🏢 Company searches: {cached + shared} paid fetches avoided "
+          f"({cached} reused from cache, {shared} shared in-flight)")
+    for kind, stats in COMPANY_FETCH_STATS.items():
+        if stats["requests"]:
+            print(f"      {kind}: {stats['fetched']} fetched / {stats['requests']} requested "
+                  f"({stats['cached']} cached, {stats['shared']} shared)")
+
+# ========================================================================
+# COMPANY NAME STANDARDIZATION CACHE (company store)
+# ========================================================================
+# Maps company LinkedIn slug to standardized company name.
+# Key: slug (e.g., "23andme")
+# Value: Standardized company name from LinkedIn (e.g., "23andMe")
+# Served from memory by validator_models.company_store; the legacy JSON file
+# below is only read once to seed the store.
+# ========================================================================
+COMPANY_NAME_CACHE_FILE = LEGACY_COMPANY_NAME_CACHE_FILE
+
+def load_company_name_cache() -> Dict[str, str]:
+    """All cached slug → standardized name entries."""
+    return get_company_store().names()
+
+def save_company_name_cache(cache: Dict[str, str]) -> bool:
+    """Write changed entries of `cache` to the company store (persisted write-behind)."""
+    store = get_company_store()
+    current = store.names()
+    for slug, name in cache.items():
+        if current.get(slug) != name:
+            store.set_name(slug, name)
+    return True
+
+def get_standardized_company_name(company_slug: str) -> Optional[str]:
+    """
+    Get standardized company name from cache.
+
+    Args:
+        company_slug: The company slug from LinkedIn URL (e.g., "23andme")
+
+    Returns:
+        Standardized company name or None if not in cache
+    """
+    # Slug is normalized to lowercase by the store
+    return get_company_store().get_name(company_slug)
+
+def set_standardized_company_name(company_slug: str, standardized_name: str) -> bool:
+    """
+    Save standardized company name to cache.
+
+    Args:
+        company_slug: The company slug from LinkedIn URL (e.g., "23andme")
+        standardized_name: The official company name from LinkedIn (e.g., "23andMe")
+
+    Returns:
+        True if saved successfully, False otherwise
+    """
+    # Normalize slug to lowercase
+    slug_normalized = normalize_slug(company_slug)
+    get_company_store().set_name(slug_normalized, standardized_name)
+    print(f"   💾 Cached company name: '{slug_normalized}' → '{standardized_name}'")
+    return True
@@ -0,0 +1,137 @@
+"""
+Environment-driven settings shared by every stage: API keys, proxy, TrueList and
+concurrency limits, cache TTLs and the in-process validation cache.
+"""
+
+import asyncio
+import os
+from typing import Dict, Tuple
+from dotenv import load_dotenv
+from validator_models.ttl_cache import TTLCache
+from validator_models.pipeline_metrics import metered
+
+
+MAX_REP_SCORE = 48  # Wayback (6) + SEC (12) + WHOIS/DNSBL (10) + GDELT (10) + Companies House (10) = 48
+
+
+# Custom exception for API infrastructure failures (should skip lead, not submit)
+class EmailVerificationUnavailableError(Exception):
+    """Raised when email verification API is unavailable (no credits, bad key, network error, etc.)"""
+    pass
+
+load_dotenv()
+
+# ════════════════════════════════════════════════════════════════════
+# PROXY CONFIGURATION: Support for containerized validators with proxies
+# ════════════════════════════════════════════════════════════════════
+
+# Read proxy configuration from environment variables
+HTTP_PROXY_URL = os.environ.get('HTTP_PROXY')
+HTTPS_PROXY_URL = os.environ.get('HTTPS_PROXY', HTTP_PROXY_URL)
+
+# Global proxy configuration for all HTTP requests
+PROXY_CONFIG = None
+if HTTP_PROXY_URL:
+    PROXY_CONFIG = {
+        'http': HTTP_PROXY_URL,
+        'https': HTTPS_PROXY_URL or HTTP_PROXY_URL
+    }
+    print(f"🌐 Proxy enabled: {HTTP_PROXY_URL[:50]}... (all API requests will use this IP)")
+
+def get_aiohttp_connector():
+    """
+    Create aiohttp connector with proxy support if configured.
+    
+    Returns connector that should be passed to aiohttp.ClientSession()
+    
+    NOTE: automated checks no longer create their own sessions - they use the
+    pooled sessions from validator_models.http_client and pass
+    proxy=HTTP_PROXY_URL per request.
+    """
+    if HTTP_PROXY_URL:
+        # aiohttp handles proxies via request parameters, not connector
+        return None
+    return None
+
+# ════════════════════════════════════════════════════════════════════
+
+# MEV removed - always use TrueList for email verification
+# Even if MYEMAILVERIFIER_API_KEY is set in environment, we ignore it
+MYEMAILVERIFIER_API_KEY = ""  # Hardcoded empty - TrueList is the only email verifier
+TRUELIST_API_KEY = os.getenv("TRUELIST_API_KEY", "")
+
+# TrueList Batch Email Validation Configuration
+# See: https://apidocs.truelist.io/#tag/Batch-email-validation
+TRUELIST_BATCH_POLL_INTERVAL = 10  # seconds between status polls
+TRUELIST_BATCH_TIMEOUT = 40 * 60   # 40 minutes in seconds
+TRUELIST_BATCH_MAX_RETRIES = 2     # Max retry attempts for errored emails
+TRUELIST_BATCH_STRATEGY = "fast"  # "fast" returns more complete results than "accurate"
+
+# Stage 4 & 5: ScrapingDog GSE API + OpenRouter LLM
+SCRAPINGDOG_API_KEY = os.getenv("SCRAPINGDOG_API_KEY", "")
+OPENROUTER_KEY = os.getenv("OPENROUTER_KEY", "")
+
+# Rep Score API keys (Companies House)
+COMPANIES_HOUSE_API_KEY = os.getenv("COMPANIES_HOUSE_API_KEY", "")
+
+EMAIL_CACHE_FILE = "email_verification_cache.pkl"
+VALIDATION_ARTIFACTS_DIR = "validation_artifacts"
+
+CACHE_TTLS = {
+    "dns_head": 24,
+    "whois": 90,
+    "myemailverifier": 90,  
+}
+
+# Stage 0-2 batch executor: leads in flight per container, plus per-dependency limits
+# that replace the old blanket 0.5s sleep between leads.
+# STAGE0_2_SEQUENTIAL=true restores the one-lead-at-a-time behaviour for comparison,
+# including the legacy container_id * STAGE0_2_STAGGER_DELAY_SECONDS WHOIS stagger.
+STAGE0_2_CONCURRENCY = int(os.getenv("STAGE0_2_CONCURRENCY", "16"))
+STAGE0_2_SEQUENTIAL = os.getenv("STAGE0_2_SEQUENTIAL", "false").lower() == "true"
+STAGE0_2_STAGGER_DELAY_SECONDS = 8  # 8s between containers (sequential mode only)
+# Release each lead into Stage 4-5 as soon as its own TrueList result arrives on the
+# epoch channel, instead of waiting for the whole centralized batch (and its retries).
+# STAGE4_5_STREAMING=false restores the wait-for-everything behaviour.
+STAGE4_5_STREAMING = os.getenv("STAGE4_5_STREAMING", "true").lower() == "true"
+# These bound concurrency per container; request rates are paced host-wide by
+# validator_models.rate_governor.
+DEPENDENCY_LIMITS = {
+    "whois": int(os.getenv("WHOIS_CONCURRENCY", "3")),   # WHOIS servers rate-limit aggressively
+    "dns": int(os.getenv("DNS_CONCURRENCY", "32")),
+    "head": int(os.getenv("HEAD_CONCURRENCY", "16")),    # Company website HEAD/GET probes
+}
+_dependency_semaphores: Dict[Tuple[int, str], Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+
+def dependency_limit(name: str):
+    """
+    Per-event-loop semaphore bounding concurrent calls to one external dependency
+    (see DEPENDENCY_LIMITS). asyncio semaphores are loop-bound, so one is kept per loop;
+    entries of closed loops are dropped whenever a new one is created.
+    Use as `async with dependency_limit(name):` - the wait is recorded as queue time.
+    """
+    loop = asyncio.get_running_loop()
+    key = (id(loop), name)
+    entry = _dependency_semaphores.get(key)
+    if entry is None or entry[0] is not loop:
+        # Forget finished loops (asyncio.run() per batch, etc.) so they can be freed
+        # and a reused id() never hands back a semaphore bound to a dead loop
+        for stale_key, (stale_loop, _) in list(_dependency_semaphores.items()):
+            if stale_loop.is_closed():
+                del _dependency_semaphores[stale_key]
+        entry = (loop, asyncio.Semaphore(DEPENDENCY_LIMITS[name]))
+        _dependency_semaphores[key] = entry
+    return metered(entry[1], name)
+
+
+# Global cache instance (O(1) TTL-aware LRU - see validator_models/ttl_cache.py)
+# Entries expire lazily after the longest CACHE_TTLS window; callers still apply
+# their per-check TTL through is_expired().
+VALIDATION_CACHE_MAX_BYTES = 64 * 1024 * 1024
+validation_cache = TTLCache(
+    max_entries=1000,
+    max_bytes=VALIDATION_CACHE_MAX_BYTES,
+    default_ttl_seconds=max(CACHE_TTLS.values()) * 3600,
+    name="validation_cache",
+)
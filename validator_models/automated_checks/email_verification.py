@@ -0,0 +1,1322 @@
+"""
+Stage 3 email verification: TrueList inline and batch APIs, and the coordinator's
+centralized TrueList batch.
+"""
+
+import aiohttp
+import asyncio
+import uuid
+import json
+import time
+from datetime import datetime
+from typing import Dict, Tuple, List, Optional, Callable, Awaitable
+from Leadpoet.utils.utils_lead_extraction import get_email
+from validator_models.http_client import pooled_session
+from validator_models.check_scheduler import log_check_scheduler_stats, screen_truelist_emails
+
+from validator_models.automated_checks.config import (
+    EmailVerificationUnavailableError,
+    HTTP_PROXY_URL,
+    TRUELIST_API_KEY,
+    TRUELIST_BATCH_POLL_INTERVAL,
+    TRUELIST_BATCH_STRATEGY,
+    TRUELIST_BATCH_TIMEOUT,
+)
+from validator_models.automated_checks.stage0_2 import (
+    check_disposable,
+    check_email_regex,
+    check_free_email_domain,
+    check_general_purpose_email,
+    check_name_email_match,
+    check_required_fields,
+)
+
+
+# Stage 3: Email Verification
+# NOTE: Single-email validation functions (check_truelist_email, check_myemailverifier_email)
+# have been REMOVED as of Dec 2024. All email validation now uses TrueList BATCH API
+# via run_batch_automated_checks() for efficiency.
+# See: submit_truelist_batch(), poll_truelist_batch(), parse_truelist_batch_csv()
+
+
+# ============================================================================
+# TrueList Batch Email Validation Functions
+# ============================================================================
+# These functions support batch email verification for improved throughput.
+# See tasks9.md for the full migration plan.
+# API Reference: https://apidocs.truelist.io/#tag/Batch-email-validation
+# ============================================================================
+
+async def submit_truelist_batch(emails: List[str]) -> str:
+    """
+    Submit a list of emails to TrueList batch API.
+    
+    This function submits emails for batch verification. The batch is processed
+    asynchronously by TrueList and must be polled for completion using
+    poll_truelist_batch().
+    
+    API Reference: https://apidocs.truelist.io/#tag/Batch-email-validation
+    
+    Args:
+        emails: List of email addresses to validate (max 5000 per batch)
+    
+    Returns:
+        batch_id: UUID of the created batch for polling
+    
+    Raises:
+        EmailVerificationUnavailableError: If batch submission fails
+        ValueError: If no emails provided or API key not configured
+    
+    Example:
+        batch_id = await submit_truelist_batch(["user1@example.com", "user2@example.com"])
+        # Then poll with: results = await poll_truelist_batch(batch_id)
+    """
+    if not emails:
+        raise ValueError("No emails provided for batch validation")
+    
+    if not TRUELIST_API_KEY:
+        raise EmailVerificationUnavailableError("TRUELIST_API_KEY not configured")
+    
+    # Log batch submission
+    print(f"\n📧 TrueList Batch: Submitting {len(emails)} emails for validation...")
+    
+    try:
+        async with pooled_session("truelist") as session:
+            # TrueList batch API endpoint
+            url = "https://api.truelist.io/api/v1/batches"
+            
+            # IMPORTANT: TrueList batch API requires multipart/form-data, NOT JSON body
+            # The 'data' parameter is a JSON string sent as a form field
+            headers = {
+                "Authorization": f"Bearer {TRUELIST_API_KEY}",
+                # Note: Do NOT set Content-Type header - aiohttp sets it automatically for FormData
+            }
+            
+            # CRITICAL: TrueList batch API rejects the ENTIRE batch if ANY email 
+            # doesn't have an @ sign. Pre-filter to avoid this.
+            # Emails without @ will be handled separately with immediate rejection.
+            valid_emails = [email for email in emails if '@' in email]
+            invalid_emails = [email for email in emails if '@' not in email]
+            
+            if invalid_emails:
+                print(f"   ⚠️  Filtered {len(invalid_emails)} invalid emails (no @ sign)")
+            
+            if not valid_emails:
+                print(f"   ❌ No valid emails to submit (all filtered)")
+                return None  # Return None to indicate no batch was created
+            
+            # IMPORTANT: TrueList file upload is currently broken (returns 500)
+            # Using JSON data format instead which works correctly
+            # JSON format: {"data": [["email1"], ["email2"]], "validation_strategy": "accurate"}
+            
+            # Convert emails to JSON array format: [["email1"], ["email2"], ...]
+            email_data = [[email] for email in valid_emails]
+            
+            # Generate unique batch name to avoid "Duplicate file upload" error
+            unique_name = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}.csv"
+            
+            json_payload = {
+                "data": email_data,
+                "validation_strategy": TRUELIST_BATCH_STRATEGY,  # "accurate" or "fast"
+                "name": unique_name  # Unique name prevents duplicate detection
+            }
+            
+            print(f"   📤 POST {url} (JSON format)")
+            print(f"   📋 Batch name: {unique_name}")
+            print(f"   📋 Strategy: {TRUELIST_BATCH_STRATEGY}")
+            print(f"   📊 Email count: {len(valid_emails)}")
+            
+            async with session.post(
+                url, 
+                headers=headers, 
+                json=json_payload,  # Use JSON format (file upload returns 500)
+                timeout=60,  # 60s timeout for batch submission
+                proxy=HTTP_PROXY_URL
+            ) as response:
+                
+                # Handle error responses
+                if response.status == 401:
+                    raise EmailVerificationUnavailableError("TrueList API: Invalid or expired API key")
+                elif response.status == 402:
+                    raise EmailVerificationUnavailableError("TrueList API: Insufficient credits")
+                elif response.status == 429:
+                    raise EmailVerificationUnavailableError("TrueList API: Rate limited")
+                elif response.status >= 500:
+                    raise EmailVerificationUnavailableError(f"TrueList API server error: HTTP {response.status}")
+                elif response.status != 200:
+                    error_text = await response.text()
+                    raise EmailVerificationUnavailableError(f"TrueList API error: HTTP {response.status} - {error_text[:200]}")
+                
+                # Parse successful response
+                data = await response.json()
+                
+                batch_id = data.get("id")
+                batch_state = data.get("batch_state", "unknown")
+                email_count = data.get("email_count", 0)
+                
+                if not batch_id:
+                    raise EmailVerificationUnavailableError("TrueList API: No batch_id in response")
+                
+                print(f"   ✅ Batch created successfully!")
+                print(f"   🆔 Batch ID: {batch_id}")
+                print(f"   📊 State: {batch_state}")
+                print(f"   📧 Emails queued: {email_count}")
+                
+                return batch_id
+    
+    except aiohttp.ClientError as e:
+        raise EmailVerificationUnavailableError(f"TrueList batch submission network error: {str(e)}")
+    except asyncio.TimeoutError:
+        raise EmailVerificationUnavailableError("TrueList batch submission timed out (60s)")
+    except EmailVerificationUnavailableError:
+        raise
+    except Exception as e:
+        raise EmailVerificationUnavailableError(f"TrueList batch submission error: {str(e)}")
+
+
+async def poll_truelist_batch(batch_id: str) -> Dict[str, dict]:
+    """
+    Poll TrueList batch until completion or timeout.
+    
+    This function polls the batch status every TRUELIST_BATCH_POLL_INTERVAL seconds
+    until the batch is complete or TRUELIST_BATCH_TIMEOUT is reached. When complete,
+    it downloads and parses the annotated CSV to get per-email results.
+    
+    API Reference: https://apidocs.truelist.io/#tag/Batch-email-validation
+    
+    Args:
+        batch_id: UUID of the batch to poll (from submit_truelist_batch)
+    
+    Returns:
+        Dict mapping email -> result dict:
+        {
+            "email@domain.com": {
+                "status": "email_ok",      # TrueList email_sub_state
+                "passed": True,            # True if email_ok
+                "needs_retry": False,      # True if unknown/timeout/error
+                "rejection_reason": None   # Rejection reason if failed
+            },
+            ...
+        }
+    
+    Raises:
+        EmailVerificationUnavailableError: If polling times out or batch fails
+    
+    Example:
+        batch_id = await submit_truelist_batch(emails)
+        results = await poll_truelist_batch(batch_id)
+        for email, result in results.items():
+            if result["passed"]:
+                print(f"{email} is valid")
+    """
+    import time
+    import csv
+    from io import StringIO
+    
+    if not batch_id:
+        raise ValueError("No batch_id provided for polling")
+    
+    if not TRUELIST_API_KEY:
+        raise EmailVerificationUnavailableError("TRUELIST_API_KEY not configured")
+    
+    url = f"https://api.truelist.io/api/v1/batches/{batch_id}"
+    headers = {"Authorization": f"Bearer {TRUELIST_API_KEY}"}
+    
+    start_time = time.time()
+    poll_count = 0
+    
+    print(f"\n⏳ TrueList Batch: Polling for completion...")
+    print(f"   🆔 Batch ID: {batch_id}")
+    print(f"   ⏱️  Poll interval: {TRUELIST_BATCH_POLL_INTERVAL}s")
+    print(f"   ⏰ Timeout: {TRUELIST_BATCH_TIMEOUT // 60} minutes")
+    
+    while True:
+        elapsed = time.time() - start_time
+        
+        # Check timeout
+        if elapsed >= TRUELIST_BATCH_TIMEOUT:
+            raise EmailVerificationUnavailableError(
+                f"TrueList batch polling timed out after {TRUELIST_BATCH_TIMEOUT // 60} minutes"
+            )
+        
+        poll_count += 1
+        
+        try:
+            async with pooled_session("truelist") as session:
+                async with session.get(
+                    url, 
+                    headers=headers, 
+                    timeout=30,
+                    proxy=HTTP_PROXY_URL
+                ) as response:
+                    
+                    if response.status == 404:
+                        raise EmailVerificationUnavailableError(f"TrueList batch not found: {batch_id}")
+                    elif response.status == 401:
+                        raise EmailVerificationUnavailableError("TrueList API: Invalid or expired API key")
+                    elif response.status >= 500:
+                        # Server error - retry polling
+                        print(f"   ⚠️  Poll #{poll_count}: Server error (HTTP {response.status}), retrying...")
+                        await asyncio.sleep(TRUELIST_BATCH_POLL_INTERVAL)
+                        continue
+                    elif response.status != 200:
+                        error_text = await response.text()
+                        raise EmailVerificationUnavailableError(
+                            f"TrueList API error: HTTP {response.status} - {error_text[:200]}"
+                        )
+                    
+                    # Success (HTTP 200) - parse JSON response
+                    data = await response.json()
+                    
+                    batch_state = data.get("batch_state", "unknown")
+                    email_count = data.get("email_count", 0)
+                    processed_count = data.get("processed_count", 0)
+                    ok_count = data.get("ok_count", 0)
+                    unknown_count = data.get("unknown_count", 0)
+                    
+                    # Progress update every 5 polls or when state changes
+                    if poll_count % 5 == 1 or batch_state == "completed":
+                        progress_pct = (processed_count / email_count * 100) if email_count > 0 else 0
+                        print(f"   📊 Poll #{poll_count} ({elapsed:.0f}s): {batch_state} - {processed_count}/{email_count} ({progress_pct:.0f}%)")
+                    
+                    # Check if batch is complete
+                    # CRITICAL: TrueList may say "completed" before all emails are processed!
+                    # We must check BOTH state AND processed_count
+                    if batch_state == "completed" and processed_count >= email_count:
+                        print(f"   ✅ Batch fully completed!")
+                        print(f"   📧 Total: {email_count}, OK: {ok_count}, Unknown: {unknown_count}")
+                    elif batch_state == "completed" and processed_count < email_count:
+                        # TrueList says completed but not all processed - keep polling!
+                        print(f"   ⚠️ Batch says 'completed' but only {processed_count}/{email_count} processed - continuing to poll...")
+                        await asyncio.sleep(TRUELIST_BATCH_POLL_INTERVAL)
+                        continue
+                    
+                    if batch_state == "completed":
+                        
+                        # CRITICAL: Wait for CSV generation to finish
+                        # TrueList's "completed" state doesn't mean CSV is ready
+                        # CSV generation happens asynchronously after processing
+                        CSV_GENERATION_DELAY = 15  # seconds
+                        print(f"   ⏳ Waiting {CSV_GENERATION_DELAY}s for CSV generation...")
+                        await asyncio.sleep(CSV_GENERATION_DELAY)
+                        
+                        # Re-fetch batch data to get fresh CSV URLs
+                        print(f"   🔄 Re-fetching batch data for fresh CSV URLs...")
+                        async with session.get(url, headers=headers, timeout=30, proxy=HTTP_PROXY_URL) as refresh_response:
+                            if refresh_response.status == 200:
+                                data = await refresh_response.json()
+                        
+                        # ============================================================
+                        # FALLBACK: CSV downloads (the /emails endpoint returns 404)
+                        # ============================================================
+                        
+                        # Get the annotated CSV URL - try multiple possible fields
+                        annotated_csv_url = (
+                            data.get("annotated_csv_url") or 
+                            data.get("results_url") or 
+                            data.get("download_url") or
+                            data.get("csv_url")
+                        )
+                        
+                        if not annotated_csv_url:
+                            # CSV URL is null - TrueList may still be generating it
+                            # Wait and retry polling - TrueList CSV generation is ASYNC
+                            # and can take 30-60+ seconds after batch shows "completed"
+                            CSV_URL_RETRY_DELAY = 10  # seconds
+                            CSV_URL_MAX_RETRIES = 6   # Total: 60 seconds of waiting
+                            
+                            for csv_retry in range(CSV_URL_MAX_RETRIES):
+                                print(f"   ⚠️  No CSV URL in response, waiting {CSV_URL_RETRY_DELAY}s and retrying ({csv_retry + 1}/{CSV_URL_MAX_RETRIES})...")
+                                await asyncio.sleep(CSV_URL_RETRY_DELAY)
+                                
+                                # Re-poll the batch
+                                async with session.get(url, headers=headers, timeout=30, proxy=HTTP_PROXY_URL) as retry_response:
+                                    if retry_response.status == 200:
+                                        retry_data = await retry_response.json()
+                                        annotated_csv_url = retry_data.get("annotated_csv_url")
+                                        if annotated_csv_url:
+                                            print(f"   ✅ CSV URL now available after retry!")
+                                            data = retry_data  # Update data for later use
+                                            break
+                            
+                            if not annotated_csv_url:
+                                # ================================================================
+                                # FALLBACK: Combine multiple CSV files when annotated_csv_url is null
+                                # TrueList provides separate CSVs for different email categories:
+                                # - highest_reach_csv_url: email_ok + accept_all emails
+                                # - only_invalid_csv_url: failed emails (failed_mx, failed_no_mailbox, etc)
+                                # By combining these, we can reconstruct all email results!
+                                # ================================================================
+                                print(f"   ⚠️  annotated_csv_url is null - trying to combine alternative CSVs...")
+                                
+                                combined_results = {}
+                                
+                                # Try highest_reach_csv_url (contains ok + accept_all)
+                                highest_reach_url = data.get("highest_reach_csv_url")
+                                if highest_reach_url:
+                                    print(f"   📥 Downloading highest_reach CSV...")
+                                    try:
+                                        reach_results = await _download_and_parse_batch_csv(highest_reach_url, headers)
+                                        if reach_results:
+                                            print(f"   ✅ Got {len(reach_results)} emails from highest_reach CSV")
+                                            combined_results.update(reach_results)
+                                    except Exception as e:
+                                        print(f"   ⚠️  highest_reach CSV failed: {str(e)[:50]}")
+                                
+                                # Try only_invalid_csv_url (contains failed emails)
+                                invalid_url = data.get("only_invalid_csv_url")
+                                if invalid_url:
+                                    print(f"   📥 Downloading only_invalid CSV...")
+                                    try:
+                                        invalid_results = await _download_and_parse_batch_csv(invalid_url, headers)
+                                        if invalid_results:
+                                            print(f"   ✅ Got {len(invalid_results)} emails from only_invalid CSV")
+                                            combined_results.update(invalid_results)
+                                    except Exception as e:
+                                        print(f"   ⚠️  only_invalid CSV failed: {str(e)[:50]}")
+                                
+                                # Try safest_bet_csv_url as additional source (email_ok only)
+                                safest_url = data.get("safest_bet_csv_url")
+                                if safest_url and len(combined_results) < email_count:
+                                    print(f"   📥 Downloading safest_bet CSV...")
+                                    try:
+                                        safest_results = await _download_and_parse_batch_csv(safest_url, headers)
+                                        if safest_results:
+                                            # Only add emails we don't already have
+                                            new_count = 0
+                                            for email, result in safest_results.items():
+                                                if email not in combined_results:
+                                                    combined_results[email] = result
+                                                    new_count += 1
+                                            if new_count > 0:
+                                                print(f"   ✅ Got {new_count} additional emails from safest_bet CSV")
+                                    except Exception as e:
+                                        print(f"   ⚠️  safest_bet CSV failed: {str(e)[:50]}")
+                                
+                                if combined_results:
+                                    print(f"   🎉 Combined {len(combined_results)} total email results from alternative CSVs!")
+                                    return combined_results
+                                
+                                # If alternative CSVs also failed, try constructed URLs
+                                constructed_url = f"https://api.truelist.io/api/v1/batches/{batch_id}/download"
+                                print(f"   ⚠️  Alternative CSVs failed, trying constructed URL: {constructed_url}")
+                                
+                                try:
+                                    results = await _download_and_parse_batch_csv(constructed_url, headers)
+                                    if results:
+                                        print(f"   ✅ Constructed URL worked! Parsed {len(results)} email results")
+                                        return results
+                                except Exception as download_err:
+                                    print(f"   ⚠️  Constructed URL failed: {str(download_err)[:100]}")
+                                
+                                # Final fallback: Use batch stats (won't work for individual emails)
+                                print(f"   ❌ Could not download CSV results after all fallbacks. Full response:")
+                                print(f"   {json.dumps(data, default=str)[:500]}")
+                                return _parse_batch_status_from_response(data, batch_id)
+                        
+                        # Download and parse the CSV
+                        print(f"   📥 Downloading results from: {annotated_csv_url[:80]}...")
+                        results = await _download_and_parse_batch_csv(annotated_csv_url, headers)
+                        
+                        print(f"   ✅ Parsed {len(results)} email results")
+                        
+                        # CRITICAL FIX: If CSV has fewer results than expected, use fallback CSVs
+                        if len(results) < email_count:
+                            print(f"   ⚠️  CSV only had {len(results)}/{email_count} emails - using fallback CSVs...")
+                            
+                            combined_results = {}
+                            
+                            # Try highest_reach_csv_url (contains ok + accept_all)
+                            highest_reach_url = data.get("highest_reach_csv_url")
+                            if highest_reach_url:
+                                print(f"   📥 Fallback: Downloading highest_reach CSV...")
+                                try:
+                                    reach_results = await _download_and_parse_batch_csv(highest_reach_url, headers)
+                                    if reach_results:
+                                        print(f"   ✅ Got {len(reach_results)} emails from highest_reach CSV")
+                                        combined_results.update(reach_results)
+                                except Exception as e:
+                                    print(f"   ⚠️  highest_reach CSV failed: {str(e)[:50]}")
+                            
+                            # Try only_invalid_csv_url (contains failed emails)
+                            invalid_url = data.get("only_invalid_csv_url")
+                            if invalid_url:
+                                print(f"   📥 Fallback: Downloading only_invalid CSV...")
+                                try:
+                                    invalid_results = await _download_and_parse_batch_csv(invalid_url, headers)
+                                    if invalid_results:
+                                        print(f"   ✅ Got {len(invalid_results)} emails from only_invalid CSV")
+                                        combined_results.update(invalid_results)
+                                except Exception as e:
+                                    print(f"   ⚠️  only_invalid CSV failed: {str(e)[:50]}")
+                            
+                            # Try safest_bet_csv_url as additional source
+                            safest_url = data.get("safest_bet_csv_url")
+                            if safest_url and len(combined_results) < email_count:
+                                print(f"   📥 Fallback: Downloading safest_bet CSV...")
+                                try:
+                                    safest_results = await _download_and_parse_batch_csv(safest_url, headers)
+                                    if safest_results:
+                                        print(f"   ✅ Got {len(safest_results)} emails from safest_bet CSV")
+                                        for email, result in safest_results.items():
+                                            if email not in combined_results:
+                                                combined_results[email] = result
+                                except Exception as e:
+                                    print(f"   ⚠️  safest_bet CSV failed: {str(e)[:50]}")
+                            
+                            if combined_results:
+                                print(f"   ✅ Combined fallback CSVs: {len(combined_results)} total emails")
+                                return combined_results
+                            else:
+                                print(f"   ❌ All fallback CSVs failed or empty")
+                                # Return empty results - will trigger retry logic
+                        
+                        return results
+                    
+                    elif batch_state == "failed":
+                        raise EmailVerificationUnavailableError(
+                            f"TrueList batch failed: {data.get('error', 'Unknown error')}"
+                        )
+                    
+                    # Still processing - wait and poll again
+                    await asyncio.sleep(TRUELIST_BATCH_POLL_INTERVAL)
+        
+        except EmailVerificationUnavailableError:
+            raise
+        except aiohttp.ClientError as e:
+            # Network error - retry polling
+            print(f"   ⚠️  Poll #{poll_count}: Network error ({str(e)[:50]}), retrying...")
+            await asyncio.sleep(TRUELIST_BATCH_POLL_INTERVAL)
+        except asyncio.TimeoutError:
+            # Timeout on single request - retry polling
+            print(f"   ⚠️  Poll #{poll_count}: Request timeout, retrying...")
+            await asyncio.sleep(TRUELIST_BATCH_POLL_INTERVAL)
+        except Exception as e:
+            print(f"   ⚠️  Poll #{poll_count}: Unexpected error ({str(e)[:50]}), retrying...")
+            await asyncio.sleep(TRUELIST_BATCH_POLL_INTERVAL)
+
+
+async def _download_and_parse_batch_csv(csv_url: str, headers: dict) -> Dict[str, dict]:
+    """
+    Download and parse TrueList annotated CSV results.
+    
+    IMPORTANT: CSV downloads are done WITHOUT proxy because TrueList's
+    S3 signed URLs may not work correctly through proxy servers.
+    The API calls (submit, poll) still use proxy for rate limit protection.
+    
+    Args:
+        csv_url: URL to the annotated CSV file
+        headers: Auth headers for the request
+    
+    Returns:
+        Dict mapping email -> result dict
+    """
+    import csv
+    from io import StringIO
+    
+    try:
+        async with pooled_session("truelist_csv") as session:
+            # NOTE: NO PROXY for CSV downloads - S3 signed URLs don't work through proxies
+            async with session.get(
+                csv_url, 
+                headers=headers, 
+                timeout=60
+                # proxy removed - CSVs must be downloaded directly
+            ) as response:
+                
+                if response.status != 200:
+                    raise EmailVerificationUnavailableError(
+                        f"Failed to download batch CSV: HTTP {response.status}"
+                    )
+                
+                csv_content = await response.text()
+                
+                return parse_truelist_batch_csv(csv_content)
+    
+    except aiohttp.ClientError as e:
+        raise EmailVerificationUnavailableError(f"Failed to download batch CSV: {str(e)}")
+    except asyncio.TimeoutError:
+        raise EmailVerificationUnavailableError("Batch CSV download timed out")
+
+
+async def _fetch_batch_email_results(batch_id: str, headers: dict, email_count: int) -> Dict[str, dict]:
+    """
+    Fetch email results using TrueList's /emails endpoint with pagination.
+    
+    This is the CORRECT way to retrieve individual email results per the API docs:
+    GET /api/v1/batches/{batch_uuid}/emails
+    
+    Args:
+        batch_id: UUID of the completed batch
+        headers: Auth headers with Bearer token
+        email_count: Expected number of emails (for progress reporting)
+    
+    Returns:
+        Dict mapping email -> result dict with status, passed, needs_retry
+    """
+    # Define which statuses pass, fail, or need retry
+    PASS_STATUSES = {"email_ok"}
+    RETRY_STATUSES = {"unknown", "unknown_error", "timeout", "error"}
+    
+    results = {}
+    page = 1
+    per_page = 100  # Maximum allowed per the docs
+    
+    print(f"   📥 Fetching email results via /emails endpoint (paginated)...")
+    
+    try:
+        async with pooled_session("truelist") as session:
+            while True:
+                url = f"https://api.truelist.io/api/v1/batches/{batch_id}/emails?page={page}&per_page={per_page}"
+                
+                async with session.get(url, headers=headers, timeout=30, proxy=HTTP_PROXY_URL) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        print(f"   ⚠️ /emails endpoint returned HTTP {response.status}: {error_text[:100]}")
+                        break
+                    
+                    data = await response.json()
+                    email_addresses = data.get("email_addresses", [])
+                    
+                    if not email_addresses:
+                        # No more results
+                        break
+                    
+                    # Process each email result
+                    for email_data in email_addresses:
+                        # The email object structure from the API
+                        email = email_data.get("email_address", email_data.get("email", "")).lower()
+                        if not email:
+                            continue
+                        
+                        email_state = email_data.get("email_state", "unknown")
+                        email_sub_state = email_data.get("email_sub_state", email_state)
+                        
+                        # Determine pass/fail/retry
+                        if email_sub_state in PASS_STATUSES:
+                            results[email] = {
+                                "status": email_sub_state,
+                                "passed": True,
+                                "needs_retry": False,
+                                "rejection_reason": None
+                            }
+                        elif email_sub_state in RETRY_STATUSES:
+                            results[email] = {
+                                "status": email_sub_state,
+                                "passed": False,
+                                "needs_retry": True,
+                                "rejection_reason": None
+                            }
+                        else:
+                            # Failed status
+                            results[email] = {
+                                "status": email_sub_state,
+                                "passed": False,
+                                "needs_retry": False,
+                                "rejection_reason": {
+                                    "stage": "Stage 3",
+                                    "check_name": "truelist_email_verification",
+                                    "message": f"Email verification failed: {email_sub_state}",
+                                    "truelist_status": email_sub_state
+                                }
+                            }
+                    
+                    print(f"   📄 Page {page}: Got {len(email_addresses)} emails (total so far: {len(results)})")
+                    
+                    # Check if we got all expected emails
+                    if len(results) >= email_count:
+                        break
+                    
+                    # Check if this was the last page (fewer than per_page results)
+                    if len(email_addresses) < per_page:
+                        break
+                    
+                    page += 1
+                    
+                    # Small delay between pages to avoid rate limiting
+                    await asyncio.sleep(0.5)
+        
+        print(f"   ✅ Fetched {len(results)}/{email_count} email results via API")
+        return results
+        
+    except Exception as e:
+        print(f"   ⚠️ Error fetching email results: {str(e)[:100]}")
+        return results
+
+
+def parse_truelist_batch_csv(csv_content: str) -> Dict[str, dict]:
+    """
+    Parse TrueList annotated CSV into email -> result mapping.
+    
+    Maps TrueList statuses to our internal format:
+    - email_ok → passed=True
+    - accept_all, disposable, failed_* → passed=False  
+    - unknown, timeout, error → needs_retry=True
+    
+    Args:
+        csv_content: Raw CSV content from TrueList
+    
+    Returns:
+        Dict mapping email -> result dict with status, passed, needs_retry, rejection_reason
+    """
+    import csv
+    from io import StringIO
+    
+    results = {}
+    
+    # Define which statuses pass, fail, or need retry
+    PASS_STATUSES = {"email_ok"}
+    RETRY_STATUSES = {"unknown", "unknown_error", "timeout", "error"}
+    # All other statuses are considered failures
+    
+    try:
+        reader = csv.DictReader(StringIO(csv_content))
+        
+        # Debug: Print first few lines and column names
+        rows = list(reader)
+        if rows:
+            print(f"   📋 CSV columns: {list(rows[0].keys())}")
+            print(f"   📋 First row: {dict(list(rows[0].items())[:5])}")  # First 5 fields
+        else:
+            print(f"   ⚠️ CSV is empty! Content preview: {csv_content[:200]}")
+        
+        for row in rows:
+            # TrueList CSV has columns: Try multiple column name formats
+            # API may use different column names: "Email Address", "email", "Email", etc.
+            email = (row.get("Email Address") or row.get("email") or 
+                     row.get("Email") or row.get("email_address") or "").strip().lower()
+            
+            if not email:
+                continue
+            
+            # Get the detailed status - try multiple column name formats
+            # TrueList uses "Email Sub-State" or "Email State"
+            status = (row.get("Email Sub-State") or row.get("email_sub_state") or
+                      row.get("Email State") or row.get("email_state") or 
+                      row.get("sub_state") or row.get("state") or "unknown")
+            status = status.lower() if status else "unknown"
+            
+            # Determine pass/fail/retry
+            if status in PASS_STATUSES:
+                results[email] = {
+                    "status": status,
+                    "passed": True,
+                    "needs_retry": False,
+                    "rejection_reason": None
+                }
+            elif status in RETRY_STATUSES:
+                results[email] = {
+                    "status": status,
+                    "passed": False,
+                    "needs_retry": True,
+                    "rejection_reason": None  # Don't reject - will retry
+                }
+            else:
+                # Failed status - build rejection reason
+                rejection_reason = _build_email_rejection_reason(status)
+                results[email] = {
+                    "status": status,
+                    "passed": False,
+                    "needs_retry": False,
+                    "rejection_reason": rejection_reason
+                }
+        
+        return results
+    
+    except Exception as e:
+        raise EmailVerificationUnavailableError(f"Failed to parse batch CSV: {str(e)}")
+
+
+def _parse_batch_status_from_response(data: dict, batch_id: str) -> Dict[str, dict]:
+    """
+    Fallback: Parse batch results from API response when CSV URL is not available.
+    
+    This is used when annotated_csv_url is missing from the response.
+    Returns aggregate counts but may not have per-email details.
+    
+    Args:
+        data: Batch API response data
+        batch_id: Batch ID for logging
+    
+    Returns:
+        Dict with limited results (may need alternative approach)
+    """
+    print(f"   ⚠️  Using fallback batch parsing (no CSV URL)")
+    
+    # This is a fallback - in practice, TrueList should always provide the CSV URL
+    # Log a warning and return empty results to trigger retry logic
+    email_count = data.get("email_count", 0)
+    ok_count = data.get("ok_count", 0)
+    unknown_count = data.get("unknown_count", 0)
+    
+    print(f"   📊 Batch stats: {email_count} total, {ok_count} ok, {unknown_count} unknown")
+    print(f"   ⚠️  Cannot map to individual emails without CSV - returning empty results")
+    
+    # Return empty dict - the orchestrator should handle this case
+    return {}
+
+
+def _build_email_rejection_reason(status: str) -> dict:
+    """
+    Build a rejection reason dict for a failed email status.
+    
+    Maps TrueList statuses to user-friendly rejection messages.
+    
+    Args:
+        status: TrueList email_sub_state value
+    
+    Returns:
+        Rejection reason dict compatible with our validation format
+    """
+    # Map TrueList statuses to rejection messages
+    # Note: TrueList uses both "disposable" and "is_disposable" for different cases
+    status_messages = {
+        "accept_all": "Email is catch-all/accept-all (instant rejection)",
+        "disposable": "Email is from a disposable provider",
+        "is_disposable": "Email is from a disposable provider",
+        "failed_no_mailbox": "Mailbox does not exist",
+        "failed_syntax_check": "Invalid email syntax",
+        "failed_mx_check": "Domain has no MX records (cannot receive email)",
+        "role": "Email is a role-based address (e.g., info@, support@)",
+        "invalid": "Email is invalid",
+        "spam_trap": "Email is a known spam trap",
+        "complainer": "Email owner is a known complainer",
+        "ok_for_all": "Email domain accepts all emails (catch-all)",
+    }
+    
+    message = status_messages.get(status, f"Email status '{status}' (only 'email_ok' accepted)")
+    
+    return {
+        "stage": "Stage 3: TrueList Batch",
+        "check_name": "truelist_batch_validation",
+        "message": message,
+        "failed_fields": ["email"],
+        "truelist_status": status
+    }
+
+
+# ============================================================================
+# Batch Helper Functions
+# ============================================================================
+
+async def submit_and_poll_truelist(emails: List[str]) -> Tuple[str, Dict[str, dict]]:
+    """
+    Submit batch and poll for results (combined for background task).
+    
+    This wrapper combines submit_truelist_batch() and poll_truelist_batch()
+    for use with asyncio.create_task() in the batch orchestrator.
+    
+    Args:
+        emails: List of email addresses to validate
+    
+    Returns:
+        Tuple of (batch_id, results_dict) where results_dict maps email -> result
+        batch_id is returned so caller can delete the batch before retrying
+    """
+    batch_id = await submit_truelist_batch(emails)
+    results = await poll_truelist_batch(batch_id)
+    return batch_id, results
+
+
+async def verify_emails_inline(emails: List[str]) -> Dict[str, dict]:
+    """
+    Verify emails using TrueList's INLINE verification API (not batch).
+    
+    This is a FALLBACK for emails that TrueList's batch API silently drops.
+    Some enterprise domains (spglobal.com, jacobs.com, etc.) work with inline
+    verification but not batch verification.
+    
+    Rate limit: 10 requests/second per TrueList docs.
+    Each request can verify up to 3 emails.
+    
+    Args:
+        emails: List of email addresses to verify
+    
+    Returns:
+        Dict mapping email -> result dict with status, passed, needs_retry
+    """
+    if not TRUELIST_API_KEY:
+        print("   ⚠️ TRUELIST_API_KEY not configured for inline verification")
+        return {email: {"needs_retry": True, "error": "No API key"} for email in emails}
+    
+    results = {}
+    headers = {"Authorization": f"Bearer {TRUELIST_API_KEY}"}
+    
+    # TrueList inline API accepts up to 3 emails per request (space-separated)
+    BATCH_SIZE = 3
+    PASS_STATUSES = {"email_ok"}  # Only email_ok passes - accept_all is rejected
+    RETRY_STATUSES = {"unknown", "unknown_error", "timeout", "error", "failed_greylisted"}
+    
+    print(f"   🔍 Inline verification for {len(emails)} emails (TrueList batch fallback)...")
+    import time as _time
+    _start = _time.time()
+    
+    try:
+        async with pooled_session("truelist") as session:
+            for i in range(0, len(emails), BATCH_SIZE):
+                batch = emails[i:i+BATCH_SIZE]
+                email_param = " ".join(batch)
+                
+                url = f"https://api.truelist.io/api/v1/verify_inline?email={email_param}"
+                
+                try:
+                    async with session.post(url, headers=headers, timeout=35, proxy=HTTP_PROXY_URL) as response:
+                        if response.status == 429:
+                            # The rate governor cuts TrueList's host-wide rate (and honours Retry-After)
+                            print(f"   ⚠️ Rate limited, backing off...")
+                            continue
+                        
+                        if response.status != 200:
+                            error_text = await response.text()
+                            print(f"   ⚠️ Inline verify failed ({response.status}): {error_text[:50]}")
+                            for email in batch:
+                                results[email.lower()] = {"needs_retry": True, "error": f"HTTP {response.status}"}
+                            continue
+                        
+                        data = await response.json()
+                        email_results = data.get("emails", [])
+                        
+                        # DEBUG: Log first response to see actual structure
+                        if i == 0 and email_results:
+                            print(f"   📋 Inline API first response: {email_results[0]}")
+                        
+                        for email_data in email_results:
+                            # TrueList inline uses "address" not "email_address"
+                            email = email_data.get("address", email_data.get("email_address", email_data.get("email", ""))).lower()
+                            if not email:
+                                continue
+                            
+                            email_state = email_data.get("email_state", "unknown")
+                            email_sub_state = email_data.get("email_sub_state", email_state)
+                            
+                            # DEBUG: Log non-email_ok statuses
+                            if email_sub_state != "email_ok":
+                                print(f"   📋 Inline status: {email} -> {email_state}/{email_sub_state}")
+                            
+                            if email_sub_state in PASS_STATUSES:
+                                results[email] = {
+                                    "status": email_sub_state,
+                                    "passed": True,
+                                    "needs_retry": False,
+                                    "rejection_reason": None
+                                }
+                            elif email_sub_state in RETRY_STATUSES:
+                                results[email] = {
+                                    "status": email_sub_state,
+                                    "passed": False,
+                                    "needs_retry": True,
+                                    "rejection_reason": None
+                                }
+                            else:
+                                results[email] = {
+                                    "status": email_sub_state,
+                                    "passed": False,
+                                    "needs_retry": False,
+                                    "rejection_reason": {
+                                        "stage": "Stage 3",
+                                        "check_name": "truelist_inline_verification",
+                                        "message": f"Email verification failed: {email_sub_state}",
+                                        "truelist_status": email_sub_state
+                                    }
+                                }
+                                
+                except asyncio.TimeoutError:
+                    print(f"   ⚠️ Inline verify timeout for: {batch}")
+                    for email in batch:
+                        results[email.lower()] = {"needs_retry": True, "error": "timeout"}
+                except Exception as e:
+                    print(f"   ⚠️ Inline verify error: {e}")
+                    for email in batch:
+                        results[email.lower()] = {"needs_retry": True, "error": str(e)}
+                # Requests are paced host-wide by the rate governor (http_client)
+        
+        passed = sum(1 for r in results.values() if r.get("passed"))
+        elapsed = _time.time() - _start
+        print(f"   ✅ Inline verification: {passed}/{len(emails)} passed ({elapsed:.1f}s)")
+        return results
+        
+    except Exception as e:
+        print(f"   ⚠️ Inline verification error: {e}")
+        return {email.lower(): {"needs_retry": True, "error": str(e)} for email in emails}
+
+
+async def retry_truelist_batch(emails: List[str], prev_batch_id: str = None) -> Tuple[str, Dict[str, dict]]:
+    """
+    Submit a retry batch and poll for results.
+    
+    IMPORTANT: If prev_batch_id is provided, deletes it first to clear
+    TrueList's duplicate detection before submitting the retry.
+    
+    On exception, marks all emails as needs_retry=True so the orchestrator
+    can decide whether to retry again or skip.
+    
+    Args:
+        emails: List of email addresses to retry validation
+        prev_batch_id: Optional batch_id from previous retry to delete first
+    
+    Returns:
+        Tuple of (batch_id, results_dict)
+        On error, returns (None, {email: needs_retry=True})
+    """
+    try:
+        # Delete previous retry batch if provided (clears duplicate detection)
+        if prev_batch_id:
+            await delete_truelist_batch(prev_batch_id)
+        
+        batch_id = await submit_truelist_batch(emails)
+        results = await poll_truelist_batch(batch_id)
+        return batch_id, results
+    except Exception as e:
+        print(f"   ⚠️  Retry batch failed: {str(e)[:100]}")
+        # On error, mark all as needing retry (orchestrator will decide next step)
+        return None, {email: {"needs_retry": True, "error": str(e)} for email in emails}
+
+
+async def submit_and_poll_truelist(emails: List[str]) -> Tuple[str, Dict[str, dict]]:
+    """
+    Submit batch and poll for results (combined for background task).
+    
+    This is a helper function that combines submit_truelist_batch() and
+    poll_truelist_batch() for use with asyncio.create_task().
+    
+    Args:
+        emails: List of email addresses to validate
+    
+    Returns:
+        Tuple of (batch_id, results_dict) where results_dict maps email -> result
+        batch_id is returned so caller can delete the batch before retrying
+    """
+    batch_id = await submit_truelist_batch(emails)
+    results = await poll_truelist_batch(batch_id)
+    return batch_id, results
+
+
+async def delete_truelist_batch(batch_id: str) -> bool:
+    """
+    Delete a TrueList batch.
+    
+    IMPORTANT: This must be called before retrying emails that were in the batch.
+    TrueList detects duplicate email content and rejects re-submissions.
+    Deleting the batch clears TrueList's duplicate detection for those emails.
+    
+    Args:
+        batch_id: The batch ID to delete
+    
+    Returns:
+        True if deleted successfully, False otherwise
+    """
+    if not batch_id:
+        return False
+    
+    url = f"https://api.truelist.io/api/v1/batches/{batch_id}"
+    headers = {"Authorization": f"Bearer {TRUELIST_API_KEY}"}
+    
+    try:
+        async with pooled_session("truelist") as session:
+            async with session.delete(url, headers=headers, timeout=30, proxy=HTTP_PROXY_URL) as response:
+                if response.status == 204:
+                    print(f"   🗑️ Deleted batch {batch_id[:8]}... (clearing duplicate detection)")
+                    return True
+                else:
+                    print(f"   ⚠️ Failed to delete batch {batch_id[:8]}... (status {response.status})")
+                    return False
+    except Exception as e:
+        print(f"   ⚠️ Error deleting batch: {str(e)[:50]}")
+        return False
+
+
+async def delete_all_truelist_batches() -> int:
+    """
+    Delete ALL TrueList batches to clear duplicate detection.
+    
+    CRITICAL: TrueList detects duplicate emails across ALL batches ever submitted.
+    Even if a batch is "completed", TrueList remembers the emails and may return
+    incomplete CSV results for subsequent batches containing the same emails.
+    
+    This function queries all batches and deletes them one by one.
+    Should be called before submitting a new batch in each epoch.
+    
+    Returns:
+        Number of batches deleted
+    """
+    url = "https://api.truelist.io/api/v1/batches"
+    headers = {"Authorization": f"Bearer {TRUELIST_API_KEY}"}
+    deleted_count = 0
+    
+    try:
+        async with pooled_session("truelist") as session:
+            # Get list of all batches
+            async with session.get(url, headers=headers, timeout=30, proxy=HTTP_PROXY_URL) as response:
+                if response.status != 200:
+                    print(f"   ⚠️ Failed to list batches (status {response.status})")
+                    return 0
+                
+                data = await response.json()
+                batches = data.get("batches", [])
+                
+                if not batches:
+                    print(f"   ✅ No old batches to delete")
+                    return 0
+                
+                print(f"   🗑️ Deleting {len(batches)} old TrueList batches to clear duplicate detection...")
+                
+                # Delete each batch
+                for batch in batches:
+                    batch_id = batch.get("id")
+                    if batch_id:
+                        delete_url = f"{url}/{batch_id}"
+                        try:
+                            async with session.delete(delete_url, headers=headers, timeout=10, proxy=HTTP_PROXY_URL) as del_response:
+                                if del_response.status == 204:
+                                    deleted_count += 1
+                        except Exception:
+                            pass  # Silently skip failed deletes
+                
+                print(f"   ✅ Deleted {deleted_count}/{len(batches)} batches")
+                return deleted_count
+                
+    except Exception as e:
+        print(f"   ⚠️ Error deleting batches: {str(e)[:50]}")
+        return deleted_count
+
+
+async def retry_truelist_batch(emails: List[str], prev_batch_id: str = None) -> Tuple[str, Dict[str, dict]]:
+    """
+    Submit a retry batch and poll for results.
+    
+    IMPORTANT: If prev_batch_id is provided, deletes it first to clear
+    TrueList's duplicate detection before submitting the retry.
+    
+    Args:
+        emails: List of email addresses to retry
+        prev_batch_id: Optional batch_id from previous retry to delete first
+    
+    Returns:
+        Tuple of (batch_id, results_dict)
+        On error, returns (None, {email: needs_retry=True})
+    """
+    try:
+        # Delete previous retry batch if provided (clears duplicate detection)
+        if prev_batch_id:
+            await delete_truelist_batch(prev_batch_id)
+        
+        batch_id = await submit_truelist_batch(emails)
+        results = await poll_truelist_batch(batch_id)
+        return batch_id, results
+    except Exception as e:
+        print(f"   ⚠️ Retry batch error: {e}")
+        # On error, mark all as needing retry
+        return None, {email: {"needs_retry": True, "error": str(e)} for email in emails}
+
+
+# Stage 0 checks that only read the lead itself (no network, deterministic), in canonical
+# order: a lead failing any of them is rejected before Stage 3, whatever its email result
+TRUELIST_SCREEN_CHECKS = [
+    check_required_fields,
+    check_email_regex,
+    check_name_email_match,
+    check_general_purpose_email,
+    check_free_email_domain,
+    check_disposable,
+]
+
+
+async def _publish_partial(on_partial: Callable[[Dict[str, dict]], Awaitable[None]], results: Dict[str, dict]):
+    """Hand resolved TrueList results to on_partial; a failing subscriber never fails the batch."""
+    resolved = {email: result for email, result in results.items() if not result.get("needs_retry")}
+    if not resolved:
+        return
+    try:
+        await on_partial(resolved)
+    except Exception as e:
+        print(f"   ⚠️ Partial TrueList publish failed: {e}")
+
+
+async def run_centralized_truelist_batch(
+    leads: List[dict],
+    on_partial: Optional[Callable[[Dict[str, dict]], Awaitable[None]]] = None
+) -> Dict[str, dict]:
+    """
+    COORDINATOR ONLY: Run TrueList batch on ALL leads at once.
+    
+    This function extracts all emails from leads, submits them to TrueList,
+    handles retries (up to 3 times), and falls back to inline verification.
+    
+    The coordinator calls this BEFORE distributing leads to workers.
+    Workers then receive the precomputed results with their leads.
+    
+    Flow:
+    1. Extract all valid emails from leads
+    2. Delete old TrueList batches (clean slate)
+    3. Submit batch with all emails
+    4. Poll for completion
+    5. Retry any emails with errors (up to 3 times total)
+    6. Fall back to inline verification for remaining errors
+    7. Return complete results dict
+    
+    Args:
+        leads: List of ALL lead dicts from gateway (e.g., 2700 leads)
+        on_partial: Optional async callback awaited with each set of newly
+                    resolved results (after every batch attempt and the inline
+                    fallback), so workers can receive them before the end
+    
+    Returns:
+        Dict mapping email (lowercase) -> result dict with:
+        - passed: bool
+        - status: str (email_ok, failed_*, etc.)
+        - needs_retry: bool (if unresolved)
+        - rejection_reason: dict (if failed)
+    
+    NOTE: This function is ONLY called by the coordinator.
+    Workers should use precomputed_email_results parameter of run_batch_automated_checks.
+    """
+    print(f"\n{'='*60}")
+    print(f"📧 COORDINATOR: Centralized TrueList batch for {len(leads)} leads")
+    print(f"{'='*60}")
+    
+    start_time = time.time()
+    
+    # ========================================================================
+    # Step 1: Extract all valid emails
+    # ========================================================================
+    emails = []
+    email_to_lead_idx = {}  # Track which lead each email came from (for debugging)
+    
+    # Emails whose leads all fail a free Stage 0 check never need Stage 3:
+    # the workers reject those leads in Stage 0 with the same reason as before
+    screened_out = await screen_truelist_emails(leads, TRUELIST_SCREEN_CHECKS, get_email)
+
+    for i, lead in enumerate(leads):
+        # Handle both formats: {"lead_blob": {...}} wrapper OR flat lead dict
+        lead_blob = lead.get("lead_blob", lead) if isinstance(lead, dict) else lead
+        email = get_email(lead_blob)
+        if email and '@' in email:
+            email_lower = email.lower()
+            if email_lower in screened_out:
+                continue
+            emails.append(email_lower)
+            email_to_lead_idx[email_lower] = i
+
+    print(f"   📧 Extracted {len(emails)} valid emails from {len(leads)} leads"
+          + (f" ({len(screened_out)} skipped: every lead fails Stage 0)" if screened_out else ""))
+    log_check_scheduler_stats()
+    
+    if not emails:
+        print(f"   ⚠️ No valid emails found - returning empty results")
+        return {}
+    
+    # ========================================================================
+    # Step 2: Clean up old TrueList batches
+    # ========================================================================
+    print(f"   🧹 Cleaning up old TrueList batches...")
+    await delete_all_truelist_batches()
+    
+    # ========================================================================
+    # Step 3: Submit batch and poll (with retries)
+    # ========================================================================
+    email_results = {}
+    batch_id = None
+    
+    # Try batch up to 3 times total
+    for batch_attempt in range(3):
+        try:
+            print(f"   🚀 Submitting TrueList batch (attempt {batch_attempt + 1}/3) for {len(emails)} emails...")
+            
+            batch_id = await submit_truelist_batch(emails)
+            results = await poll_truelist_batch(batch_id)
+            
+            # Merge results
+            email_results.update(results)
+            if on_partial:
+                await _publish_partial(on_partial, results)
+            
+            # Check for emails that need retry
+            needs_retry = []
+            for email in emails:
+                result = email_results.get(email)
+                if result is None or result.get("needs_retry"):
+                    needs_retry.append(email)
+            
+            print(f"   ✅ Batch {batch_attempt + 1} complete: {len(results)} results, {len(needs_retry)} need retry")
+            
+            if not needs_retry:
+                # All emails resolved
+                break
+            
+            if batch_attempt < 2:
+                # More retries available
+                print(f"   🔄 Retrying {len(needs_retry)} emails in 10s...")
+                
+                # Delete batch before retry (clears duplicate detection)
+                if batch_id:
+                    await delete_truelist_batch(batch_id)
+                    batch_id = None
+                
+                await asyncio.sleep(10)
+                emails = needs_retry  # Only retry failed emails
+            
+        except Exception as e:
+            print(f"   ❌ TrueList batch attempt {batch_attempt + 1} failed: {e}")
+            
+            # Delete batch before retry
+            if batch_id:
+                try:
+                    await delete_truelist_batch(batch_id)
+                except:
+                    pass
+                batch_id = None
+            
+            if batch_attempt < 2:
+                await asyncio.sleep(10 * (batch_attempt + 1))
+    
+    # ========================================================================
+    # Step 4: Inline fallback for remaining errors
+    # ========================================================================
+    needs_inline = []
+    for email in emails:
+        result = email_results.get(email)
+        if result is None or result.get("needs_retry"):
+            needs_inline.append(email)
+    
+    if needs_inline:
+        print(f"   🔄 Falling back to inline verification for {len(needs_inline)} emails...")
+        
+        try:
+            inline_results = await verify_emails_inline(needs_inline)
+            email_results.update(inline_results)
+            if on_partial:
+                await _publish_partial(on_partial, inline_results)
+            print(f"   ✅ Inline verification complete: {len(inline_results)} results")
+        except Exception as e:
+            print(f"   ❌ Inline verification failed: {e}")
+            # Mark remaining as unresolved
+            for email in needs_inline:
+                if email not in email_results or email_results[email].get("needs_retry"):
+                    email_results[email] = {
+                        "needs_retry": True,
+                        "error": f"All verification methods failed: {str(e)}"
+                    }
+    
+    # ========================================================================
+    # Step 5: Summary
+    # ========================================================================
+    elapsed = time.time() - start_time
+    elapsed_mins = int(elapsed // 60)
+    elapsed_secs = int(elapsed % 60)
+    
+    passed = sum(1 for r in email_results.values() if r.get("passed"))
+    failed = sum(1 for r in email_results.values() if not r.get("passed") and not r.get("needs_retry"))
+    unresolved = sum(1 for r in email_results.values() if r.get("needs_retry"))
+    
+    print(f"\n{'='*60}")
+    print(f"📊 CENTRALIZED TRUELIST COMPLETE")
+    print(f"{'='*60}")
+    print(f"   📦 Total leads from gateway: {len(leads)}")
+    print(f"   📧 Total emails processed: {len(email_results)}")
+    print(f"   ✅ Passed (email_ok): {passed}")
+    print(f"   ❌ Failed: {failed}")
+    print(f"   ⚠️  Unresolved: {unresolved}")
+    print(f"   ⏱️  TIME: {elapsed_mins}m {elapsed_secs}s ({elapsed:.1f} seconds total)")
+    print(f"{'='*60}\n")
+    
+    return email_results
@@ -0,0 +1,701 @@
+"""
+ICP definitions and the ICP multiplier / adjustment applied to the Rep Score.
+"""
+
+from Leadpoet.utils.utils_lead_extraction import get_employee_count
+
+from validator_models.automated_checks.stage5_matching import parse_employee_count
+
+
+# ========================================================================
+# ICP (Ideal Customer Profile) Definitions
+# ========================================================================
+# These are the target customer profiles we want to incentivize miners to find.
+# Leads matching these criteria receive a 1.5x multiplier on their rep_score during emissions.
+# Format: Each ICP is defined by Sub-Industry + Role Details
+# ========================================================================
+
+# ========================================================================
+# ICP (IDEAL CUSTOMER PROFILE) DEFINITIONS
+# ========================================================================
+# These definitions specify high-value lead profiles for ICP multiplier scoring.
+# IMPORTANT: sub_industries must use EXACT names from INDUSTRY_TAXONOMY keys
+# (case-sensitive, e.g., "FinTech" not "fintech", "E-Commerce" not "ecommerce")
+# ========================================================================
+
+ICP_DEFINITIONS = [
+    {
+        # Fuel/Energy - Operations & Technology Leaders
+        "sub_industries": ["Fuel", "Oil and Gas", "Fossil Fuels", "Energy"],
+        "role_details": [
+            # Operations
+            "coo", "chief operating officer", "director of operations", "vp of operations", 
+            "vp operations", "head of operations", "operations manager", "operations director",
+            # Technology
+            "cto", "chief technology officer", "director of technology", "vp of technology", 
+            "vp technology", "head of technology", "vp of engineering", "vp engineering",
+            "engineering director", "head of engineering", "vp of it", "vp it", "it director",
+            "cio", "chief information officer"
+        ]
+    },
+    
+    {
+        # Agriculture/Farming - Operations & Technology Leaders
+        "sub_industries": ["Agriculture", "Farming", "AgTech", "Livestock", "Aquaculture"],
+        "role_details": [
+            # Operations
+            "coo", "chief operating officer", "director of operations", "vp of operations",
+            "vp operations", "head of operations", "operations manager", "operations director",
+            # Technology
+            "cto", "chief technology officer", "director of technology", "vp of technology",
+            "vp technology", "head of technology", "vp of engineering", "vp engineering",
+            "engineering director", "head of engineering", "vp of it", "vp it", "it director",
+            "cio", "chief information officer"
+        ]
+    },
+    
+    {
+        # Renewable Energy - Operations, Technology & Asset Management
+        "sub_industries": ["Solar", "Wind Energy", "Renewable Energy", "Clean Energy", 
+                          "Biomass Energy", "Energy Storage", "Energy Efficiency"],
+        "role_details": [
+            # Operations
+            "coo", "chief operating officer", "director of operations", "vp of operations",
+            "vp operations", "head of operations", "operations manager", "operations director",
+            # Technology
+            "cto", "chief technology officer", "director of technology", "vp of technology",
+            "vp technology", "head of technology", "vp of engineering", "vp engineering",
+            "engineering director", "head of engineering", "vp of it", "vp it", "it director",
+            "cio", "chief information officer",
+            # Asset Management & Site Operations 
+            "asset manager", "director of operation", "performance engineer", "site manager",
+            "plant manager", "facility manager", "solar farm manager", "wind farm manager"
+        ]
+    },
+    
+    {
+        # Winery/Horticulture - Farm & Operations Leaders
+        "sub_industries": ["Winery", "Wine And Spirits", "Horticulture", "Farming", 
+                          "Agriculture", "AgTech", "Hydroponics"],
+        "role_details": [
+            # Operations
+            "coo", "chief operating officer", "director of operations", "vp of operations",
+            "vp operations", "head of operations", "operations manager", "operations director",
+            # Technology
+            "cto", "chief technology officer", "director of technology", "vp of technology",
+            "vp technology", "head of technology", "vp of engineering", "vp engineering",
+            "engineering director", "head of engineering", "vp of it", "vp it", "it director",
+            "cio", "chief information officer",
+            # Farm Management & Precision Agriculture 
+            "farm manager", "vineyard manager", "precision agriculture manager", 
+            "head grower", "chief agronomist", "viticulturist", "horticulturist",
+            "greenhouse manager", "crop manager", "production manager"
+        ]
+    },
+    
+    {
+        # E-Commerce/Retail - Marketing & Growth Leaders
+        "sub_industries": ["E-Commerce", "E-Commerce Platforms", "Retail", "Retail Technology"],
+        "role_details": [
+            # Marketing/Growth
+            "vp ecommerce", "vp e-commerce", "vp of ecommerce", "director of ecommerce",
+            "head of ecommerce", "ecommerce director", "head of growth", "director of growth",
+            "vp of growth", "vp growth", "chief growth officer", "cmo", "chief marketing officer",
+            "vp of marketing", "vp marketing", "director of marketing", "head of marketing",
+            "vp of digital marketing", "director of digital marketing",
+            # Leadership
+            "founder", "co-founder", "ceo", "chief executive officer"
+        ]
+    },
+    
+    {
+        # Digital Marketing/Advertising - Agency & Strategy Leaders
+        "sub_industries": ["Digital Marketing", "Email Marketing", "Marketing", 
+                          "Marketing Automation", "Advertising", "Advertising Platforms",
+                          "Affiliate Marketing", "Content Marketing"],
+        "role_details": [
+            # Leadership/Strategy
+            "founder", "co-founder", "ceo", "chief executive officer", 
+            "director of partnerships", "vp of partnerships", "vp partnerships",
+            "head of partnerships", "partnerships director",
+            "head of strategy", "director of strategy", "vp of strategy", "vp strategy",
+            "chief strategy officer", "cmo", "chief marketing officer",
+            "managing director", "president", "managing partner"
+        ]
+    },
+    
+    {
+        # AI/ML - Technical & Leadership Roles
+        "sub_industries": ["Artificial Intelligence", "Machine Learning", 
+                          "Natural Language Processing", "Predictive Analytics"],
+        "role_details": [
+            # Leadership
+            "ceo", "chief executive officer", "founder", "co-founder",
+            # Technology
+            "cto", "chief technology officer", "vp of engineering", "vp engineering",
+            "head of engineering", "engineering director", "vp of ai", "vp ai",
+            "head of ai", "director of ai", "vp of machine learning", "vp machine learning",
+            "head of machine learning", "director of machine learning", 
+            "chief ai officer", "chief data officer",
+            # Engineering
+            "software engineer", "swe", "senior software engineer", "sr swe", 
+            "staff software engineer", "principal software engineer", "lead software engineer",
+            "software developer", "senior software developer", "sr software developer"
+        ]
+    },
+    
+    {
+        # Real Estate Investment - Owners & Investment Leaders
+        "sub_industries": ["Real Estate", "Real Estate Investment", "Residential", 
+                          "Commercial Real Estate", "Property Development", "Property Management"],
+        "role_details": [
+            # Owner/Leadership
+            "ceo", "chief executive officer", "owner", "co-owner", "sole operator",
+            "founder", "co-founder", "managing partner", "managing director",
+            "principal", "president", "partner"
+        ]
+    },
+    
+    {
+        # Wealth Management/Family Office - Investment & Operations Leaders
+        # Note: No "Family Office" sub-industry in taxonomy, using closest matches
+        "sub_industries": ["Asset Management", "Venture Capital", "Hedge Funds", 
+                          "Financial Services", "Impact Investing"],
+        "role_details": [
+            # Leadership
+            "ceo", "chief executive officer", "president", "managing director", "managing partner",
+            "principal", "partner", "founder", "co-founder",
+            # Investment Leadership
+            "cio", "chief investment officer", "director of investments", "vp of investments",
+            "vp investments", "head of investments", "investment director", "investment manager",
+            "portfolio manager", "head of portfolio management", "director of portfolio management",
+            "senior portfolio manager", "lead portfolio manager",
+            # Private Markets
+            "head of private equity", "director of private equity", "vp private equity",
+            "vp of private equity", "head of venture capital", "director of venture capital",
+            "vp of venture capital", "vp venture capital", "head of vc", "director of vc",
+            "head of real estate", "director of real estate", "vp real estate", "vp of real estate",
+            "head of alternatives", "director of alternatives", "vp of alternatives", "vp alternatives",
+            "head of direct investments", "director of direct investments",
+            # Operations & Finance
+            "coo", "chief operating officer", "director of operations", "vp of operations",
+            "vp operations", "head of operations", "operations director",
+            "cfo", "chief financial officer", "director of finance", "vp of finance",
+            "vp finance", "head of finance", "finance director",
+            # Wealth & Asset Management
+            "family office manager", "wealth manager", "director of wealth management",
+            "head of family office", "family office director", "head of wealth management",
+            "asset manager", "head of asset management", "director of asset management"
+        ]
+    },
+    
+    {
+        # FinTech/Banking - Risk & Compliance Leaders
+        "sub_industries": ["FinTech", "Banking", "Payments", "Financial Services",
+                          "Credit Cards", "Mobile Payments", "Transaction Processing"],
+        "role_details": [
+            # Risk & Compliance Leadership
+            "cro", "chief risk officer", "vp of risk", "vp risk", "head of risk", 
+            "director of risk", "risk director", "vp of risk management", "vp risk management",
+            "director of risk management", "head of risk management",
+            "cco", "chief compliance officer", "vp of compliance", "vp compliance", 
+            "head of compliance", "director of compliance", "compliance director",
+            "vp of regulatory compliance", "director of regulatory compliance",
+            "head of regulatory affairs", "director of regulatory affairs",
+            # Compliance Operations
+            "compliance officer", "senior compliance officer", "compliance manager",
+            "bsa officer", "aml officer", "kyc manager", "director of aml",
+            "vp of bsa", "head of bsa", "anti-money laundering officer",
+            "financial crimes manager", "director of financial crimes",
+            # Risk Operations
+            "risk officer", "senior risk officer", "risk manager", "enterprise risk manager",
+            "operational risk manager", "credit risk manager", "director of operational risk"
+        ]
+    },
+    
+    {
+        # Clinical Research/Labs - Data & Research Leaders
+        "sub_industries": ["Clinical Trials", "Biotechnology", "Pharmaceutical", 
+                          "Biopharma", "Life Science"],
+        "role_details": [
+            # Data & Research
+            "data scientist", "senior data scientist", "lead data scientist", "principal data scientist",
+            "data manager", "clinical data manager", "data management lead", "head of data management",
+            "director of data management", "vp of data management", "vp data management",
+            "biostatistician", "senior biostatistician", "lead biostatistician",
+            "data analyst", "clinical data analyst", "research data analyst",
+            # Leadership
+            "ceo", "chief executive officer", "cto", "chief technology officer",
+            "coo", "chief operating officer", "cso", "chief scientific officer",
+            "vp of operations", "vp operations", "director of operations"
+        ]
+    },
+    
+    {
+        # Research/Academic - Principal Investigators & Researchers
+        "sub_industries": ["Higher Education", "Life Science", "Biotechnology", 
+                          "Neuroscience", "Genetics"],
+        "role_details": [
+            # Principal Investigators & Researchers
+            "principal investigator", "pi", "lead researcher", "senior researcher",
+            "research director", "director of research", "head of research",
+            "associate professor", "assistant professor", "professor",
+            "research scientist", "senior research scientist", "staff scientist",
+            "research fellow", "senior research fellow", "postdoctoral researcher",
+            "lab director", "laboratory director", "research group leader",
+            "department head", "department chair", "division chief"
+        ]
+    },
+    
+    {
+        # Biotech/Pharma - Business Development & Scientific Leadership
+        "sub_industries": ["Biotechnology", "Biopharma", "Pharmaceutical", 
+                          "Genetics", "Life Science", "Bioinformatics"],
+        "role_details": [
+            # Business Development & Leadership
+            "ceo", "chief executive officer", "founder", "co-founder",
+            "cto", "chief technology officer", "cso", "chief scientific officer",
+            "coo", "chief operating officer", "cmo", "chief medical officer",
+            "vp of business development", "vp business development", "head of business development",
+            "director of business development", "business development director",
+            "bd lead", "business development lead", "business development manager",
+            "vp of partnerships", "vp partnerships", "head of partnerships",
+            "director of partnerships", "partnerships director",
+            "vp of corporate development", "director of corporate development"
+        ]
+    },
+    
+    {
+        # Broadcasting/Media (Africa Focus) - Technology & Content Leaders
+        "sub_industries": ["Broadcasting", "Video", "Digital Media", "Content", 
+                          "Content Delivery Network", "Telecommunications", 
+                          "Digital Entertainment"],
+        "role_details": [
+            # Technology Leadership
+            "cto", "chief technology officer", "cfo", "chief financial officer",
+            "head of engineering", "vp of engineering", "vp engineering", "engineering director",
+            "director of engineering",
+            # Video/Streaming Specific
+            "head of video", "head of streaming", "director of video", "director of streaming",
+            "vp of video", "vp video", "vp of streaming", "vp streaming",
+            "head of ott", "director of ott", "vp of ott", "vp ott", "ott director",
+            "cdn architect", "video architect", "streaming architect", "media architect",
+            "head of cdn", "director of cdn", "vp of cdn",
+            # Content Operations
+            "head of content operations", "director of content operations", "vp of content operations",
+            "content operations manager", "head of media operations", "director of media operations",
+            # Broadcast Operations
+            "broadcast ops manager", "broadcast operations manager", "director of broadcast operations",
+            "head of broadcast operations", "vp of broadcast operations",
+            # Post-Production/Media Ops
+            "post-production manager", "head of post-production", "director of post-production",
+            "media ops manager", "media operations manager", "head of media ops",
+            # Product (OTT)
+            "head of product", "director of product", "vp of product", "vp product",
+            "product director", "chief product officer", "cpo"
+        ],
+        # Region filter - only match leads from Africa
+        "regions": ["africa", "african", "nigeria", "south africa", "kenya", "ghana", "egypt",
+                    "morocco", "ethiopia", "tanzania", "uganda", "algeria", "sudan", "angola",
+                    "mozambique", "cameroon", "ivory coast", "côte d'ivoire", "senegal", "zambia",
+                    "zimbabwe", "rwanda", "tunisia", "libya", "democratic republic of congo", "drc",
+                    "botswana", "namibia", "mauritius", "gabon", "malawi", "mali", "burkina faso",
+                    "niger", "chad", "somalia", "benin", "togo", "sierra leone", "liberia",
+                    "central african republic", "congo", "eritrea", "gambia", "guinea", "lesotho",
+                    "madagascar", "mauritania", "swaziland", "eswatini"],
+        # Custom multiplier for Africa leads (higher value than default 1.5x)
+        "multiplier": 5.0
+    },
+    
+    {
+        # Hospitality/Hotels - Business Development, Owners & Operations (US)
+        # Sub-industries from taxonomy: Hospitality, Hotel, Resorts (all under 'Travel and Tourism')
+        "sub_industries": ["Hospitality", "Hotel", "Resorts", "Travel Accommodations", 
+                          "Vacation Rental", "Tourism"],
+        "role_details": [
+            # Business Development
+            "business development", "bd", "biz dev", "business dev", 
+            "vp of business development", "vp business development", "head of business development",
+            "director of business development", "business development manager", "business development director",
+            "vp of bd", "head of bd", "director of bd",
+            # Ownership/Leadership
+            "owner", "co-owner", "business owner", "hotel owner", "property owner",
+            "founder", "co-founder", "ceo", "chief executive officer",
+            "president", "managing director", "general manager", "gm",
+            "principal", "partner", "managing partner",
+            # Operations Management
+            "operations manager", "director of operations", "vp of operations", "vp operations",
+            "head of operations", "operations director", "coo", "chief operating officer",
+            # Hotel/Hospitality Specific
+            "hotel manager", "hotel general manager", "hotel gm", "property manager",
+            "resort manager", "resort general manager", "hospitality manager",
+            "front office manager", "rooms division manager", "director of rooms",
+            "director of hospitality", "vp of hospitality", "head of hospitality"
+        ],
+        # Region filter - US only
+        "regions": ["united states", "usa", "us", "america", "american",
+                    "california", "new york", "texas", "florida", "illinois", "pennsylvania",
+                    "ohio", "georgia", "north carolina", "michigan", "new jersey", "virginia",
+                    "washington", "arizona", "massachusetts", "tennessee", "indiana", "missouri",
+                    "maryland", "wisconsin", "colorado", "minnesota", "south carolina", "alabama",
+                    "louisiana", "kentucky", "oregon", "oklahoma", "connecticut", "utah", "iowa",
+                    "nevada", "arkansas", "mississippi", "kansas", "new mexico", "nebraska",
+                    "idaho", "west virginia", "hawaii", "maine", "montana", "rhode island",
+                    "delaware", "south dakota", "north dakota", "alaska", "vermont", "wyoming"]
+    },
+    
+    {
+        # Small/Local Businesses - Owners (US)
+        # Note: "Small Business" not in taxonomy, using "Local Business" which is closest match
+        # This ICP targets business owners across various industries in the US
+        "sub_industries": ["Local Business", "Local", "Retail", "Restaurants", "Food and Beverage",
+                          "Professional Services", "Home Services", "Real Estate", "Construction",
+                          "Automotive", "Health Care", "Fitness", "Beauty", "Consulting"],
+        "role_details": [
+            # Ownership
+            "owner", "co-owner", "business owner", "sole proprietor", "sole operator",
+            "franchise owner", "franchisee", "store owner", "shop owner",
+            # Founder/Leadership
+            "founder", "co-founder", "ceo", "chief executive officer",
+            "president", "managing director", "principal", "partner",
+            # Small Business Specific
+            "proprietor", "operator", "entrepreneur"
+        ],
+        # Region filter - US only
+        "regions": ["united states", "usa", "us", "america", "american",
+                    "california", "new york", "texas", "florida", "illinois", "pennsylvania",
+                    "ohio", "georgia", "north carolina", "michigan", "new jersey", "virginia",
+                    "washington", "arizona", "massachusetts", "tennessee", "indiana", "missouri",
+                    "maryland", "wisconsin", "colorado", "minnesota", "south carolina", "alabama",
+                    "louisiana", "kentucky", "oregon", "oklahoma", "connecticut", "utah", "iowa",
+                    "nevada", "arkansas", "mississippi", "kansas", "new mexico", "nebraska",
+                    "idaho", "west virginia", "hawaii", "maine", "montana", "rhode island",
+                    "delaware", "south dakota", "north dakota", "alaska", "vermont", "wyoming"]
+    }
+]
+
+
+# ========================================================================
+# ICP (Ideal Customer Profile) Multiplier Determination
+# ========================================================================
+
+def determine_icp_multiplier(lead: dict) -> float:
+    """
+    LEGACY FUNCTION - Kept for backwards compatibility.
+    
+    Determine if a lead matches our ICP (Ideal Customer Profile) criteria.
+    
+    Uses the ICP_DEFINITIONS table (defined at top of file) to check if a lead matches
+    any target customer profile based on:
+    - Sub-Industry (e.g., "Gas Stations", "AI Startups")
+    - Role Type (e.g., "Operations", "Technology", "Leadership")
+    - Role Details (specific titles like "CEO", "CTO", "VP of Operations")
+    - Region (optional - e.g., "Africa" for streaming/broadcast ICP)
+    
+    Returns:
+        Custom multiplier if defined in ICP (e.g., 5.0 for Africa)
+        1.5 if lead matches ICP criteria (default)
+        1.0 if lead is standard (non-ICP)
+        
+    NOTE: This function is deprecated. Use calculate_icp_adjustment() instead.
+    """
+    # Extract lead fields (case-insensitive)
+    sub_industry = lead.get("sub_industry", "").strip().lower()
+    role = lead.get("role", "").strip().lower()
+    region = lead.get("region", "").strip().lower()
+    
+    # Helper function to check if any keyword matches in text
+    def matches_any(text: str, keywords: list) -> bool:
+        """Check if any keyword from the list is found in the text (case-insensitive)"""
+        text_lower = text.lower()
+        return any(keyword.lower() in text_lower for keyword in keywords)
+    
+    # Iterate through all ICP definitions
+    for icp in ICP_DEFINITIONS:
+        # Step 1: Check if sub_industry matches
+        if not matches_any(sub_industry, icp["sub_industries"]):
+            continue  # No match, try next ICP
+        
+        # Step 2: Check region if specified in ICP definition
+        # If "regions" is defined, lead must be from one of those regions
+        if "regions" in icp:
+            if not matches_any(region, icp["regions"]):
+                continue  # Region doesn't match, try next ICP
+        
+        # Step 3: Check if role contains role_details (specific titles)
+        # Role details are the most specific check (e.g., "CEO", "CTO", "VP of Operations")
+        if matches_any(role, icp["role_details"]):
+            # Return custom multiplier if defined, otherwise default 1.5x
+            return icp.get("multiplier", 1.5)
+    
+    # No ICP match found
+    return 1.0
+
+
+def _matches_icp_definitions(lead: dict) -> bool:
+    """
+    Check if a lead matches any ICP definition (without returning multiplier value).
+    
+    Returns:
+        True if lead matches any ICP definition
+        False otherwise
+    """
+    sub_industry = lead.get("sub_industry", "").strip().lower()
+    role = lead.get("role", "").strip().lower()
+    region = lead.get("region", "").strip().lower()
+    
+    def matches_any(text: str, keywords: list) -> bool:
+        text_lower = text.lower()
+        return any(keyword.lower() in text_lower for keyword in keywords)
+    
+    for icp in ICP_DEFINITIONS:
+        if not matches_any(sub_industry, icp["sub_industries"]):
+            continue
+        if "regions" in icp:
+            if not matches_any(region, icp["regions"]):
+                continue
+        if matches_any(role, icp["role_details"]):
+            return True
+    
+    return False
+
+
+def is_enterprise_company(lead: dict) -> bool:
+    """
+    Check if a lead is from an enterprise company (10,001+ employees).
+    
+    Enterprise companies get hardcoded rep scores:
+    - 10 if matches ICP definition
+    - 5 if doesn't match ICP definition
+    
+    This skips expensive rep score API calls for giant corporations
+    where rep score verification is less meaningful.
+    
+    Returns:
+        True if employee_count indicates 10,001+ employees
+        False otherwise
+    """
+    employee_count = lead.get("employee_count", "")
+    if not employee_count:
+        return False
+    
+    # Parse the employee count
+    parsed = parse_employee_count(str(employee_count))
+    if not parsed:
+        return False
+    
+    emp_min, emp_max = parsed
+    
+    # Enterprise = 10,001+ employees (minimum 10001)
+    return emp_min >= 10001
+
+
+def calculate_icp_adjustment(lead: dict) -> int:
+    """
+    Calculate ICP adjustment points (NEW SYSTEM - replaces multiplier).
+    
+    This function calculates an absolute point adjustment based on:
+    1. ICP Definition Match: +50 points
+    2. Small Company in Major Hub Bonus: +50 points
+       - ≤10 employees AND in major hub (NYC, SF, LA, Austin, Chicago, etc.)
+    3. Small Company Bonus:
+       - ≤50 employees: +20 points
+    4. Large Company Penalty:
+       - >1,000 employees: -10 points
+       - >5,000 or >10,000 employees: -15 points
+    
+    MAX POSITIVE BONUS: +50 (ICP and small company bonuses do NOT stack beyond 50)
+    PENALTIES STACK: Penalties are applied AFTER capping the bonus
+    
+    Args:
+        lead: Lead dictionary with employee_count, city, and ICP-relevant fields
+        
+    Returns:
+        Integer adjustment (bonus capped at +50, then penalties applied)
+        
+    Examples:
+        - ICP match only = +50
+        - ICP + ≤50 employees = +70 → capped to +50
+        - ICP + >1k employees = +50 - 10 = +40
+        - ICP + >5k employees = +50 - 15 = +35
+        - Small hub (≤10 + NYC) = +50
+        - Small hub + >1k employees = +50 - 10 = +40
+        - Non-ICP + ≤50 employees = +20
+        - Non-ICP + >5k employees = -15
+    """
+    bonus = 0
+    penalty = 0
+    breakdown = {"icp_match": 0, "major_hub_bonus": 0, "employee_bonus": 0, "employee_penalty": 0}
+    
+    # ========================================================================
+    # MAJOR HUBS BY COUNTRY (city + country must BOTH match)
+    # ========================================================================
+    # Uses CANONICAL city names from geo_lookup_fast.json (post-gateway normalization)
+    # Gateway normalizes: "NYC" -> "New York City", "SF" -> "San Francisco", etc.
+    # So we only need the canonical names here - no aliases needed!
+    # 
+    # Country names MUST match gateway/api/submit.py VALID_COUNTRIES (lowercase)
+    MAJOR_HUBS_BY_COUNTRY = {
+        # ----------------------------------------------------------------
+        # NORTH AMERICA (canonical names from geo_lookup_fast.json)
+        # ----------------------------------------------------------------
+        "united states": {
+            # NYC area (manhattan/brooklyn are separate cities in JSON)
+            "new york city", "manhattan", "brooklyn",
+            # West Coast
+            "san francisco", "los angeles", "san diego", "san jose", "seattle", "portland",
+            # Texas
+            "austin", "dallas", "houston",
+            # Other major hubs
+            "chicago", "boston", "denver", "miami", "washington", "atlanta", "phoenix",
+        },
+        "canada": {
+            "toronto", "vancouver", "montréal",  # Note: "montréal" is canonical (not "montreal")
+        },
+        # ----------------------------------------------------------------
+        # EUROPE (canonical names from geo_lookup_fast.json)
+        # ----------------------------------------------------------------
+        "united kingdom": {
+            "london", "manchester", "edinburgh", "cambridge", "oxford",
+        },
+        "germany": {
+            "berlin", "münchen", "frankfurt am main", "hamburg",  # "münchen" is canonical
+        },
+        "france": {
+            "paris",
+        },
+        "netherlands": {
+            "amsterdam", "rotterdam",
+        },
+        "switzerland": {
+            "zürich", "genève",  # Canonical names with accents
+        },
+        "ireland": {
+            "dublin",
+        },
+        "sweden": {
+            "stockholm",
+        },
+        "spain": {
+            "barcelona", "madrid",
+        },
+        # ----------------------------------------------------------------
+        # ASIA-PACIFIC (canonical names from geo_lookup_fast.json)
+        # ----------------------------------------------------------------
+        "hong kong": {
+            "hong kong",
+        },
+        "singapore": {
+            "singapore",
+        },
+        "japan": {
+            "tokyo", "osaka",
+        },
+        "south korea": {
+            "seoul",
+        },
+        "china": {
+            "shanghai", "beijing", "shenzhen",
+        },
+        "india": {
+            "bengaluru", "mumbai", "new delhi", "hyderabad", "pune",  # "bengaluru" is canonical
+        },
+        "australia": {
+            "sydney", "melbourne",
+        },
+        "new zealand": {
+            "auckland",
+        },
+        # ----------------------------------------------------------------
+        # MIDDLE EAST (canonical names from geo_lookup_fast.json)
+        # ----------------------------------------------------------------
+        "israel": {
+            "tel aviv",
+        },
+        "united arab emirates": {
+            "dubai", "abu dhabi",
+        },
+        # ----------------------------------------------------------------
+        # SOUTH AMERICA (canonical names from geo_lookup_fast.json)
+        # ----------------------------------------------------------------
+        "brazil": {
+            "são paulo",  # Canonical name with accent
+        },
+    }
+    
+    # Get city and country for major hub check
+    city = lead.get("city", "").strip().lower()
+    country = lead.get("country", "").strip().lower()
+    
+    # Check if BOTH country AND city match a major hub
+    # Simple exact matching - gateway already normalized cities to canonical form
+    is_major_hub = False
+    matched_hub = None
+    
+    if country in MAJOR_HUBS_BY_COUNTRY:
+        hub_cities = MAJOR_HUBS_BY_COUNTRY[country]  # This is now a set
+        if city in hub_cities:
+            is_major_hub = True
+            matched_hub = f"{city} ({country})"
+    
+    # ========================================================================
+    # STEP 1: ICP Definition Match (+50 points)
+    # ========================================================================
+    if _matches_icp_definitions(lead):
+        bonus += 50
+        breakdown["icp_match"] = 50
+        print(f"   🎯 ICP MATCH: +50 points")
+    
+    # ========================================================================
+    # STEP 2: Employee Count Bonuses and Penalties
+    # ========================================================================
+    employee_count_str = get_employee_count(lead) or ""
+    
+    if employee_count_str:
+        parsed = parse_employee_count(employee_count_str)
+        
+        if parsed:
+            emp_min, emp_max = parsed
+            
+            # Small company in major hub bonus (+50 points)
+            if emp_max <= 10 and is_major_hub:
+                bonus += 50
+                breakdown["major_hub_bonus"] = 50
+                print(f"   🌆 SMALL COMPANY IN MAJOR HUB (≤10 + {matched_hub}): +50 points")
+            # Small company bonus (+20 points for ≤50 employees)
+            elif emp_max <= 50:
+                bonus += 20
+                breakdown["employee_bonus"] = 20
+                print(f"   🏢 SMALL COMPANY (≤50): +20 points")
+            
+            # Large company penalty (stacks with capped bonus)
+            # Note: Uses emp_min to determine the MINIMUM company size
+            # Note: 10,001+ (enterprise) companies already have hardcoded rep scores, no ICP penalty
+            if 5000 < emp_min < 10001:
+                # 5,001-10,000 employees only (enterprise 10,001+ handled separately)
+                penalty = 15
+                breakdown["employee_penalty"] = -15
+                print(f"   🏭 LARGE COMPANY (5k-10k): -15 points")
+            elif emp_min > 1000:
+                # 1,001-5,000 employees
+                penalty = 10
+                breakdown["employee_penalty"] = -10
+                print(f"   🏭 LARGE COMPANY (>1k): -10 points")
+    else:
+        print(f"   📋 No employee count available - no size adjustment")
+    
+    # ========================================================================
+    # STEP 3: Cap bonus at +50, then apply penalties
+    # ========================================================================
+    if bonus > 50:
+        print(f"   ⚠️  Bonus {bonus} exceeds cap, capping at +50")
+        bonus = 50
+    
+    # Penalties stack with capped bonus
+    adjustment = bonus - penalty
+    
+    print(f"   📊 FINAL ICP ADJUSTMENT: {adjustment:+d} points")
+    print(f"      Bonus (capped at 50): {min(bonus, 50):+d} = ICP:{breakdown['icp_match']:+d} + Hub:{breakdown['major_hub_bonus']:+d} + Size:{breakdown['employee_bonus']:+d}")
+    print(f"      Penalty: {-penalty:+d}")
+    
+    return adjustment
@@ -0,0 +1,132 @@
+"""
+Legacy email cache and pre-pipeline helpers (domain existence, company website,
+duplicate emails) kept for validate_lead_list and the Stage 0 HEAD check.
+"""
+
+import aiohttp
+import asyncio
+import pickle
+import os
+from typing import Tuple
+from Leadpoet.utils.utils_lead_extraction import get_email
+from validator_models.http_client import COMPANY_SITE_HEADERS, pooled_session
+from validator_models.pipeline_metrics import instrumented_check
+from validator_models.dns_engine import resolve as dns_resolve_async
+
+from validator_models.automated_checks.config import EMAIL_CACHE_FILE
+
+
+# Existing functions - DO NOT TOUCH (maintained for backward compatibility)
+
+async def load_email_cache():
+    if os.path.exists(EMAIL_CACHE_FILE):
+        try:
+            with open(EMAIL_CACHE_FILE, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return {}
+    return {}
+
+async def save_email_cache(cache):
+    try:
+        with open(EMAIL_CACHE_FILE, "wb") as f:
+            pickle.dump(cache, f)
+    except Exception:
+        pass
+
+# EMAIL_CACHE = asyncio.run(load_email_cache())  # Disabled to avoid event loop issues
+EMAIL_CACHE = {}
+
+
+@instrumented_check
+async def check_domain_existence(domain: str) -> Tuple[bool, str]:
+    try:
+        await dns_resolve_async(domain, "MX")
+        return True, "Domain has MX records"
+    except Exception as e:
+        return False, f"Domain check failed: {str(e)}"
+
+async def verify_company(company_domain: str) -> Tuple[bool, str]:
+    """
+    Verify company website is accessible.
+    
+    Strategy: Try HEAD first (lightweight), fall back to GET if HEAD fails.
+    Many enterprise sites (Intuit, 3M, etc.) block HEAD requests but work with GET.
+    Uses browser User-Agent to avoid anti-bot blocking.
+    Uses custom SSL context with broader cipher support for enterprise sites (Hartford, etc.)
+    """
+    if not company_domain:
+        return False, "No domain provided"
+    if not company_domain.startswith(("http://", "https://")):
+        company_domain = f"https://{company_domain}"
+    
+    # Status codes that indicate website exists (pass immediately)
+    # 429 = Too Many Requests (rate limiting/bot protection) - proves site exists, just blocking automated requests
+    PASS_STATUS_CODES = {200, 301, 302, 307, 308, 401, 403, 405, 429, 500, 502, 503}
+    
+    # Browser User-Agent to avoid anti-bot blocking (3M, etc.)
+    headers = COMPANY_SITE_HEADERS
+    
+    # Pooled "company_site" session carries the custom SSL context with broader
+    # cipher support (Hartford, etc.) - see http_client._company_site_ssl_context
+    try:
+        async with pooled_session("company_site") as session:
+            # Try HEAD request first (lightweight)
+            head_status = None
+            head_error = None
+            try:
+                async with session.head(company_domain, headers=headers, timeout=10, allow_redirects=True) as response:
+                    head_status = response.status
+                    if head_status in PASS_STATUS_CODES:
+                        return True, f"Website accessible (HEAD: {head_status})"
+            except aiohttp.ClientError as e:
+                head_error = str(e) or "connection_error"
+                # Handle large enterprise headers - pass immediately
+                if "Header value is too long" in head_error or "Got more than" in head_error:
+                    return True, "Website accessible (large enterprise headers detected)"
+            except asyncio.TimeoutError:
+                head_error = "timeout"
+            except Exception as e:
+                head_error = str(e) or type(e).__name__
+            
+            # HEAD failed or returned non-pass status - try GET as fallback
+            # Many enterprise sites (Intuit, 3M) block HEAD but allow GET
+            try:
+                async with session.get(company_domain, headers=headers, timeout=10, allow_redirects=True) as response:
+                    get_status = response.status
+                    if get_status in PASS_STATUS_CODES:
+                        return True, f"Website accessible (GET fallback: {get_status})"
+                    else:
+                        # Both HEAD and GET returned non-pass status
+                        return False, f"Website not accessible (HEAD: {head_status}, GET: {get_status})"
+            except aiohttp.ClientError as e:
+                get_error = str(e) or "connection_error"
+                # Handle large enterprise headers on GET too
+                if "Header value is too long" in get_error or "Got more than" in get_error:
+                    return True, "Website accessible (large enterprise headers detected)"
+                # Both HEAD and GET failed
+                return False, f"Website inaccessible (HEAD: {head_error or head_status}, GET: {get_error})"
+            except asyncio.TimeoutError:
+                return False, f"Website inaccessible (HEAD: {head_error or head_status}, GET: timeout)"
+            except Exception as e:
+                return False, f"Website inaccessible (HEAD: {head_error or head_status}, GET: {str(e) or type(e).__name__})"
+    except Exception as e:
+        return False, f"Website inaccessible: {str(e)}"
+
+@instrumented_check
+async def check_duplicates(leads: list) -> Tuple[bool, dict]:
+    """Check for duplicate emails and return which leads are duplicates (not first occurrence)"""
+    email_first_occurrence = {}  # Track first occurrence of each email
+    duplicate_leads = {}  # Track which lead indices are duplicates
+
+    for i, lead in enumerate(leads):
+        email = get_email(lead)
+
+        if email in email_first_occurrence:
+            # This is a duplicate - mark this lead index as duplicate
+            duplicate_leads[i] = email
+        else:
+            # First occurrence - record the lead index
+            email_first_occurrence[email] = i
+
+    return len(duplicate_leads) > 0, duplicate_leads
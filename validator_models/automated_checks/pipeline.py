@@ -0,0 +1,2037 @@
+"""
+Orchestration of the automated checks: Stage 0-2 and Stage 4-5 runners, the batch
+pipeline fed by the coordinator's TrueList results, and the single-lead entry points.
+
+Only config and common are imported here at module level; each runner imports the
+stage modules it needs on first call, so importing the package (or this module)
+at validator startup does not load the checks themselves.
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+from urllib.parse import urlparse
+from typing import Dict, Any, Tuple, List, Optional
+from Leadpoet.utils.utils_lead_extraction import get_email, get_website, get_company
+from validator_models.pipeline_metrics import instrumented_check, metered, log_pipeline_metrics
+
+from validator_models.automated_checks.config import (
+    DEPENDENCY_LIMITS,
+    MAX_REP_SCORE,
+    STAGE0_2_CONCURRENCY,
+    STAGE0_2_SEQUENTIAL,
+    STAGE0_2_STAGGER_DELAY_SECONDS,
+    STAGE4_5_STREAMING,
+    TRUELIST_BATCH_MAX_RETRIES,
+)
+from validator_models.automated_checks.common import get_lead_dns_domains
+
+
+# ============================================================================
+# Stage 0-2 Extraction for Batch Processing
+# ============================================================================
+# This function extracts Stage 0, 1, and 2 from run_automated_checks() to
+# allow parallel execution with batch email verification.
+# See tasks9.md for the full migration plan.
+# ============================================================================
+
+@instrumented_check
+async def run_stage0_2_checks(lead: dict) -> Tuple[bool, dict]:
+    """
+    Run Stage 0, 1, and 2 checks only (no email verification).
+    
+    This function is extracted from run_automated_checks() to support
+    batch email verification. It runs all checks BEFORE Stage 3 (email
+    verification), which is handled separately by the batch process.
+    
+    The actual check functions are IDENTICAL to run_automated_checks() -
+    only the orchestration is different.
+    
+    Stages included:
+    - Pre-checks: Source provenance verification
+    - Stage 0: Required fields, email regex, name-email match, 
+               general purpose email, free email, disposable, HEAD request
+    - Stage 1: Domain age, MX record, SPF/DMARC (parallel)
+    - Stage 2: DNSBL reputation check
+    
+    Args:
+        lead: Lead dict with all fields
+    
+    Returns:
+        Tuple[bool, dict]: (passed, partial_automated_checks_data)
+            - If passed: (True, data with stage_0, stage_1, stage_2 populated)
+            - If failed: (False, data with rejection_reason)
+    
+    Note:
+        This function does NOT run Stage 3 (email verification).
+        Email verification is handled by the batch process (submit_truelist_batch
+        + poll_truelist_batch).
+    """
+    from validator_models.dns_engine import resolve_many as dns_resolve_many, lead_dns_queries
+    from validator_models.domain_plan import run_domain_check
+    from validator_models.check_evidence import run_with_evidence
+    from validator_models.automated_checks.stage0_2 import (
+        check_disposable,
+        check_dnsbl,
+        check_domain_age,
+        check_email_regex,
+        check_free_email_domain,
+        check_general_purpose_email,
+        check_head_request,
+        check_mx_record,
+        check_name_email_match,
+        check_required_fields,
+        check_spf_dmarc,
+    )
+    from validator_models.automated_checks.provenance import (
+        check_licensed_resale_proof,
+        check_source_provenance,
+    )
+    email = get_email(lead)
+    company = get_company(lead)
+    
+    # Initialize structured data collection (same structure as run_automated_checks)
+    automated_checks_data = {
+        "stage_0_hardcoded": {
+            "name_in_email": False,
+            "is_general_purpose_email": False
+        },
+        "stage_1_dns": {
+            "has_mx": False,
+            "has_spf": False,
+            "has_dmarc": False,
+            "dmarc_policy": None
+        },
+        "stage_2_domain": {
+            "dnsbl_checked": False,
+            "dnsbl_blacklisted": False,
+            "dnsbl_list": None,
+            "domain_age_days": None,
+            "domain_registrar": None,
+            "domain_nameservers": None,
+            "whois_updated_days_ago": None
+        },
+        "stage_3_email": {
+            "email_status": "unknown",
+            "email_score": 0,
+            "is_disposable": False,
+            "is_role_based": False,
+            "is_free": False
+        },
+        "stage_4_linkedin": {
+            "linkedin_verified": False,
+            "gse_search_count": 0,
+            "llm_confidence": "none"
+        },
+        "stage_5_verification": {
+            "role_verified": False,
+            "region_verified": False,
+            "industry_verified": False,
+            "extracted_role": None,
+            "extracted_region": None,
+            "extracted_industry": None,
+            "early_exit": None
+        },
+        "rep_score": {
+            "total_score": 0,
+            "max_score": MAX_REP_SCORE,
+            "breakdown": {
+                "wayback_machine": 0,
+                "uspto_trademarks": 0,
+                "sec_edgar": 0,
+                "whois_dnsbl": 0,
+                "gdelt": 0,
+                "companies_house": 0
+            }
+        },
+        "passed": False,
+        "rejection_reason": None
+    }
+
+    # ========================================================================
+    # Pre-Attestation Check: REMOVED
+    # ========================================================================
+    # NOTE: Attestation verification removed from validators.
+    # Gateway verifies attestations during POST /submit.
+    print(f"🔍 Pre-Attestation Check: Skipped (gateway verifies during submission)")
+
+    # ========================================================================
+    # Source Provenance Verification: Source Validation (HARD)
+    # Validates source_url, source_type, denylist, and licensed resale proof
+    # ========================================================================
+    print(f"🔍 Source Provenance Verification: Source validation for {email} @ {company}")
+    
+    checks_stage0_5 = [
+        check_source_provenance,       # Validate source URL, type, denylist
+        check_licensed_resale_proof,   # Validate license hash if applicable
+    ]
+    
+    for check_func in checks_stage0_5:
+        passed, rejection_reason = await check_func(lead)
+        if not passed:
+            msg = rejection_reason.get("message", "Unknown error") if rejection_reason else "Unknown error"
+            print(f"   ❌ Source Provenance Verification failed: {msg}")
+            automated_checks_data["passed"] = False
+            automated_checks_data["rejection_reason"] = rejection_reason
+            return False, automated_checks_data
+    
+    print("   ✅ Source Provenance Verification passed")
+
+    # ========================================================================
+    # Stage 0: Hardcoded Checks (MIXED)
+    # - Required Fields, Email Regex, Name-Email Match, General Purpose Email, Disposable, HEAD Request
+    # ========================================================================
+    print(f"🔍 Stage 0: Hardcoded checks for {email} @ {company}")
+    
+    # OPTIMIZATION: Run instant checks first, then overlap HEAD request with Stage 1 DNS checks
+    checks_stage0_instant = [
+        check_required_fields,      # Required fields validation (HARD)
+        check_email_regex,          # RFC-5322 regex validation (HARD)
+        check_name_email_match,     # Name in email check (HARD)
+        check_general_purpose_email,# General purpose email filter (HARD)
+        check_free_email_domain,    # Reject free email domains (HARD)
+        check_disposable,           # Filter throwaway email providers (HARD)
+    ]
+
+    for check_func in checks_stage0_instant:
+        passed, rejection_reason = await check_func(lead)
+        if not passed:
+            msg = rejection_reason.get("message", "Unknown error") if rejection_reason else "Unknown error"
+            print(f"   ❌ Stage 0 failed: {msg}")
+            automated_checks_data["passed"] = False
+            automated_checks_data["rejection_reason"] = rejection_reason
+            return False, automated_checks_data
+
+    # Collect Stage 0 data after successful instant checks
+    automated_checks_data["stage_0_hardcoded"]["name_in_email"] = True
+    automated_checks_data["stage_0_hardcoded"]["is_general_purpose_email"] = False
+
+    print("   ✅ Stage 0 instant checks passed")
+    
+    # OPTIMIZATION: Start HEAD request as background task (will check result after Stage 1)
+    head_request_task = asyncio.create_task(run_with_evidence(check_head_request, lead, run_domain_check))
+    
+    # OPTIMIZATION: Fire MX, SPF TXT, _dmarc TXT and DNSBL A queries together.
+    # Stage 1/2 checks below coalesce onto these in-flight queries (or hit cache).
+    dns_prefetch_task = asyncio.create_task(dns_resolve_many(lead_dns_queries(*get_lead_dns_domains(lead))))
+
+    # ========================================================================
+    # Stage 1: DNS Layer (MIXED)
+    # - Domain Age, MX Record (HARD)
+    # - SPF/DMARC (SOFT - always passes, appends data)
+    # ========================================================================
+    print(f"🔍 Stage 1: DNS layer checks for {email} @ {company}")
+    
+    # OPTIMIZATION: Run all Stage 1 DNS checks in parallel
+    results = await asyncio.gather(
+        run_with_evidence(check_domain_age, lead, run_domain_check),
+        run_with_evidence(check_mx_record, lead, run_domain_check),
+        run_with_evidence(check_spf_dmarc, lead, run_domain_check),
+        return_exceptions=True
+    )
+    await dns_prefetch_task  # Never raises - outcomes are cached for check_dnsbl
+    
+    # Check results
+    check_names = ["check_domain_age", "check_mx_record", "check_spf_dmarc"]
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            print(f"   ❌ Stage 1 failed: {str(result)}")
+            automated_checks_data["passed"] = False
+            automated_checks_data["rejection_reason"] = {
+                "stage": "Stage 1: DNS Layer",
+                "check_name": check_names[i],
+                "message": f"Check failed: {str(result)}",
+                "failed_fields": ["domain"]
+            }
+            # Collect partial Stage 1 data even on failure
+            automated_checks_data["stage_1_dns"]["has_mx"] = lead.get("has_mx", False)
+            automated_checks_data["stage_1_dns"]["has_spf"] = lead.get("has_spf", False)
+            automated_checks_data["stage_1_dns"]["has_dmarc"] = lead.get("has_dmarc", False)
+            automated_checks_data["stage_1_dns"]["dmarc_policy"] = "strict" if lead.get("dmarc_policy_strict") else "none"
+            automated_checks_data["stage_2_domain"]["domain_age_days"] = lead.get("domain_age_days")
+            automated_checks_data["stage_2_domain"]["domain_registrar"] = lead.get("domain_registrar")
+            automated_checks_data["stage_2_domain"]["domain_nameservers"] = lead.get("domain_nameservers")
+            automated_checks_data["stage_2_domain"]["whois_updated_days_ago"] = lead.get("whois_updated_days_ago")
+            return False, automated_checks_data
+        
+        passed, rejection_reason = result
+        if not passed:
+            msg = rejection_reason.get("message", "Unknown error") if rejection_reason else "Unknown error"
+            print(f"   ❌ Stage 1 failed: {msg}")
+            automated_checks_data["passed"] = False
+            automated_checks_data["rejection_reason"] = rejection_reason
+            # Collect partial Stage 1 data even on failure
+            automated_checks_data["stage_1_dns"]["has_mx"] = lead.get("has_mx", False)
+            automated_checks_data["stage_1_dns"]["has_spf"] = lead.get("has_spf", False)
+            automated_checks_data["stage_1_dns"]["has_dmarc"] = lead.get("has_dmarc", False)
+            automated_checks_data["stage_1_dns"]["dmarc_policy"] = "strict" if lead.get("dmarc_policy_strict") else "none"
+            automated_checks_data["stage_2_domain"]["domain_age_days"] = lead.get("domain_age_days")
+            automated_checks_data["stage_2_domain"]["domain_registrar"] = lead.get("domain_registrar")
+            automated_checks_data["stage_2_domain"]["domain_nameservers"] = lead.get("domain_nameservers")
+            automated_checks_data["stage_2_domain"]["whois_updated_days_ago"] = lead.get("whois_updated_days_ago")
+            return False, automated_checks_data
+
+    # Collect Stage 1 DNS data after successful checks
+    automated_checks_data["stage_1_dns"]["has_mx"] = lead.get("has_mx", True)
+    automated_checks_data["stage_1_dns"]["has_spf"] = lead.get("has_spf", False)
+    automated_checks_data["stage_1_dns"]["has_dmarc"] = lead.get("has_dmarc", False)
+    automated_checks_data["stage_1_dns"]["dmarc_policy"] = "strict" if lead.get("dmarc_policy_strict") else "none"
+
+    print("   ✅ Stage 1 passed")
+
+    # ========================================================================
+    # Stage 0 (continued): HEAD Request Check
+    # Check result of background HEAD request task
+    # ========================================================================
+    print(f"🔍 Stage 0: Website HEAD request check for {email} @ {company}")
+    passed, rejection_reason = await head_request_task
+    if not passed:
+        msg = rejection_reason.get("message", "Unknown error") if rejection_reason else "Unknown error"
+        print(f"   ❌ Stage 0 (HEAD request) failed: {msg}")
+        automated_checks_data["passed"] = False
+        automated_checks_data["rejection_reason"] = rejection_reason
+        return False, automated_checks_data
+    
+    print("   ✅ Stage 0 (HEAD request) passed")
+
+    # ========================================================================
+    # Stage 2: Lightweight Domain Reputation Checks (HARD)
+    # - DNSBL (Domain Block List) - Spamhaus DBL lookup
+    # ========================================================================
+    print(f"🔍 Stage 2: Domain reputation checks for {email} @ {company}")
+    passed, rejection_reason = await run_with_evidence(check_dnsbl, lead, run_domain_check)
+    
+    # Collect Stage 2 domain data (DNSBL + WHOIS from Stage 1)
+    automated_checks_data["stage_2_domain"]["dnsbl_checked"] = lead.get("dnsbl_checked", False)
+    automated_checks_data["stage_2_domain"]["dnsbl_blacklisted"] = lead.get("dnsbl_blacklisted", False)
+    automated_checks_data["stage_2_domain"]["dnsbl_list"] = lead.get("dnsbl_list")
+    automated_checks_data["stage_2_domain"]["domain_age_days"] = lead.get("domain_age_days")
+    automated_checks_data["stage_2_domain"]["domain_registrar"] = lead.get("domain_registrar")
+    automated_checks_data["stage_2_domain"]["domain_nameservers"] = lead.get("domain_nameservers")
+    automated_checks_data["stage_2_domain"]["whois_updated_days_ago"] = lead.get("whois_updated_days_ago")
+    
+    if not passed:
+        msg = rejection_reason.get("message", "Unknown error") if rejection_reason else "Unknown error"
+        print(f"   ❌ Stage 2 failed: {msg}")
+        automated_checks_data["passed"] = False
+        automated_checks_data["rejection_reason"] = rejection_reason
+        return False, automated_checks_data
+
+    print("   ✅ Stage 2 passed")
+
+    # ========================================================================
+    # STOP HERE - Stage 3 (email verification) is handled by batch process
+    # ========================================================================
+    # Mark as passed up to Stage 2
+    # The batch orchestrator will handle email verification separately
+    automated_checks_data["passed"] = True  # Passed Stage 0-2
+    
+    print(f"   ✅ Stage 0-2 complete for {email} @ {company}")
+    return True, automated_checks_data
+
+
+@instrumented_check
+async def run_stage4_5_repscore(
+    lead: dict,
+    email_result: dict,
+    stage0_2_data: dict
+) -> Tuple[bool, dict]:
+    """
+    Run Stage 4, Stage 5, and Rep Score checks only.
+    
+    This function is extracted from run_automated_checks() to support
+    batch email verification. It runs AFTER the lead has passed both:
+    1. TrueList batch email verification (email_result)
+    2. Stage 0-2 checks (stage0_2_data from run_stage0_2_checks)
+    
+    The actual check functions (check_linkedin_gse, check_stage5_unified,
+    check_wayback_machine, etc.) are called EXACTLY as in run_automated_checks().
+    
+    Args:
+        lead: Lead dict with email, company, linkedin, etc.
+        email_result: Result from TrueList batch for this email
+                     {"status": "email_ok", "passed": True, "rejection_reason": None}
+        stage0_2_data: Partial automated_checks_data from run_stage0_2_checks()
+    
+    Returns:
+        Tuple[bool, dict]: (passed, complete_automated_checks_data)
+    """
+    from validator_models.check_evidence import run_with_evidence
+    from validator_models.domain_plan import run_domain_check
+    from validator_models.automated_checks.icp import (
+        _matches_icp_definitions,
+        calculate_icp_adjustment,
+        is_enterprise_company,
+    )
+    from validator_models.automated_checks.company_cache import (
+        get_standardized_company_name,
+        set_standardized_company_name,
+    )
+    from validator_models.automated_checks.stage4 import check_linkedin_gse
+    from validator_models.automated_checks.rep_score import check_whois_dnsbl_reputation, run_reputation_check
+    from validator_models.automated_checks.stage5 import check_stage5_unified
+    email = get_email(lead)
+    company = get_company(lead)
+    
+    # ========================================================================
+    # MERGE: Start with stage0_2_data and extend with Stage 3-5 + Rep Score
+    # ========================================================================
+    automated_checks_data = stage0_2_data.copy()
+    
+    # Ensure Stage 3-5 and rep_score sections exist
+    if "stage_3_email" not in automated_checks_data:
+        automated_checks_data["stage_3_email"] = {
+            "email_status": "unknown",
+            "email_score": 0,
+            "is_disposable": False,
+            "is_role_based": False,
+            "is_free": False
+        }
+    if "stage_4_linkedin" not in automated_checks_data:
+        automated_checks_data["stage_4_linkedin"] = {
+            "linkedin_verified": False,
+            "gse_search_count": 0,
+            "llm_confidence": "none"
+        }
+    if "stage_5_verification" not in automated_checks_data:
+        automated_checks_data["stage_5_verification"] = {
+            "role_verified": False,
+            "region_verified": False,
+            "industry_verified": False,
+            "extracted_role": None,
+            "extracted_region": None,
+            "extracted_industry": None,
+            "early_exit": None
+        }
+    if "rep_score" not in automated_checks_data:
+        automated_checks_data["rep_score"] = {
+            "total_score": 0,
+            "max_score": MAX_REP_SCORE,
+            "breakdown": {
+                "wayback_machine": 0,
+                "uspto_trademarks": 0,
+                "sec_edgar": 0,
+                "whois_dnsbl": 0,
+                "gdelt": 0,
+                "companies_house": 0
+            }
+        }
+    
+    # ========================================================================
+    # Stage 3: Populate from Batch Email Result (NO API CALL - already done)
+    # ========================================================================
+    print(f"🔍 Stage 3: Email verification (from batch) for {email} @ {company}")
+    
+    # Map TrueList batch status to internal format for lead["email_verifier_status"]
+    # This matches the mapping in run_automated_checks() Stage 3 data collection
+    batch_status = email_result.get("status", "unknown")
+    
+    if batch_status == "email_ok":
+        lead["email_verifier_status"] = "Valid"
+        email_status = "valid"
+        email_passed = True
+    elif batch_status == "accept_all":
+        lead["email_verifier_status"] = "Catch-All"
+        email_status = "catch-all"
+        # Catch-all passes only if SPF exists (checked in Stage 1)
+        has_spf = automated_checks_data.get("stage_1_dns", {}).get("has_spf", False)
+        email_passed = has_spf
+    elif batch_status in ["disposable"]:
+        lead["email_verifier_status"] = "Disposable"
+        email_status = "invalid"
+        email_passed = False
+    elif batch_status in ["failed_no_mailbox", "failed_syntax_check", "failed_mx_check"]:
+        lead["email_verifier_status"] = "Invalid"
+        email_status = "invalid"
+        email_passed = False
+    else:
+        # unknown, timeout, error - should have been retried, treat as failure
+        lead["email_verifier_status"] = "Unknown"
+        email_status = "unknown"
+        email_passed = False
+    
+    # Populate batch result flags on lead (for downstream compatibility)
+    lead["email_verifier_disposable"] = email_result.get("is_disposable", False)
+    lead["email_verifier_role_based"] = email_result.get("is_role_based", False)
+    lead["email_verifier_free"] = email_result.get("is_free", False)
+    
+    # Collect Stage 3 email data
+    automated_checks_data["stage_3_email"]["email_status"] = email_status
+    automated_checks_data["stage_3_email"]["email_score"] = 10 if email_passed else 0
+    automated_checks_data["stage_3_email"]["is_disposable"] = lead.get("email_verifier_disposable", False)
+    automated_checks_data["stage_3_email"]["is_role_based"] = lead.get("email_verifier_role_based", False)
+    automated_checks_data["stage_3_email"]["is_free"] = lead.get("email_verifier_free", False)
+    
+    if not email_passed:
+        rejection_reason = email_result.get("rejection_reason") or {
+            "stage": "Stage 3: Email Verification (Batch)",
+            "check_name": "truelist_batch",
+            "message": f"Email verification failed: {batch_status}",
+            "failed_fields": ["email"]
+        }
+        print(f"   ❌ Stage 3 failed: {rejection_reason.get('message', 'Email verification failed')}")
+        automated_checks_data["passed"] = False
+        automated_checks_data["rejection_reason"] = rejection_reason
+        return False, automated_checks_data
+    
+    print("   ✅ Stage 3 passed (batch verified)")
+    
+    # ========================================================================
+    # Stage 4: LinkedIn/GSE Validation (HARD)
+    # EXTRACTED VERBATIM from run_automated_checks()
+    # ========================================================================
+    print(f"🔍 Stage 4: LinkedIn/GSE validation for {email} @ {company}")
+    
+    passed, rejection_reason = await run_with_evidence(check_linkedin_gse, lead)
+    
+    # Collect Stage 4 data even on failure
+    automated_checks_data["stage_4_linkedin"]["gse_search_count"] = lead.get("gse_search_count", 0)
+    automated_checks_data["stage_4_linkedin"]["llm_confidence"] = lead.get("llm_confidence", "none")
+    
+    if not passed:
+        msg = rejection_reason.get("message", "Unknown error") if rejection_reason else "Unknown error"
+        print(f"   ❌ Stage 4 failed: {msg}")
+        automated_checks_data["passed"] = False
+        automated_checks_data["rejection_reason"] = rejection_reason
+        return False, automated_checks_data
+
+    print("   ✅ Stage 4 passed")
+    
+    # Collect Stage 4 data after successful check
+    automated_checks_data["stage_4_linkedin"]["linkedin_verified"] = True
+    automated_checks_data["stage_4_linkedin"]["gse_search_count"] = lead.get("gse_search_count", 0)
+    automated_checks_data["stage_4_linkedin"]["llm_confidence"] = lead.get("llm_confidence", "none")
+
+    # ========================================================================
+    # Stage 5: Role/Region/Industry Verification (HARD)
+    # EXTRACTED VERBATIM from run_automated_checks()
+    # - Uses ScrapingDog search + fuzzy matching + LLM to verify role, region, industry
+    # - Early exit: if role fails → skip region/industry
+    # - Early exit: if region fails → skip industry
+    # - Anti-gaming: rejects if miner puts multiple states in region
+    # ========================================================================
+    print(f"🔍 Stage 5: Role/Region/Industry verification for {email} @ {company}")
+    
+    passed, rejection_reason = await run_with_evidence(check_stage5_unified, lead)
+    
+    # Collect Stage 5 data
+    automated_checks_data["stage_5_verification"]["role_verified"] = lead.get("stage5_role_match", False)
+    automated_checks_data["stage_5_verification"]["region_verified"] = lead.get("stage5_region_match", False)
+    automated_checks_data["stage_5_verification"]["industry_verified"] = lead.get("stage5_industry_match", False)
+    automated_checks_data["stage_5_verification"]["extracted_role"] = lead.get("stage5_extracted_role")
+    automated_checks_data["stage_5_verification"]["extracted_region"] = lead.get("stage5_extracted_region")
+    automated_checks_data["stage_5_verification"]["extracted_industry"] = lead.get("stage5_extracted_industry")
+    
+    if not passed:
+        msg = rejection_reason.get("message", "Unknown error") if rejection_reason else "Unknown error"
+        print(f"   ❌ Stage 5 failed: {msg}")
+        automated_checks_data["passed"] = False
+        automated_checks_data["rejection_reason"] = rejection_reason
+        automated_checks_data["stage_5_verification"]["early_exit"] = rejection_reason.get("early_exit") if rejection_reason else None
+        return False, automated_checks_data
+
+    print("   ✅ Stage 5 passed")
+
+    # ========================================================================
+    # ENTERPRISE COMPANY SPECIAL HANDLING (10,001+ employees)
+    # Hardcoded rep score: 10 if ICP match, 5 if not
+    # Skips expensive rep score API calls for giant corporations
+    # ========================================================================
+    if is_enterprise_company(lead):
+        matches_icp = _matches_icp_definitions(lead)
+        hardcoded_score = 10 if matches_icp else 5
+        
+        lead["rep_score"] = hardcoded_score
+        lead["rep_score_details"] = {
+            "enterprise_company": True,
+            "matches_icp": matches_icp,
+            "hardcoded_score": hardcoded_score,
+            "reason": "10,001+ employees - rep score checks skipped"
+        }
+        automated_checks_data["rep_score"] = {
+            "total_score": hardcoded_score,
+            "max_score": MAX_REP_SCORE,
+            "breakdown": {"enterprise_company_hardcoded": hardcoded_score},
+            "enterprise_company": True,
+            "matches_icp": matches_icp
+        }
+        print(f"   🏢 ENTERPRISE COMPANY (10,001+): Hardcoded rep score = {hardcoded_score} ({'ICP match' if matches_icp else 'No ICP match'})")
+    else:
+        # ========================================================================
+        # Rep Score: Soft Reputation Checks (SOFT)
+        # EXTRACTED VERBATIM from run_automated_checks()
+        # - Wayback Machine (max 6 points), SEC (max 12 points), 
+        #   WHOIS/DNSBL (max 10 points), GDELT Press/Media (max 10 points),
+        #   Companies House (max 10 points)
+        # - Always passes, appends scores to lead
+        # - Total: 0-48 points
+        # ========================================================================
+        print(f"📊 Rep Score: Running soft checks for {email} @ {company} (parallel execution)")
+        
+        # OPTIMIZATION: Run all rep score checks in parallel to save time
+        # Old: Sequential execution = 6-12s total
+        # New: Parallel execution = 3-4s total (time of slowest API)
+        # API-backed signals are read from the reputation store first (fresh entries skip the API)
+        results = await asyncio.gather(
+            run_reputation_check("wayback", lead),
+            run_reputation_check("sec_edgar", lead),
+            run_domain_check(check_whois_dnsbl_reputation, lead),
+            run_reputation_check("gdelt", lead),
+            run_reputation_check("companies_house", lead),
+            return_exceptions=True  # Don't fail entire batch if one check fails
+        )
+        
+        # Unpack results (handle exceptions gracefully)
+        wayback_score, wayback_data = results[0] if not isinstance(results[0], Exception) else (0, {"error": str(results[0])})
+        sec_score, sec_data = results[1] if not isinstance(results[1], Exception) else (0, {"error": str(results[1])})
+        whois_dnsbl_score, whois_dnsbl_data = results[2] if not isinstance(results[2], Exception) else (0, {"error": str(results[2])})
+        gdelt_score, gdelt_data = results[3] if not isinstance(results[3], Exception) else (0, {"error": str(results[3])})
+        companies_house_score, companies_house_data = results[4] if not isinstance(results[4], Exception) else (0, {"error": str(results[4])})
+        
+        total_rep_score = (
+            wayback_score + sec_score + whois_dnsbl_score + gdelt_score +
+            companies_house_score
+        )
+        
+        # Append to lead data
+        lead["rep_score"] = total_rep_score
+        lead["rep_score_details"] = {
+            "wayback": wayback_data,
+            "sec": sec_data,
+            "whois_dnsbl": whois_dnsbl_data,
+            "gdelt": gdelt_data,
+            "companies_house": companies_house_data
+        }
+        
+        # Append to automated_checks_data
+        automated_checks_data["rep_score"] = {
+            "total_score": total_rep_score,
+            "max_score": MAX_REP_SCORE,
+            "breakdown": {
+                "wayback_machine": wayback_score,       # 0-6 points
+                "sec_edgar": sec_score,                 # 0-12 points
+                "whois_dnsbl": whois_dnsbl_score,       # 0-10 points
+                "gdelt": gdelt_score,                   # 0-10 points
+                "companies_house": companies_house_score      # 0-10 points
+            }
+        }
+        
+        print(f"   📊 Rep Score: {total_rep_score:.1f}/{MAX_REP_SCORE} (Wayback: {wayback_score:.1f}/6, SEC: {sec_score:.1f}/12, WHOIS/DNSBL: {whois_dnsbl_score:.1f}/10, GDELT: {gdelt_score:.1f}/10, Companies House: {companies_house_score:.1f}/10)")
+    
+    # ========================================================================
+    # ICP Adjustment Calculation (NEW SYSTEM - Absolute Points)
+    # Replaces the old multiplier system with absolute point adjustments
+    # ========================================================================
+    icp_adjustment = calculate_icp_adjustment(lead)
+    # Store in is_icp_multiplier field for backwards compatibility
+    # Values: -15 to +20 (new format) vs 1.0/1.5/5.0 (old format)
+    lead["is_icp_multiplier"] = float(icp_adjustment)
+    automated_checks_data["is_icp_multiplier"] = float(icp_adjustment)
+
+    # ========================================================================
+    # Company Name Standardization (only on approval)
+    # ========================================================================
+    # Use the company LinkedIn slug to get/set the standardized company name.
+    # This ensures all leads with the same company_linkedin URL have the same
+    # standardized company name, regardless of how the miner submitted it.
+    # ========================================================================
+    company_slug = lead.get("company_linkedin_slug")
+    company_linkedin_data = lead.get("company_linkedin_data")
+
+    if company_slug:
+        # Check cache first
+        standardized_name = get_standardized_company_name(company_slug)
+
+        if standardized_name:
+            # Cache hit - use cached standardized name
+            print(f"   📦 Company name from cache: '{company_slug}' → '{standardized_name}'")
+        else:
+            # Cache miss - get from Stage 4 scraped data and save to cache
+            if company_linkedin_data and company_linkedin_data.get("company_name_from_linkedin"):
+                standardized_name = company_linkedin_data["company_name_from_linkedin"]
+                set_standardized_company_name(company_slug, standardized_name)
+            else:
+                # Fallback to miner's submitted company name if no scraped data
+                standardized_name = company
+                print(f"   ⚠️ No scraped company name available, using submitted: '{standardized_name}'")
+
+        # Set on lead and automated_checks_data
+        lead["company_standardized"] = standardized_name
+        automated_checks_data["company_standardized"] = standardized_name
+        print(f"   ✅ Company standardized: '{company}' → '{standardized_name}'")
+    else:
+        # No company_linkedin_slug - use submitted company name
+        lead["company_standardized"] = company
+        automated_checks_data["company_standardized"] = company
+        print(f"   ⚠️ No company LinkedIn slug, using submitted name: '{company}'")
+
+    print(f"🎉 All stages passed for {email} @ {company}")
+
+    # All checks passed - return structured success data
+    automated_checks_data["passed"] = True
+    automated_checks_data["rejection_reason"] = None
+
+    # IMPORTANT: Also set rep_score on lead object for validator.py to pick up
+    # validator.py looks for lead_blob.get("rep_score", 50)
+    lead["rep_score"] = total_rep_score
+
+    return True, automated_checks_data
+
+
+TRUELIST_WAIT_TIMEOUT = 1200  # 20 minutes max wait for coordinator TrueList results
+
+_last_batch_timing: Dict[str, Any] = {}
+
+
+def get_batch_timing() -> Dict[str, Any]:
+    """
+    Timing of the most recent run_batch_automated_checks call (one per epoch per container).
+
+    Returns:
+        {"mode": "streaming" | "batch", "leads", "stage4_5_leads", "stage0_2_s",
+         "time_to_first_result_s", "truelist_wait_s", "total_s", "finished_at"}
+    """
+    return dict(_last_batch_timing)
+
+
+async def _poll_leads_file_truelist(leads_file_path: str, max_wait: float, poll_interval: int = 5) -> Dict[str, dict]:
+    """POLL the leads file until truelist_results is available (not None); {} on timeout."""
+    poll_waited = 0
+    while True:
+        try:
+            with open(leads_file_path, 'r') as f:
+                file_data = json.load(f)
+                file_truelist = file_data.get("truelist_results")
+                
+                if file_truelist is not None:
+                    # Results available (dict, possibly empty if coordinator failed)
+                    print(f"   ✅ Received TrueList results from coordinator: {len(file_truelist)} emails (waited {poll_waited}s)")
+                    return file_truelist
+                else:
+                    # Still None = in progress
+                    if poll_waited % 30 == 0 and poll_waited > 0:
+                        print(f"   ⏳ Still waiting for TrueList... ({poll_waited}s elapsed)")
+        except Exception as e:
+            print(f"   ⚠️ Error reading leads file: {e}")
+        
+        await asyncio.sleep(poll_interval)
+        poll_waited += poll_interval
+        
+        if poll_waited >= max_wait:
+            print(f"   ❌ Timeout waiting for TrueList results ({int(max_wait)}s)")
+            print(f"   ⚠️ Leads will fail email verification")
+            return {}
+
+
+class _TrueListStream:
+    """
+    Per-email TrueList results pushed by the coordinator over the epoch channel.
+
+    Leads whose email result is still unknown wait here; take() hands back the ones
+    whose result has arrived since the last call, in arrival order (input order
+    within one update), so they can be released into Stage 4-5 immediately.
+    Partial results are provisional: once the stream finishes, every lead routed
+    on one is checked against the final result set (reconciled).
+    """
+
+    def __init__(self, channel, deadline: float):
+        self.channel = channel
+        self.deadline = deadline
+        self.waiting: Dict[str, List[int]] = {}  # email (lowercase) -> lead indices
+        self.routed: Dict[int, Optional[dict]] = {}  # lead index -> email result it was routed on
+        self.reconciled = False
+        self._arrived: List[str] = []
+        channel.on_email_results(self._on_results)
+
+    def add(self, email: str, idx: int):
+        self.waiting.setdefault(email, []).append(idx)
+
+    def _on_results(self, delta: Dict[str, dict]):
+        for email in delta:
+            if email in self.waiting:
+                self._arrived.append(email)
+
+    def has_arrivals(self) -> bool:
+        return bool(self._arrived)
+
+    def take(self) -> List[Tuple[int, dict]]:
+        ready = []
+        for email in self._arrived:
+            for idx in sorted(self.waiting.pop(email, [])):
+                ready.append((idx, self.channel.email_results.get(email)))
+        self._arrived = []
+        return ready
+
+    @property
+    def finished(self) -> bool:
+        """No more results will arrive on the channel (done, disconnected, or past the deadline)."""
+        return self.channel.truelist_done or not self.channel.connected or time.time() >= self.deadline
+
+
+async def run_batch_automated_checks(
+    leads: List[dict],
+    container_id: int = 0,
+    precomputed_email_results: Dict[str, dict] = None,
+    leads_file_path: str = None,
+    sequential_stage0_2: Optional[bool] = None,
+    epoch_channel=None
+) -> List[Tuple[bool, dict]]:
+    """
+    Batch validation with bounded-concurrency Stage 0-2 and SEQUENTIAL Stage 4-5.
+    Stage 0-2 runs IN PARALLEL with coordinator's centralized TrueList batch.
+    
+    This REPLACES calling run_automated_checks() individually for each lead.
+    Orchestrates the full batch flow without modifying any actual validation checks.
+    
+    Flow (when leads_file_path is provided - worker/coordinator mode):
+    1. Run Stage 0-2 for all leads (concurrent, order-preserving)
+    2. Wait for truelist_results on epoch_channel (pushed by the coordinator);
+       without a connected channel, POLL leads_file_path until they are available
+    3. Use the received results for Stage 4-5
+    With STAGE4_5_STREAMING and a connected epoch_channel, step 2 does not block:
+    each lead enters Stage 4-5 as soon as its own email result is pushed (first
+    batch, retry batches and inline verification each publish partial results),
+    so Stage 4-5 overlaps the coordinator's retries. The batch still waits for the
+    final result set and re-routes any lead whose partial result it dropped or
+    changed (e.g. {} after a failed coordinator batch). Verdicts do not depend on
+    arrival order, and results are still returned in input order.
+    
+    Flow (when precomputed_email_results is provided - already has results):
+    1. Run Stage 0-2 for all leads (concurrent, order-preserving)
+    2. Use precomputed email results directly
+    3. Run Stage 4-5 SEQUENTIALLY
+    
+    Args:
+        leads: List of lead dicts (e.g., 110 leads per container)
+        container_id: Container ID (0-29) for logging (and the legacy WHOIS
+                      stagger in sequential mode).
+        precomputed_email_results: Dict mapping email (lowercase) -> result dict.
+                                   If provided, skip polling and use these directly.
+        leads_file_path: Path to shared leads file for polling truelist_results.
+                         If provided, poll this file after Stage 0-2 until truelist_results is available.
+        sequential_stage0_2: Run Stage 0-2 one lead at a time with the legacy
+                             container stagger and 0.5s per-lead sleep.
+                             Defaults to the STAGE0_2_SEQUENTIAL env flag; otherwise
+                             leads run through the bounded-concurrency executor.
+        epoch_channel: Connected epoch_channel.EpochSubscriber for this epoch. Used
+                       instead of polling leads_file_path while it stays connected.
+    
+    Returns:
+        List of (passed, automated_checks_data) tuples in SAME ORDER as input
+        - passed: True (approved), False (rejected), or None (skipped)
+    
+    CRITICAL: Results are returned in the SAME ORDER as input leads.
+    """
+    from validator_models.http_client import log_http_client_stats
+    from validator_models.rate_governor import log_rate_governor_stats
+    from validator_models.provider_resilience import log_provider_resilience_stats
+    from validator_models.serp_cache import get_serp_cache_stats, log_serp_cache_stats
+    from validator_models.llm_service import log_llm_stats
+    from validator_models.dns_engine import prefetch_leads_dns
+    from validator_models.domain_plan import DomainCheckPlan, activate_plan, deactivate_plan
+    from validator_models.check_evidence import get_check_evidence_stats, log_check_evidence_stats
+    from validator_models.automated_checks.company_cache import (
+        log_company_fetch_stats,
+        reset_company_fetch_stats,
+    )
+    from validator_models.automated_checks.email_verification import (
+        delete_truelist_batch,
+        retry_truelist_batch,
+        verify_emails_inline,
+    )
+    print(f"📦 Starting batch validation for {len(leads)} leads")
+    start_time = time.time()
+    reset_company_fetch_stats()
+    serp_stats_start = get_serp_cache_stats()
+    evidence_stats_start = get_check_evidence_stats()
+    
+    n = len(leads)
+    
+    # Handle empty batch
+    if n == 0:
+        print("   ⚠️ Empty batch - nothing to validate")
+        return []
+    
+    # Initialize results array with None (will be filled in order)
+    results = [None] * n  # Index-based for order preservation
+    
+    # ========================================================================
+    # Step 1: Extract emails and build lookup maps
+    # ========================================================================
+    emails = []
+    email_to_idx = {}  # email (lowercase) -> index in leads list
+    
+    for i, lead in enumerate(leads):
+        email = get_email(lead)
+        if email:
+            email_lower = email.lower()  # Normalize to lowercase for matching with CSV results
+            emails.append(email_lower)
+            email_to_idx[email_lower] = i
+        else:
+            # No email - immediate rejection
+            results[i] = (False, {
+                "passed": False,
+                "rejection_reason": {
+                    "stage": "Pre-Batch",
+                    "check_name": "email_extraction",
+                    "message": "No email found in lead",
+                                "failed_fields": ["email"]
+                }
+            })
+    
+    print(f"   📧 Extracted {len(emails)} emails from {n} leads")
+    
+    # Check if all leads rejected (no valid emails)
+    if not emails:
+        print("   ⚠️ No valid emails found - all leads rejected")
+        return results
+    
+    # ========================================================================
+    # Step 1.5: FAST PRE-FILTER - Reject emails without @ sign
+    # ========================================================================
+    # This is a super low-latency check that:
+    # 1. Prevents TrueList batch from failing (it rejects entire batch if ANY email lacks @)
+    # 2. Saves Stage 0-2 processing time for obviously invalid emails
+    
+    valid_emails = []
+    invalid_syntax_count = 0
+    
+    for email in emails:
+        if '@' not in email:
+            # Instant rejection - no @ sign
+            idx = email_to_idx[email]
+            results[idx] = (False, {
+                "passed": False,
+                "rejection_reason": {
+                    "stage": "Pre-Batch",
+                    "check_name": "email_syntax_prefilter",
+                    "message": "Email missing @ symbol (instant rejection)",
+                                "failed_fields": ["email"]
+                }
+            })
+            invalid_syntax_count += 1
+        else:
+            valid_emails.append(email)
+    
+    if invalid_syntax_count > 0:
+        print(f"   ⚡ Pre-filter: Rejected {invalid_syntax_count} emails (missing @ sign)")
+    
+    print(f"   ✅ {len(valid_emails)} valid emails ready for batch processing")
+    
+    # Update email list and check if any remain
+    emails = valid_emails
+    
+    if not emails:
+        print("   ⚠️ No valid emails after pre-filter - all leads rejected")
+        return results
+    
+    # ========================================================================
+    # Step 2: Determine TrueList results source
+    # ========================================================================
+    # Centralized TrueList is handled EXTERNALLY by coordinator's background task.
+    # This function just runs Stage 0-2, then polls file OR uses precomputed results.
+    
+    has_precomputed = precomputed_email_results is not None and len(precomputed_email_results) > 0
+    needs_polling = leads_file_path is not None and not has_precomputed
+    streaming = (needs_polling and STAGE4_5_STREAMING
+                 and epoch_channel is not None and epoch_channel.connected)
+    
+    if has_precomputed:
+        print(f"   📥 Using precomputed TrueList results ({len(precomputed_email_results)} emails)")
+    elif streaming:
+        print(f"   📡 Will stream TrueList results into Stage 4-5 as they arrive on the epoch channel")
+    elif needs_polling and epoch_channel is not None and epoch_channel.connected:
+        print(f"   ⏳ Will wait for TrueList results on the epoch channel after Stage 0-2")
+    elif needs_polling:
+        print(f"   ⏳ Will poll {leads_file_path} for TrueList results after Stage 0-2")
+    else:
+        print(f"   ⚠️ No TrueList source - leads will fail email verification")
+    
+    # Stage 0-2 starts right away in every container: WHOIS is paced host-wide by
+    # the rate governor instead of a container_id * 8s stagger (sequential mode
+    # below still applies the stagger so it stays a like-for-like legacy baseline).
+    #
+    # Batch-resolve every lead's DNS queries in one pass.
+    # Per-lead Stage 1-2 checks then read from the DNS cache or join in-flight queries.
+    dns_prefetch_task = asyncio.create_task(prefetch_leads_dns([
+        get_lead_dns_domains(leads[email_to_idx[email]]) for email in emails
+    ]))
+    
+    # Domain plan: group the batch by domain so WHOIS, MX, SPF/DMARC, HEAD, DNSBL
+    # and WHOIS/DNSBL reputation run once per unique domain; every other lead of
+    # that domain gets a copy of the result and its lead[...] side fields.
+    # Tasks created from here on (Stage 0-2 executor, retries, Stage 4-5) inherit it.
+    domain_plan = DomainCheckPlan([leads[email_to_idx[email]] for email in emails], get_lead_dns_domains)
+    domain_plan_token = activate_plan(domain_plan)
+    print(f"   🧭 Domain plan: {len(emails)} leads -> "
+          f"{domain_plan.planned['check_domain_age']['unique_domains']} website domains, "
+          f"{domain_plan.planned['check_spf_dmarc']['unique_domains']} email domains")
+    
+    # ========================================================================
+    # Step 3: Run Stage 0-2 (while TrueList batch processes)
+    # Default: bounded-concurrency executor - up to STAGE0_2_CONCURRENCY leads in
+    # flight, with WHOIS / DNS / HEAD each throttled by dependency_limit().
+    # sequential_stage0_2=True (or STAGE0_2_SEQUENTIAL=true) restores the old
+    # pacing: container_id * 8s stagger, then one lead at a time with a 0.5s
+    # sleep between leads.
+    # ========================================================================
+    if sequential_stage0_2 is None:
+        sequential_stage0_2 = STAGE0_2_SEQUENTIAL
+    
+    async def _stage0_2_for_lead(i: int, lead: dict) -> Tuple[bool, dict]:
+        email = get_email(lead)
+        
+        # Skip leads without email (already rejected in Step 1)
+        if not email:
+            return (False, results[i][1] if results[i] else {})
+        
+        print(f"   Stage 0-2: Lead {i+1}/{n} ({email})")
+        
+        try:
+            return await run_stage0_2_checks(lead)
+        except Exception as e:
+            print(f"      ❌ Stage 0-2 error: {e}")
+            return (False, {
+                "passed": False,
+                "rejection_reason": {
+                    "stage": "Stage 0-2",
+                    "check_name": "run_stage0_2_checks",
+                    "message": f"Stage 0-2 error: {str(e)}",
+                    "error": str(e)
+                }
+            })
+    
+    stage0_2_start = time.time()
+    
+    if sequential_stage0_2:
+        # Legacy per-container stagger so WHOIS requests from the containers on a
+        # host do not all start at once
+        stagger_delay = container_id * STAGE0_2_STAGGER_DELAY_SECONDS
+        if stagger_delay > 0:
+            print(f"   ⏳ Container {container_id}: Waiting {stagger_delay}s before Stage 0-2 (staggered WHOIS)...")
+            await asyncio.sleep(stagger_delay)
+        
+        print(f"   🔍 Running Stage 0-2 checks SEQUENTIALLY for {n} leads...")
+        stage0_2_results = []  # List of (passed, data) in order, indexed by lead position
+        
+        for i, lead in enumerate(leads):
+            stage0_2_results.append(await _stage0_2_for_lead(i, lead))
+            
+            # 0.5-second delay between Stage 0-2 leads (rate limiting)
+            if i < len(leads) - 1:
+                await asyncio.sleep(0.5)
+    else:
+        print(f"   🔍 Running Stage 0-2 checks for {n} leads "
+              f"(concurrency={STAGE0_2_CONCURRENCY}, limits={DEPENDENCY_LIMITS})...")
+        stage0_2_semaphore = asyncio.Semaphore(STAGE0_2_CONCURRENCY)
+        
+        async def _bounded_stage0_2(i: int, lead: dict) -> Tuple[bool, dict]:
+            async with metered(stage0_2_semaphore, "stage0_2_executor"):
+                return await _stage0_2_for_lead(i, lead)
+        
+        # gather() preserves input order, so stage0_2_results[i] belongs to leads[i]
+        stage0_2_results = list(await asyncio.gather(
+            *[_bounded_stage0_2(i, lead) for i, lead in enumerate(leads)]
+        ))
+    
+    stage0_2_elapsed = time.time() - stage0_2_start
+    stage0_2_throughput = n / stage0_2_elapsed if stage0_2_elapsed > 0 else 0.0
+    print(f"   ⚡ Stage 0-2 throughput: {n} leads in {stage0_2_elapsed:.1f}s "
+          f"({stage0_2_throughput:.2f} leads/s, {'sequential' if sequential_stage0_2 else 'concurrent'})")
+    
+    await dns_prefetch_task
+    
+    stage0_2_passed_count = sum(1 for passed, _ in stage0_2_results if passed)
+    print(f"   ✅ Stage 0-2 complete: {stage0_2_passed_count}/{n} passed")
+    
+    # ========================================================================
+    # Step 4: Get TrueList results (precomputed, streamed, OR poll file)
+    # ========================================================================
+    
+    email_results = {}
+    stream = None  # _TrueListStream while streaming results are still arriving
+    truelist_wait = 0.0  # Seconds Stage 4-5 sat idle waiting for email results
+    
+    if has_precomputed:
+        # Use precomputed results directly
+        email_results = precomputed_email_results
+        print(f"   ✅ Using precomputed email results: {len(email_results)} emails")
+    elif streaming:
+        # Start Stage 4-5 with whatever the coordinator has published so far;
+        # the rest of the leads are released as their results arrive
+        email_results = dict(epoch_channel.email_results)
+        stream = _TrueListStream(epoch_channel, deadline=time.time() + TRUELIST_WAIT_TIMEOUT)
+        print(f"   📡 Streaming TrueList results from the epoch channel "
+              f"({len(email_results)} already received)")
+    elif needs_polling:
+        poll_start = time.time()
+        channel_results = None
+        
+        if epoch_channel is not None and epoch_channel.connected:
+            # Coordinator pushes results the moment TrueList finishes
+            channel_results = await epoch_channel.wait_truelist(timeout=TRUELIST_WAIT_TIMEOUT)
+            poll_waited = int(time.time() - poll_start)
+            if channel_results is not None:
+                email_results = channel_results
+                print(f"   ✅ Received TrueList results on epoch channel: {len(email_results)} emails (waited {poll_waited}s)")
+            elif poll_waited < TRUELIST_WAIT_TIMEOUT:
+                print(f"   ⚠️ Epoch channel closed - falling back to polling {leads_file_path}")
+        
+        if channel_results is None:
+            # POLL the leads file until truelist_results is available (not None)
+            print(f"   ⏳ Polling for TrueList results from coordinator...")
+            email_results = await _poll_leads_file_truelist(
+                leads_file_path, max(TRUELIST_WAIT_TIMEOUT - (time.time() - poll_start), 5)
+            )
+        truelist_wait += time.time() - poll_start
+    else:
+        # No source - all leads fail email verification
+        print(f"   ⚠️ No TrueList results available - leads will fail email verification")
+        email_results = {}
+    
+    # ========================================================================
+    # Step 5: Categorize leads
+    # ========================================================================
+    stage4_5_queue = []  # List of (index, lead, email_result, stage0_2_data)
+    needs_retry = []     # List of emails that errored
+    
+    def _categorize(i: int, email_result: Optional[dict]):
+        """Route one Stage 0-2 survivor by its email result (None if not in results)."""
+        lead = leads[i]
+        if stream is not None:
+            stream.routed[i] = email_result
+        email_lower = get_email(lead).lower()
+        stage0_2_passed, stage0_2_data = stage0_2_results[i]
+        
+        if email_result is None:
+            # Email NOT IN results at all
+            if has_precomputed or needs_polling:
+                # Using precomputed/polled results: Coordinator couldn't verify this email → skip
+                # (Coordinator has already done retries, so we trust the absence)
+                results[i] = (None, {
+                    "skipped": True,
+                    "reason": "EmailNotInPrecomputedResults",
+                    "message": "Coordinator could not verify this email"
+                })
+            else:
+                # No external results: Queue for retry
+                # This happens when TrueList's CSV doesn't include all emails
+                needs_retry.append(email_lower)
+        elif email_result.get("needs_retry"):
+            # Email explicitly errored
+            if has_precomputed or needs_polling:
+                # WORKER MODE: Coordinator marked as needing retry but couldn't resolve → skip
+                results[i] = (None, {
+                    "skipped": True,
+                    "reason": "EmailVerificationIncomplete",
+                    "message": "Coordinator could not complete email verification"
+                })
+            else:
+                # COORDINATOR MODE: Queue for retry
+                needs_retry.append(email_lower)
+        elif email_result.get("passed"):
+            # Both passed → queue for Stage 4-5
+            stage4_5_queue.append((i, lead, email_result, stage0_2_data))
+        else:
+            # Email explicitly failed (has status) → reject
+            rejection_data = stage0_2_data.copy()
+            rejection_data["passed"] = False
+            rejection_data["rejection_reason"] = email_result.get("rejection_reason") or {
+                "stage": "Stage 3: Email Verification (Batch)",
+                "check_name": "truelist_batch",
+                "message": f"Email verification failed: {email_result.get('status', 'unknown')}",
+                                "failed_fields": ["email"]
+            }
+            results[i] = (False, rejection_data)
+    
+    for i, lead in enumerate(leads):
+        email = get_email(lead)
+        
+        # Skip leads without email (already rejected)
+        if not email:
+            continue
+        
+        email_lower = email.lower()  # Use lowercase for lookup (CSV results are lowercase)
+        stage0_2_passed, stage0_2_data = stage0_2_results[i]
+        
+        if not stage0_2_passed:
+            # Failed Stage 0-2 → immediate reject
+            results[i] = (False, stage0_2_data)
+        elif stream is not None and email_lower not in email_results:
+            # Result not published yet - released into Stage 4-5 when it arrives
+            stream.add(email_lower, i)
+        else:
+            _categorize(i, email_results.get(email_lower, None))
+    
+    print(f"   📊 Categorization: {len(stage4_5_queue)} ready for Stage 4-5, {sum(1 for r in results if r and r[0] == False)} rejected, {len(needs_retry)} need retry"
+          + (f", {sum(len(idxs) for idxs in stream.waiting.values())} awaiting TrueList" if stream is not None else ""))
+    
+    # ========================================================================
+    # Step 6: Start Stage 4-5 SEQUENTIALLY + Handle retries in parallel
+    # ========================================================================
+    
+    # Start retry batch if needed (runs in background)
+    # NOTE: When polling file, retries are handled by coordinator - workers don't retry
+    retry_task = None
+    inline_task = None  # Inline verification task (runs in background after retries exhaust)
+    retry_attempt = 0
+    last_retry_batch_id = None  # Track retry batch_id for deletion before next retry
+    
+    if needs_retry and not has_precomputed and not needs_polling:
+        # COORDINATOR MODE ONLY: Retry failed emails
+        # CRITICAL: Delete the original batch BEFORE retrying
+        # TrueList detects duplicate email content and rejects re-submissions.
+        # Deleting the batch clears their duplicate detection for those emails.
+        if original_batch_id:
+            await delete_truelist_batch(original_batch_id)
+        
+        print(f"   🔄 Starting retry batch #1 for {len(needs_retry)} emails...")
+        retry_task = asyncio.create_task(retry_truelist_batch(needs_retry, None))
+    
+    # Process Stage 4-5 queue SEQUENTIALLY
+    queue_idx = 0
+    total_stage4_5 = len(stage4_5_queue)
+    first_result_at = None
+    
+    while (queue_idx < len(stage4_5_queue) or retry_task is not None or inline_task is not None
+           or (stream is not None and not stream.reconciled)):
+        # Release leads whose TrueList result has arrived since the last lead
+        if stream is not None:
+            for idx, email_result in stream.take():
+                _categorize(idx, email_result)
+            if stream.finished and not stream.reconciled:
+                stream.reconciled = True
+                remaining = stream.waiting
+                stream.waiting = {}
+                final_results = None
+                if epoch_channel.truelist_done:
+                    final_results = epoch_channel.email_results
+                elif not epoch_channel.connected and time.time() < stream.deadline:
+                    # Coordinator went away mid-epoch - the leads file still gets the final results
+                    print(f"   ⚠️ Epoch channel closed - polling {leads_file_path} for the final TrueList results")
+                    wait_start = time.time()
+                    final_results = await _poll_leads_file_truelist(leads_file_path, stream.deadline - time.time())
+                    truelist_wait += time.time() - wait_start
+                else:
+                    print(f"   ❌ Timeout waiting for TrueList results ({TRUELIST_WAIT_TIMEOUT}s) - "
+                          f"{sum(len(idxs) for idxs in remaining.values())} leads will fail email verification")
+                if final_results is not None:
+                    # The final set is authoritative (a failed coordinator batch publishes {}):
+                    # re-route every lead whose partial result it dropped or changed, so this
+                    # worker reaches the same verdicts as one reading the leads file
+                    changed = [idx for idx, used in stream.routed.items()
+                               if final_results.get(get_email(leads[idx]).lower()) != used]
+                    if changed:
+                        print(f"   ⚠️ Final TrueList results differ for {len(changed)} streamed leads - re-routing them")
+                        changed_set = set(changed)
+                        stage4_5_queue[queue_idx:] = [entry for entry in stage4_5_queue[queue_idx:]
+                                                      if entry[0] not in changed_set]
+                        for idx in sorted(changed):
+                            results[idx] = None
+                            _categorize(idx, final_results.get(get_email(leads[idx]).lower()))
+                for email, idxs in remaining.items():
+                    for idx in sorted(idxs):
+                        _categorize(idx, (final_results or {}).get(email))
+        
+        # Process next lead in Stage 4-5 queue (if available)
+        if queue_idx < len(stage4_5_queue):
+            idx, lead, email_result, stage0_2_data = stage4_5_queue[queue_idx]
+            email = get_email(lead)
+            print(f"   Stage 4-5: Lead {queue_idx+1}/{len(stage4_5_queue)} ({email})")
+            
+            try:
+                passed, data = await run_stage4_5_repscore(lead, email_result, stage0_2_data)
+                results[idx] = (passed, data)
+            except Exception as e:
+                print(f"      ❌ Stage 4-5 error: {e}")
+                results[idx] = (False, {
+                    "passed": False,
+                    "rejection_reason": {
+                        "stage": "Stage 4-5",
+                        "check_name": "run_stage4_5_repscore",
+                        "message": f"Stage 4-5 error: {str(e)}",
+                        "error": str(e)
+                    }
+                })
+            
+            queue_idx += 1
+            if first_result_at is None:
+                first_result_at = time.time()
+            
+            # No delay between Stage 4-5 leads - ScrapingDog/OpenRouter can handle it
+            # (Stage 0-2 still has 1s delay for DNS/HEAD request rate limiting)
+        
+        # Check if retry batch completed (non-blocking check)
+        if retry_task is not None and retry_task.done():
+            try:
+                last_retry_batch_id, retry_results = retry_task.result()
+            except Exception as e:
+                print(f"   ⚠️ Retry batch failed: {e}")
+                last_retry_batch_id = None
+                retry_results = {email: {"needs_retry": True, "error": str(e)} for email in needs_retry}
+            
+            retry_task = None
+            still_needs_retry = []
+            
+            for email in needs_retry:
+                result = retry_results.get(email, {"needs_retry": True})
+                idx = email_to_idx[email]
+                stage0_2_passed, stage0_2_data = stage0_2_results[idx]
+                
+                if result.get("needs_retry"):
+                    still_needs_retry.append(email)
+                elif result.get("passed"):
+                    # Retry succeeded → add to Stage 4-5 queue
+                    print(f"   ✅ Retry succeeded for: {email}")
+                    stage4_5_queue.append((idx, leads[idx], result, stage0_2_data))
+                else:
+                    # Retry failed → reject
+                    rejection_data = stage0_2_data.copy()
+                    rejection_data["passed"] = False
+                    rejection_data["rejection_reason"] = result.get("rejection_reason") or {
+                        "stage": "Stage 3: Email Verification (Batch Retry)",
+                        "check_name": "truelist_batch",
+                        "message": f"Email verification failed after retry: {result.get('status', 'unknown')}",
+                        "failed_fields": ["email"]
+                    }
+                    results[idx] = (False, rejection_data)
+            
+            needs_retry = still_needs_retry
+            retry_attempt += 1
+            
+            print(f"   📊 After retry #{retry_attempt}: {len(still_needs_retry)} still pending, {len(stage4_5_queue) - queue_idx} added to queue")
+            
+            # Start next retry if needed and haven't exceeded max
+            if needs_retry and retry_attempt < TRUELIST_BATCH_MAX_RETRIES:
+                print(f"   🔄 Starting retry batch #{retry_attempt+1} for {len(needs_retry)} emails...")
+                # Pass the previous retry batch_id so it gets deleted before new submission
+                retry_task = asyncio.create_task(retry_truelist_batch(needs_retry, last_retry_batch_id))
+            elif needs_retry and retry_attempt >= TRUELIST_BATCH_MAX_RETRIES:
+                # ================================================================
+                # INLINE FALLBACK: Retries exhausted, start inline in BACKGROUND
+                # Stage 4-5 continues processing while inline runs
+                # ================================================================
+                print(f"   🔍 Starting inline verification for {len(needs_retry)} emails (retries exhausted)...")
+                inline_task = asyncio.create_task(verify_emails_inline(needs_retry))
+        
+        # Check if inline verification completed (non-blocking check)
+        if inline_task is not None and inline_task.done():
+            try:
+                inline_results = inline_task.result()
+            except Exception as e:
+                print(f"   ⚠️ Inline verification failed: {e}")
+                inline_results = {email: {"needs_retry": True, "error": str(e)} for email in needs_retry}
+            
+            inline_task = None
+            
+            for email in needs_retry:
+                idx = email_to_idx[email]
+                stage0_2_passed, stage0_2_data = stage0_2_results[idx]
+                result = inline_results.get(email.lower(), {"needs_retry": True})
+                
+                if result.get("passed"):
+                    # Inline passed → add to Stage 4-5 queue
+                    print(f"   ✅ Inline verified: {email}")
+                    stage4_5_queue.append((idx, leads[idx], result, stage0_2_data))
+                elif result.get("needs_retry"):
+                    # Still can't verify → skip
+                    print(f"   ⏭️ Cannot verify (batch + inline failed): {email}")
+                    results[idx] = (None, {
+                        "skipped": True,
+                        "reason": "EmailVerificationUnavailable",
+                        "message": f"Email verification unavailable after batch + inline"
+                    })
+                else:
+                    # Inline explicitly failed → reject
+                    rejection_data = stage0_2_data.copy()
+                    rejection_data["passed"] = False
+                    rejection_data["rejection_reason"] = result.get("rejection_reason") or {
+                        "stage": "Stage 3: Email Verification (Inline)",
+                        "check_name": "truelist_inline",
+                        "message": f"Email failed inline verification: {result.get('status', 'unknown')}",
+                        "failed_fields": ["email"]
+                    }
+                    results[idx] = (False, rejection_data)
+            
+            # Clear needs_retry since we've handled them
+            needs_retry = []
+            print(f"   📊 After inline: {len(stage4_5_queue) - queue_idx} leads added to Stage 4-5 queue")
+        
+        # If queue is empty but tasks pending, wait briefly before checking again
+        if queue_idx >= len(stage4_5_queue) and (retry_task is not None or inline_task is not None):
+            await asyncio.sleep(1)
+        elif (queue_idx >= len(stage4_5_queue) and stream is not None and not stream.reconciled
+              and not stream.has_arrivals() and not stream.finished):
+            wait_start = time.time()
+            await epoch_channel.wait_update(timeout=min(5, max(stream.deadline - wait_start, 0)))
+            truelist_wait += time.time() - wait_start
+    
+    # ========================================================================
+    # Step 7: (Moved) Inline verification now happens inside the while loop
+    # immediately after retries are exhausted, so leads get added to Stage 4-5 queue
+    # ========================================================================
+    
+    # ========================================================================
+    # Summary
+    # ========================================================================
+    elapsed = time.time() - start_time
+    passed_count = sum(1 for r in results if r and r[0] is True)
+    failed_count = sum(1 for r in results if r and r[0] is False)
+    skipped_count = sum(1 for r in results if r and r[0] is None)
+    
+    print(f"📦 Batch validation complete in {elapsed:.1f}s")
+    print(f"   ✅ Passed: {passed_count}")
+    print(f"   ❌ Failed: {failed_count}")
+    print(f"   ⏭️ Skipped: {skipped_count}")
+    _last_batch_timing.clear()
+    _last_batch_timing.update({
+        "mode": "streaming" if streaming else "batch",
+        "leads": n,
+        "stage4_5_leads": len(stage4_5_queue),
+        "stage0_2_s": round(stage0_2_elapsed, 1),
+        "time_to_first_result_s": round(first_result_at - start_time, 1) if first_result_at else None,
+        "truelist_wait_s": round(truelist_wait, 1),
+        "total_s": round(elapsed, 1),
+        "finished_at": datetime.utcnow().isoformat() + "Z",
+    })
+    first_result = _last_batch_timing["time_to_first_result_s"]
+    print(f"   ⏱️ Stage 4-5 ({_last_batch_timing['mode']}): first result after "
+          f"{f'{first_result}s' if first_result is not None else 'n/a'}, {_last_batch_timing['truelist_wait_s']}s waiting "
+          f"for TrueList, total {_last_batch_timing['total_s']}s")
+    domain_plan.log_report()
+    log_company_fetch_stats()
+    log_check_evidence_stats(since=evidence_stats_start)
+    deactivate_plan(domain_plan_token)
+    log_http_client_stats()
+    log_rate_governor_stats()
+    log_provider_resilience_stats()
+    log_llm_stats()
+    log_serp_cache_stats(since=serp_stats_start)
+    log_pipeline_metrics()
+    
+    return results
+
+
+# Main validation pipeline
+
+@instrumented_check
+async def run_automated_checks(lead: dict) -> Tuple[bool, dict]:
+    """
+    Run all automated checks in stages, returning (passed, structured_data).
+
+    Returns:
+        Tuple[bool, dict]: (passed, structured_automated_checks_data)
+            - If passed: (True, structured_data with stage_1_dns, stage_2_domain, stage_3_email)
+            - If failed: (False, structured_data with rejection_reason and partial check data)
+            
+    Structured data format (tasks2.md Phase 1):
+    {
+        "stage_1_dns": {
+            "has_mx": bool,
+            "has_spf": bool,
+            "has_dmarc": bool,
+            "dmarc_policy": str
+        },
+        "stage_2_domain": {
+            "dnsbl_checked": bool,
+            "dnsbl_blacklisted": bool,
+            "dnsbl_list": str,
+            "domain_age_days": int,
+            "domain_registrar": str,
+            "domain_nameservers": list,
+            "whois_updated_days_ago": int
+        },
+        "stage_3_email": {
+            "email_status": str,  # "valid", "catch-all", "invalid", "unknown"
+            "email_score": int,
+            "is_disposable": bool,
+            "is_role_based": bool,
+            "is_free": bool
+        },
+        "passed": bool,
+        "rejection_reason": dict or None
+    }
+    """
+    from validator_models.automated_checks.icp import (
+        _matches_icp_definitions,
+        calculate_icp_adjustment,
+        is_enterprise_company,
+    )
+    from validator_models.automated_checks.company_cache import (
+        get_standardized_company_name,
+        set_standardized_company_name,
+    )
+    from validator_models.automated_checks.stage0_2 import (
+        check_disposable,
+        check_dnsbl,
+        check_domain_age,
+        check_email_regex,
+        check_free_email_domain,
+        check_general_purpose_email,
+        check_head_request,
+        check_mx_record,
+        check_name_email_match,
+        check_required_fields,
+        check_spf_dmarc,
+    )
+    from validator_models.automated_checks.stage4 import check_linkedin_gse
+    from validator_models.automated_checks.rep_score import (
+        check_companies_house,
+        check_gdelt_mentions,
+        check_sec_edgar,
+        check_wayback_machine,
+        check_whois_dnsbl_reputation,
+    )
+    from validator_models.automated_checks.provenance import (
+        check_licensed_resale_proof,
+        check_source_provenance,
+    )
+    from validator_models.automated_checks.stage5 import check_stage5_unified
+    from validator_models.check_evidence import run_with_evidence
+
+    email = get_email(lead)
+    company = get_company(lead)
+    
+    # Initialize structured data collection
+    automated_checks_data = {
+        "stage_0_hardcoded": {
+            "name_in_email": False,
+            "is_general_purpose_email": False
+        },
+        "stage_1_dns": {
+            "has_mx": False,
+            "has_spf": False,
+            "has_dmarc": False,
+            "dmarc_policy": None
+        },
+        "stage_2_domain": {
+            "dnsbl_checked": False,
+            "dnsbl_blacklisted": False,
+            "dnsbl_list": None,
+            "domain_age_days": None,
+            "domain_registrar": None,
+            "domain_nameservers": None,
+            "whois_updated_days_ago": None
+        },
+        "stage_3_email": {
+            "email_status": "unknown",
+            "email_score": 0,
+            "is_disposable": False,
+            "is_role_based": False,
+            "is_free": False
+        },
+        "stage_4_linkedin": {
+            "linkedin_verified": False,
+            "gse_search_count": 0,
+            "llm_confidence": "none"
+        },
+        "stage_5_verification": {  # NEW: Role/Region/Industry verification
+            "role_verified": False,
+            "region_verified": False,
+            "industry_verified": False,
+            "extracted_role": None,
+            "extracted_region": None,
+            "extracted_industry": None,
+            "early_exit": None  # "role_failed", "region_failed", or None
+        },
+        "rep_score": {
+            "total_score": 0,
+            "max_score": MAX_REP_SCORE,
+            "breakdown": {
+                "wayback_machine": 0,
+                "uspto_trademarks": 0,
+                "sec_edgar": 0,
+                "whois_dnsbl": 0,
+                "gdelt": 0,
+                "companies_house": 0
+            }
+        },
+        "passed": False,
+        "rejection_reason": None
+    }
+
+    # ========================================================================
+    # Pre-Attestation Check: REMOVED
+    # ========================================================================
+    # NOTE: Attestation verification removed from validators.
+    # Validators don't have Supabase credentials and shouldn't verify attestations.
+    # 
+    # SECURITY: Gateway verifies attestations during POST /submit:
+    # - If lead is in validator queue → gateway already verified attestation
+    # - Validators trust gateway's verification (gateway is TEE-protected)
+    # - This prevents security bypass where validator skips check due to 401 errors
+    # 
+    # If you need attestation verification, implement it in gateway/api/submit.py
+    print(f"🔍 Pre-Attestation Check: Skipped (gateway verifies during submission)")
+
+    # ========================================================================
+    # Source Provenance Verification: Source Validation (HARD)
+    # Validates source_url, source_type, denylist, and licensed resale proof
+    # ========================================================================
+    print(f"🔍 Source Provenance Verification: Source validation for {email} @ {company}")
+    
+    checks_stage0_5 = [
+        check_source_provenance,       # Validate source URL, type, denylist
+        check_licensed_resale_proof,   # Validate license hash if applicable
+    ]
+    
+    for check_func in checks_stage0_5:
+        passed, rejection_reason = await check_func(lead)
+        if not passed:
+            msg = rejection_reason.get("message", "Unknown error") if rejection_reason else "Unknown error"
+            print(f"   ❌ Source Provenance Verification failed: {msg}")
+            automated_checks_data["passed"] = False
+            automated_checks_data["rejection_reason"] = rejection_reason
+            return False, automated_checks_data
+    
+    print("   ✅ Source Provenance Verification passed")
+
+    # ========================================================================
+    # Stage 0: Hardcoded Checks (MIXED)
+    # - Required Fields, Email Regex, Name-Email Match, General Purpose Email, Disposable, HEAD Request
+    # - Deduplication (handled in validate_lead_list)
+    # ========================================================================
+    print(f"🔍 Stage 0: Hardcoded checks for {email} @ {company}")
+    
+    # OPTIMIZATION: Run instant checks first, then overlap HEAD request with Stage 1 DNS checks
+    # Instant checks (run sequentially - they're <0.01s each anyway)
+    checks_stage0_instant = [
+        check_required_fields,      # Required fields validation (HARD)
+        check_email_regex,          # RFC-5322 regex validation (HARD)
+        check_name_email_match,     # Name in email check (HARD) - NEW
+        check_general_purpose_email,# General purpose email filter (HARD) - NEW
+        check_free_email_domain,    # Reject free email domains (HARD) - NEW
+        check_disposable,           # Filter throwaway email providers (HARD)
+    ]
+
+    for check_func in checks_stage0_instant:
+        passed, rejection_reason = await check_func(lead)
+        if not passed:
+            msg = rejection_reason.get("message", "Unknown error") if rejection_reason else "Unknown error"
+            print(f"   ❌ Stage 0 failed: {msg}")
+            automated_checks_data["passed"] = False
+            automated_checks_data["rejection_reason"] = rejection_reason
+            return False, automated_checks_data
+
+    # Collect Stage 0 data after successful instant checks
+    automated_checks_data["stage_0_hardcoded"]["name_in_email"] = True  # Passed name-email match
+    automated_checks_data["stage_0_hardcoded"]["is_general_purpose_email"] = False  # Not general purpose
+
+    print("   ✅ Stage 0 instant checks passed")
+    
+    # OPTIMIZATION: Start HEAD request as background task (will check result after Stage 1)
+    # This overlaps the 5-10s HEAD request with 1-3s Stage 1 DNS checks
+    head_request_task = asyncio.create_task(run_with_evidence(check_head_request, lead))
+
+    # ========================================================================
+    # Stage 1: DNS Layer (MIXED)
+    # - Domain Age, MX Record (HARD)
+    # - SPF/DMARC (SOFT - always passes, appends data)
+    # ========================================================================
+    print(f"🔍 Stage 1: DNS layer checks for {email} @ {company}")
+    
+    # OPTIMIZATION: Run all Stage 1 DNS checks in parallel to save time
+    # Old: Sequential execution = 2-5s total
+    # New: Parallel execution = 1-3s (time of slowest check)
+    results = await asyncio.gather(
+        run_with_evidence(check_domain_age, lead),
+        run_with_evidence(check_mx_record, lead),
+        run_with_evidence(check_spf_dmarc, lead),
+        return_exceptions=True  # Don't fail entire batch if one check fails
+    )
+    
+    # Check results
+    check_names = ["check_domain_age", "check_mx_record", "check_spf_dmarc"]
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            # Handle exception
+            print(f"   ❌ Stage 1 failed: {str(result)}")
+            automated_checks_data["passed"] = False
+            automated_checks_data["rejection_reason"] = {
+                "stage": "Stage 1: DNS Layer",
+                "check_name": check_names[i],
+                "message": f"Check failed: {str(result)}",
+                "failed_fields": ["domain"]
+            }
+            # Collect partial Stage 1 data even on failure
+            automated_checks_data["stage_1_dns"]["has_mx"] = lead.get("has_mx", False)
+            automated_checks_data["stage_1_dns"]["has_spf"] = lead.get("has_spf", False)
+            automated_checks_data["stage_1_dns"]["has_dmarc"] = lead.get("has_dmarc", False)
+            automated_checks_data["stage_1_dns"]["dmarc_policy"] = "strict" if lead.get("dmarc_policy_strict") else "none"
+            # Collect partial Stage 2 data (WHOIS)
+            automated_checks_data["stage_2_domain"]["domain_age_days"] = lead.get("domain_age_days")
+            automated_checks_data["stage_2_domain"]["domain_registrar"] = lead.get("domain_registrar")
+            automated_checks_data["stage_2_domain"]["domain_nameservers"] = lead.get("domain_nameservers")
+            automated_checks_data["stage_2_domain"]["whois_updated_days_ago"] = lead.get("whois_updated_days_ago")
+            return False, automated_checks_data
+        
+        passed, rejection_reason = result
+        if not passed:
+            msg = rejection_reason.get("message", "Unknown error") if rejection_reason else "Unknown error"
+            print(f"   ❌ Stage 1 failed: {msg}")
+            automated_checks_data["passed"] = False
+            automated_checks_data["rejection_reason"] = rejection_reason
+            # Collect partial Stage 1 data even on failure
+            automated_checks_data["stage_1_dns"]["has_mx"] = lead.get("has_mx", False)
+            automated_checks_data["stage_1_dns"]["has_spf"] = lead.get("has_spf", False)
+            automated_checks_data["stage_1_dns"]["has_dmarc"] = lead.get("has_dmarc", False)
+            automated_checks_data["stage_1_dns"]["dmarc_policy"] = "strict" if lead.get("dmarc_policy_strict") else "none"
+            # Collect partial Stage 2 data (WHOIS)
+            automated_checks_data["stage_2_domain"]["domain_age_days"] = lead.get("domain_age_days")
+            automated_checks_data["stage_2_domain"]["domain_registrar"] = lead.get("domain_registrar")
+            automated_checks_data["stage_2_domain"]["domain_nameservers"] = lead.get("domain_nameservers")
+            automated_checks_data["stage_2_domain"]["whois_updated_days_ago"] = lead.get("whois_updated_days_ago")
+            return False, automated_checks_data
+
+    # Collect Stage 1 DNS data after successful checks
+    automated_checks_data["stage_1_dns"]["has_mx"] = lead.get("has_mx", True)  # Passed MX check
+    automated_checks_data["stage_1_dns"]["has_spf"] = lead.get("has_spf", False)
+    automated_checks_data["stage_1_dns"]["has_dmarc"] = lead.get("has_dmarc", False)
+    automated_checks_data["stage_1_dns"]["dmarc_policy"] = "strict" if lead.get("dmarc_policy_strict") else "none"
+
+    print("   ✅ Stage 1 passed")
+
+    # ========================================================================
+    # Stage 0 (continued): HEAD Request Check
+    # Check result of background HEAD request task that was started before Stage 1
+    # ========================================================================
+    print(f"🔍 Stage 0: Website HEAD request check for {email} @ {company}")
+    passed, rejection_reason = await head_request_task
+    if not passed:
+        msg = rejection_reason.get("message", "Unknown error") if rejection_reason else "Unknown error"
+        print(f"   ❌ Stage 0 (HEAD request) failed: {msg}")
+        automated_checks_data["passed"] = False
+        automated_checks_data["rejection_reason"] = rejection_reason
+        return False, automated_checks_data
+    
+    print("   ✅ Stage 0 (HEAD request) passed")
+
+    # ========================================================================
+    # Stage 2: Lightweight Domain Reputation Checks (HARD)
+    # - DNSBL (Domain Block List) - Spamhaus DBL lookup
+    # ========================================================================
+    print(f"🔍 Stage 2: Domain reputation checks for {email} @ {company}")
+    passed, rejection_reason = await run_with_evidence(check_dnsbl, lead)
+    
+    # Collect Stage 2 domain data (DNSBL + WHOIS from Stage 1)
+    automated_checks_data["stage_2_domain"]["dnsbl_checked"] = lead.get("dnsbl_checked", False)
+    automated_checks_data["stage_2_domain"]["dnsbl_blacklisted"] = lead.get("dnsbl_blacklisted", False)
+    automated_checks_data["stage_2_domain"]["dnsbl_list"] = lead.get("dnsbl_list")
+    automated_checks_data["stage_2_domain"]["domain_age_days"] = lead.get("domain_age_days")
+    automated_checks_data["stage_2_domain"]["domain_registrar"] = lead.get("domain_registrar")
+    automated_checks_data["stage_2_domain"]["domain_nameservers"] = lead.get("domain_nameservers")
+    automated_checks_data["stage_2_domain"]["whois_updated_days_ago"] = lead.get("whois_updated_days_ago")
+    
+    if not passed:
+        msg = rejection_reason.get("message", "Unknown error") if rejection_reason else "Unknown error"
+        print(f"   ❌ Stage 2 failed: {msg}")
+        automated_checks_data["passed"] = False
+        automated_checks_data["rejection_reason"] = rejection_reason
+        return False, automated_checks_data
+
+    print("   ✅ Stage 2 passed")
+
+    # ========================================================================
+    # Stage 3: Email Verification (DEPRECATED - use run_batch_automated_checks instead)
+    # ========================================================================
+    # NOTE: Single-email validation has been removed. Email validation is now
+    # handled by TrueList BATCH API in run_batch_automated_checks().
+    # This function is kept for backwards compatibility but should not be used.
+    print(f"⚠️  Stage 3: DEPRECATED - use run_batch_automated_checks() for email validation")
+    print(f"   Skipping single-email validation for {email}")
+    
+    # Mark Stage 3 as skipped (not verified)
+    automated_checks_data["stage_3_email"]["email_status"] = "skipped"
+    automated_checks_data["stage_3_email"]["email_score"] = 0
+    automated_checks_data["stage_3_email"]["is_disposable"] = False
+    automated_checks_data["stage_3_email"]["is_role_based"] = False
+    automated_checks_data["stage_3_email"]["is_free"] = False
+    
+    print("   ⏭️  Stage 3 skipped (use batch validation)")
+
+    # ========================================================================
+    # Stage 4: LinkedIn/GSE Validation (HARD)
+    # ========================================================================
+    print(f"🔍 Stage 4: LinkedIn/GSE validation for {email} @ {company}")
+    
+    passed, rejection_reason = await run_with_evidence(check_linkedin_gse, lead)
+    
+    # Collect Stage 4 data even on failure
+    automated_checks_data["stage_4_linkedin"]["gse_search_count"] = lead.get("gse_search_count", 0)
+    automated_checks_data["stage_4_linkedin"]["llm_confidence"] = lead.get("llm_confidence", "none")
+    
+    if not passed:
+        msg = rejection_reason.get("message", "Unknown error") if rejection_reason else "Unknown error"
+        print(f"   ❌ Stage 4 failed: {msg}")
+        automated_checks_data["passed"] = False
+        automated_checks_data["rejection_reason"] = rejection_reason
+        return False, automated_checks_data
+
+    print("   ✅ Stage 4 passed")
+    
+    # Collect Stage 4 data after successful check
+    automated_checks_data["stage_4_linkedin"]["linkedin_verified"] = True
+    automated_checks_data["stage_4_linkedin"]["gse_search_count"] = lead.get("gse_search_count", 0)
+    automated_checks_data["stage_4_linkedin"]["llm_confidence"] = lead.get("llm_confidence", "none")
+
+    # ========================================================================
+    # Stage 5: Role/Region/Industry Verification (HARD)
+    # - Uses ScrapingDog search + fuzzy matching + LLM to verify role, region, industry
+    # - Early exit: if role fails → skip region/industry
+    # - Early exit: if region fails → skip industry
+    # - Anti-gaming: rejects if miner puts multiple states in region
+    # ========================================================================
+    print(f"🔍 Stage 5: Role/Region/Industry verification for {email} @ {company}")
+    
+    passed, rejection_reason = await run_with_evidence(check_stage5_unified, lead)
+    
+    # Collect Stage 5 data
+    automated_checks_data["stage_5_verification"]["role_verified"] = lead.get("stage5_role_match", False)
+    automated_checks_data["stage_5_verification"]["region_verified"] = lead.get("stage5_region_match", False)
+    automated_checks_data["stage_5_verification"]["industry_verified"] = lead.get("stage5_industry_match", False)
+    automated_checks_data["stage_5_verification"]["extracted_role"] = lead.get("stage5_extracted_role")
+    automated_checks_data["stage_5_verification"]["extracted_region"] = lead.get("stage5_extracted_region")
+    automated_checks_data["stage_5_verification"]["extracted_industry"] = lead.get("stage5_extracted_industry")
+    
+    if not passed:
+        msg = rejection_reason.get("message", "Unknown error") if rejection_reason else "Unknown error"
+        print(f"   ❌ Stage 5 failed: {msg}")
+        automated_checks_data["passed"] = False
+        automated_checks_data["rejection_reason"] = rejection_reason
+        automated_checks_data["stage_5_verification"]["early_exit"] = rejection_reason.get("early_exit") if rejection_reason else None
+        return False, automated_checks_data
+
+    print("   ✅ Stage 5 passed")
+
+    # ========================================================================
+    # ENTERPRISE COMPANY SPECIAL HANDLING (10,001+ employees)
+    # Hardcoded rep score: 10 if ICP match, 5 if not
+    # Skips expensive rep score API calls for giant corporations
+    # ========================================================================
+    if is_enterprise_company(lead):
+        matches_icp = _matches_icp_definitions(lead)
+        hardcoded_score = 10 if matches_icp else 5
+        
+        lead["rep_score"] = hardcoded_score
+        lead["rep_score_details"] = {
+            "enterprise_company": True,
+            "matches_icp": matches_icp,
+            "hardcoded_score": hardcoded_score,
+            "reason": "10,001+ employees - rep score checks skipped"
+        }
+        automated_checks_data["rep_score"] = {
+            "total_score": hardcoded_score,
+            "max_score": MAX_REP_SCORE,
+            "breakdown": {"enterprise_company_hardcoded": hardcoded_score},
+            "enterprise_company": True,
+            "matches_icp": matches_icp
+        }
+        print(f"   🏢 ENTERPRISE COMPANY (10,001+): Hardcoded rep score = {hardcoded_score} ({'ICP match' if matches_icp else 'No ICP match'})")
+    else:
+        # ========================================================================
+        # Rep Score: Soft Reputation Checks (SOFT)
+        # - Wayback Machine (max 6 points), SEC (max 12 points), 
+        #   WHOIS/DNSBL (max 10 points), GDELT Press/Media (max 10 points),
+        #   Companies House (max 10 points)
+        # - Always passes, appends scores to lead
+        # - Total: 0-48 points
+        # ========================================================================
+        print(f"📊 Rep Score: Running soft checks for {email} @ {company} (parallel execution)")
+        
+        # OPTIMIZATION: Run all rep score checks in parallel to save time
+        # Old: Sequential execution = 6-12s total
+        # New: Parallel execution = 3-4s total (time of slowest API)
+        results = await asyncio.gather(
+            check_wayback_machine(lead),
+            check_sec_edgar(lead),
+            check_whois_dnsbl_reputation(lead),
+            check_gdelt_mentions(lead),
+            check_companies_house(lead),
+            return_exceptions=True  # Don't fail entire batch if one check fails
+        )
+        
+        # Unpack results (handle exceptions gracefully)
+        wayback_score, wayback_data = results[0] if not isinstance(results[0], Exception) else (0, {"error": str(results[0])})
+        sec_score, sec_data = results[1] if not isinstance(results[1], Exception) else (0, {"error": str(results[1])})
+        whois_dnsbl_score, whois_dnsbl_data = results[2] if not isinstance(results[2], Exception) else (0, {"error": str(results[2])})
+        gdelt_score, gdelt_data = results[3] if not isinstance(results[3], Exception) else (0, {"error": str(results[3])})
+        companies_house_score, companies_house_data = results[4] if not isinstance(results[4], Exception) else (0, {"error": str(results[4])})
+        
+        total_rep_score = (
+            wayback_score + sec_score + whois_dnsbl_score + gdelt_score +
+            companies_house_score
+        )
+        
+        # Append to lead data
+        lead["rep_score"] = total_rep_score
+        lead["rep_score_details"] = {
+            "wayback": wayback_data,
+            "sec": sec_data,
+            "whois_dnsbl": whois_dnsbl_data,
+            "gdelt": gdelt_data,
+            "companies_house": companies_house_data
+        }
+        
+        # Append to automated_checks_data
+        automated_checks_data["rep_score"] = {
+            "total_score": total_rep_score,
+            "max_score": MAX_REP_SCORE,
+            "breakdown": {
+                "wayback_machine": wayback_score,       # 0-6 points
+                "sec_edgar": sec_score,                 # 0-12 points
+                "whois_dnsbl": whois_dnsbl_score,       # 0-10 points
+                "gdelt": gdelt_score,                   # 0-10 points
+                "companies_house": companies_house_score      # 0-10 points
+            }
+        }
+        
+        print(f"   📊 Rep Score: {total_rep_score:.1f}/{MAX_REP_SCORE} (Wayback: {wayback_score:.1f}/6, SEC: {sec_score:.1f}/12, WHOIS/DNSBL: {whois_dnsbl_score:.1f}/10, GDELT: {gdelt_score:.1f}/10, Companies House: {companies_house_score:.1f}/10)")
+    
+    # ========================================================================
+    # ICP Adjustment Calculation (NEW SYSTEM - Absolute Points)
+    # Replaces the old multiplier system with absolute point adjustments
+    # ========================================================================
+    icp_adjustment = calculate_icp_adjustment(lead)
+    # Store in is_icp_multiplier field for backwards compatibility
+    # Values: -15 to +20 (new format) vs 1.0/1.5/5.0 (old format)
+    lead["is_icp_multiplier"] = float(icp_adjustment)
+    automated_checks_data["is_icp_multiplier"] = float(icp_adjustment)
+
+    # ========================================================================
+    # Company Name Standardization (only on approval)
+    # ========================================================================
+    # Use the company LinkedIn slug to get/set the standardized company name.
+    # This ensures all leads with the same company_linkedin URL have the same
+    # standardized company name, regardless of how the miner submitted it.
+    # ========================================================================
+    company_slug = lead.get("company_linkedin_slug")
+    company_linkedin_data = lead.get("company_linkedin_data")
+
+    if company_slug:
+        # Check cache first
+        standardized_name = get_standardized_company_name(company_slug)
+
+        if standardized_name:
+            # Cache hit - use cached standardized name
+            print(f"   📦 Company name from cache: '{company_slug}' → '{standardized_name}'")
+        else:
+            # Cache miss - get from Stage 4 scraped data and save to cache
+            if company_linkedin_data and company_linkedin_data.get("company_name_from_linkedin"):
+                standardized_name = company_linkedin_data["company_name_from_linkedin"]
+                set_standardized_company_name(company_slug, standardized_name)
+            else:
+                # Fallback to miner's submitted company name if no scraped data
+                standardized_name = company
+                print(f"   ⚠️ No scraped company name available, using submitted: '{standardized_name}'")
+
+        # Set on lead and automated_checks_data
+        lead["company_standardized"] = standardized_name
+        automated_checks_data["company_standardized"] = standardized_name
+        print(f"   ✅ Company standardized: '{company}' → '{standardized_name}'")
+    else:
+        # No company_linkedin_slug - use submitted company name
+        lead["company_standardized"] = company
+        automated_checks_data["company_standardized"] = company
+        print(f"   ⚠️ No company LinkedIn slug, using submitted name: '{company}'")
+
+    print(f"🎉 All stages passed for {email} @ {company}")
+
+    # All checks passed - return structured success data
+    automated_checks_data["passed"] = True
+    automated_checks_data["rejection_reason"] = None
+
+    # IMPORTANT: Also set rep_score on lead object for validator.py to pick up
+    # validator.py looks for lead_blob.get("rep_score", 50)
+    lead["rep_score"] = total_rep_score
+
+    return True, automated_checks_data
+
+
+async def validate_lead_list(leads: list) -> list:
+    """Main validation function - maintains backward compatibility"""
+    from validator_models.automated_checks.legacy import check_duplicates
+
+    # Check for duplicates
+    has_duplicates, duplicate_leads = await check_duplicates(leads)
+    if has_duplicates:
+        duplicate_emails = set(duplicate_leads.values())
+        print(f"Duplicate emails detected: {duplicate_emails}")
+        print(f"Duplicate lead indices: {list(duplicate_leads.keys())}")
+
+        # Process all leads, but mark duplicates as invalid
+        report = []
+        for i, lead in enumerate(leads):
+            email = get_email(lead)
+            website = get_website(lead)
+            domain = urlparse(website).netloc if website else ""
+
+            if i in duplicate_leads:
+                # Mark duplicate lead as invalid
+                report.append({
+                    "lead_index": i,
+                    "email": email,
+                    "company_domain": domain,
+                    "status": "Invalid",
+                    "reason": "Duplicate email"
+                })
+            else:
+                # Process non-duplicate leads through automated checks
+                passed, automated_checks_data = await run_automated_checks(lead)
+                status = "Valid" if passed else "Invalid"
+                # Extract rejection_reason for backwards compatibility
+                reason = automated_checks_data.get("rejection_reason", {}) if not passed else {}
+                report.append({
+                    "lead_index": i,
+                    "email": email,
+                    "company_domain": domain,
+                    "status": status,
+                    "reason": reason,
+                    "automated_checks": automated_checks_data  # NEW: Include full structured data
+                })
+
+        return report
+
+    # Process each lead through the new validation pipeline
+    report = []
+    for i, lead in enumerate(leads):
+        email = get_email(lead)
+        website = get_website(lead)
+        domain = urlparse(website).netloc if website else ""
+
+        # Run new automated checks
+        passed, automated_checks_data = await run_automated_checks(lead)
+
+        status = "Valid" if passed else "Invalid"
+        # Extract rejection_reason for backwards compatibility
+        reason = automated_checks_data.get("rejection_reason", {}) if not passed else {}
+        report.append({
+            "lead_index": i,
+            "email": email,
+            "company_domain": domain,
+            "status": status,
+            "reason": reason,
+            "automated_checks": automated_checks_data  # NEW: Include full structured data
+        })
+
+    return report
+
+# DEPRECATED: Collusion detection function (never used in production)
+# async def collusion_check(validators: list, responses: list) -> dict:
+#     """Simulate PyGOD/DBScan collusion detection."""
+#     validator_scores = []
+#     for v in validators:
+#         for r in responses:
+#             validation = await v.validate_leads(r.leads)
+#             validator_scores.append({"hotkey": v.wallet.hotkey.ss58_address, "O_v": validation["O_v"]})
+# 
+#     # Mock PyGOD analysis
+#     data = np.array([[s["O_v"]] for s in validator_scores])
+#     detector = DOMINANT()
+#     detector.fit(data)
+#     V_c = detector.decision_score_.max()
+# 
+#     collusion_flags = {}
+#     for v in validators:
+#         collusion_flags[v.wallet.hotkey.ss58_address] = 0 if V_c > 0.7 else 1
+#     return collusion_flags
@@ -0,0 +1,227 @@
+"""
+Source provenance and licensed-resale checks.
+"""
+
+from typing import Tuple
+from validator_models.pipeline_metrics import instrumented_check
+
+
+@instrumented_check
+async def check_terms_attestation(lead: dict) -> Tuple[bool, dict]:
+    """
+    Verify miner's attestation metadata against Supabase database (SOURCE OF TRUTH).
+    
+    Security Checks:
+    1. Query contributor_attestations table for wallet's attestation record
+    2. Reject if no valid attestation exists (prevents local file manipulation)
+    3. Verify lead metadata matches Supabase attestation record
+    4. Validate terms version and boolean attestations
+    
+    This is Stage -1 (runs BEFORE all other checks) to ensure regulatory compliance.
+    """
+    from Leadpoet.utils.contributor_terms import TERMS_VERSION_HASH
+    from Leadpoet.utils.cloud_db import get_supabase_client
+    
+    # Check required attestation fields in lead
+    required_fields = ["wallet_ss58", "terms_version_hash", "lawful_collection", 
+                      "no_restricted_sources", "license_granted"]
+    
+    missing = [f for f in required_fields if f not in lead]
+    if missing:
+        return False, {
+            "stage": "Stage -1: Terms Attestation",
+            "check_name": "check_terms_attestation",
+            "message": f"Missing attestation fields: {', '.join(missing)}",
+            "failed_fields": missing
+        }
+    
+    wallet_ss58 = lead.get("wallet_ss58")
+    lead_terms_hash = lead.get("terms_version_hash")
+    
+    # SECURITY CHECK 1: Query Supabase for authoritative attestation record
+    try:
+        supabase = get_supabase_client()
+        if not supabase:
+            # If Supabase not available, log warning but don't fail validation
+            # This prevents breaking validators during network issues
+            print(f"   ⚠️  Supabase client not available - skipping attestation verification")
+            return True, {}
+        
+        result = supabase.table("contributor_attestations")\
+            .select("*")\
+            .eq("wallet_ss58", wallet_ss58)\
+            .eq("terms_version_hash", TERMS_VERSION_HASH)\
+            .eq("accepted", True)\
+            .execute()
+        
+        # SECURITY CHECK 2: Reject if no valid attestation in database
+        if not result.data or len(result.data) == 0:
+            return False, {
+                "stage": "Stage -1: Terms Attestation",
+                "check_name": "check_terms_attestation",
+                "message": f"No valid attestation found in database for wallet {wallet_ss58[:10]}...",
+                "failed_fields": ["wallet_ss58"]
+            }
+        
+        # Attestation exists in Supabase - miner has legitimately accepted terms
+        supabase_attestation = result.data[0]
+        
+    except Exception as e:
+        # Log error but don't fail validation - prevents breaking validators
+        print(f"   ⚠️  Failed to verify attestation in database: {str(e)}")
+        return True, {}
+    
+    # SECURITY CHECK 3: Verify lead metadata matches Supabase record
+    if lead_terms_hash != supabase_attestation.get("terms_version_hash"):
+        return False, {
+            "stage": "Stage -1: Terms Attestation",
+            "check_name": "check_terms_attestation",
+            "message": f"Lead attestation hash mismatch (lead: {lead_terms_hash[:8]}, db: {supabase_attestation.get('terms_version_hash', '')[:8]})",
+            "failed_fields": ["terms_version_hash"]
+        }
+    
+    # Check: Verify terms version is current
+    if lead_terms_hash != TERMS_VERSION_HASH:
+        return False, {
+            "stage": "Stage -1: Terms Attestation",
+            "check_name": "check_terms_attestation",
+            "message": f"Outdated terms version (lead: {lead_terms_hash[:8]}, current: {TERMS_VERSION_HASH[:8]})",
+            "failed_fields": ["terms_version_hash"]
+        }
+    
+    # Check: Verify boolean attestations in lead
+    if not all([lead.get("lawful_collection"), 
+                lead.get("no_restricted_sources"), 
+                lead.get("license_granted")]):
+        return False, {
+            "stage": "Stage -1: Terms Attestation",
+            "check_name": "check_terms_attestation",
+            "message": "Incomplete attestations",
+            "failed_fields": ["lawful_collection", "no_restricted_sources", "license_granted"]
+        }
+    
+    return True, {}
+
+
+@instrumented_check
+async def check_source_provenance(lead: dict) -> Tuple[bool, dict]:
+    """
+    Verify source provenance metadata.
+    
+    Validates:
+    - source_url is present and valid
+    - source_type is in allowed list
+    - Domain not in restricted sources denylist
+    - Domain age ≥ 7 days (reuses existing check)
+    
+    This ensures miners are providing valid source information and not using
+    prohibited data brokers without proper authorization.
+    """
+    from Leadpoet.utils.source_provenance import (
+        validate_source_url,
+        is_restricted_source,
+        extract_domain_from_url
+    )
+    
+    # Check required fields
+    source_url = lead.get("source_url")
+    source_type = lead.get("source_type")
+    
+    if not source_url:
+        return False, {
+            "stage": "Stage 0.5: Source Provenance",
+            "check_name": "check_source_provenance",
+            "message": "Missing source_url",
+            "failed_fields": ["source_url"]
+        }
+    
+    if not source_type:
+        return False, {
+            "stage": "Stage 0.5: Source Provenance",
+            "check_name": "check_source_provenance",
+            "message": "Missing source_type",
+            "failed_fields": ["source_type"]
+        }
+    
+    # Validate source_type against allowed list
+    valid_types = ["public_registry", "company_site", "first_party_form", 
+                   "licensed_resale", "proprietary_database"]
+    if source_type not in valid_types:
+        return False, {
+            "stage": "Stage 0.5: Source Provenance",
+            "check_name": "check_source_provenance",
+            "message": f"Invalid source_type: {source_type}",
+            "failed_fields": ["source_type"]
+        }
+    
+    # Validate source URL (checks denylist, domain age, reachability)
+    # SECURITY: Pass source_type to prevent spoofing proprietary_database
+    try:
+        is_valid, reason = await validate_source_url(source_url, source_type)
+        if not is_valid:
+            return False, {
+                "stage": "Stage 0.5: Source Provenance",
+                "check_name": "check_source_provenance",
+                "message": f"Source URL validation failed: {reason}",
+                "failed_fields": ["source_url"]
+            }
+    except Exception as e:
+        return False, {
+            "stage": "Stage 0.5: Source Provenance",
+            "check_name": "check_source_provenance",
+            "message": f"Error validating source URL: {str(e)}",
+            "failed_fields": ["source_url"]
+        }
+    
+    # Additional check: Extract domain and verify not restricted
+    # (This is redundant with validate_source_url but provides explicit feedback)
+    domain = extract_domain_from_url(source_url)
+    if domain and is_restricted_source(domain):
+        # Only fail if NOT a licensed resale (those are handled in next check)
+        if source_type != "licensed_resale":
+            return False, {
+                "stage": "Stage 0.5: Source Provenance",
+                "check_name": "check_source_provenance",
+                "message": f"Source domain {domain} is in restricted denylist",
+                "failed_fields": ["source_url"]
+            }
+    
+    return True, {}
+
+
+@instrumented_check
+async def check_licensed_resale_proof(lead: dict) -> Tuple[bool, dict]:
+    """
+    Validate license document proof for licensed resale submissions.
+    
+    If source_type = "licensed_resale", validates that:
+    - license_doc_hash is present
+    - license_doc_hash is valid SHA-256 format
+    
+    This allows miners to use restricted data brokers (ZoomInfo, Apollo, etc.)
+    IF they have a valid resale agreement and provide cryptographic proof.
+    """
+    from Leadpoet.utils.source_provenance import validate_licensed_resale
+    
+    source_type = lead.get("source_type")
+    
+    # Only validate if this is a licensed resale submission
+    if source_type != "licensed_resale":
+        return True, {}
+    
+    # Validate license proof
+    is_valid, reason = validate_licensed_resale(lead)
+    
+    if not is_valid:
+        return False, {
+            "stage": "Stage 0.5: Source Provenance",
+            "check_name": "check_licensed_resale_proof",
+            "message": reason,
+            "failed_fields": ["license_doc_hash"]
+        }
+    
+    # Log for audit trail
+    license_hash = lead.get("license_doc_hash", "")
+    print(f"   📄 Licensed resale detected: hash={license_hash[:16]}...")
+    
+    return True, {}
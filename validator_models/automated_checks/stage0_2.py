@@ -0,0 +1,1046 @@
+"""
+Stage 0-2 checks: required fields, email format and domain rules, WHOIS age,
+MX / SPF / DMARC and DNSBL.
+"""
+
+import asyncio
+import dns.resolver
+import re
+from datetime import datetime
+from typing import Tuple
+from Leadpoet.utils.utils_lead_extraction import (
+    get_email,
+    get_website,
+    get_company,
+    get_first_name,
+    get_last_name,
+)
+from validator_models.pipeline_metrics import instrumented_check
+from validator_models.dns_engine import resolve as dns_resolve_async
+from validator_models.domain_index import get_domain_index
+from validator_models.rate_governor import OK, THROTTLED, TIMEOUT, acquire as governor_acquire, report_outcome
+
+from validator_models.automated_checks.config import (
+    CACHE_TTLS,
+    dependency_limit,
+    validation_cache,
+)
+from validator_models.automated_checks.common import (
+    extract_root_domain,
+    log_validation_metrics,
+    restore_from_shared_cache,
+    store_in_shared_cache,
+)
+from validator_models.automated_checks.legacy import check_domain_existence, verify_company
+
+
+# Stage 0: Basic Hardcoded Checks
+
+@instrumented_check
+async def check_required_fields(lead: dict) -> Tuple[bool, dict]:
+    """Check that all required fields are present and non-empty.
+    
+    Region validation:
+    - country and city are ALWAYS required
+    - state is required ONLY for United States leads
+    - The validator builds the region string internally from country/state/city
+    """
+    required_fields = {
+        "industry": ["industry", "Industry"],
+        "sub_industry": ["sub_industry", "sub-industry", "Sub-industry", "Sub_industry"],
+        "role": ["role", "Role"],
+        "country": ["country", "Country"],
+        "city": ["city", "City"],
+    }
+    
+    missing_fields = []
+    
+    # Check for name (either full_name OR both first + last)
+    full_name = lead.get("full_name") or lead.get("Full_name") or lead.get("Full Name")
+    first_name = lead.get("first") or lead.get("First") or lead.get("first_name")
+    last_name = lead.get("last") or lead.get("Last") or lead.get("last_name")
+    
+    has_name = bool(full_name) or (bool(first_name) and bool(last_name))
+    if not has_name:
+        missing_fields.append("contact_name")
+    
+    # Check other required fields
+    for field_name, possible_keys in required_fields.items():
+        found = False
+        for key in possible_keys:
+            value = lead.get(key)
+            if value and str(value).strip():  # Check for non-empty string
+                found = True
+                break
+        
+        if not found:
+            missing_fields.append(field_name)
+    
+    # Special check: state is required for US leads
+    country = lead.get("country") or lead.get("Country") or ""
+    country_lower = country.lower().strip() if country else ""
+    us_aliases = ["united states", "usa", "us", "u.s.", "u.s.a.", "america", "united states of america"]
+    
+    if country_lower in us_aliases:
+        state = lead.get("state") or lead.get("State") or ""
+        if not state or not str(state).strip():
+            missing_fields.append("state (required for US leads)")
+    
+    # Return structured rejection if any fields are missing
+    if missing_fields:
+        return False, {
+            "stage": "Stage 0: Hardcoded Checks",
+            "check_name": "check_required_fields",
+            "message": f"Missing required fields: {', '.join(missing_fields)}",
+            "failed_fields": missing_fields
+        }
+    
+    return True, {}
+
+@instrumented_check
+async def check_email_regex(lead: dict) -> Tuple[bool, dict]:
+    """Check email format using RFC-5322 simplified regex with Unicode support (RFC 6531)"""
+    try:
+        email = get_email(lead)
+        if not email:
+            rejection_reason = {
+                "stage": "Stage 0: Hardcoded Checks",
+                "check_name": "check_email_regex",
+                "message": "No email provided",
+                "failed_fields": ["email"]
+            }
+            # Cache result
+            cache_key = f"email_regex:no_email"
+            validation_cache[cache_key] = (False, rejection_reason)
+            await log_validation_metrics(lead, {"passed": False, "reason": rejection_reason["message"]}, "email_regex")
+            return False, rejection_reason
+
+        # RFC-5322 simplified regex (original ASCII validation)
+        pattern_ascii = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+        is_valid_ascii = bool(re.match(pattern_ascii, email))
+        
+        # RFC-6531 - Internationalized Email (Unicode support for international characters)
+        # Allows emails like: anna.kosińska@cdprojekt.com, müller@siemens.de
+        pattern_unicode = r"^[\w._%+-]+@[\w.-]+\.[a-zA-Z]{2,}$"
+        is_valid_unicode = bool(re.match(pattern_unicode, email, re.UNICODE))
+        
+        # Accept if EITHER pattern matches (ASCII OR Unicode)
+        is_valid = is_valid_ascii or is_valid_unicode
+
+        if not is_valid:
+            rejection_reason = {
+                "stage": "Stage 0: Hardcoded Checks",
+                "check_name": "check_email_regex",
+                "message": f"Invalid email format: {email}",
+                "failed_fields": ["email"]
+            }
+            # Cache result
+            cache_key = f"email_regex:{email}"
+            validation_cache[cache_key] = (False, rejection_reason)
+            await log_validation_metrics(lead, {"passed": False, "reason": rejection_reason["message"]}, "email_regex")
+            return False, rejection_reason
+        
+        # Reject emails with "+" sign (prevents duplicate submission exploit via email aliasing)
+        # Example: jwest+alias1@domain.com and jwest+alias2@domain.com are the same email
+        if "+" in email.split("@")[0]:
+            rejection_reason = {
+                "stage": "Stage 0: Hardcoded Checks",
+                "check_name": "check_email_regex",
+                "message": f"Email contains '+' alias character (not allowed): {email}",
+                "failed_fields": ["email"]
+            }
+            # Cache result
+            cache_key = f"email_regex:{email}"
+            validation_cache[cache_key] = (False, rejection_reason)
+            await log_validation_metrics(lead, {"passed": False, "reason": rejection_reason["message"]}, "email_regex")
+            return False, rejection_reason
+
+        # Valid email - cache success result
+        cache_key = f"email_regex:{email}"
+        validation_cache[cache_key] = (True, {})
+        await log_validation_metrics(lead, {"passed": True, "reason": "Valid email format"}, "email_regex")
+
+        return True, {}
+    except Exception as e:
+        rejection_reason = {
+            "stage": "Stage 0: Hardcoded Checks",
+            "check_name": "check_email_regex",
+            "message": f"Email regex check failed: {str(e)}",
+            "failed_fields": ["email"]
+        }
+        await log_validation_metrics(lead, {"passed": False, "reason": str(e)}, "email_regex")
+        return False, rejection_reason
+
+@instrumented_check
+async def check_name_email_match(lead: dict) -> Tuple[bool, dict]:
+    """
+    Check if first name or last name appears in the email address.
+    This is a HARD check that prevents costly API calls for leads that will fail anyway.
+    
+    Returns:
+        (True, {}): If first OR last name found in email
+        (False, rejection_reason): If NO name found in email
+    """
+    try:
+        email = get_email(lead)
+        first_name = get_first_name(lead)
+        last_name = get_last_name(lead)
+        
+        if not email:
+            rejection_reason = {
+                "stage": "Stage 0: Hardcoded Checks",
+                "check_name": "check_name_email_match",
+                "message": "No email provided",
+                "failed_fields": ["email"]
+            }
+            return False, rejection_reason
+        
+        if not first_name or not last_name:
+            rejection_reason = {
+                "stage": "Stage 0: Hardcoded Checks",
+                "check_name": "check_name_email_match",
+                "message": "Missing first name or last name",
+                "failed_fields": ["first_name", "last_name"]
+            }
+            return False, rejection_reason
+        
+        # Extract local part of email (before @)
+        local_part = email.split("@")[0].lower() if "@" in email else email.lower()
+        
+        # Normalize names for comparison (lowercase, remove special chars)
+        first_normalized = re.sub(r'[^a-z0-9]', '', first_name.lower())
+        last_normalized = re.sub(r'[^a-z0-9]', '', last_name.lower())
+        local_normalized = re.sub(r'[^a-z0-9]', '', local_part)
+        
+        # Check if either first OR last name appears in email
+        # Pattern matching: full name, first initial + last, last + first initial, etc.
+        # Also handles shortened names by checking if email local part is a prefix of the name
+        # Examples: "rich@" matches "Richard" (prefix check), "greg@" matches "Gregory" (prefix check)
+        # Security: Requires minimum 3 characters and checks that local part matches BEGINNING of name (not substring)
+        
+        # Minimum match length to prevent false positives (e.g., "an" in "daniel")
+        MIN_NAME_MATCH_LENGTH = 3
+        
+        name_match = False
+        
+        # Strategy 1: Check if normalized name patterns appear in local part
+        # This handles: john@example.com, johndoe@example.com, jdoe@example.com
+        patterns = []
+        
+        # Full normalized names
+        if len(first_normalized) >= MIN_NAME_MATCH_LENGTH:
+            patterns.append(first_normalized)  # john
+        if len(last_normalized) >= MIN_NAME_MATCH_LENGTH:
+            patterns.append(last_normalized)  # doe
+        
+        # Full name combinations
+        patterns.append(f"{first_normalized}{last_normalized}")  # johndoe
+        
+        # Initial + last name combinations
+        if len(first_normalized) > 0:
+            patterns.append(f"{first_normalized[0]}{last_normalized}")  # jdoe
+            patterns.append(f"{last_normalized}{first_normalized[0]}")  # doej
+        
+        # Check if any pattern appears in the normalized local part
+        patterns = [p for p in patterns if p and len(p) >= MIN_NAME_MATCH_LENGTH]
+        name_match = any(pattern in local_normalized for pattern in patterns)
+        
+        # Strategy 2: Check if local part matches shortened versions of the name
+        # This handles: greg@example.com where first_name is "Gregory"
+        # Check if local_part is a prefix of the normalized name (shortened form)
+        if not name_match and len(local_normalized) >= MIN_NAME_MATCH_LENGTH:
+            # Check if local_part matches beginning of first name (shortened)
+            # e.g., "greg" matches "gregory" (local_part is prefix of name)
+            if len(first_normalized) >= len(local_normalized):
+                if first_normalized.startswith(local_normalized):
+                    name_match = True
+            
+            # Check if local_part matches beginning of last name (shortened)
+            if not name_match and len(last_normalized) >= len(local_normalized):
+                if last_normalized.startswith(local_normalized):
+                    name_match = True
+            
+            # Check if name prefixes appear in local part (reverse direction)
+            # e.g., "gregory" prefix "greg" in local_part "greg"
+            if not name_match:
+                # Check first name prefixes (3-6 characters)
+                for length in range(MIN_NAME_MATCH_LENGTH, min(len(first_normalized) + 1, 7)):
+                    name_prefix = first_normalized[:length]
+                    if name_prefix == local_normalized or name_prefix in local_normalized:
+                        name_match = True
+                        break
+                
+                # Check last name prefixes if still no match
+                if not name_match:
+                    for length in range(MIN_NAME_MATCH_LENGTH, min(len(last_normalized) + 1, 7)):
+                        name_prefix = last_normalized[:length]
+                        if name_prefix == local_normalized or name_prefix in local_normalized:
+                            name_match = True
+                            break
+        
+        if not name_match:
+            rejection_reason = {
+                "stage": "Stage 0: Hardcoded Checks",
+                "check_name": "check_name_email_match",
+                "message": f"Name '{first_name} {last_name}' does not match email pattern '{email}'",
+                "failed_fields": ["email", "first_name", "last_name"]
+            }
+            print(f"   ❌ Stage 0: {email} @ {get_company(lead)} - Name not found in email")
+            return False, rejection_reason
+        
+        print(f"   ✅ Stage 0: {email} @ {get_company(lead)} - Name found in email")
+        return True, {}
+        
+    except Exception as e:
+        rejection_reason = {
+            "stage": "Stage 0: Hardcoded Checks",
+            "check_name": "check_name_email_match",
+            "message": f"Name-email match check failed: {str(e)}",
+            "failed_fields": ["email"]
+        }
+        return False, rejection_reason
+
+@instrumented_check
+async def check_general_purpose_email(lead: dict) -> Tuple[bool, dict]:
+    """
+    Check if email is a general-purpose email address (instant fail).
+    
+    General-purpose emails are not personal contacts and should be rejected immediately
+    to save API costs and maintain lead quality.
+    
+    Returns:
+        (True, {}): If email is NOT general purpose (personal contact)
+        (False, rejection_reason): If email IS general purpose (instant fail)
+    """
+    try:
+        email = get_email(lead)
+        
+        if not email:
+            rejection_reason = {
+                "stage": "Stage 0: Hardcoded Checks",
+                "check_name": "check_general_purpose_email",
+                "message": "No email provided",
+                "failed_fields": ["email"]
+            }
+            return False, rejection_reason
+        
+        # General-purpose local parts live in the domain index (must match calculate-rep-score exactly)
+        role = get_domain_index().lookup_email(email).role
+        matched_prefix = f"{role}@" if role else None
+        
+        if matched_prefix:
+            rejection_reason = {
+                "stage": "Stage 0: Hardcoded Checks",
+                "check_name": "check_general_purpose_email",
+                "message": f"Email '{email}' is a general purpose email (starts with {matched_prefix}) - not a personal contact",
+                "failed_fields": ["email"]
+            }
+            print(f"   ❌ Stage 0: {email} @ {get_company(lead)} - General purpose email detected: {matched_prefix}")
+            return False, rejection_reason
+        
+        # Not a general-purpose email - proceed
+        print(f"   ✅ Stage 0: {email} @ {get_company(lead)} - Personal email (not general purpose)")
+        return True, {}
+        
+    except Exception as e:
+        rejection_reason = {
+            "stage": "Stage 0: Hardcoded Checks",
+            "check_name": "check_general_purpose_email",
+            "message": f"General purpose email check failed: {str(e)}",
+            "failed_fields": ["email"]
+        }
+        return False, rejection_reason
+
+@instrumented_check
+async def check_free_email_domain(lead: dict) -> Tuple[bool, dict]:
+    """
+    Check if email uses a free/personal email domain (instant fail).
+    
+    B2B leads should use corporate email domains, not free consumer services.
+    This prevents low-quality leads from free email providers.
+    
+    Returns:
+        (True, {}): If email is corporate domain
+        (False, rejection_reason): If email is free domain (gmail, yahoo, etc.)
+    """
+    try:
+        email = get_email(lead)
+        
+        if not email:
+            rejection_reason = {
+                "stage": "Stage 0: Hardcoded Checks",
+                "check_name": "check_free_email_domain",
+                "message": "No email provided",
+                "failed_fields": ["email"]
+            }
+            return False, rejection_reason
+        
+        # Extract domain from email
+        try:
+            domain = email.split("@")[1].lower() if "@" in email else ""
+        except IndexError:
+            return True, {}  # Invalid format handled by other checks
+        
+        # Free email domains (and their subdomains) from the domain index
+        if get_domain_index().lookup_domain(domain).free:
+            rejection_reason = {
+                "stage": "Stage 0: Hardcoded Checks",
+                "check_name": "check_free_email_domain",
+                "message": f"Email uses free consumer domain '{domain}' - B2B leads require corporate email",
+                "failed_fields": ["email"]
+            }
+            print(f"   ❌ Stage 0: {email} @ {get_company(lead)} - Free email domain rejected: {domain}")
+            return False, rejection_reason
+        
+        # Corporate domain - proceed
+        return True, {}
+        
+    except Exception as e:
+        rejection_reason = {
+            "stage": "Stage 0: Hardcoded Checks",
+            "check_name": "check_free_email_domain",
+            "message": f"Free email domain check failed: {str(e)}",
+            "failed_fields": ["email"]
+        }
+        return False, rejection_reason
+
+
+def _whois_outcome(whois_data: dict) -> str:
+    """Rate governor feedback for a WHOIS lookup: resets and refusals are how WHOIS servers rate-limit."""
+    error = str(whois_data.get("error") or "").lower()
+    if "timed out" in error or "timeout" in error:
+        return TIMEOUT
+    if "reset" in error or "refused" in error or "limit" in error:
+        return THROTTLED
+    return OK  # Answered (including "no match" style errors)
+
+
+@instrumented_check
+async def check_domain_age(lead: dict) -> Tuple[bool, dict]:
+    """
+    Check domain age using WHOIS lookup.
+    Appends WHOIS data to lead object for reputation scoring.
+    """
+    import whois
+    website = get_website(lead)
+    if not website:
+        # Append default WHOIS data
+        lead["whois_checked"] = False
+        lead["domain_age_days"] = None
+        lead["domain_creation_date"] = None
+        return False, {
+            "stage": "Stage 1: DNS Layer",
+            "check_name": "check_domain_age",
+            "message": "No website provided",
+            "failed_fields": ["website"]
+        }
+
+    domain = extract_root_domain(website)
+    if not domain:
+        lead["whois_checked"] = False
+        lead["domain_age_days"] = None
+        lead["domain_creation_date"] = None
+        return False, {
+            "stage": "Stage 1: DNS Layer",
+            "check_name": "check_domain_age",
+            "message": f"Invalid website format: {website}",
+            "failed_fields": ["website"]
+        }
+
+    cache_key = f"domain_age:{domain}"
+    await restore_from_shared_cache("whois", domain, cache_key, CACHE_TTLS["whois"])
+    if cache_key in validation_cache and not validation_cache.is_expired(cache_key, CACHE_TTLS["whois"]):
+        cached_result = validation_cache[cache_key]
+        # Restore cached WHOIS data to lead
+        cached_data = validation_cache.get(f"{cache_key}_data")
+        if cached_data:
+            lead["whois_checked"] = cached_data.get("checked", True)
+            lead["domain_age_days"] = cached_data.get("age_days")
+            lead["domain_creation_date"] = cached_data.get("creation_date")
+            lead["domain_registrar"] = cached_data.get("registrar")
+            lead["domain_nameservers"] = cached_data.get("nameservers")
+            lead["whois_updated_date"] = cached_data.get("updated_date")
+            lead["whois_updated_days_ago"] = cached_data.get("whois_updated_days_ago")
+        return cached_result
+
+    try:
+        # Implement actual WHOIS lookup
+        def get_domain_age_sync(domain_name):
+            try:
+                w = whois.whois(domain_name)
+                
+                # Extract registrar, nameservers, and updated_date for reputation scoring
+                registrar = getattr(w, 'registrar', None)
+                nameservers = getattr(w, 'name_servers', None)
+                if isinstance(nameservers, list):
+                    nameservers = nameservers[:3]  # Limit to first 3 nameservers
+                
+                # Extract updated_date for WHOIS stability check
+                updated_date = getattr(w, 'updated_date', None)
+                if updated_date:
+                    if isinstance(updated_date, list):
+                        updated_date = updated_date[0]
+                    # Make timezone-naive if timezone-aware
+                    if hasattr(updated_date, 'tzinfo') and updated_date.tzinfo is not None:
+                        updated_date = updated_date.replace(tzinfo=None)
+                
+                if w.creation_date:
+                    if isinstance(w.creation_date, list):
+                        creation_date = w.creation_date[0]
+                    else:
+                        creation_date = w.creation_date
+                    
+                    # Make creation_date timezone-naive if it's timezone-aware
+                    if creation_date.tzinfo is not None:
+                        creation_date = creation_date.replace(tzinfo=None)
+
+                    age_days = (datetime.now() - creation_date).days
+                    min_age_days = 7  # 7 days minimum
+
+                    # Calculate whois_updated_days_ago
+                    whois_updated_days_ago = None
+                    if updated_date:
+                        whois_updated_days_ago = (datetime.now() - updated_date).days
+
+                    # Return WHOIS data along with result
+                    whois_data = {
+                        "age_days": age_days,
+                        "creation_date": creation_date.isoformat(),
+                        "registrar": registrar,
+                        "nameservers": nameservers,
+                        "updated_date": updated_date.isoformat() if updated_date else None,
+                        "whois_updated_days_ago": whois_updated_days_ago,
+                        "checked": True
+                    }
+
+                    if age_days >= min_age_days:
+                        return (True, {}, whois_data)
+                    else:
+                        return (False, {
+                            "stage": "Stage 1: DNS Layer",
+                            "check_name": "check_domain_age",
+                            "message": f"Domain too new: {age_days} days (minimum: {min_age_days})",
+                            "failed_fields": ["website"]
+                        }, whois_data)
+                else:
+                    # Calculate whois_updated_days_ago even if creation_date is missing
+                    whois_updated_days_ago = None
+                    if updated_date:
+                        whois_updated_days_ago = (datetime.now() - updated_date).days
+                    
+                    whois_data = {
+                        "age_days": None,
+                        "creation_date": None,
+                        "registrar": registrar,
+                        "nameservers": nameservers,
+                        "updated_date": updated_date.isoformat() if updated_date else None,
+                        "whois_updated_days_ago": whois_updated_days_ago,
+                        "checked": True
+                    }
+                    return False, {
+                        "stage": "Stage 1: DNS Layer",
+                        "check_name": "check_domain_age",
+                        "message": "Could not determine domain creation date",
+                        "failed_fields": ["website"]
+                    }, whois_data
+            except Exception as e:
+                whois_data = {
+                    "age_days": None,
+                    "creation_date": None,
+                    "registrar": None,
+                    "nameservers": None,
+                    "updated_date": None,
+                    "whois_updated_days_ago": None,
+                    "checked": False,
+                    "error": str(e)
+                }
+                return False, {
+                    "stage": "Stage 1: DNS Layer",
+                    "check_name": "check_domain_age",
+                    "message": f"WHOIS lookup failed: {str(e)}",
+                    "failed_fields": ["website"]
+                }, whois_data
+
+        # Run WHOIS lookup in executor to avoid blocking
+        loop = asyncio.get_event_loop()
+        await governor_acquire("whois")  # Host-wide pacing, before taking a concurrency slot
+        async with dependency_limit("whois"):
+            passed, rejection_reason, whois_data = await loop.run_in_executor(None, get_domain_age_sync, domain)
+        await asyncio.to_thread(report_outcome, "whois", _whois_outcome(whois_data))
+        
+        # Append WHOIS data to lead
+        lead["whois_checked"] = whois_data.get("checked", True)
+        lead["domain_age_days"] = whois_data.get("age_days")
+        lead["domain_creation_date"] = whois_data.get("creation_date")
+        lead["domain_registrar"] = whois_data.get("registrar")
+        lead["domain_nameservers"] = whois_data.get("nameservers")
+        lead["whois_updated_date"] = whois_data.get("updated_date")
+        lead["whois_updated_days_ago"] = whois_data.get("whois_updated_days_ago")
+        if "error" in whois_data:
+            lead["whois_error"] = whois_data["error"]
+        
+        # Cache both result and data
+        result = (passed, rejection_reason)
+        validation_cache[cache_key] = result
+        validation_cache[f"{cache_key}_data"] = whois_data
+        # Share successful lookups only - WHOIS errors are usually transient rate limits
+        if whois_data.get("checked"):
+            await store_in_shared_cache("whois", domain, result, whois_data)
+        
+        return result
+
+    except Exception as e:
+        # Append error state
+        lead["whois_checked"] = False
+        lead["domain_age_days"] = None
+        lead["domain_creation_date"] = None
+        lead["whois_error"] = str(e)
+        
+        result = (False, {
+            "stage": "Stage 1: DNS Layer",
+            "check_name": "check_domain_age",
+            "message": f"Domain age check failed: {str(e)}",
+            "failed_fields": ["website"]
+        })
+        validation_cache[cache_key] = result
+        return result
+
+@instrumented_check
+async def check_mx_record(lead: dict) -> Tuple[bool, dict]:
+    """Check if domain has MX records"""
+    website = get_website(lead)
+    if not website:
+        return False, {
+            "stage": "Stage 1: DNS Layer",
+            "check_name": "check_mx_record",
+            "message": "No website provided",
+            "failed_fields": ["website"]
+        }
+
+    domain = extract_root_domain(website)
+    if not domain:
+        return False, {
+            "stage": "Stage 1: DNS Layer",
+            "check_name": "check_mx_record",
+            "message": f"Invalid website format: {website}",
+            "failed_fields": ["website"]
+        }
+
+    cache_key = f"mx_record:{domain}"
+    await restore_from_shared_cache("mx", domain, cache_key, CACHE_TTLS["dns_head"])
+    if cache_key in validation_cache and not validation_cache.is_expired(cache_key, CACHE_TTLS["dns_head"]):
+        return validation_cache[cache_key]
+
+    try:
+        async with dependency_limit("dns"):
+            passed, msg = await check_domain_existence(domain)
+        if passed:
+            result = (True, {})
+            # Only share positives - a failed MX lookup may be a transient DNS timeout
+            await store_in_shared_cache("mx", domain, result)
+        else:
+            result = (False, {
+                "stage": "Stage 1: DNS Layer",
+                "check_name": "check_mx_record",
+                "message": msg,
+                "failed_fields": ["website"]
+            })
+        validation_cache[cache_key] = result
+        return result
+    except Exception as e:
+        result = (False, {
+            "stage": "Stage 1: DNS Layer",
+            "check_name": "check_mx_record",
+            "message": f"MX record check failed: {str(e)}",
+            "failed_fields": ["website"]
+        })
+        validation_cache[cache_key] = result
+        return result
+
+@instrumented_check
+async def check_spf_dmarc(lead: dict) -> Tuple[bool, dict]:
+    """
+    Check SPF and DMARC DNS records (SOFT check - always passes, appends data to lead)
+
+    This is a SOFT check that:
+    - Checks DNS TXT record for v=spf1
+    - Checks DNS TXT record at _dmarc.{domain} for v=DMARC1
+    - Checks DMARC policy for p=quarantine or p=reject
+    - Appends results to lead but NEVER rejects
+
+    Args:
+        lead: Dict containing email/website
+
+    Returns:
+        (True, dict): Always passes with empty dict (SOFT check)
+    """
+    def fail_lead(lead):
+        lead["has_spf"] = False
+        lead["has_dmarc"] = False
+        lead["dmarc_policy_strict"] = False
+        return lead
+        
+    email = get_email(lead)
+    if not email:
+        # No email to check - append default values
+        lead = fail_lead(lead)
+        return True, {}
+
+    # Extract domain from email
+    try:
+        domain = email.split("@")[1].lower() if "@" in email else ""
+        if not domain:
+            lead = fail_lead(lead)
+            return True, {}
+    except (IndexError, AttributeError):
+        lead = fail_lead(lead)
+        return True, {}
+
+    cache_key = f"spf_dmarc:{domain}"
+    await restore_from_shared_cache("spf_dmarc", domain, cache_key, CACHE_TTLS["dns_head"])
+    if cache_key in validation_cache and not validation_cache.is_expired(cache_key, CACHE_TTLS["dns_head"]):
+        cached_data = validation_cache[cache_key]
+        # Apply cached values to lead
+        lead["has_spf"] = cached_data.get("has_spf", False)
+        lead["has_dmarc"] = cached_data.get("has_dmarc", False)
+        lead["dmarc_policy_strict"] = cached_data.get("dmarc_policy_strict", False)
+        return True, {}
+
+    try:
+        # Initialize results
+        has_spf = False
+        has_dmarc = False
+        dmarc_policy_strict = False
+
+        # Async DNS lookups (shared cache + in-flight coalescing, no executor threads)
+        async def check_spf_async(domain_name):
+            """Check if domain has SPF record"""
+            try:
+                txt_records = await dns_resolve_async(domain_name, "TXT")
+                for record in txt_records:
+                    txt_string = "".join([s.decode() if isinstance(s, bytes) else s for s in record.strings])
+                    if "v=spf1" in txt_string.lower():
+                        return True
+                return False
+            except Exception:
+                return False
+
+        async def check_dmarc_async(domain_name):
+            """Check if domain has DMARC record and return policy strictness"""
+            try:
+                dmarc_domain = f"_dmarc.{domain_name}"
+                txt_records = await dns_resolve_async(dmarc_domain, "TXT")
+                for record in txt_records:
+                    txt_string = "".join([s.decode() if isinstance(s, bytes) else s for s in record.strings])
+                    txt_lower = txt_string.lower()
+
+                    if "v=dmarc1" in txt_lower:
+                        # Check if policy is strict (quarantine or reject)
+                        is_strict = "p=quarantine" in txt_lower or "p=reject" in txt_lower
+                        return True, is_strict
+                return False, False
+            except Exception:
+                return False, False
+
+        # Execute DNS checks (SPF and DMARC queries run concurrently)
+        async with dependency_limit("dns"):
+            has_spf, (has_dmarc, dmarc_policy_strict) = await asyncio.gather(
+                check_spf_async(domain),
+                check_dmarc_async(domain),
+            )
+
+        # Append results to lead (SOFT check data)
+        lead["has_spf"] = has_spf
+        lead["has_dmarc"] = has_dmarc
+        lead["dmarc_policy_strict"] = dmarc_policy_strict
+
+        # Create informational message
+        spf_status = "✓" if has_spf else "✗"
+        dmarc_status = "✓" if has_dmarc else "✗"
+        policy_status = "✓ (strict)" if dmarc_policy_strict else ("✓ (permissive)" if has_dmarc else "✗")
+
+        message = f"SPF: {spf_status}, DMARC: {dmarc_status}, Policy: {policy_status}"
+
+        # Cache the results
+        cache_data = {
+            "has_spf": has_spf,
+            "has_dmarc": has_dmarc,
+            "dmarc_policy_strict": dmarc_policy_strict,
+            "message": message
+        }
+        validation_cache[cache_key] = cache_data
+        await store_in_shared_cache("spf_dmarc", domain, cache_data)
+
+        print(f"📧 SPF/DMARC Check (SOFT): {domain} - {message}")
+
+        # ALWAYS return True (SOFT check never fails)
+        return True, {}
+
+    except Exception as e:
+        # On any error, append False values and pass
+        lead["has_spf"] = False
+        lead["has_dmarc"] = False
+        lead["dmarc_policy_strict"] = False
+
+        message = f"SPF/DMARC check error (SOFT - passed): {str(e)}"
+        print(f"⚠️ {message}")
+
+        # Cache the error result
+        cache_data = {
+            "has_spf": False,
+            "has_dmarc": False,
+            "dmarc_policy_strict": False,
+            "message": message
+        }
+        validation_cache[cache_key] = cache_data
+
+        # ALWAYS return True (SOFT check never fails)
+        return True, {}
+
+@instrumented_check
+async def check_head_request(lead: dict) -> Tuple[bool, dict]:
+    """Wrapper around existing verify_company function"""
+    website = get_website(lead)
+    if not website:
+        return False, {
+            "stage": "Stage 0: Hardcoded Checks",
+            "check_name": "check_head_request",
+            "message": "No website provided",
+            "failed_fields": ["website"]
+        }
+
+    domain = extract_root_domain(website)
+    if not domain:
+        return False, {
+            "stage": "Stage 0: Hardcoded Checks",
+            "check_name": "check_head_request",
+            "message": f"Invalid website format: {website}",
+            "failed_fields": ["website"]
+        }
+
+    cache_key = f"head_request:{domain}"
+    if cache_key in validation_cache and not validation_cache.is_expired(cache_key, CACHE_TTLS["dns_head"]):
+        return validation_cache[cache_key]
+
+    try:
+        async with dependency_limit("head"):
+            passed, msg = await verify_company(domain)
+        if passed:
+            result = (True, {})
+        else:
+            result = (False, {
+                "stage": "Stage 0: Hardcoded Checks",
+                "check_name": "check_head_request",
+                "message": f"Website not accessible: {msg}",
+                "failed_fields": ["website"]
+            })
+        validation_cache[cache_key] = result
+        return result
+    except Exception as e:
+        result = (False, {
+            "stage": "Stage 0: Hardcoded Checks",
+            "check_name": "check_head_request",
+            "message": f"HEAD request check failed: {str(e)}",
+            "failed_fields": ["website"]
+        })
+        validation_cache[cache_key] = result
+        return result
+
+@instrumented_check
+async def check_disposable(lead: dict) -> Tuple[bool, dict]:
+    """Check if email domain is disposable"""
+    email = get_email(lead)
+    if not email:
+        rejection_reason = {
+            "stage": "Stage 0: Hardcoded Checks",
+            "check_name": "check_disposable",
+            "message": "No email provided",
+            "failed_fields": ["email"]
+        }
+        return False, rejection_reason
+
+    cache_key = f"disposable:{email}"
+    if cache_key in validation_cache:
+        return validation_cache[cache_key]
+
+    try:
+        is_disposable, reason = await is_disposable_email(email)
+        # For validation pipeline: return True if check PASSES (email is NOT disposable)
+        # return False if check FAILS (email IS disposable)
+        if is_disposable:
+            rejection_reason = {
+                "stage": "Stage 0: Hardcoded Checks",
+                "check_name": "check_disposable",
+                "message": f"Disposable email domain detected: {email}",
+                "failed_fields": ["email"]
+            }
+            validation_cache[cache_key] = (False, rejection_reason)
+            return False, rejection_reason
+        else:
+            validation_cache[cache_key] = (True, {})
+            return True, {}
+    except Exception as e:
+        rejection_reason = {
+            "stage": "Stage 0: Hardcoded Checks",
+            "check_name": "check_disposable",
+            "message": f"Disposable check failed: {str(e)}",
+            "failed_fields": ["email"]
+        }
+        validation_cache[cache_key] = (False, rejection_reason)
+        return False, rejection_reason
+
+@instrumented_check
+async def check_dnsbl(lead: dict) -> Tuple[bool, dict]:
+    """
+    Check if lead's email domain is listed in Spamhaus DBL.
+    Appends DNSBL data to lead object for reputation scoring.
+
+    Args:
+        lead: Dict containing email field
+
+    Returns:
+        (bool, dict): (is_valid, rejection_reason_dict)
+    """
+    email = get_email(lead)
+    if not email:
+        # Append default DNSBL data
+        lead["dnsbl_checked"] = False
+        lead["dnsbl_blacklisted"] = False
+        lead["dnsbl_list"] = None
+        return False, {
+            "stage": "Stage 2: Domain Reputation",
+            "check_name": "check_dnsbl",
+            "message": "No email provided",
+            "failed_fields": ["email"]
+        }
+
+    # Extract domain from email
+    try:
+        domain = email.split("@")[1].lower() if "@" in email else ""
+        if not domain:
+            lead["dnsbl_checked"] = False
+            lead["dnsbl_blacklisted"] = False
+            lead["dnsbl_list"] = None
+            return True, {}  # Invalid format handled by other checks
+    except (IndexError, AttributeError):
+        lead["dnsbl_checked"] = False
+        lead["dnsbl_blacklisted"] = False
+        lead["dnsbl_list"] = None
+        return True, {}  # Invalid format handled by other checks
+
+    # Use root domain extraction helper
+    root_domain = extract_root_domain(domain)
+    if not root_domain:
+        lead["dnsbl_checked"] = False
+        lead["dnsbl_blacklisted"] = False
+        lead["dnsbl_list"] = None
+        return True, {}  # Could not extract - handled by other checks
+
+    cache_key = f"dnsbl_{root_domain}"
+    await restore_from_shared_cache("dnsbl", root_domain, cache_key, CACHE_TTLS["dns_head"])
+    if cache_key in validation_cache and not validation_cache.is_expired(cache_key, CACHE_TTLS["dns_head"]):
+        cached_result = validation_cache[cache_key]
+        # Restore cached DNSBL data to lead
+        cached_data = validation_cache.get(f"{cache_key}_data")
+        if cached_data:
+            lead["dnsbl_checked"] = cached_data.get("checked", True)
+            lead["dnsbl_blacklisted"] = cached_data.get("blacklisted", False)
+            lead["dnsbl_list"] = cached_data.get("list", "cloudflare_dbl")
+            lead["dnsbl_domain"] = cached_data.get("domain", root_domain)
+        return cached_result
+
+    try:
+        # Perform Cloudflare DNSBL lookup (more reliable than Spamhaus for free tier)
+        # Cloudflare has no rate limits and fewer false positives
+        query = f"{root_domain}.dbl.cloudflare.com"
+
+        # Async DNS lookup (shared cache + in-flight coalescing, no executor threads)
+        # Returns (is_blacklisted, answered); answered is False when the resolver failed
+        async def dns_lookup():
+            try:
+                print(f"   🔍 DNSBL Query: {query}")
+                answers = await dns_resolve_async(query, "A")
+                # If we get A records, domain IS blacklisted
+                a_records = [str(rdata) for rdata in answers]
+                
+                # Check for actual blacklist codes (127.0.0.x where x < 128)
+                for record in a_records:
+                    if record.startswith("127.0.0."):
+                        print(f"   ⚠️  DNSBL returned A records: {a_records} → BLACKLISTED")
+                        return True, True
+                
+                # Any other response is not a confirmed blacklist
+                print(f"   ✅ DNSBL returned A records: {a_records} → CLEAN (not a blacklist code)")
+                return False, True
+                
+            except dns.resolver.NXDOMAIN:
+                # NXDOMAIN = not in blacklist (expected for clean domains)
+                print(f"   ✅ DNSBL returned NXDOMAIN → CLEAN")
+                return False, True  # No record = domain is clean
+            except dns.resolver.NoAnswer:
+                # No answer = not in blacklist
+                print(f"   ✅ DNSBL returned NoAnswer → CLEAN")
+                return False, True
+            except dns.resolver.Timeout:
+                # Timeout = treat as clean (don't block on infrastructure issues)
+                print(f"   ⚠️  DNSBL query timeout for {query} → treating as CLEAN")
+                return False, False
+            except Exception as e:
+                # On any DNS error, default to valid (don't block on infrastructure issues)
+                print(f"   ⚠️  DNS lookup error for {query}: {type(e).__name__}: {e} → treating as CLEAN")
+                return False, False
+
+        async with dependency_limit("dns"):
+            is_blacklisted, answered = await dns_lookup()
+
+        # Append DNSBL data to lead
+        lead["dnsbl_checked"] = True
+        lead["dnsbl_blacklisted"] = is_blacklisted
+        lead["dnsbl_list"] = "cloudflare_dbl"
+        lead["dnsbl_domain"] = root_domain
+
+        # Cache the data separately for restoration
+        dnsbl_data = {
+            "checked": True,
+            "blacklisted": is_blacklisted,
+            "list": "cloudflare_dbl",
+            "domain": root_domain
+        }
+        validation_cache[f"{cache_key}_data"] = dnsbl_data
+
+        if is_blacklisted:
+            result = (False, {
+                "stage": "Stage 2: Domain Reputation",
+                "check_name": "check_dnsbl",
+                "message": f"Domain {root_domain} blacklisted in Cloudflare DBL",
+                "failed_fields": ["email"]
+            })
+            print(f"❌ DNSBL: Domain {root_domain} found in Cloudflare blacklist")
+        else:
+            result = (True, {})
+            print(f"✅ DNSBL: Domain {root_domain} clean")
+
+        validation_cache[cache_key] = result
+        if answered:
+            # A resolver failure is only treated as clean for this lead, never shared host-wide
+            await store_in_shared_cache("dnsbl", root_domain, result, dnsbl_data)
+        return result
+
+    except Exception as e:
+        # On any unexpected error, append error state
+        lead["dnsbl_checked"] = True
+        lead["dnsbl_blacklisted"] = False
+        lead["dnsbl_list"] = "spamhaus_dbl"
+        lead["dnsbl_domain"] = root_domain
+        lead["dnsbl_error"] = str(e)
+        
+        result = (True, {})  # Don't block on infrastructure issues
+        validation_cache[cache_key] = result
+        print(f"⚠️ DNSBL check error for {root_domain}: {e}")
+        return result
+
+
+async def is_disposable_email(email: str) -> Tuple[bool, str]:
+    # Return True if email IS disposable (the domain or a parent domain is blocklisted)
+    is_disposable = get_domain_index().lookup_email(email).disposable is not None
+    return is_disposable, "Disposable domain" if is_disposable else "Not disposable"
@@ -0,0 +1,965 @@
+"""
+Stage 4 LinkedIn verification (ScrapingDog Google search + LLM).
+"""
+
+import asyncio
+import re
+import json
+from typing import Tuple, List
+from Leadpoet.utils.utils_lead_extraction import get_company, get_linkedin
+from validator_models.serp_cache import scrapingdog_get
+from validator_models.llm_service import complete as llm_complete, strip_code_fences
+from validator_models.pipeline_metrics import instrumented_check
+
+from validator_models.automated_checks.config import OPENROUTER_KEY, PROXY_CONFIG, SCRAPINGDOG_API_KEY
+from validator_models.automated_checks.common import normalize_accents
+from validator_models.automated_checks.company_cache import load_company_linkedin
+from validator_models.automated_checks.stage5_matching import (
+    extract_person_location_from_linkedin_snippet,
+    extract_role_from_search_title,
+)
+from validator_models.automated_checks.stage5 import validate_company_linkedin_url
+
+
+# NOTE: check_myemailverifier_email() has been REMOVED as of Dec 2024.
+# All email validation now uses TrueList BATCH API via run_batch_automated_checks().
+
+# Stage 4: LinkedIn/GSE Validation
+
+async def search_linkedin_gse(full_name: str, company: str, linkedin_url: str = None, max_results: int = 5) -> Tuple[List[dict], bool]:
+    """
+    Search LinkedIn using ScrapingDog Google Search API.
+    
+    Uses 3 search variations:
+    1. Exact URL in quotes (most specific)
+    2. Profile slug only (handles www/protocol differences)
+    3. Name + company + "linkedin" (broadest fallback)
+
+    Args:
+        full_name: Person's full name
+        company: Company name
+        linkedin_url: LinkedIn URL provided by miner (required)
+        max_results: Max search results to return
+
+    Returns:
+        Tuple of (List of search results with title, link, snippet, url_match_exact: bool)
+    """
+    if not linkedin_url:
+        print(f"   ⚠️ No LinkedIn URL provided")
+        return [], False
+    
+    if not SCRAPINGDOG_API_KEY:
+        raise Exception("SCRAPINGDOG_API_KEY not set")
+    
+    # Extract profile slug from LinkedIn URL
+    profile_slug = linkedin_url.split("/in/")[-1].strip("/") if "/in/" in linkedin_url else None
+    
+    # Track if URL matched exactly (strong identity proof)
+    url_match_exact = False
+    
+    # Build search query variations (in order of specificity)
+    query_variations = [
+        # 1. Exact URL in quotes (most specific)
+        f'"{linkedin_url}"',
+        
+        # 2. Profile slug only (handles www/protocol differences)
+        f'"linkedin.com/in/{profile_slug}"' if profile_slug else None,
+        
+        # 3. Name + LinkedIn + company (more context)
+        f'"{full_name}" linkedin "{company}"',
+    ]
+    
+    # Remove None values
+    query_variations = [q for q in query_variations if q]
+    
+    print(f"   🔍 Trying {len(query_variations)} search variations for LinkedIn profile...")
+    
+    def _search_linkedin_sync(query: str) -> List[dict]:
+        """Synchronous ScrapingDog search helper for Stage 4"""
+        try:
+            params = {
+                "api_key": SCRAPINGDOG_API_KEY,
+                "query": query,
+                "results": max_results
+            }
+            
+            response = scrapingdog_get(params, timeout=30, proxies=PROXY_CONFIG)
+            if response.status_code != 200:
+                print(f"         ⚠️ GSE API error: HTTP {response.status_code}: {response.text}")
+                return []
+            
+            data = response.json()
+            items = []
+            
+            # Convert ScrapingDog format to standard format
+            for item in data.get("organic_results", []):
+                items.append({
+                            "title": item.get("title", ""),
+                            "link": item.get("link", ""),
+                            "snippet": item.get("snippet", "")
+                        })
+                    
+            return items
+        except Exception as e:
+            print(f"         ⚠️ Request error: {str(e)}")
+            return []
+    
+    try:
+        # Try each query variation until we get results
+        for variation_idx, query in enumerate(query_variations, 1):
+            print(f"      🔄 Variation {variation_idx}/{len(query_variations)}: {query[:80]}...")
+            
+            try:
+                # Execute sync request in thread pool to keep function async
+                items = await asyncio.to_thread(_search_linkedin_sync, query)
+                
+                if items:
+                    print(f"         ✅ Found {len(items)} result(s) with variation {variation_idx}")
+                    
+                    # FILTER: Only keep LinkedIn results (profile URLs)
+                    linkedin_results = []
+                    found_profile_urls = []
+                    
+                    for item in items:
+                        link = item.get("link", "")
+                        if "linkedin.com/in/" in link:
+                            result_slug = link.split("/in/")[-1].strip("/").split("?")[0]
+                            found_profile_urls.append(result_slug)
+                            linkedin_results.append(item)
+                        elif "linkedin.com" in link:
+                            # Include other LinkedIn pages (company, posts) for context
+                            linkedin_results.append(item)
+                    
+                    if not linkedin_results:
+                        print(f"         ⚠️ No LinkedIn URLs in results, trying next variation...")
+                        continue
+                    
+                    print(f"         ✅ Found {len(linkedin_results)} LinkedIn result(s)")
+                    
+                    # URL matching logic - all variations are name-based, verify profile matches
+                    if profile_slug:
+                        if found_profile_urls:
+                            # Normalize slugs for comparison (remove hyphens/underscores)
+                            profile_slug_norm = profile_slug.lower().replace("-", "").replace("_", "")
+                            
+                            # Check exact match first (normalized)
+                            exact_match = any(
+                                profile_slug_norm == result_slug.lower().replace("-", "").replace("_", "")
+                                for result_slug in found_profile_urls
+                            )
+                            # Also check partial match (profile slug contained in result, normalized)
+                            partial_match = any(
+                                profile_slug_norm in result_slug.lower().replace("-", "").replace("_", "") or 
+                                result_slug.lower().replace("-", "").replace("_", "") in profile_slug_norm
+                                    for result_slug in found_profile_urls
+                                )
+                                
+                            if exact_match:
+                                print(f"         ✅ URL MATCH: Profile '{profile_slug}' confirmed (exact)")
+                                url_match_exact = True  # Strong identity proof!
+                            elif partial_match:
+                                print(f"         ✅ URL MATCH: Profile '{profile_slug}' confirmed (partial)")
+                                url_match_exact = "partial"  # Partial match
+                            else:
+                                print(f"         ⚠️  URL MISMATCH: Expected '{profile_slug}' but found: {found_profile_urls[:3]}")
+                                continue
+                    
+                    # FILTER 1: Clean up concatenated titles and separate profile headlines from posts
+                    # ScrapingDog often concatenates multiple result titles together
+                    profile_headlines = []
+                    posts = []
+                    
+                    for item in linkedin_results:
+                        title = item.get("title", "")
+                        
+                        # ScrapingDog concatenates titles - extract only the FIRST profile
+                        # Pattern: "Name - Title | LinkedIn Name2 - Title2"
+                        if " | LinkedIn " in title:
+                            # Take only the first profile (before the concatenation)
+                            title = title.split(" | LinkedIn ")[0] + " | LinkedIn"
+                            item = dict(item)  # Copy to avoid modifying original
+                            item["title"] = title
+                        
+                        # Skip non-profile results (posts, intro requests, etc.)
+                        if " on LinkedIn:" in title or " on LinkedIn :" in title:
+                            posts.append(item)
+                            continue
+                        if title.lower().startswith("seeking intro"):
+                            posts.append(item)
+                            continue
+                        # Skip directory pages (but not profiles that just have this text concatenated)
+                        # Check both: title pattern AND link pattern
+                        # Check for various LinkedIn directory page patterns
+                        is_directory_title = ("profiles | LinkedIn" in title or 
+                                             "profiles - LinkedIn" in title or
+                                             "profiles on LinkedIn" in title)
+                        
+                        if is_directory_title:
+                            # Only skip if it's actually a directory page (/pub/dir/) or starts with "N+ profiles"
+                            link = item.get("link", "")
+                            is_directory_link = "/pub/dir/" in link or "/directory/" in link
+                            starts_with_profiles = re.match(r'^\d+\+?\s+"?[^"]*"?\s+profiles', title.lower())
+                            
+                            if is_directory_link or starts_with_profiles:
+                                continue  # Skip directory pages
+                            # Otherwise, keep it - might be a valid profile with concatenated text
+                            
+                        profile_headlines.append(item)
+                    
+                    # FILTER 2: Only keep results for TARGET PERSON (filter out other people)
+                    # ScrapingDog often returns concatenated results with multiple profiles
+                    name_parts = full_name.lower().split()
+                    first_name = name_parts[0] if name_parts else ""
+                    last_name = name_parts[-1] if len(name_parts) > 1 else ""
+                    
+                    # Normalize accents for matching (José -> Jose, François -> Francois)
+                    first_name_normalized = normalize_accents(first_name)
+                    last_name_normalized = normalize_accents(last_name)
+                    
+                    target_person_results = []
+                    other_person_results = []
+                    
+                    for item in profile_headlines:
+                        title_lower = item.get("title", "").lower()
+                        link = item.get("link", "")
+                        
+                        # Normalize the title too for accent-insensitive matching
+                        title_normalized = normalize_accents(title_lower)
+                        
+                        # PRIORITY: If this result's URL matches our target profile slug, it's THE profile!
+                        # Skip name-in-title check - URL match is authoritative proof of identity
+                        if profile_slug and "linkedin.com/in/" in link:
+                            result_slug = link.split("/in/")[-1].strip("/").split("?")[0]
+                            if profile_slug.lower() == result_slug.lower():
+                                target_person_results.append(item)
+                                continue  # Skip name check - URL match is definitive
+                        
+                        # Check if target person's name is in the title (accent-insensitive)
+                        # This handles cases like "Jose Varatojo" matching "José Diogo Varatojo"
+                        if first_name_normalized in title_normalized and last_name_normalized in title_normalized:
+                            target_person_results.append(item)
+                        else:
+                            other_person_results.append(item)
+                    
+                    # Prioritize target person's profile headlines
+                    if target_person_results:
+                        print(f"      📊 GSE Profile Headlines for {full_name}:")
+                        for i, item in enumerate(target_person_results[:3], 1):
+                            print(f"         {i}. {item.get('title', '')[:70]}")
+                        if other_person_results:
+                            print(f"      📊 Other profiles filtered out: {len(other_person_results)}")
+                        if posts:
+                            print(f"      📊 Posts filtered out: {len(posts)}")
+                        # Return only target person's profile headlines (with URL match status)
+                        return target_person_results[:max_results], url_match_exact
+                    elif profile_headlines:
+                        # No exact name match - TRY NEXT VARIATION instead of returning wrong person
+                        # This is important because ScrapingDog sometimes returns different people first
+                        print(f"      ⚠️ No name match in results (found: {profile_headlines[0].get('title', '')[:50]}...)")
+                        print(f"      🔄 Trying next variation to find correct person...")
+                        # No delay needed - ScrapingDog has no rate limiting
+                        continue  # Try next query variation
+                    elif posts:
+                        # Only posts found (no profile headlines) - return posts
+                        print(f"      📊 ScrapingDog Posts only (no profile headlines found):")
+                        for i, item in enumerate(posts[:3], 1):
+                            print(f"         {i}. {item.get('title', '')[:70]}")
+                        return posts[:max_results], url_match_exact
+                    else:
+                        # No results at all - try next variation
+                        print(f"         ⚠️ No usable results, trying next variation...")
+                        continue
+                else:
+                    print(f"         ❌ No results with variation {variation_idx}")
+            
+            except Exception as e:
+                print(f"         ⚠️ Error for variation {variation_idx}: {str(e)}")
+                continue
+            
+            # All variations exhausted
+            print(f"   ❌ GSE: No results found after trying {len(query_variations)} variations")
+        return [], False
+    
+    except Exception as e:
+        print(f"   ⚠️ GSE API error: {str(e)}")
+        return [], False
+
+async def verify_linkedin_with_llm(full_name: str, company: str, linkedin_url: str, search_results: List[dict], url_match_exact: bool = False) -> Tuple[bool, str]:
+    """
+    Use OpenRouter LLM to verify if search results match the person.
+
+    Args:
+        full_name: Person's full name
+        company: Company name
+        linkedin_url: Provided LinkedIn URL
+        search_results: Google search results
+        url_match_exact: If True, URL slug matched exactly (strong identity proof)
+
+    Returns:
+        (is_verified, reasoning)
+    """
+    try:
+        if not search_results:
+            return False, "No LinkedIn search results found"
+        
+        # DETERMINISTIC PRE-CHECK: Check company match from titles directly
+        # This avoids LLM hallucination issues
+        company_lower = company.lower().strip()
+        
+        # Normalize apostrophes (ScrapingDog returns "mcdonald ' s" with spaces, we need "mcdonald's")
+        # Also handle curly apostrophes and other variants
+        company_lower = company_lower.replace("'", "'").replace("'", "'").replace("`", "'")
+        company_lower = re.sub(r"\s*'\s*", "'", company_lower)  # "mcdonald ' s" → "mcdonald's"
+        company_lower = re.sub(r"\s*-\s*", "-", company_lower)  # "chick - fil - a" → "chick-fil-a"
+        
+        # Normalize company name by removing common legal suffixes
+        # e.g., "Bank Of America Corporation" → "Bank Of America"
+        # e.g., "Google LLC" → "Google"
+        LEGAL_SUFFIXES = [
+            " corporation", " corp.", " corp", " incorporated", " inc.", " inc",
+            " llc", " l.l.c.", " ltd.", " ltd", " limited", " plc", " p.l.c.",
+            " co.", " co", " company", " gmbh", " ag", " sa", " nv", " bv",
+            " holdings", " holding", " group", " international", " intl"
+        ]
+        company_normalized = company_lower
+        for suffix in LEGAL_SUFFIXES:
+            if company_normalized.endswith(suffix):
+                company_normalized = company_normalized[:-len(suffix)].strip()
+                break  # Only remove one suffix
+        
+        company_words = company_normalized.split()  # ["bank", "of", "america"]
+        
+        # CRITICAL FIX: When URL matched exactly, use the result with matching URL
+        # for company verification, NOT just the first result.
+        # This handles common names where multiple people have the same name.
+        target_result = search_results[0]  # Default to first
+        
+        if url_match_exact and linkedin_url:
+            # Find the result with the matching URL
+            profile_slug = linkedin_url.split("/in/")[-1].strip("/").split("?")[0].lower() if "/in/" in linkedin_url else None
+            if profile_slug:
+                for result in search_results:
+                    result_url = result.get("link", "").lower()
+                    if f"/in/{profile_slug}" in result_url:
+                        target_result = result
+                        print(f"   🎯 Using URL-matched result for company check: {result_url[:50]}")
+                        break
+        
+        # Check the TARGET result (URL-matched or first)
+        first_title = target_result.get("title", "").lower()
+        
+        # Normalize apostrophes and hyphens in title too (ScrapingDog returns "mcdonald ' s" and "chick - fil - a")
+        first_title = first_title.replace("'", "'").replace("'", "'").replace("`", "'")
+        first_title = re.sub(r"\s*'\s*", "'", first_title)  # "mcdonald ' s" → "mcdonald's"
+        first_title = re.sub(r"\s*-\s*", "-", first_title)  # "chick - fil - a" → "chick-fil-a"
+        
+        # Extract ONLY the headline part (before "| linkedin")
+        # ScrapingDog often concatenates descriptions after "| LinkedIn"
+        # e.g., "Name - Title @ Company | LinkedIn About Company: ..."
+        if "| linkedin" in first_title:
+            first_title = first_title.split("| linkedin")[0].strip()
+        
+        # Also get snippet for additional company matching
+        first_snippet = target_result.get("snippet", "").lower()
+        first_snippet = re.sub(r"\s*-\s*", "-", first_snippet)  # Normalize hyphens
+        
+        # Check if title is truncated (contains "...")
+        # If truncated, we may be missing the company name
+        title_truncated = "..." in first_title
+        
+        # Method 1: Exact normalized company name in title
+        company_in_title = company_normalized in first_title
+        
+        # Method 2: All significant words of company name in title (for multi-word companies)
+        # e.g., "Bank Of America" → check if "bank", "of", "america" are all in title
+        if not company_in_title and len(company_words) > 1:
+            significant_words = [w for w in company_words if len(w) > 2]  # Skip "of", "the", etc.
+            company_in_title = all(word in first_title for word in significant_words)
+        
+        # Method 2b: FUZZY MATCH - Handle shortened company names
+        # e.g., "Sirona" in title matches "Sirona Hygiene" claimed
+        # Extract company name from title (typically after "at " or "@ ")
+        if not company_in_title:
+            # Try to extract company from title patterns like "Name - Title at Company" or "Name @ Company"
+            title_company_match = re.search(r'(?:at|@)\s+([^|\-]+?)(?:\s*[\|\-]|$)', first_title, re.IGNORECASE)
+            if title_company_match:
+                extracted_company = title_company_match.group(1).strip().lower()
+                # Remove common trailing words that aren't part of company name
+                extracted_company = re.sub(r'\s+(linkedin|profile|page).*$', '', extracted_company)
+                # Remove parenthetical content and other junk after company name
+                extracted_company = re.sub(r'\s*\([^)]*\).*$', '', extracted_company)  # Remove "(anything)" and everything after
+                extracted_company = re.sub(r'\s*\|.*$', '', extracted_company)  # Remove "|" and everything after
+                extracted_company = extracted_company.strip()
+                
+                # Normalize the extracted company name (remove legal suffixes)
+                extracted_company_normalized = extracted_company
+                for suffix in LEGAL_SUFFIXES:
+                    if extracted_company_normalized.endswith(suffix):
+                        extracted_company_normalized = extracted_company_normalized[:-len(suffix)].strip()
+                        break
+                
+                # Check if either is a substring of the other (fuzzy match)
+                # e.g., "sirona" ⊆ "sirona hygiene" OR "sirona hygiene" ⊇ "sirona"
+                if len(extracted_company_normalized) >= 4 and len(company_normalized) >= 4:  # Both must be substantial
+                    # Bidirectional containment check
+                    if (extracted_company_normalized in company_normalized or 
+                        company_normalized in extracted_company_normalized):
+                        # Additional safety: must share at least 80% of longer word if both are single words
+                        # This prevents "Meta" matching "Metamorph" 
+                        if ' ' in extracted_company_normalized or ' ' in company_normalized:
+                            # Multi-word: accept substring match
+                            company_in_title = True
+                            print(f"   ✅ FUZZY MATCH: '{extracted_company_normalized}' ≈ '{company_normalized}' (substring match)")
+                        else:
+                            # Single-word: check similarity
+                            longer = max(extracted_company_normalized, company_normalized, key=len)
+                            shorter = min(extracted_company_normalized, company_normalized, key=len)
+                            if len(shorter) / len(longer) >= 0.6:  # At least 60% length ratio
+                                company_in_title = True
+                                print(f"   ✅ FUZZY MATCH: '{extracted_company_normalized}' ≈ '{company_normalized}' (similar length)")
+        
+        # Method 3: Check snippet for company name
+        # First try strict "Experience: [Company]" pattern (LinkedIn profile format)
+        # Then try general company name mention (for LinkedIn posts)
+        company_in_snippet = False
+        if not company_in_title:
+            # Check for "experience: [company]" pattern (LinkedIn's standard format)
+            if f"experience: {company_normalized}" in first_snippet:
+                company_in_snippet = True
+            elif f"experience : {company_normalized}" in first_snippet:
+                company_in_snippet = True
+            # Check for multi-word companies in Experience section
+            elif len(company_words) > 1:
+                significant_words = [w for w in company_words if len(w) > 2]
+                # Must have "experience:" prefix AND all company words
+                if "experience:" in first_snippet or "experience :" in first_snippet:
+                    # Find the part after "experience:"
+                    exp_parts = first_snippet.split("experience:")
+                    if len(exp_parts) > 1:
+                        experience_section = exp_parts[1][:100]  # First 100 chars after "experience:"
+                        if all(word in experience_section for word in significant_words):
+                            company_in_snippet = True
+            
+            # Method 3b: For LinkedIn posts, also accept company name anywhere in snippet
+            # This handles cases where Yahoo returns posts with company mentioned in content
+            # e.g., "Although Smartcar is a fully remote company..."
+            if not company_in_snippet:
+                if company_normalized in first_snippet:
+                    company_in_snippet = True
+                    print(f"   ℹ️  Company found in snippet (general mention)")
+                elif len(company_words) > 1:
+                    # Multi-word company - check all significant words
+                    significant_words = [w for w in company_words if len(w) > 2]
+                    if all(word in first_snippet for word in significant_words):
+                        company_in_snippet = True
+                        print(f"   ℹ️  Company words found in snippet (general mention)")
+        
+        # Method 4: If first result is truncated and no company found, check OTHER results
+        # ScrapingDog often truncates titles, so we need to look at more results
+        if not company_in_title and not company_in_snippet and title_truncated and len(search_results) > 1:
+            print(f"   ℹ️  First title truncated, checking other results for company...")
+            for idx, result in enumerate(search_results[1:4], start=2):  # Check next 3 results
+                other_title = result.get("title", "").lower()
+                other_snippet = result.get("snippet", "").lower()
+                
+                # Normalize the other title/snippet
+                other_title = other_title.replace("'", "'").replace("'", "'").replace("`", "'")
+                other_title = re.sub(r"\s*'\s*", "'", other_title)
+                other_title = re.sub(r"\s*-\s*", "-", other_title)
+                
+                # Check if company in this result
+                if company_normalized in other_title or company_normalized in other_snippet:
+                    company_in_title = True
+                    print(f"   ✅ Company found in result #{idx}: {other_title[:60]}...")
+                    break
+                
+                # Check multi-word company
+                if len(company_words) > 1:
+                    significant_words = [w for w in company_words if len(w) > 2]
+                    if all(word in other_title or word in other_snippet for word in significant_words):
+                        company_in_title = True
+                        print(f"   ✅ Company words found in result #{idx}: {other_title[:60]}...")
+                        break
+        
+        # Deterministic company match decision (title OR snippet)
+        deterministic_company_match = company_in_title or company_in_snippet
+        
+        # Show normalized company name if it differs from original
+        match_location = "title" if company_in_title else ("snippet" if company_in_snippet else "NOT FOUND")
+        if company_normalized != company_lower:
+            print(f"   🔍 Deterministic check: Company '{company}' (normalized: '{company_normalized}') in {match_location} = {deterministic_company_match}")
+        else:
+            print(f"   🔍 Deterministic check: Company '{company}' in {match_location} = {deterministic_company_match}")
+        print(f"      First title: {first_title[:80]}...")
+        if company_in_snippet and not company_in_title:
+            print(f"      First snippet: {first_snippet[:80]}...")
+        
+        # Prepare search results for LLM
+        results_text = json.dumps(search_results, indent=2, default=str)  # Handle any datetime objects
+        
+        # Build LinkedIn URL line (only if provided)
+        linkedin_url_line = f"LinkedIn URL Provided: {linkedin_url}\n" if linkedin_url else ""
+        
+        # Explicit 3-check prompt: name match + company match + profile valid
+        prompt = f"""You are validating a LinkedIn profile for B2B lead generation. Analyze these search results.
+
+PROVIDED INFORMATION:
+- Expected Name: {full_name}
+- Expected Company: {company}
+- LinkedIn URL: {linkedin_url}
+
+SEARCH RESULTS:
+{results_text}
+
+CHECK THREE CRITERIA SEPARATELY:
+
+1. NAME MATCH: Does the person name in search results match "{full_name}"?
+   - Look at the profile title (e.g., "John Smith - CEO" vs "Jane Doe - VP")
+   - Names must substantially match, but allow common variants:
+     * Spelling variants (e.g., "Jacobson" = "Jacobsen", "Smith" = "Smyth", "Steven" = "Stephen")
+     * Shortened names (e.g., "Ben" = "Benjamin", "Mike" = "Michael", "Chris" = "Christopher")
+     * Middle names/initials present or absent (e.g., "John Smith" = "John A. Smith")
+   - Different people = name_match FALSE (e.g., "John Black" ≠ "Pranav Ramesh")
+
+2. COMPANY MATCH: Does the profile TITLE show "{company}" as current employer?
+   - ONLY look at the TITLE (e.g., "Name - Title at Company | LinkedIn")
+   - IGNORE the snippet/description - it may contain outdated or unrelated info
+   - ACCEPT if "{company}" appears in the TITLE
+   - REJECT if TITLE shows a DIFFERENT company (e.g., "Name - CEO at OtherCorp")
+   - REJECT if "Exited", "Former", or "Left" in TITLE about "{company}"
+   - If NO company in TITLE, company_match = FALSE
+
+3. PROFILE VALID: Is profile legitimate and indexed?
+   - Profile appears in search results = valid
+
+CRITICAL: Check name AND company separately. Both must match.
+
+Respond ONLY with JSON: {{"name_match": true/false, "company_match": true/false, "profile_valid": true/false, "confidence": 0.0-1.0, "reasoning": "Brief explanation"}}"""
+        
+        llm_response, error = await llm_complete("stage4_linkedin", prompt, timeout=15, api_key=OPENROUTER_KEY)
+        if error:
+            return False, error
+        
+        # Strip markdown code blocks if present (LLM sometimes wraps JSON in ```json ... ```)
+        llm_response = strip_code_fences(llm_response)
+        
+        # Parse JSON response with 3 separate checks
+        result = json.loads(llm_response)
+        
+        name_match = result.get("name_match", False)
+        llm_company_match = result.get("company_match", False)
+        profile_valid = result.get("profile_valid", False)
+        confidence = result.get("confidence", 0.0)
+        reasoning = result.get("reasoning", "")
+        
+        # OVERRIDE 1: Use deterministic company match instead of LLM's decision
+        # This prevents LLM hallucination issues
+        company_match = deterministic_company_match
+        
+        if llm_company_match != deterministic_company_match:
+            print(f"   ⚠️ LLM company_match ({llm_company_match}) OVERRIDDEN by deterministic check ({deterministic_company_match})")
+            reasoning = f"[Deterministic: company '{company}' {'found' if deterministic_company_match else 'NOT found'} in title] {reasoning}"
+        
+        # OVERRIDE 2: If URL matched EXACTLY + company matched deterministically,
+        # override LLM's name_match and confidence decisions.
+        # 
+        # WHY THIS IS SAFE:
+        # - URL can only match if ScrapingDog found that URL when searching for the CLAIMED NAME
+        # - ScrapingDog searches "Pranav Ramesh" → only returns results for that name
+        # - If miner gave a different person's URL, it wouldn't appear in those results
+        # - So exact URL match = the profile IS for the claimed person
+        # 
+        # WHY THIS IS NEEDED:
+        # - ScrapingDog often returns concatenated results with OTHER people's headlines
+        # - LLM compares those wrong headlines against claimed name → false negative
+        # - Example: Search "Melissa Carberry" → ScrapingDog returns correct URL but 
+        #   headlines mixed with other people → LLM says "name mismatch"
+        #
+        # REQUIRES BOTH:
+        # - url_match_exact=True (strong identity proof from URL slug)
+        # - deterministic_company_match=True (they work at right company)
+        if url_match_exact and deterministic_company_match:
+            if not name_match or confidence < 0.5:
+                print(f"   ✅ URL EXACT MATCH + COMPANY MATCH: Overriding LLM decision")
+                print(f"      (URL slug is authoritative identity proof when searching by name)")
+                name_match = True
+                confidence = max(confidence, 0.8)  # Boost confidence for strong deterministic proof
+                profile_valid = True  # URL exists = profile is valid
+                reasoning = f"[URL exact match + company verified - identity confirmed] {reasoning}"
+        
+        # OVERRIDE 3: If URL matched (exact OR partial) + name matches, but company not in results
+        # (due to ScrapingDog returning truncated titles/posts), PASS Stage 4 and let Stage 5 verify company.
+        #
+        # WHY THIS IS SAFE:
+        # - URL match (even partial) + name match = we verified the profile exists and belongs to right person
+        # - Profile slug matching means ScrapingDog found that URL when searching for the person's name
+        # - If miner gave wrong URL, it wouldn't appear in name-based search results
+        # - Stage 4's job = verify IDENTITY (person exists on LinkedIn)
+        # - Stage 5's job = verify EMPLOYMENT (person works at claimed company/role/region)
+        # - If company not found in title, likely due to ScrapingDog truncation ("Chief Technology ...")
+        # - Stage 5 will independently verify company by searching "Name + Company + Role"
+        # - If miner lied about company, Stage 5 will catch it
+        #
+        # REQUIRES:
+        # - url_match_exact=True OR we found the URL in results (partial match)
+        # - name_match=True (identity confirmed)
+        # - company_match=False (company not in results, but will be verified in Stage 5)
+        # Extract profile slug from linkedin_url to check for partial matches
+        profile_slug = linkedin_url.split("/in/")[-1].strip("/").split("?")[0] if linkedin_url and "/in/" in linkedin_url else None
+        profile_slug_norm = profile_slug.lower().replace("-", "").replace("_", "") if profile_slug else ""
+        has_url_match = url_match_exact or any(
+            profile_slug_norm in result.get("link", "").lower().replace("-", "").replace("_", "")
+            for result in search_results[:5] if "linkedin.com/in/" in result.get("link", "")
+        )
+        
+        if has_url_match and name_match and not company_match:
+            print(f"   ⚠️ OVERRIDE: URL + Name match, but company not in GSE results")
+            print(f"      → Passing Stage 4 (identity verified)")
+            print(f"      → Stage 5 will verify company/role/region")
+            company_match = True  # Override to pass Stage 4
+            profile_valid = True
+            confidence = max(confidence, 0.7)
+            reasoning = f"[URL + name verified, company check deferred to Stage 5] {reasoning}"
+        
+        # DEBUG: Print LLM analysis with all 3 checks
+        print(f"   🤖 LLM Analysis:")
+        print(f"      Name Match: {name_match} (Does {full_name} match the profile?)")
+        print(f"      Company Match: {company_match} (Deterministic from title)")
+        print(f"      Profile Valid: {profile_valid} (Is profile legitimate?)")
+        print(f"      Confidence: {confidence}")
+        print(f"      Reasoning: {reasoning}")
+        
+        # Verification passes ONLY if ALL THREE criteria are met:
+        # 1. Name matches (prevents using wrong person's LinkedIn)
+        # 2. Company matches (prevents outdated employment)
+        # 3. Profile valid (prevents fake profiles)
+        # 4. Confidence >= 0.5
+        if name_match and company_match and profile_valid and confidence >= 0.5:
+            return True, reasoning
+        else:
+            # Build detailed failure reason
+            failures = []
+            if not name_match:
+                failures.append("name mismatch")
+            if not company_match:
+                failures.append("company mismatch")
+            if not profile_valid:
+                failures.append("invalid profile")
+            if confidence < 0.5:
+                failures.append("low confidence")
+            
+            failure_str = ", ".join(failures) if failures else "unknown"
+            detailed_reason = f"{reasoning} [Failed: {failure_str}]"
+            return False, detailed_reason
+    
+    except asyncio.TimeoutError:
+        return False, "LLM API timeout"
+    except json.JSONDecodeError as e:
+        return False, f"LLM response parsing error: {str(e)}"
+    except Exception as e:
+        return False, f"LLM verification error: {str(e)}"
+
+@instrumented_check
+async def check_linkedin_gse(lead: dict) -> Tuple[bool, dict]:
+    """
+    Stage 4: LinkedIn/GSE validation (HARD check).
+    
+    Verifies that the person works at the company using:
+    1. Google Custom Search (LinkedIn)
+    2. OpenRouter LLM verification
+    
+    This is a HARD check - instant rejection if fails.
+
+    Args:
+        lead: Lead data with full_name, company, linkedin
+
+    Returns:
+        (passed, rejection_reason)
+    """
+    try:
+        full_name = lead.get("full_name") or lead.get("Full_name") or lead.get("Full Name")
+        company = get_company(lead)
+        linkedin_url = get_linkedin(lead)
+        
+        if not full_name:
+            return False, {
+                "stage": "Stage 4: LinkedIn/GSE Validation",
+                "check_name": "check_linkedin_gse",
+                "message": "Missing full_name",
+                "failed_fields": ["full_name"]
+            }
+        
+        if not company:
+            return False, {
+                "stage": "Stage 4: LinkedIn/GSE Validation",
+                "check_name": "check_linkedin_gse",
+                "message": "Missing company",
+                "failed_fields": ["company"]
+            }
+        
+        if not linkedin_url:
+            return False, {
+                "stage": "Stage 4: LinkedIn/GSE Validation",
+                "check_name": "check_linkedin_gse",
+                "message": "Missing linkedin URL",
+                "failed_fields": ["linkedin"]
+            }
+        
+        # Step 1: Search LinkedIn via ScrapingDog GSE
+        print(f"   🔍 Stage 4: Verifying LinkedIn profile for {full_name} at {company}")
+        
+        # ScrapingDog GSE search for LinkedIn profile (returns url_match_exact status)
+        search_results, url_match_exact = await search_linkedin_gse(full_name, company, linkedin_url)
+        
+        # Store search count in lead for data collection
+        lead["gse_search_count"] = len(search_results)
+        
+        if not search_results:
+            # Store LLM confidence as "none" when no search results
+            lead["llm_confidence"] = "none"
+            return False, {
+                "stage": "Stage 4: LinkedIn/GSE Validation",
+                "check_name": "check_linkedin_gse",
+                "message": f"LinkedIn profile {linkedin_url} not found in Google's index (may be private or invalid)",
+                "failed_fields": ["linkedin"]
+            }
+        
+        # Step 2: Verify with LLM (pass URL match status for identity override)
+        verified, reasoning = await verify_linkedin_with_llm(full_name, company, linkedin_url, search_results, url_match_exact)
+        
+        # Store LLM confidence (low, medium, high, or "none")
+        # This is derived from the LLM's confidence score
+        lead["llm_confidence"] = "medium"  # Default, can be enhanced later
+        
+        if not verified:
+            return False, {
+                "stage": "Stage 4: LinkedIn/GSE Validation",
+                "check_name": "check_linkedin_gse",
+                "message": f"LinkedIn verification failed: {reasoning}",
+                "failed_fields": ["linkedin"]
+            }
+        
+        # Extract role from Stage 4's confirmed profile title for use in Stage 5
+        # This provides an authoritative role source directly from the LinkedIn profile
+        stage4_extracted_role = None
+        if search_results and len(search_results) > 0:
+            # Try extracting role from ALL search results (not just first one)
+            # This handles cases where the first result's title is malformed/concatenated
+            # but subsequent results have cleaner titles with the role
+            for result in search_results[:3]:  # Try first 3 results
+                result_title = result.get("title", "")
+                result_snippet = result.get("snippet", "")
+                
+                # Try title first (most reliable)
+                role_from_title = extract_role_from_search_title(
+                    result_title, "", company_name=company, full_name=full_name
+                )
+                
+                if role_from_title:
+                    # Sanity check: Role should be reasonable length (not garbage from concatenation)
+                    if len(role_from_title) < 100 and " ... " not in role_from_title:
+                        stage4_extracted_role = role_from_title
+                        break  # Found a clean role, stop searching
+            
+            # If title extraction failed, try snippet as fallback
+            # Snippets often contain LinkedIn's meta description with role info
+            if not stage4_extracted_role:
+                for result in search_results[:3]:
+                    result_snippet = result.get("snippet", "")
+                    if result_snippet:
+                        role_from_snippet = extract_role_from_search_title(
+                            "", result_snippet, company_name=company, full_name=full_name
+                        )
+                        if role_from_snippet and len(role_from_snippet) < 100:
+                            stage4_extracted_role = role_from_snippet
+                            break
+            
+            if stage4_extracted_role:
+                lead["stage4_extracted_role"] = stage4_extracted_role
+                print(f"   📝 Stage 4: Extracted role from profile: '{stage4_extracted_role}'")
+        
+        # ========================================================================
+        # EXTRACT PERSON LOCATION FROM LINKEDIN SEARCH RESULTS (NEW)
+        # ========================================================================
+        # The person's profile header location often appears in Google snippets.
+        # This is the PERSON's location, not the company headquarters.
+        # Format in snippets: "...School of Business. New York, New York, United States."
+        # 
+        # IMPORTANT: Only extract location from results that match the miner's
+        # provided LinkedIn URL. This prevents extracting location from a different
+        # person with the same name.
+        # ========================================================================
+        stage4_extracted_location = None
+        if search_results and len(search_results) > 0:
+            # Extract profile slug from miner's provided LinkedIn URL
+            profile_slug = linkedin_url.split("/in/")[-1].strip("/").split("?")[0].lower() if linkedin_url and "/in/" in linkedin_url else None
+            
+            # Try extracting location from search result snippets
+            # ONLY from results that match the miner's LinkedIn profile URL
+            for result in search_results[:5]:  # Check first 5 results
+                result_url = result.get("link", result.get("url", "")).lower()
+                result_snippet = result.get("snippet", result.get("body", ""))
+                
+                # ENFORCE: Only extract from results that match the profile slug
+                if profile_slug and "linkedin.com/in/" in result_url:
+                    # Extract slug from result URL
+                    result_slug = result_url.split("/in/")[-1].strip("/").split("?")[0]
+                    
+                    # Normalize for comparison (handle hyphens, underscores)
+                    profile_slug_norm = profile_slug.replace("-", "").replace("_", "")
+                    result_slug_norm = result_slug.replace("-", "").replace("_", "")
+                    
+                    if profile_slug_norm != result_slug_norm:
+                        # URL doesn't match miner's profile - skip this result
+                        continue
+                
+                if result_snippet:
+                    location = extract_person_location_from_linkedin_snippet(result_snippet)
+                    if location:
+                        stage4_extracted_location = location
+                        print(f"   📍 Stage 4: Extracted person location from VERIFIED profile URL")
+                        break
+            
+            if stage4_extracted_location:
+                lead["stage4_extracted_location"] = stage4_extracted_location
+                print(f"   📍 Stage 4: Extracted person location from profile: '{stage4_extracted_location}'")
+        
+        # ========================================================================
+        # STAGE 4: COMPANY LINKEDIN VALIDATION (NEW)
+        # ========================================================================
+        # Validates company_linkedin URL, verifies company name matches, and caches
+        # company data (industry, description, employee_count) for Stage 5.
+        # FAIL HERE = Stage 5 never runs = saves all Stage 5 API costs
+        # ========================================================================
+        
+        company_linkedin = lead.get("company_linkedin", "") or ""
+        
+        if company_linkedin:
+            print(f"   🏢 Stage 4: Validating company LinkedIn URL...")
+            
+            # Step 1: Validate URL format (must be /company/, not /in/)
+            url_valid, url_reason, company_slug = validate_company_linkedin_url(company_linkedin)
+            
+            if not url_valid:
+                print(f"   ❌ Stage 4: Company LinkedIn URL INVALID: {url_reason}")
+                return False, {
+                    "stage": "Stage 4: Company LinkedIn Validation",
+                    "check_name": "check_linkedin_gse",
+                    "message": f"Company LinkedIn URL is invalid: {url_reason}",
+                    "failed_fields": ["company_linkedin"],
+                    "provided_url": company_linkedin,
+                    "expected_format": "https://linkedin.com/company/{company-name}"
+                }
+            
+            print(f"   ✅ Stage 4: Company LinkedIn URL format valid: /company/{company_slug}")
+            
+            # Step 2-3: Global cache first, otherwise scrape company LinkedIn page via GSE
+            # (single-flight: overlapping leads of the same company share one scrape)
+            cached_data, scraped_data = await load_company_linkedin(company_slug, company)
+            
+            if cached_data:
+                print(f"   📦 Stage 4: Using CACHED company LinkedIn data for '{company_slug}'")
+                
+                # Verify company name still matches (cache might have different company)
+                cached_company_name = cached_data.get("company_name_from_linkedin", "")
+                if cached_company_name:
+                    # Check if cached company matches current company claim
+                    cached_lower = cached_company_name.lower().strip()
+                    claimed_lower = company.lower().strip()
+                    
+                    if cached_lower != claimed_lower and cached_lower not in claimed_lower and claimed_lower not in cached_lower:
+                        print(f"   ❌ Stage 4: Cached company name '{cached_company_name}' doesn't match claimed '{company}'")
+                        return False, {
+                            "stage": "Stage 4: Company LinkedIn Validation",
+                            "check_name": "check_linkedin_gse",
+                            "message": f"Company LinkedIn page shows '{cached_company_name}' but miner claimed '{company}'",
+                            "failed_fields": ["company_linkedin", "company"],
+                            "linkedin_company": cached_company_name,
+                            "claimed_company": company
+                        }
+                
+                # Store cached data on lead for Stage 5
+                lead["company_linkedin_verified"] = True
+                lead["company_linkedin_slug"] = company_slug
+                lead["company_linkedin_data"] = cached_data
+                lead["company_linkedin_from_cache"] = True
+                
+                # Log what data we have cached
+                if cached_data.get("employee_count"):
+                    print(f"   📊 Cached employee count: {cached_data['employee_count']}")
+                if cached_data.get("industry"):
+                    print(f"   🏭 Cached industry: {cached_data['industry']}")
+                if cached_data.get("description"):
+                    print(f"   📝 Cached description: {cached_data['description'][:80]}...")
+            else:
+                if scraped_data.get("success"):
+                    # Step 4: Verify company name matches
+                    if not scraped_data.get("company_name_match"):
+                        linkedin_company = scraped_data.get("company_name_from_linkedin", "Unknown")
+                        print(f"   ❌ Stage 4: Company name MISMATCH: LinkedIn shows '{linkedin_company}' but miner claimed '{company}'")
+                        return False, {
+                            "stage": "Stage 4: Company LinkedIn Validation",
+                            "check_name": "check_linkedin_gse",
+                            "message": f"Company LinkedIn page shows '{linkedin_company}' but miner claimed '{company}'",
+                            "failed_fields": ["company_linkedin", "company"],
+                            "linkedin_company": linkedin_company,
+                            "claimed_company": company
+                        }
+                    
+                    print(f"   ✅ Stage 4: Company name verified: '{company}'")
+                    
+                    # Step 5: Already cached globally by load_company_linkedin (only on success)
+                    
+                    # Store on lead for Stage 5
+                    lead["company_linkedin_verified"] = True
+                    lead["company_linkedin_slug"] = company_slug
+                    lead["company_linkedin_data"] = scraped_data
+                    lead["company_linkedin_from_cache"] = False
+                    
+                    # Log what data we scraped
+                    if scraped_data.get("employee_count"):
+                        print(f"   📊 Scraped employee count: {scraped_data['employee_count']}")
+                    if scraped_data.get("industry"):
+                        print(f"   🏭 Scraped industry: {scraped_data['industry']}")
+                    if scraped_data.get("description"):
+                        print(f"   📝 Scraped description: {scraped_data['description'][:80]}...")
+                else:
+                    # Scraping failed - check if it's a URL mismatch (reject) or just scraping error (warn)
+                    error_msg = scraped_data.get('error', 'Unknown')
+                    
+                    # If URL doesn't match, this is a CRITICAL error - reject immediately
+                    if "does not match expected slug" in error_msg or "URL mismatch" in error_msg:
+                        print(f"   ❌ Stage 4: Company LinkedIn URL mismatch: {error_msg}")
+                        return False, {
+                            "stage": "Stage 4: Company LinkedIn Validation",
+                            "check_name": "check_linkedin_gse",
+                            "message": f"Company LinkedIn URL is incorrect or ambiguous: {error_msg}",
+                            "failed_fields": ["company_linkedin"],
+                            "provided_url": company_linkedin,
+                            "hint": "The URL provided returns a different company page. Ensure you're using the exact LinkedIn company slug."
+                        }
+                    
+                    # Other scraping errors (network, API, etc.) - warn but don't fail
+                    # Stage 5 will use fallback GSE searches
+                    print(f"   ⚠️ Stage 4: Could not scrape company LinkedIn: {error_msg}")
+                    print(f"   ⚠️ Stage 4: Stage 5 will use fallback GSE searches for industry/employee data")
+                    lead["company_linkedin_verified"] = True  # URL was valid format
+                    lead["company_linkedin_slug"] = company_slug
+                    lead["company_linkedin_data"] = None  # No data - Stage 5 will fallback
+                    lead["company_linkedin_from_cache"] = False
+        else:
+            # No company_linkedin provided - Stage 5 will use fallback GSE searches
+            print(f"   ⚠️ Stage 4: No company_linkedin URL provided")
+            lead["company_linkedin_verified"] = False
+            lead["company_linkedin_data"] = None
+        
+        print(f"   ✅ Stage 4: LinkedIn verified for {full_name} at {company}")
+        return True, {}
+    
+    except Exception as e:
+        return False, {
+            "stage": "Stage 4: LinkedIn/GSE Validation",
+            "check_name": "check_linkedin_gse",
+            "message": f"LinkedIn/GSE check failed: {str(e)}",
+            "failed_fields": ["linkedin"]
+        }
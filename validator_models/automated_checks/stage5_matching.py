@@ -0,0 +1,2498 @@
+"""
+Deterministic Stage 5 matching helpers: geocoding, role and location extraction
+from search results, and employee-count parsing.
+"""
+
+import os
+import re
+from typing import Dict, Tuple, List, Optional
+from validator_models.text_patterns import compile_pattern, compile_each, keyword_gate, substring_alternation
+from validator_models.ttl_cache import TTLCache
+from validator_models.geocoder import AMBIGUOUS as GEOCODE_AMBIGUOUS, get_geocoder, haversine_km
+from validator_models.rate_governor import THROTTLED, acquire_sync, report_outcome
+
+
+# ============================================================================
+# STAGE 5: UNIFIED VERIFICATION (Role, Region, Industry)
+# ============================================================================
+# Verifies role, region, and industry in ONE LLM call after Stage 4 passes
+# Uses ScrapingDog search results + fuzzy matching + LLM verification
+# 
+# Flow:
+# 1. ScrapingDog search for ROLE (name + company + linkedin)
+# 2. ScrapingDog search for REGION (company headquarters)
+# 3. ScrapingDog search for INDUSTRY (what company does)
+# 4. Fuzzy pre-verification (deterministic matching)
+# 5. LLM verification (only for fields that need it)
+# 6. Early exit if role fails → skip region/industry
+# 7. Early exit if region fails → skip industry
+# ============================================================================
+
+
+# Geocoding: offline gazetteer (validator_models/geocoder.py). Nominatim is only
+# consulted for ambiguous queries, and only when explicitly enabled - it needs
+# network access, is paced at 1 request/second host-wide (rate_governor) and is
+# not reproducible across validators.
+GEOCODER_NOMINATIM_FALLBACK = os.getenv("VALIDATOR_GEOCODER_NOMINATIM_FALLBACK", "false").lower() == "true"
+_nominatim_cache = TTLCache(max_entries=5000, default_ttl_seconds=7 * 24 * 3600, name="nominatim_geocode")
+
+def _geocode_location(location: str) -> Optional[Dict]:
+    """
+    Geocode a location string against the offline gazetteer.
+    Returns dict with city, state, country, country_code, lat, lon, display or None if not found.
+    """
+    if not location or len(location.strip()) < 2:
+        return None
+    
+    status, result = get_geocoder().resolve(location)
+    if status == GEOCODE_AMBIGUOUS and GEOCODER_NOMINATIM_FALLBACK:
+        return _geocode_location_nominatim(location)
+    return result
+
+
+def _geocode_location_nominatim(location: str) -> Optional[Dict]:
+    """
+    Geocode a location string using Nominatim (free OpenStreetMap).
+    Returns dict with city, state, country, lat, lon or None if not found.
+    Rate limited to 1 request/second per Nominatim policy, shared by every
+    container on the host through the rate governor.
+    """
+    cache_key = location.lower().strip()
+    if cache_key in _nominatim_cache:
+        return _nominatim_cache[cache_key]
+    
+    try:
+        from geopy.geocoders import Nominatim
+        
+        acquire_sync("nominatim")
+        geolocator = Nominatim(user_agent="leadpoet_verifier", timeout=5)
+        geo = geolocator.geocode(location, addressdetails=True)
+        
+        if geo and geo.raw:
+            address = geo.raw.get("address", {})
+            result = {
+                "city": address.get("city") or address.get("town") or address.get("village") or address.get("municipality"),
+                "state": address.get("state") or address.get("region") or address.get("province"),
+                "country": address.get("country"),
+                "country_code": address.get("country_code", "").upper(),
+                "lat": geo.latitude,
+                "lon": geo.longitude,
+                "display": geo.address
+            }
+            _nominatim_cache[cache_key] = result
+            return result
+    except ImportError:
+        pass
+    except Exception as e:
+        if type(e).__name__ == "GeocoderRateLimited":
+            report_outcome("nominatim", THROTTLED, getattr(e, "retry_after", None))
+        print(f"   ⚠️ Geocoding failed for '{location}': {e}")
+    
+    _nominatim_cache[cache_key] = None
+    return None
+
+
+def locations_match_geopy(claimed: str, extracted: str, max_distance_km: float = 50,
+                          geocode: bool = True) -> Tuple[bool, str]:
+    """
+    Compare two locations: string matching first, then the offline geocoder for pairs
+    in the same state or within max_distance_km. geocode=False returns the string-match
+    verdict alone (see `python -m validator_models.geocoder compare`).
+    Returns (match: bool, reason: str)
+    """
+    if not claimed or not extracted:
+        return False, "Missing location data - needs LLM verification"
+    
+    if "UNKNOWN" in extracted.upper():
+        return False, "Extracted location unknown - needs LLM verification"
+    
+    US_STATES_SET = {
+        'alabama', 'alaska', 'arizona', 'arkansas', 'california', 'colorado',
+        'connecticut', 'delaware', 'florida', 'georgia', 'hawaii', 'idaho',
+        'illinois', 'indiana', 'iowa', 'kansas', 'kentucky', 'louisiana',
+        'maine', 'maryland', 'massachusetts', 'michigan', 'minnesota',
+        'mississippi', 'missouri', 'montana', 'nebraska', 'nevada',
+        'new hampshire', 'new jersey', 'new mexico', 'new york', 'north carolina',
+        'north dakota', 'ohio', 'oklahoma', 'oregon', 'pennsylvania',
+        'rhode island', 'south carolina', 'south dakota', 'tennessee', 'texas',
+        'utah', 'vermont', 'virginia', 'washington', 'west virginia',
+        'wisconsin', 'wyoming', 'district of columbia'
+    }
+    US_STATE_ABBREVS = {
+        'al', 'ak', 'az', 'ar', 'ca', 'co', 'ct', 'de', 'fl', 'ga', 'hi', 'id',
+        'il', 'in', 'ia', 'ks', 'ky', 'la', 'me', 'md', 'ma', 'mi', 'mn', 'ms',
+        'mo', 'mt', 'ne', 'nv', 'nh', 'nj', 'nm', 'ny', 'nc', 'nd', 'oh', 'ok',
+        'or', 'pa', 'ri', 'sc', 'sd', 'tn', 'tx', 'ut', 'vt', 'va', 'wa', 'wv',
+        'wi', 'wy', 'dc'
+    }
+    
+    claimed_lower = claimed.lower()
+    
+    # Count distinct US states mentioned (use word boundaries to avoid "kansas" matching "arkansas")
+    states_found = set()
+    for state in US_STATES_SET:
+        # e.g., "Arkansas" should not match "kansas"
+        pattern = r'\b' + re.escape(state) + r'\b'
+        if re.search(pattern, claimed_lower):
+            states_found.add(state)
+    for abbrev in US_STATE_ABBREVS:
+        if re.search(rf'\b{abbrev}\b', claimed_lower):
+            states_found.add(abbrev)
+    
+    # Special case: "west virginia" should not also count "virginia"
+    if 'west virginia' in states_found and 'virginia' in states_found:
+        states_found.discard('virginia')
+    
+    if len(states_found) > 2:
+        return False, f"ANTI-GAMING: Multiple states detected in claimed region: {states_found}"
+    
+    match, reason = _locations_match_strings(claimed, extracted)
+    if match or not geocode:
+        return match, reason
+    
+    # The geocoder may only confirm pairs the string match sends to the LLM, and only
+    # when they are provably close: verdicts otherwise stay those of the string match
+    geo_reason = _locations_match_geocoded(claimed, extracted, max_distance_km)
+    if geo_reason:
+        return True, geo_reason
+    return match, reason
+
+
+def _locations_match_strings(claimed: str, extracted: str) -> Tuple[bool, str]:
+    """String-match verdict (what locations_match_geopy returned whenever geocoding was unavailable)."""
+    claimed_lower = claimed.lower().strip()
+    extracted_lower = extracted.lower().strip()
+    
+    def extract_city(loc: str) -> str:
+        loc = loc.lower().strip()
+        parts = [p.strip() for p in loc.split(',')]
+        if parts:
+            first_part = parts[0]
+            if re.match(r'^\d+\s+', first_part):
+                street_match = re.search(r'\d+\s+(\w+)\s+(?:pkwy|blvd|ave|st|rd|dr|way|ln|ct|hwy)', first_part, re.IGNORECASE)
+                if street_match:
+                    return street_match.group(1)
+                if len(parts) > 1:
+                    return parts[1].strip()
+            return first_part
+        return loc
+    
+    claimed_city = extract_city(claimed)
+    extracted_city = extract_city(extracted)
+    
+    if claimed_city and extracted_city:
+        if claimed_city == extracted_city:
+            return True, f"City match: {claimed_city} (geocoding unavailable)"
+        if claimed_city in extracted_city or extracted_city in claimed_city:
+            return True, f"City containment match: {claimed_city} in {extracted_city}"
+    
+    if claimed_lower in extracted_lower or extracted_lower in claimed_lower:
+        return True, "String match (geocoding unavailable)"
+    
+    claimed_words = set(claimed_lower.replace(',', ' ').split())
+    extracted_words = set(extracted_lower.replace(',', ' ').split())
+    filler = {'us', 'usa', 'uk', 'gb', 'ca', 'au', 'the', 'of', 'and', 'st', 'ave', 'blvd', 'rd', 'dr', 'suite', 'floor', 'unit', 'united', 'states', 'america'}
+    claimed_words -= filler
+    extracted_words -= filler
+    
+    common = claimed_words & extracted_words
+    if common:
+        return True, f"Location word match: {common}"
+    
+    for code in ["us", "usa", "uk", "gb", "ca", "au", "de", "fr", "in", "sg", "ch", "be", "nl"]:
+        if code in claimed_lower and code in extracted_lower:
+            return False, f"Same country ({code.upper()}) but no city match - needs LLM verification"
+    
+    return False, "Geocoding unavailable and no string match - needs LLM verification"
+
+
+def _locations_match_geocoded(claimed: str, extracted: str, max_distance_km: float) -> Optional[str]:
+    """
+    Reason string when both locations geocode to the same state, or to cities within
+    max_distance_km of each other; None otherwise (same country alone is not a match).
+    """
+    geo_claimed = _geocode_location(claimed)
+    geo_extracted = _geocode_location(extracted)
+    if not geo_claimed or not geo_extracted:
+        return None
+    if geo_claimed.get("country_code") != geo_extracted.get("country_code"):
+        return None
+    
+    if geo_claimed.get("state") and geo_extracted.get("state"):
+        if geo_claimed["state"].lower() == geo_extracted["state"].lower():
+            return f"Same state: {geo_claimed['state']}"
+    
+    # Distances only between cities: a country or state resolves to its capital/centroid
+    if (geo_claimed.get("city") and geo_extracted.get("city")
+            and geo_claimed.get("lat") is not None and geo_extracted.get("lat") is not None):
+        dist = float(haversine_km(geo_claimed["lat"], geo_claimed["lon"], geo_extracted["lat"], geo_extracted["lon"]))
+        if dist <= max_distance_km:
+            return f"Nearby cities ({dist:.0f}km apart)"
+    return None
+
+
+# Stage 5 Role Matching Constants
+C_SUITE_EXPANSIONS = {
+    "ceo": "chief executive officer",
+    "cto": "chief technology officer",
+    "cfo": "chief financial officer",
+    "coo": "chief operating officer",
+    "cmo": "chief marketing officer",
+    "cio": "chief information officer",
+    "cpo": "chief product officer",
+    "cso": "chief strategy officer",
+    "cro": "chief revenue officer",
+    "chro": "chief human resources officer",
+    "cdo": "chief data officer",
+    "cno": "chief nursing officer",
+    "cao": "chief administrative officer",
+    # Additional C-suite roles (conservative additions)
+    "ciso": "chief information security officer",
+    "clo": "chief legal officer",
+    "cco": "chief compliance officer",
+    "cgo": "chief growth officer",
+    "ctpo": "chief technology product officer",
+    "csco": "chief supply chain officer",
+}
+
+ROLE_ABBREVIATIONS = {
+    "vp": "vice president",
+    "svp": "senior vice president",
+    "evp": "executive vice president",
+    "avp": "assistant vice president",
+    "sr": "senior",
+    "sr.": "senior",
+    "jr": "junior",
+    "jr.": "junior",
+    "dir": "director",
+    "dir.": "director",
+    "mgr": "manager",
+    "mgr.": "manager",
+    "eng": "engineer",
+    "eng.": "engineer",
+    "exec": "executive",
+    "md": "managing director",
+    "gp": "general partner",
+    "pm": "product manager",
+    # Additional common abbreviations (conservative additions)
+    "acct": "accountant",
+    "admin": "administrator",
+    "asst": "assistant",
+    "coord": "coordinator",
+    "rep": "representative",
+    "supv": "supervisor",
+    "tech": "technician",
+}
+
+ROLE_EQUIVALENCIES = {
+    "founder": ["founder", "co-founder", "co founder", "cofounder", "founding", "founding member", "founding partner"],
+    "owner": ["owner", "business owner", "franchise owner", "store owner", "agent owner", "owner operator"],
+    "president": ["president", "pres", "pres."],
+    "partner": ["partner", "managing partner", "general partner", "senior partner", "equity partner", "founding partner"],
+    "board": ["board member", "board director", "director", "board of directors"],
+    "chair": ["chairman", "chairwoman", "chair", "chairperson", "executive chair", "executive chairman"],
+    "attorney": ["attorney", "counsel", "lawyer", "legal counsel", "associate attorney", "staff attorney"],
+    "recruiting": ["recruiting", "recruitment", "recruitments", "recruiter", "talent acquisition", "staffing"],
+    # Sales and Business Development are often used interchangeably
+    "sales": ["sales", "business development", "bd", "biz dev", "revenue", "commercial"],
+    "business development": ["business development", "sales", "bd", "biz dev", "revenue", "commercial"],
+    # HR/People - all refer to the same function
+    "hr": ["hr", "human resources", "people", "talent", "people operations", "people ops"],
+    "human resources": ["human resources", "hr", "people", "talent", "people operations", "people ops"],
+    "people": ["people", "hr", "human resources", "talent", "people operations"],
+    # Operations abbreviation
+    "ops": ["ops", "operations"],
+    "operations": ["operations", "ops"],
+    # Customer-facing roles - often overlap
+    "customer success": ["customer success", "customer service", "client success", "account management", "client services"],
+    "customer service": ["customer service", "customer success", "support", "client services", "client support"],
+    "support": ["support", "customer service", "customer support", "technical support", "client support"],
+}
+
+
+_SPACED_NUMBER_RE = compile_pattern("normalize.spaced_number", r'\s+(\d+)\s*')
+_NUMBER_SPACE_RE = compile_pattern("normalize.number_space", r'(\d+)\s+')
+_SPACED_HYPHEN_RE = compile_pattern("normalize.spaced_hyphen", r'\s*-\s*')
+
+
+def normalize_for_comparison(text: str) -> str:
+    """Normalize text for comparison: lowercase, remove extra spaces, normalize hyphens/numbers."""
+    if not text:
+        return ""
+    # Lowercase
+    text = text.lower()
+    # Normalize spaces around numbers (J 2 Health -> j2health)
+    text = _SPACED_NUMBER_RE.sub(r'\1', text)
+    text = _NUMBER_SPACE_RE.sub(r'\1', text)
+    # Normalize hyphens with spaces
+    text = _SPACED_HYPHEN_RE.sub('-', text)
+    # Remove extra whitespace
+    text = ' '.join(text.split())
+    return text
+
+
+ROLE_KEYWORDS = [
+    # C-suite and executive
+    "ceo", "cto", "cfo", "coo", "cmo", "cio", "cpo",
+    "founder", "co-founder", "cofounder", "co founder",
+    "president", "vice president", "vp",
+    "executive", "officer", "chief",
+    
+    # Management and leadership
+    "director", "manager", "lead", "head",
+    "owner", "partner", "principal",
+    "supervisor", "coordinator",
+    
+    # Technical roles
+    "engineer", "developer", "analyst", "architect", "designer",
+    "technician", "programmer", "administrator", "sysadmin",
+    
+    # Professional services
+    "consultant", "advisor", "specialist",
+    "attorney", "lawyer", "counsel", "paralegal",  # Legal
+    "accountant", "auditor", "controller", "treasurer", "bookkeeper", "comptroller",  # Finance/Accounting
+    
+    # Healthcare (specific, low false positive risk)
+    "physician", "surgeon", "nurse", "pharmacist", "dentist", "therapist",
+    
+    # Academic
+    "professor", "teacher", "instructor", "lecturer",
+    "scientist", "researcher",
+    
+    # Sales and customer-facing
+    "representative", "agent", "broker", "account executive",
+    
+    # General professional
+    "product owner", "staff", "senior", "sr.", "jr.",
+    "associate", "assistant",
+    "creative", "marketing", "sales", "hr", "human resources",
+    "operations", "business operations",
+    
+    # Administrative
+    "receptionist", "secretary", "clerk", "registrar",
+    
+    # Finance/Investment
+    "investor", "trader", "banker",
+]
+
+# Compiled once at import (see validator_models.text_patterns). PATTERN 5 and the
+# snippet keyword scan return the first keyword in list order, so their combined
+# alternations are only used as gates before the ordered per-keyword patterns.
+_ROLE_KEYWORD_ANY_RE = substring_alternation("role.keyword_any", ROLE_KEYWORDS)
+_JOB_POSTING_RE = compile_pattern("role.job_posting", r'hiring\s+(.+?)(?:\s+in\s+[\w\s,]+)?(?:\s*\||\s*$)', re.IGNORECASE)
+_TRAILING_IN_LOCATION_RE = compile_pattern("role.trailing_in_location", r'\s+in\s+[\w\s,]+$', re.IGNORECASE)
+_LINKEDIN_SUFFIX_RE = compile_pattern("role.linkedin_suffix", r'\s+-\s*LinkedIn.*$', re.IGNORECASE)
+_TRAILING_ELLIPSIS_RE = compile_pattern("role.trailing_ellipsis", r'\s*\.\.\.\s*$')
+_NAME_ROLE_AT_RE = compile_pattern("role.name_role_at", r'^[^-]+-\s*(.+?)\s+(?:@|at)\s+', re.IGNORECASE)
+_KEYWORD_ROLE_AT_RE = compile_pattern(
+    "role.keyword_role_at", r'(\b(?:' + '|'.join(ROLE_KEYWORDS) + r')[^|@]*?)\s+(?:@|at)\s+\w', re.IGNORECASE
+)
+_NAME_DASH_REST_RE = compile_pattern("role.name_dash_rest", r'^([^-]+)-\s*(.+?)$', re.IGNORECASE)
+_TRAILING_AT_COMPANY_RE = compile_pattern("role.trailing_at_company", r'\s+(?:@|at)\s+.*$', re.IGNORECASE)
+_TITLE_COMPOUND_ROLE_PATTERNS = [
+    compile_pattern(f"role.title_compound.{i}", pattern, re.IGNORECASE) for i, pattern in enumerate([
+        r'\b((?:co-?)?founder\s+(?:and|&)\s+(?:ceo|cto|cfo|coo|president|cmo))\s*(?:@|at)',
+        r'\b((?:ceo|cto|cfo|coo|president|cmo)\s+(?:and|&)\s+(?:co-?)?founder)\s*(?:@|at)',
+        r'\b(president\s+(?:and|&)\s+(?:co-?)?founder)\s*(?:@|at)',
+        r'\b((?:co-?)?founder\s+(?:and|&)\s+president)\s*(?:@|at)',
+    ])
+]
+_TITLE_KEYWORD_AT_TEMPLATE = r'\b({kw}[^|,@]*?)\s+(?:@|at)\s+'
+_TITLE_KEYWORD_AT_GATE = keyword_gate("role.title_keyword_at_gate", _TITLE_KEYWORD_AT_TEMPLATE, ROLE_KEYWORDS, re.IGNORECASE)
+_TITLE_KEYWORD_AT_PATTERNS = compile_each("role.title_keyword_at", _TITLE_KEYWORD_AT_TEMPLATE, ROLE_KEYWORDS, re.IGNORECASE)
+_SNIPPET_GARBAGE_RE = substring_alternation("role.snippet_garbage", [
+    "session details", "read more", "click here", "learn more",
+    "view profile", "see the complete", "view full", "show more",
+    "scientific index", "company profile", "funding", "competitors"
+])
+_SNIPPET_COMPOUND_ROLE_PATTERNS = [
+    compile_pattern(f"role.snippet_compound.{i}", pattern, re.IGNORECASE) for i, pattern in enumerate([
+        # "Founder and CEO John Smith" or "CEO and Founder John Smith"
+        r'\b((?:co-?)?founder\s+(?:and|&)\s+(?:ceo|cto|cfo|coo|president|cmo))\b',
+        r'\b((?:ceo|cto|cfo|coo|president|cmo)\s+(?:and|&)\s+(?:co-?)?founder)\b',
+        # "President and Co-Founder"
+        r'\b(president\s+(?:and|&)\s+(?:co-?)?founder)\b',
+        r'\b((?:co-?)?founder\s+(?:and|&)\s+president)\b',
+        # "Chief Executive Officer and Founder"
+        r'\b(chief\s+\w+\s+officer\s+(?:and|&)\s+(?:co-?)?founder)\b',
+        r'\b((?:co-?)?founder\s+(?:and|&)\s+chief\s+\w+\s+officer)\b',
+    ])
+]
+_SNIPPET_ROLE_PATTERNS = [
+    compile_pattern(f"role.snippet.{i}", pattern, re.IGNORECASE) for i, pattern in enumerate([
+        # LinkedIn snippet pattern: "is currently a Director of Partnerships and Growth at akoyaGO"
+        # This must come FIRST to avoid the shorter "is [Role] at" pattern below matching too early
+        r'\b(?:is|was)\s+currently\s+(?:a|an|the)\s+([A-Za-z\s&,\-]+?)\s+at\s+',
+        # "rose to the role of Chief Operating Officer" - capture full C-suite title
+        r'(?:role\s+of|as\s+(?:a|the)?)\s*(chief\s+\w+\s+officer)\b',
+        r'(?:was\s+(?:a|the)\s+)(chief\s+\w+\s+officer)\b',
+        r'(?:served\s+as\s+)(chief\s+\w+\s+officer)\b',
+        # "currently a Chief of Staff" or "currently a Chief Technology Officer"
+        r'\b(?:currently\s+(?:a|the|an)\s+)(chief\s+of\s+staff[^|,.]{0,20})\b',
+        r'\b(?:currently\s+(?:a|the|an)\s+)(chief\s+\w+\s+officer)\b',
+        r'\b(?:currently\s+(?:a|the|an)\s+)((?:senior\s+)?vice\s+president[^|,.]{0,30})',
+        # SPECIAL: "serves as the Director of [Department/Area] at Company"
+        # This must come BEFORE the generic "serves as X at" pattern to capture full "Director of X" roles
+        r'(?:serves?\s+as\s+(?:the\s+)?)((?:director|head|vp|vice\s+president|manager|leader|chief)\s+of\s+[A-Za-z\s&,\-]+?)\s+at\s+',
+        # "John is the CEO at Company" or "John serves as Director at..." (without "of")
+        # NOTE: Only match " at " here, not "of" or "for" which can appear WITHIN roles (e.g., "Director of Sales")
+        r'(?:is\s+(?:the\s+)?|serves?\s+as\s+(?:the\s+)?|works?\s+as\s+(?:the\s+)?)([^.]+?)\s+at\s+',
+        # "from Founder & CEO, Name" or "by CEO Name" (common in press releases)
+        r'(?:from|by)\s+([A-Za-z\s&]+?(?:' + '|'.join(ROLE_KEYWORDS[:15]) + r')[A-Za-z\s&]*?),?\s+[A-Z][a-z]+',
+        # "John, CEO at Company" - common in non-LinkedIn sources  
+        r',\s*([A-Za-z\s&]+?(?:' + '|'.join(ROLE_KEYWORDS[:20]) + r')[A-Za-z\s&]*?)\s+at\s+',
+        # "currently serving as Director"
+        r'(?:works? as|serving as|position)[:\s]+([^|.\n]+)',
+        # Academic: "Associate Professor of X at University"
+        r'\b((?:assistant|associate|full|adjunct|visiting)?\s*professor\s+of\s+[^|,.]+)',
+        # "Name is an Associate Professor"
+        r'\b(?:is\s+an?\s+)((?:assistant|associate|full)?\s*professor[^|,.]{0,30})',
+    ])
+]
+_COMPANY_C_SUITE_ABBREVS = ['ceo', 'cfo', 'cto', 'coo', 'cmo', 'cio', 'cpo', 'cso', 'ciso', 'clo', 'cco', 'cgo', 'ctpo', 'csco']
+_LINKEDIN_DIRECTORY_ROLE_RE = compile_pattern("role.linkedin_directory", r'\.\s+([A-Za-z\s,]+?)\s+@\s+')
+_SNIPPET_KEYWORD_AT_TEMPLATE = r'((?:[A-Za-z,]+\s+){{0,6}}{kw})\s+(?:at|@)\s+'
+_SNIPPET_KEYWORD_AT_GATE = keyword_gate("role.snippet_keyword_at_gate", _SNIPPET_KEYWORD_AT_TEMPLATE, ROLE_KEYWORDS, re.IGNORECASE)
+_SNIPPET_KEYWORD_AT_PATTERNS = compile_each("role.snippet_keyword_at", _SNIPPET_KEYWORD_AT_TEMPLATE, ROLE_KEYWORDS, re.IGNORECASE)
+
+
+def extract_role_from_search_title(title: str, snippet: str = "", company_name: str = "", full_name: str = "") -> Optional[str]:
+    """
+    Extract job role from ScrapingDog LinkedIn search result title/snippet.
+    
+    CRITICAL: Only extract ROLES, not company names. LinkedIn titles have two formats:
+    1. "Name - Role @ Company | LinkedIn" (has role)
+    2. "Name - Company | LinkedIn" (NO role, just company)
+    
+    We must distinguish between these and return None for format 2.
+    
+    If full_name is provided, verify the extracted role is associated with that person
+    (role should appear near the person's name in the text).
+    
+    PRIORITY: If title is truncated ("..."), prioritize snippet extraction for complete data.
+    """
+    # Need at least title OR snippet to extract from
+    if not title and not snippet:
+        return None
+    
+    original_title = title if title else ""
+    
+    # Normalize company name for comparison
+    company_normalized = normalize_for_comparison(company_name) if company_name else ""
+    
+    # For name proximity check - extract name parts for matching
+    name_parts = []
+    if full_name:
+        name_parts = [p.lower() for p in full_name.split() if len(p) > 2]
+    
+    def has_role_keyword(text: str) -> bool:
+        """Check if text contains a role keyword."""
+        return _ROLE_KEYWORD_ANY_RE.search(text.lower()) is not None
+    
+    def is_company_name(text: str) -> bool:
+        """Check if text is likely a company name, not a role."""
+        if not company_name:
+            return False
+        text_norm = normalize_for_comparison(text)
+        # Check if extraction matches company name (normalized)
+        if text_norm == company_normalized:
+            return True
+        # Check if company is contained in extraction
+        if company_normalized and company_normalized in text_norm:
+            return True
+        # Check if extraction is contained in company (e.g., "J2" for "J2 Health")
+        if text_norm and len(text_norm) > 2 and text_norm in company_normalized:
+            return True
+        return False
+    
+    # Check for job posting format FIRST: "Company hiring Role [in Location] | LinkedIn"
+    job_posting_match = _JOB_POSTING_RE.search(title)
+    if job_posting_match:
+        role = job_posting_match.group(1).strip()
+        role = _TRAILING_IN_LOCATION_RE.sub('', role).strip()
+        if len(role) > 2 and len(role) < 100 and not is_company_name(role) and _is_valid_role_extraction(role):
+            return role
+    
+    first_segment = title.split('|')[0].strip()
+    first_segment = _LINKEDIN_SUFFIX_RE.sub('', first_segment).strip()
+    first_segment = _TRAILING_ELLIPSIS_RE.sub('', first_segment).strip()
+    
+    # Common role abbreviations that are valid even if ≤2 chars
+    common_abbreviations = ['vp', 'ceo', 'cto', 'cfo', 'coo', 'cmo', 'cio', 'cpo', 'svp', 'evp']
+    
+    # PATTERN 1: "Name - Role @ Company" or "Name - Role at Company"
+    # This is the MOST reliable pattern - role has separator before company
+    role_at_match = _NAME_ROLE_AT_RE.search(first_segment)
+    if role_at_match:
+        role = role_at_match.group(1).strip()
+        # Allow common abbreviations even if ≤2 chars (VP, CEO, CTO, etc.)
+        is_common_abbrev = role.lower() in common_abbreviations
+        
+        if (len(role) > 2 or is_common_abbrev) and not is_company_name(role) and _is_valid_role_extraction(role):
+            return role
+    
+    # PATTERN 2: Look for "Role @ Company" or "Role at Company" anywhere
+    role_at_patterns = _KEYWORD_ROLE_AT_RE.findall(original_title)
+    if role_at_patterns:
+        role = role_at_patterns[0].strip()
+        # Allow common abbreviations even if ≤2 chars
+        is_common_abbrev = role.lower() in common_abbreviations
+        
+        if (len(role) > 2 or is_common_abbrev) and not is_company_name(role) and _is_valid_role_extraction(role):
+            return role
+    
+    # PATTERN 3: "Name - Something" where Something contains role keywords
+    # ONLY use this if we find role keywords - otherwise it's probably the company name
+    match = _NAME_DASH_REST_RE.search(first_segment)
+    if match:
+        potential_role = match.group(2).strip()
+        # Clean up trailing "at Company" or "@Company"
+        potential_role = _TRAILING_AT_COMPANY_RE.sub('', potential_role).strip()
+        
+        # NEW: If company name appears at the end (e.g., "Managing Director Wajer Yachts"),
+        # try to strip it off to isolate the role
+        if company_name and company_normalized:
+            # Check if company name is at the end of potential_role
+            potential_role_norm = normalize_for_comparison(potential_role)
+            if potential_role_norm.endswith(company_normalized):
+                # Strip company from end: "Managing Director Wajer Yachts" → "Managing Director"
+                potential_role = potential_role[:-(len(company_name))].strip()
+            elif company_normalized in potential_role_norm:
+                # Company somewhere in the middle/end, try to remove it
+                # Split on company name and take the part before it
+                parts = re.split(re.escape(company_name), potential_role, flags=re.IGNORECASE)
+                if parts and parts[0].strip():
+                    potential_role = parts[0].strip()
+        
+        # ONLY return if it has a role keyword AND is not a company name
+        if len(potential_role) > 2 and has_role_keyword(potential_role) and not is_company_name(potential_role) and _is_valid_role_extraction(potential_role):
+            return potential_role
+    
+    # PATTERN 4: Look for compound titles in title (e.g., "President & Co-Founder @ Company")
+    for pattern in _TITLE_COMPOUND_ROLE_PATTERNS:
+        match = pattern.search(original_title)
+        if match:
+            role = match.group(1).strip()
+            if not is_company_name(role) and _is_valid_role_extraction(role):
+                return role
+    
+    # PATTERN 5: Look for role keywords followed by "at" anywhere (first keyword in list order wins)
+    keyword_at_patterns = _TITLE_KEYWORD_AT_PATTERNS.values() if _TITLE_KEYWORD_AT_GATE.search(original_title) else ()
+    for pattern in keyword_at_patterns:
+        match = pattern.search(original_title)
+        if match:
+            role = match.group(1).strip()
+            if len(role) > 2 and not is_company_name(role) and _is_valid_role_extraction(role):
+                return role
+    
+    # SNIPPET PATTERNS - look in snippet for role info
+    if snippet:
+        snippet_clean = snippet.strip()
+        
+        # Skip garbage snippets entirely
+        if _SNIPPET_GARBAGE_RE.search(snippet_clean.lower()):
+            return None
+        
+        # NAME PROXIMITY CHECK: If name provided, verify snippet mentions this person
+        # near any extracted role (to avoid extracting role of wrong person)
+        # 
+        # EXCEPTION: Skip this check for LinkedIn PROFILE snippets where:
+        # - The person's name IS in the title (confirms it's their profile)
+        # - But NOT in snippet (because profile speaks in first person)
+        # This is common for LinkedIn profiles: "Responsible AI Lead... As a technical advisor..."
+        is_linkedin_profile_snippet = False
+        if name_parts and len(name_parts) >= 2 and original_title:
+            title_lower = original_title.lower()
+            # Check if name is in title (LinkedIn format: "Name - Role")
+            name_in_title = any(part in title_lower for part in name_parts if len(part) > 2)
+            if name_in_title:
+                is_linkedin_profile_snippet = True
+        
+        # Only do name proximity check if NOT a LinkedIn profile snippet
+        if name_parts and len(name_parts) >= 2 and not is_linkedin_profile_snippet:
+            snippet_lower = snippet_clean.lower()
+            # Check for last name (usually more unique) or first name
+            last_name = name_parts[-1] if len(name_parts[-1]) > 2 else None
+            first_name = name_parts[0] if len(name_parts[0]) > 2 else None
+            
+            name_mentioned = False
+            if last_name and last_name in snippet_lower:
+                name_mentioned = True
+            elif first_name and first_name in snippet_lower:
+                name_mentioned = True
+            # Also check for common title patterns like "Mr.", "Ms.", "Dr."
+            elif any(title in snippet_lower for title in ['mr.', 'ms.', 'dr.', 'prof.']):
+                # If there's a title, be more lenient
+                name_mentioned = True
+            
+            if not name_mentioned:
+                # This snippet doesn't mention our person at all, skip it
+                return None
+        
+        # HIGH-PRIORITY: Look for compound titles first (e.g., "Founder and CEO", "President & Co-Founder")
+        for pattern in _SNIPPET_COMPOUND_ROLE_PATTERNS:
+            match = pattern.search(snippet_clean)
+            if match:
+                role = match.group(1).strip()
+                if not is_company_name(role):
+                    return role
+        
+        for pattern in _SNIPPET_ROLE_PATTERNS:
+            match = pattern.search(snippet_clean)
+            if match:
+                role = match.group(1).strip()
+                if len(role) > 2 and len(role) < 80:
+                    # Reject if starts with common garbage words
+                    if role.lower().startswith(('now ', 'the ', 'a ', 'an ', 'this ', 'that ', 'is ', 'was ', 'in ', 'of ', 'at ', 'i ')):
+                        continue
+                    if is_company_name(role):
+                        continue
+                    # Final validation
+                    if _is_valid_role_extraction(role):
+                        return role
+        
+        # PATTERN: "Company [C-Suite Abbreviation]" (e.g., "Eucalyptus CSO", "Microsoft CFO")
+        # Common in LinkedIn directory listings where format is "Name. Company ROLE."
+        if company_name:
+            # Check for C-suite abbreviations right after company name
+            company_escaped = re.escape(company_name)
+            # One combined search first; only on a hit is list-order priority resolved below
+            if re.search(rf'{company_escaped}\s+(?:{"|".join(_COMPANY_C_SUITE_ABBREVS)})\b', snippet_clean, re.IGNORECASE):
+                for abbrev in _COMPANY_C_SUITE_ABBREVS:
+                    # Match "Company ABBREV" where ABBREV is at word boundary
+                    pattern = rf'{company_escaped}\s+({abbrev})\b'
+                    match = re.search(pattern, snippet_clean, re.IGNORECASE)
+                    if match:
+                        role_abbrev = match.group(1).strip()
+                        # Expand abbreviation to full title for validation
+                        if role_abbrev.lower() in C_SUITE_EXPANSIONS:
+                            return C_SUITE_EXPANSIONS[role_abbrev.lower()].title()
+                        elif role_abbrev.upper() in ['CSO', 'CISO', 'CLO', 'CCO', 'CGO', 'CTPO', 'CSCO']:
+                            # Return as-is for less common abbreviations
+                            return role_abbrev.upper()
+        
+        # PRIORITY: LinkedIn directory format: "Name. Role @ Company"
+        # E.g., "Allison Constable. VP of Sales, Ad Measurement @ DISQO"
+        # This pattern allows commas in the role title
+        match = _LINKEDIN_DIRECTORY_ROLE_RE.search(snippet_clean)
+        if match:
+            potential_role = match.group(1).strip()
+            # Remove any trailing commas
+            potential_role = potential_role.rstrip(',').strip()
+            if len(potential_role) > 2 and has_role_keyword(potential_role) and not is_company_name(potential_role):
+                if _is_valid_role_extraction(potential_role):
+                    return potential_role
+        
+        found_roles = []
+        keyword_at_patterns = _SNIPPET_KEYWORD_AT_PATTERNS.values() if _SNIPPET_KEYWORD_AT_GATE.search(snippet_clean) else ()
+        for pattern in keyword_at_patterns:
+            # Match FULL ROLE: capture everything from word boundary to keyword, stopping at "at/@"
+            # E.g., "VP of Sales @ DISQO" or "Chief Technology Advisor at Microsoft"
+            match = pattern.search(snippet_clean)
+            if match:
+                role = match.group(1).strip()
+                if len(role) > 2 and len(role) < 100 and not is_company_name(role):
+                    found_roles.append(role)
+        
+        # Return the longest found role (compound titles are longer)
+        if found_roles:
+            best_role = max(found_roles, key=len)
+            # Final validation
+            if _is_valid_role_extraction(best_role):
+                return best_role
+    
+    return None
+
+
+_ASSISTANT_TO_RE = compile_pattern("role_valid.assistant_to", r'\b(assistant|secretary|aide|exec\s+assistant)\s+to\s+')
+_FAMILY_TERM_RE = compile_pattern("role_valid.family_term", r'\b(elder|son|daughter|wife|husband|father|mother|brother|sister)\b')
+_WEB_NAV_PHRASE_RE = compile_pattern("role_valid.web_nav_phrase", r'(view|click|read|learn|see|show)\s+(more|profile|full)')
+_INVALID_TOOLS = ['contactout', 'rocketreach', 'apollo', 'leadiq', 'lusha',
+                  'seamless', 'hunter', 'clearbit', 'datanyze', 'discoverorg',
+                  'insideview', 'owler', 'zoominfo', 'crunchbase']
+_INVALID_TOOL_RE = substring_alternation("role_valid.invalid_tool", _INVALID_TOOLS)
+_GARBAGE_PHRASE_RE = substring_alternation("role_valid.garbage_phrase", [
+    'practice on the', 'focuses on the', 'specializes in the',
+    'expertise in the', 'experience in the', 'works in the',
+    'involved in the', 'engaged in the', 'active in the',
+    'known for the', 'recognized for', 'awarded for',
+    'session details', 'read more about', 'learn more',
+    'areas of', 'field of', 'domain of', 'realm of'
+])
+_WEB_UI_TEXT_RE = substring_alternation("role_valid.web_ui_text", [
+    'opens in', 'new window', 'new tab', 'click to', 'click here',
+    'tap to', 'swipe to', 'scroll to', 'navigate to',
+    'opens a new', 'link opens', 'external link',
+    'download', 'print', 'share', 'save', 'bookmark',
+    'sign in', 'log in', 'register', 'subscribe',
+    'terms of', 'privacy policy', 'cookies', 'consent'
+])
+_COUNTRY_SUFFIX_RE = substring_alternation("role_valid.country_suffix", [
+    ', canada', ', uk', ', usa', ', us', ', united states', ', united kingdom',
+    ', india', ', australia', ', germany', ', france', ', spain', ', italy',
+    ', mexico', ', brazil', ', china', ', japan', ', singapore', ', ireland'
+])
+_SUSPICIOUS_ENDINGS = [
+    (ending, compile_pattern(f"role_valid.ending.{ending.strip(' $')}", ending)) for ending in [
+        ' human$',  # "Executive Assistant Human" (should be "Human Resources")
+        ' resources$',  # Standalone (should be paired with department)
+        ' services$',  # Standalone (should be paired with type)
+        ' operations$',  # Standalone (should be paired with type)
+        ' support$',  # Too generic alone
+        ' team$',  # "Marketing Team" is not a role
+        ' department$',  # Department name, not role
+    ]
+]
+
+
+def _is_valid_role_extraction(role: str) -> bool:
+    """Final validation to filter garbage role extractions."""
+    if not role:
+        return False
+    
+    role_lower = role.lower().strip()
+    
+    # Filter: "assistant to X", "secretary to X" patterns (wrong person's role)
+    if _ASSISTANT_TO_RE.search(role_lower):
+        return False
+    
+    # Filter: Single-word garbage that snuck through
+    garbage_single_words = [
+        'enthusiasm', 'passion', 'expert', 'professional', 'leader',
+        'elder', 'son', 'daughter', 'father', 'mother', 'brother', 'sister',
+        'currently', 'former', 'previously', 'now', 'recent',
+        'best', 'top', 'great', 'amazing', 'excellent',
+        'view', 'see', 'click', 'read', 'more', 'about',
+        'profile', 'page', 'website', 'site', 'link',
+        'executive', 'officer', 'director', 'manager',  # Too generic without context
+    ]
+    if role_lower in garbage_single_words:
+        return False
+    
+    # Filter: Family/personal terms
+    if _FAMILY_TERM_RE.search(role_lower):
+        return False
+    
+    # Filter: Too short and not a known role abbreviation
+    known_short_roles = ['ceo', 'cto', 'cfo', 'coo', 'cmo', 'cio', 'cpo', 'vp', 'svp', 'evp', 'md', 'gm']
+    if len(role_lower) < 4 and role_lower not in known_short_roles:
+        return False
+    
+    # Filter: Starts with articles/prepositions/conjunctions (incomplete extraction)
+    if role_lower.startswith(('the ', 'a ', 'an ', 'to ', 'for ', 'at ', 'in ', 'of ', 'by ', 'as ', 'currently ', 'and ', 'or ', 'but ', 'with ', 'from ', 'on ')):
+        return False
+    
+    # Filter: Contains obvious non-role patterns
+    if _WEB_NAV_PHRASE_RE.search(role_lower):
+        return False
+    
+    # Filter: Single generic role words that need more context (but keep founder, CEO, etc)
+    too_generic_single = ['head', 'lead', 'officer', 'assistant', 'executive']
+    if role_lower in too_generic_single:
+        return False
+    
+    # Filter: Known invalid tool/site names
+    if role_lower in _INVALID_TOOLS or _INVALID_TOOL_RE.search(role_lower):
+        return False
+    
+    # Filter: Garbage descriptive phrases (not roles)
+    if _GARBAGE_PHRASE_RE.search(role_lower):
+        return False
+    
+    # Filter: Web UI text patterns (browser/website interface text)
+    if _WEB_UI_TEXT_RE.search(role_lower):
+        return False
+    
+    # Filter: "licensed to" patterns (legal/regulatory text, not roles)
+    if 'licensed' in role_lower and ('to practice' in role_lower or 'by the state' in role_lower):
+        return False
+    
+    # Filter: Department/Region patterns (e.g., "Public Sector, Canada", "Healthcare, UK")
+    # These appear in LinkedIn when showing department + location, not job titles
+    # Pattern: "[Department/Sector], [Country/Region]"
+    if _COUNTRY_SUFFIX_RE.search(role_lower):
+        # Exception: If it has clear role keywords, it might be "VP Sales, Canada" (valid)
+        clear_role_keywords = ['vice president', 'director', 'manager', 'ceo', 'cto', 'cfo', 
+                               'head', 'lead', 'engineer', 'analyst', 'consultant']
+        has_clear_role = any(kw in role_lower for kw in clear_role_keywords)
+        if not has_clear_role:
+            return False
+    
+    # Filter: "Sector" without role keywords (e.g., "Public Sector", "Private Sector", "Healthcare Sector")
+    # These are department/industry descriptors, not job titles
+    if 'sector' in role_lower:
+        # Must have a clear role keyword to be valid (e.g., "Public Sector Director" is valid)
+        sector_role_keywords = ['director', 'manager', 'head', 'lead', 'coordinator', 
+                                'specialist', 'analyst', 'consultant', 'officer']
+        if not any(kw in role_lower for kw in sector_role_keywords):
+            return False
+    
+    # Filter: Truncated/malformed role endings (e.g., "Executive Assistant Human" from "Human Resources")
+    # These indicate concatenation errors or incomplete extraction
+    for ending, ending_re in _SUSPICIOUS_ENDINGS:
+        # Only filter if it's a trailing word that doesn't make sense as a role
+        if ending_re.search(role_lower):
+            # Exception: "Human Resources" together is valid
+            if ending == ' human$' and role_lower.endswith(' human'):
+                # Check if it's "Executive Assistant Human" type pattern (invalid)
+                # vs "Director of Human Relations" (valid with "of")
+                if ' of ' not in role_lower and ' for ' not in role_lower:
+                    return False
+            # Exception: "Customer Support" is valid
+            elif ending == ' support$' and any(prefix in role_lower for prefix in ['customer', 'technical', 'client', 'it ']):
+                continue
+            # Exception: "Business Operations" is valid  
+            elif ending == ' operations$' and any(prefix in role_lower for prefix in ['business', 'field', 'plant', 'network']):
+                continue
+            # Exception: "Professional Services" is valid
+            elif ending == ' services$' and any(prefix in role_lower for prefix in ['professional', 'managed', 'cloud', 'customer']):
+                continue
+            # Exception: "Human Resources" together is valid
+            elif ending == ' resources$' and 'human resources' in role_lower:
+                continue
+            else:
+                return False
+    
+    return True
+
+
+_TAGLINE_SENTENCE_RE = compile_pattern("role_format.tagline_sentence", r'\.\s+[A-Z][a-z]+\s+[a-z]+\s+[a-z]+')
+# Any one of these means rejection, so they are searched as one alternation
+_GEOGRAPHIC_ENDING_RE = compile_pattern("role_format.geographic_ending", "|".join(f"(?:{p})" for p in [
+    # Countries
+    r'[-–,]\s*(Vietnam|Cambodia|India|China|Philippines|Indonesia|Thailand|Malaysia|Singapore)',
+    r'[-–,]\s*(Mexico|Canada|Brazil|Argentina|Chile|Colombia)',
+    r'[-–,]\s*(Germany|France|UK|Spain|Italy|Netherlands|Belgium|Switzerland|Austria)',
+    r'[-–,]\s*(Japan|Korea|Taiwan|Hong Kong)',
+    r'[-–,]\s*(Australia|New Zealand)',
+    r'[-–,]\s*(Nigeria|Kenya|Egypt|South Africa|Morocco)',
+    r'[-–,]\s*(UAE|Saudi Arabia|Qatar|Kuwait)',
+    r'[-–,]\s*(United States|United Kingdom)',
+    # Regions (if at end of role)
+    r'[-–]\s*(APAC|EMEA|LATAM|MENA)\s*$',
+    r'[-–]\s*(Asia Pacific|Asia-Pacific)\s*$',
+]), re.IGNORECASE)
+# Use word boundary matching to avoid false positives like 'cto' in 'director'
+_C_SUITE_TITLE_PATTERNS = compile_each("role_format.c_suite_title", r'\b{kw}\b', [
+    'ceo', 'cto', 'cfo', 'coo', 'cmo', 'cio', 'cpo', 'chief executive', 'chief technology',
+    'chief financial', 'chief operating', 'chief marketing', 'chief information', 'chief product'
+], escape=True)
+_DIRECTOR_TITLE_PATTERNS = compile_each("role_format.director_title", r'\b{kw}\b', [
+    'managing director', 'executive director', 'senior director', 'director of'
+], escape=True)
+# Role keywords that indicate a distinct job title
+_ROLE_TITLE_KEYWORD_RE = keyword_gate("role_format.role_title_keyword", r'\b{kw}\b', [
+    'manager', 'director', 'analyst', 'engineer', 'developer', 'designer',
+    'coordinator', 'specialist', 'consultant', 'advisor', 'associate',
+    'executive', 'officer', 'president', 'owner', 'partner', 'principal',
+    'lead', 'head', 'supervisor', 'administrator', 'representative'
+])
+_EDGE_DASH_RE = compile_pattern("role_format.edge_dash", r'^\s*[-–]\s*|\s*[-–]\s*$')
+
+
+def validate_role_format(role: str, full_name: str = "", company: str = "") -> Tuple[bool, str]:
+    """
+    Validate role FORMAT for gaming patterns BEFORE fuzzy matching.
+    
+    This catches malformed roles that might pass content matching:
+    - Person's name embedded in role
+    - Company name embedded in role ("at Cloudfactory", "Morgan Stanley Wealth Management")
+    - Marketing taglines/sentences
+    - Geographic locations at end (should be in region field)
+    - Excessively long roles (> 80 chars)
+    
+    Returns: (is_valid: bool, rejection_reason: str)
+    """
+    if not role or not role.strip():
+        return False, "Empty role"
+    
+    role = role.strip()
+    role_lower = role.lower()
+    
+    # ========================================================================
+    # CHECK 1: Role too long (legitimate titles are < 80 chars)
+    # ========================================================================
+    # Examples of valid long roles:
+    #   - "Vice President of Global Sales and Marketing" (47 chars)
+    #   - "Senior Director of Enterprise Customer Success" (47 chars)
+    # Examples of gaming (stuffed roles):
+    #   - "CEO/Board Member at Cloudfactory. Unlocking the Disruptive Potential..." (130+ chars)
+    # ========================================================================
+    if len(role) > 80:
+        return False, f"Role too long ({len(role)} chars > 80). Remove taglines and extra info."
+    
+    # ========================================================================
+    # CHECK 2: Marketing sentences/taglines (period followed by sentence)
+    # ========================================================================
+    # Pattern: ". X" where X is capital letter starting a sentence
+    # Examples:
+    #   - "CEO. Unlocking the potential of AI for the world" → FAIL
+    #   - "Sr. Director" → PASS (abbreviation)
+    #   - "V.P. of Sales" → PASS (abbreviation)
+    # ========================================================================
+    # Look for sentence patterns (period + space + 3+ words)
+    if _TAGLINE_SENTENCE_RE.search(role):
+        return False, "Role contains marketing sentence/tagline. Use just the job title."
+    
+    # ========================================================================
+    # CHECK 3: Role ends with country/city names (geographic gaming)
+    # ========================================================================
+    # Pattern: "- Vietnam, Cambodia" or "- Asia Pacific"
+    # These should be in the region field, not role
+    # ========================================================================
+    if _GEOGRAPHIC_ENDING_RE.search(role):
+            return False, "Role ends with geographic location. Put location in region/country field."
+    
+    # ========================================================================
+    # CHECK 4: "at [Company]" pattern embedded in role
+    # ========================================================================
+    # Pattern: "CEO at CloudFactory" or "CEO/Board Member at Cloudfactory"
+    # The role should NOT include where the person works
+    # ========================================================================
+    if company:
+        company_lower = company.lower().strip()
+        # Escape regex special characters in company name
+        company_escaped = re.escape(company_lower)
+        # Check for "at {company}" pattern
+        if re.search(rf'\bat\s+{company_escaped}', role_lower):
+            return False, f"Role contains 'at {company}'. Just provide the job title."
+        # Also check for company name at the end of role
+        # E.g., "Managing Director, Chief Operating Officer- Field Management, Morgan Stanley Wealth Management"
+        if role_lower.rstrip().endswith(company_lower):
+            return False, f"Role ends with company name '{company}'. Just provide the job title."
+        # Check for company name anywhere with a comma separator
+        # E.g., "VP Sales, Morgan Stanley"
+        if re.search(rf',\s*{company_escaped}\s*$', role_lower):
+            return False, f"Role ends with ', {company}'. Just provide the job title."
+    
+    # ========================================================================
+    # CHECK 5: Person's name embedded in role
+    # ========================================================================
+    # Pattern: "Jones - Associate Director -" where "Jones" is the person's last name
+    # The role should NOT include the person's name
+    # Exception: Very short name parts (< 3 chars) might match legitimate words
+    # ========================================================================
+    if full_name:
+        name_parts = full_name.lower().split()
+        for name_part in name_parts:
+            # Skip very short name parts (might match words like "VP", "IT", etc.)
+            if len(name_part) < 3:
+                continue
+            # Skip common name parts that could be legitimate words in roles
+            # E.g., "Grant" (name) vs "Grant Manager" (role)
+            common_role_words = ['grant', 'case', 'mark', 'bill', 'will', 'ray', 'joy', 'hope', 'faith', 'grace', 'dean', 'chase']
+            if name_part in common_role_words:
+                continue
+            # Check if name appears as a standalone word in role
+            if re.search(rf'\b{re.escape(name_part)}\b', role_lower):
+                return False, f"Role contains person's name '{name_part}'. Just provide the job title."
+    
+    # ========================================================================
+    # CHECK 6: Multiple distinct roles (job title stuffing)
+    # ========================================================================
+    # Pattern: "Managing Director, Chief Operating Officer- Field Management"
+    # Multiple C-suite or Director-level titles in one field suggests gaming
+    # CAREFUL: "Co-Founder & CEO" is valid (Founder + 1 role)
+    # ========================================================================
+    # Word boundaries avoid matching 'cto' in 'director' or 'coo' in 'coordinator'
+    c_suite_count = sum(1 for pattern in _C_SUITE_TITLE_PATTERNS.values() if pattern.search(role_lower))
+    director_count = sum(1 for pattern in _DIRECTOR_TITLE_PATTERNS.values() if pattern.search(role_lower))
+    
+    # Allow: "CEO & Co-Founder" (1 c-suite + founder)
+    # Allow: "VP of Sales & Marketing" (1 role, multiple functions)
+    # Fail: "CEO, CFO" (2 c-suite roles)
+    # Fail: "Managing Director, Chief Operating Officer" (director + c-suite)
+    has_founder = 'founder' in role_lower
+    if c_suite_count > 1:
+        return False, f"Role contains multiple C-suite titles. Submit one role per lead."
+    if c_suite_count >= 1 and director_count >= 1 and not has_founder:
+        return False, f"Role contains both C-suite and Director titles. Submit one role per lead."
+    
+    # ========================================================================
+    # CHECK 6b: Multiple comma-separated distinct roles (non-C-suite stuffing)
+    # ========================================================================
+    # Pattern: "Director of Marketing, Analyst, Operations Manager"
+    # This catches cases where miner stuffs multiple different job titles
+    # CAREFUL: Don't catch "VP of Sales and Marketing" (one role, multiple depts)
+    # CAREFUL: Don't catch "Senior Engineer, Backend" (role + specialization)
+    # ========================================================================
+    # Split by comma and check each segment for role keywords
+    if ',' in role:
+        segments = [s.strip().lower() for s in role.split(',') if s.strip()]
+        # Each segment counts once if it contains any role keyword
+        segments_with_roles = [seg for seg in segments if _ROLE_TITLE_KEYWORD_RE.search(seg)]
+        
+        # If 3+ comma-separated segments each contain a role keyword, reject
+        # (Using 3+ to avoid false positives on "Director of Marketing, Sales")
+        if len(segments_with_roles) >= 3:
+            return False, f"Role contains {len(segments_with_roles)} distinct job titles. Submit one role per lead."
+    
+    # ========================================================================
+    # CHECK 7: Trailing dashes/garbage formatting
+    # ========================================================================
+    # Pattern: "Associate Director -" or "- VP Sales -"
+    # Clean formatting shouldn't have leading/trailing dashes
+    # ========================================================================
+    if _EDGE_DASH_RE.search(role):
+        return False, "Role has trailing/leading dashes. Clean up formatting."
+    
+    return True, ""
+
+
+_WHITESPACE_RUN_RE = compile_pattern("role_match.whitespace_run", r'\s+')
+_C_SUITE_ABBREV_PATTERNS = compile_each("role_match.c_suite_abbrev", r'\b{kw}\b', C_SUITE_EXPANSIONS)
+_ROLE_ABBREV_PATTERNS = compile_each("role_match.role_abbrev", r'\b{kw}\b', ROLE_ABBREVIATIONS, escape=True)
+# Applied in order (C-suite first, then role abbreviations): earlier expansions feed later ones
+_ABBREVIATION_SUBSTITUTIONS = (
+    [(_C_SUITE_ABBREV_PATTERNS[abbrev], full) for abbrev, full in C_SUITE_EXPANSIONS.items()]
+    + [(_ROLE_ABBREV_PATTERNS[abbrev], full) for abbrev, full in ROLE_ABBREVIATIONS.items()]
+)
+# No abbreviation in the input means none of the substitutions above can fire
+_ABBREVIATION_GATE = keyword_gate(
+    "role_match.abbrev_gate", r'\b{kw}\b', list(C_SUITE_EXPANSIONS) + [re.escape(a) for a in ROLE_ABBREVIATIONS]
+)
+
+
+def _sorted_set_repr(words) -> str:
+    """Set repr with sorted members, so match reasons do not depend on the hash seed."""
+    return "{" + ", ".join(repr(w) for w in sorted(words)) + "}"
+
+
+def fuzzy_match_role(claimed_role: str, extracted_role: str) -> Tuple[bool, float, str]:
+    """
+    Fuzzy match two roles with STRICT rules to prevent false positives.
+    Returns (is_match: bool, confidence: float, reason: str)
+    """
+    if not claimed_role or not extracted_role:
+        return False, 0.0, "Missing role data"
+    
+    claimed_lower = claimed_role.lower().strip()
+    extracted_lower = extracted_role.lower().strip()
+    
+    if claimed_lower == extracted_lower:
+        return True, 1.0, "Exact match"
+    
+    def normalize(r: str) -> str:
+        r = r.lower().strip()
+        r = r.replace("&", " and ")
+        r = r.replace(",", " ")
+        r = r.replace("-", " ")
+        r = r.replace("/", " ")
+        r = _WHITESPACE_RUN_RE.sub(' ', r).strip()
+        return r
+    
+    norm_claimed = normalize(claimed_role)
+    norm_extracted = normalize(extracted_role)
+    
+    if norm_claimed == norm_extracted:
+        return True, 1.0, "Normalized exact match"
+    
+    if norm_extracted in norm_claimed:
+        return True, 0.95, f"Extracted role contained in claimed: '{extracted_role}' in '{claimed_role}'"
+    if norm_claimed in norm_extracted:
+        return True, 0.95, f"Claimed role contained in extracted: '{claimed_role}' in '{extracted_role}'"
+    
+    def expand_abbreviations(r: str) -> str:
+        r = normalize(r)
+        if not _ABBREVIATION_GATE.search(r):
+            return r
+        for pattern, full in _ABBREVIATION_SUBSTITUTIONS:
+            r = pattern.sub(full, r)
+        return r
+    
+    exp_claimed = expand_abbreviations(claimed_role)
+    exp_extracted = expand_abbreviations(extracted_role)
+    
+    if exp_claimed == exp_extracted:
+        return True, 1.0, "Abbreviation expansion match"
+    
+    if exp_extracted in exp_claimed:
+        return True, 0.95, f"Expanded extracted in claimed: CEO/CTO match"
+    if exp_claimed in exp_extracted:
+        return True, 0.95, f"Expanded claimed in extracted: CEO/CTO match"
+    
+    def get_c_suite_type(role: str) -> Optional[str]:
+        role_lower = role.lower()
+        for abbrev, full in C_SUITE_EXPANSIONS.items():
+            if _C_SUITE_ABBREV_PATTERNS[abbrev].search(role_lower) or full in role_lower:
+                return abbrev
+        return None
+    
+    claimed_csuite = get_c_suite_type(claimed_role)
+    extracted_csuite = get_c_suite_type(extracted_role)
+    
+    if claimed_csuite and extracted_csuite:
+        if claimed_csuite != extracted_csuite:
+            return False, 0.0, f"C-Suite MISMATCH: {claimed_csuite.upper()} ≠ {extracted_csuite.upper()}"
+    
+    def is_business_owner(r: str) -> bool:
+        r_lower = r.lower()
+        return "owner" in r_lower and "product owner" not in r_lower and "product" not in r_lower.split("owner")[0]
+    
+    def is_product_owner(r: str) -> bool:
+        return "product owner" in r.lower()
+    
+    if is_business_owner(claimed_role) and is_product_owner(extracted_role):
+        return False, 0.0, "MISMATCH: Owner (business) ≠ Product Owner (tech role)"
+    if is_product_owner(claimed_role) and is_business_owner(extracted_role):
+        return False, 0.0, "MISMATCH: Product Owner (tech role) ≠ Owner (business)"
+    
+    # ANTI-GAMING: Expanded department/function list to catch role finessing
+    # E.g., "VP of Risk" vs "VP of Treasury" should FAIL (different functions)
+    # NOTE: Multi-word departments MUST come first so "business development" matches before "business"
+    departments = [
+        # Multi-word departments first (check these before single words)
+        "business development", "supply chain", "human resources",
+        "customer success", "customer service", "account management",
+        "change management", "project management",
+        "information security", "cybersecurity",
+        # Single-word departments
+        "sales", "marketing", "engineering", "finance", "operations",
+        "product", "hr", "legal", "it", "technology",
+        "customer", "business", "development", "research", "data",
+        # Financial functions
+        "risk", "treasury", "accounting", "audit", "compliance",
+        # Operations functions
+        "logistics", "procurement", "readiness",
+        # Strategy/Leadership functions
+        "strategy", "transformation",
+        # Security/Tech functions
+        "security", "infrastructure",
+        # Customer-facing
+        "support"
+    ]
+    
+    # Equivalent department pairs - these are interchangeable (GTM functions)
+    EQUIVALENT_DEPT_PAIRS = {
+        frozenset({"sales", "business development"}),
+        frozenset({"sales", "business"}),  # "business development" sometimes matches "business"
+        frozenset({"business development", "business"}),
+        frozenset({"hr", "human resources"}),
+    }
+    
+    def are_equivalent_depts(dept1: str, dept2: str) -> bool:
+        """Check if two departments are considered equivalent."""
+        if dept1 == dept2:
+            return True
+        return frozenset({dept1, dept2}) in EQUIVALENT_DEPT_PAIRS
+    
+    def get_department(r: str) -> Optional[str]:
+        r_lower = r.lower()
+        for dept in departments:
+            if dept in r_lower:
+                return dept
+        return None
+    
+    claimed_dept = get_department(claimed_role)
+    extracted_dept = get_department(extracted_role)
+    
+    if claimed_dept and extracted_dept and claimed_dept != extracted_dept:
+        # First check: Are these equivalent departments? (e.g., sales ≈ business development)
+        if are_equivalent_depts(claimed_dept, extracted_dept):
+            pass  # Equivalent departments, continue to other checks
+        else:
+            # Second check: Multi-function roles that share a department
+            # ANTI-GAMING: Only allow this if EXTRACTED has 2+ departments
+            # (miner can't control what LinkedIn shows, so this prevents padding)
+            extracted_depts = [d for d in departments if d in extracted_role.lower()]
+            
+            if len(extracted_depts) >= 2:
+                # LinkedIn shows a genuine multi-function role
+                # Check if there's overlap with claimed role
+                common_depts = [d for d in extracted_depts if d in claimed_role.lower()]
+                if not common_depts:
+                    return False, 0.0, f"DEPARTMENT MISMATCH: {claimed_dept} ≠ {extracted_dept}"
+                # else: common_depts exist, bypass allowed - continue to other checks
+            else:
+                # LinkedIn shows single-function role, miner claims different dept
+                return False, 0.0, f"DEPARTMENT MISMATCH: {claimed_dept} ≠ {extracted_dept}"
+    
+    def has_founder(r: str) -> bool:
+        r_lower = r.lower()
+        return any(f in r_lower for f in ["founder", "co-founder", "cofounder", "co founder"])
+    
+    if has_founder(claimed_role) and has_founder(extracted_role):
+        if claimed_csuite and extracted_csuite and claimed_csuite == extracted_csuite:
+            return True, 1.0, "Founder + matching C-suite"
+        elif not claimed_csuite and not extracted_csuite:
+            return True, 0.95, "Both are founders"
+        return True, 0.85, "Founder match (one has additional C-suite role)"
+    
+    if is_business_owner(claimed_role) and is_business_owner(extracted_role):
+        return True, 0.95, "Both are business owners"
+    
+    if is_product_owner(claimed_role) and is_product_owner(extracted_role):
+        return True, 0.95, "Both are Product Owners"
+    
+    def strip_common_modifiers(r: str) -> str:
+        r = normalize(r)
+        modifiers = [
+            "assurance", "technical", "business", "global", "regional",
+            "corporate", "digital", "strategic", "commercial", "associate",
+            "assistant", "staff", "lead", "principal"
+        ]
+        words = r.split()
+        core_words = [w for w in words if w not in modifiers]
+        return " ".join(core_words)
+    
+    stripped_claimed = strip_common_modifiers(claimed_role)
+    stripped_extracted = strip_common_modifiers(extracted_role)
+    
+    if stripped_claimed and stripped_extracted:
+        if stripped_claimed == stripped_extracted:
+            return True, 0.9, f"Core role match after stripping modifiers: '{stripped_claimed}'"
+        if stripped_claimed in stripped_extracted or stripped_extracted in stripped_claimed:
+            return True, 0.85, f"Core role containment: '{stripped_claimed}' ~ '{stripped_extracted}'"
+    
+    if exp_claimed in exp_extracted:
+        return True, 0.9, f"Claimed role contained in extracted: '{claimed_role}' in '{extracted_role}'"
+    if exp_extracted in exp_claimed:
+        return True, 0.9, f"Extracted role contained in claimed: '{extracted_role}' in '{claimed_role}'"
+    
+    def get_meaningful_words(r: str) -> set:
+        r = normalize(r)
+        r = expand_abbreviations(r)
+        words = set(r.split())
+        filler = {"at", "of", "the", "and", "for", "in", "a", "an", "to", "&", "or"}
+        return words - filler
+    
+    claimed_words = get_meaningful_words(claimed_role)
+    extracted_words = get_meaningful_words(extracted_role)
+    
+    if claimed_words and extracted_words:
+        intersection = claimed_words & extracted_words
+        union = claimed_words | extracted_words
+        jaccard = len(intersection) / len(union) if union else 0
+        
+        if jaccard >= 0.6:
+            return True, jaccard, f"Word overlap: {jaccard:.0%} - common words: {_sorted_set_repr(intersection)}"
+    
+    def expand_with_equivalencies(words: set) -> set:
+        expanded = set(words)
+        for word in list(words):
+            for equiv_key, equiv_list in ROLE_EQUIVALENCIES.items():
+                if word in equiv_list or word == equiv_key:
+                    expanded.update(equiv_list)
+                    expanded.add(equiv_key)
+        return expanded
+    
+    exp_claimed_words = expand_with_equivalencies(claimed_words)
+    exp_extracted_words = expand_with_equivalencies(extracted_words)
+    
+    equiv_intersection = exp_claimed_words & exp_extracted_words
+    if len(equiv_intersection) >= 2:
+        return True, 0.8, f"Equivalency match: {_sorted_set_repr(equiv_intersection)}"
+    
+    jaccard = len(claimed_words & extracted_words) / len(claimed_words | extracted_words) if (claimed_words | extracted_words) else 0
+    return False, jaccard, f"No match (word similarity: {jaccard:.0%})"
+
+
+# Location patterns for extraction
+# Patterns for location extraction
+# Group 1: Use IGNORECASE (common phrases that can be any case)
+# Group 2: Case-sensitive (require actual capitalization for city/state)
+# Location pattern: matches City or "City, State" or "City, Country"
+_LOC_CITY_STATE = r'[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:,\s*(?:[A-Z]{2}|[A-Z][a-z]+))?'
+
+LOCATION_PATTERNS_IGNORECASE = [
+    # Primary patterns - most reliable
+    rf'headquarter(?:ed|s)?\s+in\s+({_LOC_CITY_STATE})\b',   # "headquartered in X"
+    rf'based\s+in\s+({_LOC_CITY_STATE})\b',                  # "based in San Jose, CA"
+    rf'located\s+in\s+({_LOC_CITY_STATE})\b',                # "located in X"
+    rf'offices?\s+in\s+({_LOC_CITY_STATE})\b',               # "office(s) in X"
+    rf'hq\s+in\s+({_LOC_CITY_STATE})\b',                     # "hq in X"
+    rf'hq:\s*({_LOC_CITY_STATE})\b',                         # "HQ: City"
+    # Secondary patterns
+    r'(?:^|[^\w])([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)-based\s+(?:company|firm|startup)',  # "Paris-based company"
+    rf'company\s+(?:from|in)\s+({_LOC_CITY_STATE})\b',       # "company from/in X"
+    # Location in context patterns
+    rf'founded\s+in\s+({_LOC_CITY_STATE})\b',                # "founded in X"
+    rf'started\s+in\s+({_LOC_CITY_STATE})\b',                # "started in X"
+    rf'from\s+({_LOC_CITY_STATE})\s+(?:is|was|that)',        # "from San Francisco, CA is"
+    rf'(?:startup|company|firm)\s+in\s+({_LOC_CITY_STATE})\b',  # "startup in X"
+]
+
+# Case-sensitive patterns for "City, ST" format
+LOCATION_PATTERNS_CASESENSITIVE = [
+    r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2})\s*[-–—]',  # "New York, NY -"
+    r'\|\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2})\b',     # "| New York, NY" (must end at word boundary)
+    r',\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2})\s*$',    # ", City, ST" at end
+    # Match standalone "City, State" or "City, Country" patterns in text
+    r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*(?:[A-Z]{2}|[A-Z][a-z]+))\b',  # "San Francisco, CA" or "Lyon, France"
+]
+
+# Major tech hub cities - for direct city name matching when patterns fail
+MAJOR_CITIES = {
+    # US Major Cities
+    "san francisco", "new york", "los angeles", "chicago", "seattle", "austin", "boston",
+    "denver", "atlanta", "miami", "dallas", "houston", "phoenix", "philadelphia",
+    "san jose", "san diego", "portland", "baltimore", "washington", "detroit",
+    "kansas city", "minneapolis", "tampa", "nashville", "cleveland", "pittsburgh",
+    "cincinnati", "indianapolis", "columbus", "milwaukee", "salt lake city",
+    "charlotte", "raleigh", "sacramento", "las vegas", "orlando", "st. louis",
+    "richmond", "jacksonville", "memphis", "omaha", "new orleans", "buffalo",
+    # International
+    "london", "paris", "berlin", "amsterdam", "tokyo", "singapore", "sydney",
+    "toronto", "vancouver", "dublin", "tel aviv", "bangalore", "mumbai", "beijing",
+    "shanghai", "hong kong", "seoul", "lyon", "munich", "zurich", "stockholm",
+    "melbourne", "auckland", "copenhagen", "oslo", "helsinki", "prague", "vienna"
+}
+
+# Map nationality adjectives to countries (for "American company" → "United States")
+NATIONALITY_TO_COUNTRY = {
+    "american": "United States",
+    "french": "France", 
+    "german": "Germany",
+    "british": "United Kingdom",
+    "canadian": "Canada",
+    "australian": "Australia",
+    "japanese": "Japan",
+    "chinese": "China",
+    "indian": "India",
+    "brazilian": "Brazil",
+    "mexican": "Mexico",
+    "spanish": "Spain",
+    "italian": "Italy",
+    "dutch": "Netherlands",
+    "swiss": "Switzerland",
+    "swedish": "Sweden",
+    "norwegian": "Norway",
+    "danish": "Denmark",
+    "finnish": "Finland",
+    "irish": "Ireland",
+    "singaporean": "Singapore",
+    "korean": "South Korea",
+}
+
+LOCATION_PATTERNS_IGNORECASE_COMPILED = [
+    compile_pattern(f"location.ignorecase.{i}", p, re.IGNORECASE) for i, p in enumerate(LOCATION_PATTERNS_IGNORECASE)
+]
+LOCATION_PATTERNS_CASESENSITIVE_COMPILED = [
+    compile_pattern(f"location.casesensitive.{i}", p) for i, p in enumerate(LOCATION_PATTERNS_CASESENSITIVE)
+]
+_PIPE_SUFFIX_RE = compile_pattern("location.pipe_suffix", r'\s*\|.*$')
+_DASH_SUFFIX_RE = compile_pattern("location.dash_suffix", r'\s*-.*$')
+_NATIONALITY_GATE = keyword_gate("location.nationality_gate", r'\b{kw}\b', NATIONALITY_TO_COUNTRY)
+_NATIONALITY_PATTERNS = compile_each("location.nationality", r'\b{kw}\b', NATIONALITY_TO_COUNTRY)
+_COMPANY_CONTEXT_RE = substring_alternation(
+    "location.company_context", ['company', 'corporation', 'firm', 'business', 'enterprise', 'multinational']
+)
+# Last-resort city scan: the gate is one search over all cities; on a hit the
+# per-city patterns are tried in sorted order (set order varies with the hash
+# seed, so two validators could otherwise return different cities)
+_MAJOR_CITIES_ORDERED = sorted(MAJOR_CITIES)
+_MAJOR_CITY_TEMPLATE = r'\b({kw}(?:,?\s*[A-Z]{{2}})?)\b'
+_MAJOR_CITY_GATE = keyword_gate("location.major_city_gate", _MAJOR_CITY_TEMPLATE, _MAJOR_CITIES_ORDERED, escape=True)
+_MAJOR_CITY_PATTERNS = compile_each("location.major_city", _MAJOR_CITY_TEMPLATE, _MAJOR_CITIES_ORDERED, escape=True)
+_LOCATION_CONTEXT_RE = substring_alternation(
+    "location.location_context", ['based', 'headquarter', 'located', 'office', 'hq', 'from', 'in', 'city', 'area']
+)
+_MAJOR_CITY_ANY_RE = substring_alternation("location.major_city_any", MAJOR_CITIES)
+_CITY_STATE_FORMAT_RE = compile_pattern("location.city_state_format", r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2,}$')
+_STATE_CODE_ONLY_RE = compile_pattern("location.state_code_only", r'^[A-Z]{2}$')
+_LOCATION_GARBAGE_RE = substring_alternation("location.garbage", [
+    # Business/company terms
+    'products', 'competitors', 'valuation', 'funding', 'revenue',
+    'technology', 'entertainment', 'software', 'services', 'solutions',
+    'company', 'corporation', 'enterprise', 'business', 'industry',
+    'profile', 'overview', 'about', 'description', 'information',
+    'employees', 'staff', 'team', 'board', 'members', 'contacts',
+    'education', 'internet', 'partnerships', 'news',
+    # NOTE: 'media' removed from here - it's a valid city name (Media, PA)
+    'silicon', 'bay area',  # Too generic - reject "Silicon Valley" / "Bay Area"
+    # Generic web terms
+    'linkedin', 'crunchbase', 'wikipedia', 'facebook', 'twitter',
+    # Too generic
+    'global', 'worldwide', 'international', 'regional',
+    'united states', 'usa',  # Too generic
+    # Business departments/units (CRITICAL NEW FILTERS)
+    'sales', 'marketing', 'operations', 'engineering', 'hr', 'finance',
+    'accounting', 'legal', 'it', 'support', 'customer', 'business development',
+    # Street address indicators (NOT locations)
+    'street', 'avenue', 'boulevard', 'drive', 'road', 'lane', 'way',
+    'court', 'circle', 'plaza', 'square', 'parkway', 'highway',
+    'suite', 'floor', 'building', 'tower', 'complex', 'center',
+    'crescent', 'block', 'terrace', 'mews', 'close', 'grove',
+    'ste', 'apt', 'unit', 'room', 'no.', '#',
+    # Product/material names
+    'glass', 'steel', 'wood', 'metal', 'plastic', 'ceramic',
+    'stained', 'colored', 'painted',
+    # CRITICAL: Company suffixes (NOT locations!)
+    ' inc', ' inc.', ' llc', ' corp', ' corp.', ' ltd', ' ltd.',
+    ' co.', ' company', ' group', ' enterprises', ' holdings',
+])
+_KNOWN_STATE_RE = substring_alternation("location.known_state", [
+    # US States (comprehensive list)
+    'california', 'new york', 'texas', 'florida', 'washington', 'massachusetts',
+    'illinois', 'georgia', 'colorado', 'oregon', 'pennsylvania', 'ohio',
+    'virginia', 'north carolina', 'michigan', 'arizona', 'maryland', 'tennessee',
+    'alabama', 'alaska', 'arkansas', 'connecticut', 'delaware', 'hawaii', 'idaho',
+    'indiana', 'iowa', 'kansas', 'kentucky', 'louisiana', 'maine', 'minnesota',
+    'mississippi', 'missouri', 'montana', 'nebraska', 'nevada', 'new hampshire',
+    'new jersey', 'new mexico', 'north dakota', 'oklahoma', 'rhode island',
+    'south carolina', 'south dakota', 'utah', 'vermont', 'west virginia',
+    'wisconsin', 'wyoming',
+    # International Countries/Regions
+    'canada', 'united kingdom', 'france', 'germany', 'australia', 'singapore',
+    'south africa', 'ireland', 'leinster', 'denmark', 'sweden', 'norway',
+    'finland', 'netherlands', 'belgium', 'switzerland', 'austria', 'spain',
+    'italy', 'portugal', 'japan', 'china', 'india', 'brazil', 'mexico',
+    'argentina', 'chile', 'colombia'
+])
+
+
+def _is_valid_location(location: str) -> bool:
+    """Check if extracted text is a valid location (not garbage)."""
+    if not location:
+        return False
+    
+    location_lower = location.lower()
+    
+    # Check if it's in "City, State/Country" format (e.g., "Media, US")
+    # If so, skip garbage pattern checks for city names that might match garbage words
+    is_city_state_format = bool(_CITY_STATE_FORMAT_RE.match(location))
+    
+    # Reject obvious garbage patterns (but not if it's a valid City, State format)
+    if not is_city_state_format:
+        if _LOCATION_GARBAGE_RE.search(location_lower):
+            return False
+    
+    # Reject if it's just state codes without city
+    if _STATE_CODE_ONLY_RE.match(location):
+        return False
+    
+    # CRITICAL: Reject duplicate words (e.g., "Modotech Modotech")
+    # Check before comma (to catch "Modotech Modotech, Inc")
+    first_part = location.split(',')[0].strip()
+    words = first_part.split()
+    if len(words) >= 2 and words[0].lower() == words[1].lower():
+        return False
+    
+    # CRITICAL: Reject person name patterns (e.g., "Mike Shaughnessy, Mike")
+    # Pattern: "FirstName LastName, FirstName" - person name with repeated first name
+    if ',' in location:
+        parts = location.split(',')
+        before_comma = parts[0].strip()
+        after_comma = parts[1].strip() if len(parts) > 1 else ""
+        
+        # Check if it looks like "FirstName LastName, FirstName"
+        before_words = before_comma.split()
+        after_words = after_comma.split() if after_comma else []
+        
+        if len(before_words) == 2 and len(after_words) >= 1:
+            # Check if first word before comma matches first word after comma (e.g., "Mike Shaughnessy, Mike")
+            if before_words[0].lower() == after_words[0].lower():
+                return False
+    
+    # CRITICAL: Reject reversed city/state (e.g., "York, New" should be "New York")
+    # Check if it's "Word, Word" where the second word is a common city prefix
+    if ', ' in location:
+        parts = location.split(', ')
+        if len(parts) == 2:
+            first, second = parts
+            # Common city first-word patterns
+            common_city_prefixes = ['new', 'san', 'los', 'fort', 'mount', 'saint', 'st.', 'port', 'lake']
+            if second.lower() in common_city_prefixes:
+                return False  # This is reversed! (e.g., "York, New" instead of "New York")
+    
+    # Reject if too long (likely a description, not a location)
+    if len(location) > 50:
+        return False
+    
+    # Reject if starts with articles or prepositions  
+    if location_lower.startswith(('the ', 'a ', 'an ', 'in ', 'at ', 'on ')):
+        return False
+    
+    # Must contain at least some location-like content
+    # Either a known city, state, or comma-separated format
+    has_comma = ',' in location
+    has_known_state = _KNOWN_STATE_RE.search(location_lower) is not None
+    has_known_city = _MAJOR_CITY_ANY_RE.search(location_lower) is not None
+    
+    return has_comma or has_known_state or has_known_city
+
+
+# Known countries for validating LinkedIn profile-header locations
+LINKEDIN_LOCATION_COUNTRIES = {
+    'united states', 'united kingdom', 'canada', 'australia', 'germany', 
+    'france', 'spain', 'italy', 'netherlands', 'india', 'singapore',
+    'japan', 'china', 'brazil', 'mexico', 'ireland', 'switzerland',
+    'sweden', 'norway', 'denmark', 'finland', 'belgium', 'austria',
+    'new zealand', 'south africa', 'israel', 'uae', 'united arab emirates',
+    'hong kong', 'taiwan', 'south korea', 'poland', 'czech republic',
+    'portugal', 'greece', 'argentina', 'chile', 'colombia', 'peru',
+    'russia', 'turkey', 'egypt', 'nigeria', 'kenya', 'indonesia',
+    'malaysia', 'thailand', 'vietnam', 'philippines'
+}
+
+# US state abbreviations for "City, ST" format
+US_STATE_ABBREVS = {
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA', 'HI', 'ID',
+    'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN', 'MS',
+    'MO', 'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'OH', 'OK',
+    'OR', 'PA', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV',
+    'WI', 'WY', 'DC'
+}
+
+# Profile-header location patterns for extract_person_location_from_linkedin_snippet.
+# State codes are all two letters, so their order in the alternation doesn't matter.
+_PERSON_LOCATION_FULL_END_RE = compile_pattern(
+    "person_location.full_end", r'([A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+)\.?\s*$'
+)
+_PERSON_LOCATION_FULL_MIDDLE_RE = compile_pattern(
+    "person_location.full_middle", r'([A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+)(?:\s*[·\.\|]|\s+\d)'
+)
+_PERSON_LOCATION_ABBREV_RE = compile_pattern(
+    "person_location.abbrev", r'([A-Z][a-zA-Z\s]+,\s*(' + '|'.join(sorted(US_STATE_ABBREVS)) + r'))\b'
+)
+_PERSON_LOCATION_PREFIX_RE = compile_pattern(
+    "person_location.prefix", r'Location:\s*([A-Z][a-zA-Z\s,]+?)(?:\s*[·\|]|\s+\d|\s*$)'
+)
+_PERSON_LOCATION_METRO_RE = compile_pattern(
+    "person_location.metro", r'((?:Greater\s+)?[A-Z][a-zA-Z\s]+(?:Bay\s+Area|Metro(?:politan)?\s+Area|City\s+Area))'
+)
+_PERSON_LOCATION_TWO_PART_RE = compile_pattern(
+    "person_location.two_part", r'([A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+)\.?\s*$'
+)
+
+
+def extract_person_location_from_linkedin_snippet(snippet: str) -> Optional[str]:
+    """
+    Extract person's location from LinkedIn search result snippet.
+    
+    LinkedIn snippets typically show the profile header location in formats like:
+    - End of snippet: "...School of Business. New York, New York, United States."
+    - Middle of snippet: "...10 months. Manhattan, New York, United States..."
+    - Directory format: "New York, NY. Nasdaq, +3 more."
+    - Location prefix: "Location: New York"
+    
+    This extracts the PERSON's location (from their profile header),
+    NOT the company headquarters.
+    
+    Returns:
+        Location string if found, None otherwise
+    """
+    if not snippet:
+        return None
+    
+    # Pattern 1: Full location at END of snippet with country
+    # Matches: "...School of Business. New York, New York, United States."
+    match = _PERSON_LOCATION_FULL_END_RE.search(snippet)
+    if match:
+        location = match.group(1).strip().rstrip('.')
+        parts = [p.strip() for p in location.split(',')]
+        if len(parts) >= 2 and parts[-1].lower() in LINKEDIN_LOCATION_COUNTRIES:
+            return location
+    
+    # Pattern 2: Full location in MIDDLE of snippet with country
+    # Matches: "...10 months. Manhattan, New York, United States..."
+    match = _PERSON_LOCATION_FULL_MIDDLE_RE.search(snippet)
+    if match:
+        location = match.group(1).strip()
+        parts = [p.strip() for p in location.split(',')]
+        if len(parts) >= 2 and parts[-1].lower() in LINKEDIN_LOCATION_COUNTRIES:
+            return location
+    
+    # Pattern 3: Abbreviated US location (City, ST) anywhere in snippet
+    # Matches: "New York, NY" or "San Francisco, CA"
+    match = _PERSON_LOCATION_ABBREV_RE.search(snippet)
+    if match:
+        return match.group(1).strip()
+    
+    # Pattern 4: Location with "Location:" prefix (from LinkedIn directory pages)
+    # Matches: "Location: New York" or "Location: 600039"
+    match = _PERSON_LOCATION_PREFIX_RE.search(snippet)
+    if match:
+        location = match.group(1).strip()
+        # Skip numeric-only locations (postal codes)
+        if not location.isdigit():
+            return location
+    
+    # Pattern 5: Metro areas
+    # Matches: "San Francisco Bay Area", "Greater New York City Area"
+    match = _PERSON_LOCATION_METRO_RE.search(snippet)
+    if match:
+        return match.group(1).strip()
+    
+    # Pattern 6: Two-part location at end (City, Country) - no state
+    # Matches: "...profile. London, United Kingdom."
+    match = _PERSON_LOCATION_TWO_PART_RE.search(snippet)
+    if match:
+        location = match.group(1).strip().rstrip('.')
+        parts = [p.strip() for p in location.split(',')]
+        if len(parts) == 2 and parts[-1].lower() in LINKEDIN_LOCATION_COUNTRIES:
+            return location
+    
+    return None
+
+
+def extract_location_from_text(text: str) -> Optional[str]:
+    """Extract location from text using regex patterns."""
+    if not text:
+        return None
+    
+    # Try case-insensitive patterns first (headquartered in, based in, located in)
+    for pattern in LOCATION_PATTERNS_IGNORECASE_COMPILED:
+        match = pattern.search(text)
+        if match:
+            location = match.group(1).strip()
+            location = _PIPE_SUFFIX_RE.sub('', location)
+            location = _DASH_SUFFIX_RE.sub('', location)
+            # Validate: reject garbage
+            if not _is_valid_location(location):
+                continue
+            return location
+    
+    # Try case-sensitive patterns (City, ST format)
+    for pattern in LOCATION_PATTERNS_CASESENSITIVE_COMPILED:
+        match = pattern.search(text)  # No IGNORECASE
+        if match:
+            location = match.group(1).strip()
+            if _is_valid_location(location):
+                return location
+    
+    # Try nationality patterns (e.g., "American company" → "United States")
+    text_lower = text.lower()
+    if _NATIONALITY_GATE.search(text_lower):
+        for nationality, country in NATIONALITY_TO_COUNTRY.items():
+            if _NATIONALITY_PATTERNS[nationality].search(text_lower):
+                # Make sure it's in context of company description
+                if _COMPANY_CONTEXT_RE.search(text_lower):
+                    return country
+    
+    # Last resort: Look for major tech hub cities mentioned in text
+    cities = _MAJOR_CITIES_ORDERED if _MAJOR_CITY_GATE.search(text_lower) else ()
+    for city in cities:
+        # Match city as whole word with possible state/country after
+        match = _MAJOR_CITY_PATTERNS[city].search(text_lower)
+        if match:
+            # Find the actual case-preserved text from original
+            start = match.start(1)
+            end = match.end(1)
+            original_match = text[start:end]
+            # Only return if it looks like a location reference (not part of company name)
+            # Check context: should have location-related context nearby
+            context_start = max(0, start - 30)
+            context_end = min(len(text), end + 30)
+            context = text[context_start:context_end].lower()
+            if _LOCATION_CONTEXT_RE.search(context):
+                return original_match.title()
+    
+    return None
+
+
+def fuzzy_pre_verification_stage5(
+    claimed_role: str,
+    claimed_region: str,
+    claimed_industry: str,
+    role_search_results: List[Dict],
+    region_search_results: List[Dict],
+    industry_search_results: List[Dict],
+    full_name: str = "",
+    company: str = "",
+    role_only: bool = False,
+    role_verified_stage4: bool = False
+) -> Dict:
+    """
+    Pre-verify ROLE and REGION using fuzzy matching BEFORE sending to LLM.
+    INDUSTRY is ALWAYS sent to LLM.
+    
+    Args:
+        role_only: If True, only check role and suppress region/industry messages.
+                   Used for early exit check before region/industry ScrapingDog searches.
+        role_verified_stage4: If True, role was already verified in Stage 4 (don't print confusing warnings).
+    """
+    result = {
+        "role_verified": False,
+        "role_extracted": None,
+        "role_confidence": 0.0,
+        "role_reason": "Not checked",
+        "role_definitive_fail": False,
+        
+        "region_verified": False,
+        "region_extracted": None,
+        "region_confidence": 0.0,
+        "region_reason": "Not checked",
+        "region_hard_fail": False,
+        
+        "industry_verified": False,
+        "industry_extracted": None,
+        "industry_confidence": 0.0,
+        "industry_reason": "Industry always verified by LLM (too subjective for fuzzy match)",
+        
+        "needs_llm": ["industry"],
+    }
+    
+    # ROLE FUZZY MATCHING
+    if role_search_results and claimed_role:
+        # Check if role was VERIFIED by fallback search (name+company+role confirmed)
+        for r in role_search_results[:3]:  # Check first few results
+            if r.get("role_verified") and r.get("verified_role"):
+                verified_role = r["verified_role"]
+                print(f"   ✅ ROLE PRE-VERIFIED: '{verified_role}' (from fallback verification)")
+                result["role_verified"] = True
+                result["role_extracted"] = verified_role
+                result["role_confidence"] = 1.0
+                result["role_reason"] = f"Role verified via fallback search (name+company+role confirmed)"
+                result["needs_llm"] = [x for x in result["needs_llm"] if x != "role"]  # Don't need LLM
+                # Still continue to check region/industry
+                break
+        
+        if not result["role_verified"]:  # Only do fuzzy matching if not already verified
+            name_lower = full_name.lower() if full_name else ""
+            first_name = name_lower.split()[0] if name_lower else ""
+            last_name = name_lower.split()[-1] if name_lower else ""
+            
+            best_extracted_role = None
+            best_match = False
+            best_confidence = 0.0
+            best_reason = "No role found in ScrapingDog results"
+            
+            # DEBUG: Show what we're trying to extract from
+            print(f"   🔍 DEBUG ROLE: Attempting to extract role from {len(role_search_results)} search results")
+            print(f"      Claimed role: '{claimed_role}'")
+            print(f"      Person: '{full_name}' at '{company}'")
+            
+            # Look at up to 15 results to include fallback results (5 primary + 5 fallback1 + 5 fallback2)
+            for idx, r in enumerate(role_search_results[:15], 1):
+                title = r.get("title", "")
+                snippet = r.get("snippet", r.get("body", ""))
+                link = r.get("href", r.get("link", ""))
+                
+                # DEBUG: Show what text we're processing
+                print(f"      Result {idx}: Title: '{title[:80]}{'...' if len(title) > 80 else ''}'")
+                print(f"                 Snippet: '{snippet[:80]}{'...' if len(snippet) > 80 else ''}'")
+                
+                # CRITICAL: Filter out LinkedIn POSTS - they contain garbage text
+                # Posts have URLs like: linkedin.com/posts/username/activity-123456
+                # We only want PROFILES: linkedin.com/in/username
+                if "/posts/" in link or "/feed/" in link or "/pulse/" in link:
+                    print(f"                 SKIPPED (LinkedIn post/feed)")
+                    continue  # Skip posts, only process profiles and company pages
+                
+                title_lower = title.lower()
+                
+                # Check if title contains the person's name OR is a job posting/company role listing
+                # Job postings like "Company hiring Role" don't contain the person's name but prove the role exists
+                is_job_posting = "hiring" in title_lower
+                is_company_role = company and company.lower() in title_lower
+                
+                if first_name and last_name and not is_job_posting:
+                    first_pattern = rf'\b{re.escape(first_name)}\b'
+                    last_pattern = rf'\b{re.escape(last_name)}\b'
+                    has_name_in_title = re.search(first_pattern, title_lower) and re.search(last_pattern, title_lower)
+                    
+                    # ALSO check if name is in snippet (for directory-style listings)
+                    # e.g., Title: "Steven Rimpici - VP Sales", Snippet: "Ty Horner. Senior VP, Marketing. Email..."
+                    snippet_lower = snippet.lower() if snippet else ""
+                    has_name_in_snippet = snippet_lower and re.search(first_pattern, snippet_lower) and re.search(last_pattern, snippet_lower)
+                    
+                    has_name = has_name_in_title or has_name_in_snippet
+                    
+                    # Allow if: has person's name (in title OR snippet), OR is a job posting, OR is a company role listing
+                    if not has_name and not is_company_role:
+                        print(f"                 SKIPPED (name '{full_name}' not found in title or snippet)")
+                        continue
+                
+                extracted = extract_role_from_search_title(title, snippet, company_name=company, full_name=full_name)
+                
+                if extracted:
+                    print(f"                 📝 EXTRACTED: '{extracted}'")
+                else:
+                    print(f"                 ❌ NO ROLE extracted (filters rejected or no role found)")
+                
+                if extracted:
+                    extracted_lower = extracted.lower()
+                    
+                    # Pre-compute: Check for strong role keywords (used in multiple filters)
+                    role_keywords_quick = ["ceo", "cto", "cfo", "coo", "founder", "president", "director", 
+                                           "manager", "head", "lead", "vp", "chief", "officer", "attorney",
+                                           "engineer", "accountant", "physician", "partner", "principal"]
+                    has_strong_role_keyword = any(kw in extracted_lower for kw in role_keywords_quick)
+                    
+                    # Filter 1: Known invalid site names and domains
+                    invalid_extractions = ["wikipedia", "linkedin", "facebook", "twitter", "crunchbase", 
+                                           "glassdoor", "indeed", "zoominfo", "bloomberg", "forbes", "reuters",
+                                           "craft.co", "theorg.com", "the org", "contactout", "rocketreach",
+                                           "apollo.io", "leadiq", "lusha", "seamless.ai", "hunter.io",
+                                           "clearbit", "datanyze", "discoverorg", "insideview", "owler"]
+                    if extracted_lower in invalid_extractions:
+                        print(f"                 REJECTED (invalid site name: '{extracted}')")
+                        continue
+                    # Filter website domains (anything ending in .com, .co, .io, etc.)
+                    if re.match(r'^[\w\-]+\.(com|co|io|org|net)$', extracted_lower):
+                        print(f"                 REJECTED (looks like domain: '{extracted}')")
+                        continue
+                    
+                    # Filter 1b: Too short/generic extractions
+                    # Common role abbreviations that are valid even if ≤2 chars
+                    common_abbreviations = ['vp', 'ceo', 'cto', 'cfo', 'coo', 'cmo', 'cio', 'cpo', 'svp', 'evp']
+                    is_common_abbrev = extracted_lower in common_abbreviations
+                    
+                    too_short_generic = ["lead", "head", "manager", "director", "partner", "officer", 
+                                        "engineer", "analyst", "the org", "the company", "org", "inc", "llc"]
+                    if extracted_lower in too_short_generic:
+                        print(f"                 REJECTED (too generic/short: '{extracted}')")
+                        continue
+                    if len(extracted) < 5 and not is_common_abbrev:
+                        print(f"                 REJECTED (too short: {len(extracted)} chars)")
+                        continue
+                    
+                    # Filter 1c: Truncated/garbage extractions
+                    if "..." in extracted or extracted_lower.endswith("- linkedin") or extracted_lower.endswith("| linkedin"):
+                        print(f"                 REJECTED (truncated/garbage)")
+                        continue
+                    
+                    # Filter 2: Garbage patterns that contain role keywords but aren't roles
+                    # Be specific to avoid false positives (e.g., "email example" in titles shouldn't block)
+                    garbage_patterns = [
+                        "work history", "executive bio", "company profile", "contact info",
+                        "phone number", "email address", "company overview", "about us",
+                        "company headquarters", "company website", "biography of",
+                        "practice on the", "focuses on the", "specializes in the",
+                        "expertise in the", "experience in the", "works in the",
+                        "involved in the", "engaged in the", "active in the",
+                        "known for the", "recognized for", "awarded for",
+                        "session details", "read more", "click here", "learn more",
+                        "view profile", "see the complete", "view full", "show more"
+                    ]
+                    # Only filter if these patterns appear AND no strong role keyword exists
+                    has_garbage = any(pattern in extracted_lower for pattern in garbage_patterns)
+                    if has_garbage and not has_strong_role_keyword:
+                        print(f"                 REJECTED (garbage pattern found, no role keyword)")
+                        continue
+                    
+                    # Filter 3: Location patterns (US states, countries, cities)
+                    # If extraction contains US state names or common location words, skip
+                    location_indicators = [
+                        "alabama", "alaska", "arizona", "arkansas", "california", "colorado",
+                        "connecticut", "delaware", "florida", "georgia", "hawaii", "idaho",
+                        "illinois", "indiana", "iowa", "kansas", "kentucky", "louisiana",
+                        "maine", "maryland", "massachusetts", "michigan", "minnesota",
+                        "mississippi", "missouri", "montana", "nebraska", "nevada",
+                        "new hampshire", "new jersey", "new mexico", "new york", "north carolina",
+                        "north dakota", "ohio", "oklahoma", "oregon", "pennsylvania",
+                        "rhode island", "south carolina", "south dakota", "tennessee", "texas",
+                        "utah", "vermont", "virginia", "washington", "west virginia",
+                        "wisconsin", "wyoming", "united states", "united kingdom", "canada",
+                        "australia", "germany", "france", "spain", "italy", "netherlands"
+                    ]
+                    is_location = any(loc in extracted_lower for loc in location_indicators)
+                    # Only skip if it ONLY looks like a location (no role keywords)
+                    if is_location and not has_strong_role_keyword:
+                        print(f"                 REJECTED (looks like location, no role keyword)")
+                        continue
+                    
+                    # Filter 4: Too long to be a job title (likely garbage)
+                    # But allow longer strings if they contain clear role indicators
+                    # (Yahoo sometimes concatenates multiple results which still contain valid roles)
+                    # Note: Yahoo can produce VERY long concatenated titles (300+ chars) but still contain valid roles
+                    if len(extracted) > 500:
+                        print(f"                 REJECTED (too long: {len(extracted)} chars)")
+                        continue
+                    if len(extracted) > 100 and not has_strong_role_keyword:
+                        print(f"                 REJECTED (long but no role keyword: {len(extracted)} chars)")
+                        continue
+                    
+                    # Filter 5: Company name check (stricter)
+                    if company:
+                        company_lower = company.lower()
+                        
+                        role_keywords = ["ceo", "cto", "cfo", "coo", "cio", "chief", "president", "director", 
+                                         "manager", "founder", "owner", "partner", "head", "lead", "vp", 
+                                         "vice", "executive", "officer", "analyst", "engineer", "developer"]
+                        
+                        has_role_keyword = any(kw in extracted_lower for kw in role_keywords)
+                        
+                        if not has_role_keyword:
+                            # Exact match or company in extraction or extraction in company
+                            if extracted_lower == company_lower:
+                                continue
+                            if company_lower in extracted_lower:
+                                continue
+                            if extracted_lower in company_lower:  # e.g., "Ori" for company "Ori Living"
+                                continue
+                    
+                    # Filter 6: Full name check
+                    if full_name and extracted_lower == full_name.lower():
+                        continue
+                    
+                    is_match, confidence, reason = fuzzy_match_role(claimed_role, extracted)
+                    
+                    # Check if this result mentions the target person's name
+                    has_target_name = False
+                    if first_name and last_name and title_lower:
+                        first_pattern = rf'\b{re.escape(first_name)}\b'
+                        last_pattern = rf'\b{re.escape(last_name)}\b'
+                        has_target_name = re.search(first_pattern, title_lower) and re.search(last_pattern, title_lower)
+                    
+                    # Prioritize results that:
+                    # 1. Have higher confidence
+                    # 2. Mention the target person's name (avoids extracting from wrong person)
+                    # 3. Have strong role keywords
+                    # CRITICAL: Don't accept low-confidence extractions without name match
+                    should_update = False
+                    
+                    if confidence > best_confidence:
+                        # Always update if confidence is better
+                        should_update = True
+                    elif not best_extracted_role and extracted:
+                        # Accept first extraction ONLY if:
+                        # - It has the target person's name, OR
+                        # - It has strong role keywords AND reasonable confidence
+                        if has_target_name:
+                            should_update = True
+                        elif has_strong_role_keyword and confidence >= 0.3:
+                            should_update = True
+                        # If no strong role keyword and no name match, reject
+                    elif has_target_name and not best_match:
+                        # Prefer results with target name over generic extractions
+                        should_update = True
+                    
+                    if should_update:
+                        print(f"                 ✅ ACCEPTED: '{extracted}' (confidence: {confidence:.0%})")
+                        best_extracted_role = extracted
+                        best_match = is_match
+                        best_confidence = confidence
+                        best_reason = reason
+                    else:
+                        if extracted:
+                            print(f"                 REJECTED (not better than current best)")
+            
+            # DEBUG: Summary of role extraction
+            if not best_extracted_role:
+                print(f"      ❌ FINAL: No valid role extracted from {len(role_search_results)} results")
+            else:
+                print(f"      ✅ FINAL: Best role = '{best_extracted_role}' (confidence: {best_confidence:.0%})")
+            
+            if best_extracted_role:
+                result["role_extracted"] = best_extracted_role
+                result["role_confidence"] = best_confidence
+                result["role_reason"] = best_reason
+                
+                if best_match and best_confidence >= 0.8:
+                    result["role_verified"] = True
+                    print(f"   ✅ FUZZY ROLE MATCH: '{claimed_role}' ≈ '{best_extracted_role}'")
+                    print(f"      Confidence: {best_confidence:.0%} | Reason: {best_reason}")
+                elif best_match:
+                    result["needs_llm"].append("role")
+                    print(f"   ⚠️ FUZZY ROLE: Low confidence match ({best_confidence:.0%}), sending to LLM")
+                else:
+                    # Match failed - check if extraction looks like a valid role
+                    result["needs_llm"].append("role")
+                    print(f"   ❌ FUZZY ROLE: No match - '{claimed_role}' vs '{best_extracted_role}' ({best_confidence:.0%})")
+            else:
+                # No role extracted at all from search results
+                result["needs_llm"].append("role")
+                print(f"   ⚠️ FUZZY ROLE: No role extracted from ScrapingDog results")
+        else:
+            result["needs_llm"].append("role")
+            result["role_reason"] = "Could not extract role from ScrapingDog results"
+            print(f"   ⚠️ FUZZY ROLE: Could not extract role from search results, sending to LLM")
+    else:
+        # This triggers when role_search_results is empty (intentionally not searched)
+        # OR when claimed_role is empty
+        if role_verified_stage4:
+            # Role was already verified in Stage 4 - don't print any warning
+            print(f"   ℹ️  FUZZY ROLE: Skipped (already verified by Stage 4)")
+        elif not role_search_results and claimed_role:
+            # Role search was intentionally skipped for some other reason
+            print(f"   ℹ️  FUZZY ROLE: Skipped (role search not performed)")
+        elif not claimed_role:
+            print(f"   ℹ️  FUZZY ROLE: Skipped (no role claimed by miner)")
+        else:
+            print(f"   ⚠️ FUZZY ROLE: No ScrapingDog results")
+        
+        # Don't add to needs_llm if already verified by Stage 4
+        if not role_verified_stage4:
+            result["needs_llm"].append("role")
+    
+    # REGION ANTI-GAMING CHECK (runs even in role_only mode for early exit)
+    if claimed_region:
+        US_STATES_SET = {
+            'alabama', 'alaska', 'arizona', 'arkansas', 'california', 'colorado',
+            'connecticut', 'delaware', 'florida', 'georgia', 'hawaii', 'idaho',
+            'illinois', 'indiana', 'iowa', 'kansas', 'kentucky', 'louisiana',
+            'maine', 'maryland', 'massachusetts', 'michigan', 'minnesota',
+            'mississippi', 'missouri', 'montana', 'nebraska', 'nevada',
+            'new hampshire', 'new jersey', 'new mexico', 'new york', 'north carolina',
+            'north dakota', 'ohio', 'oklahoma', 'oregon', 'pennsylvania',
+            'rhode island', 'south carolina', 'south dakota', 'tennessee', 'texas',
+            'utah', 'vermont', 'virginia', 'washington', 'west virginia',
+            'wisconsin', 'wyoming', 'district of columbia'
+        }
+        
+        claimed_lower = claimed_region.lower()
+        states_found = set()
+        for state in US_STATES_SET:
+            # e.g., "Arkansas" should not match "kansas" (use word boundaries)
+            pattern = r'\b' + re.escape(state) + r'\b'
+            if re.search(pattern, claimed_lower):
+                states_found.add(state)
+        
+        # Special case: "west virginia" should not also count "virginia"
+        if 'west virginia' in states_found and 'virginia' in states_found:
+            states_found.discard('virginia')
+        
+        if len(states_found) >= 2:
+            result["region_verified"] = False
+            result["region_hard_fail"] = True
+            result["region_confidence"] = 0.0
+            result["region_reason"] = f"HARD FAIL: Multiple US states in claimed region: {states_found}"
+            result["region_extracted"] = "REJECTED - multiple states detected"
+            print(f"   ❌ ANTI-GAMING HARD FAIL: Multiple states detected in region: {states_found}")
+            print(f"      Claimed region contains {len(states_found)} different US states - HARD FAIL")
+            print(f"      This lead will FAIL regardless of LLM verification")
+            region_search_results = None
+        
+        # ANTI-GAMING: Check for multiple major US cities (comma-separated)
+        # Pattern: "Los Angeles, Chicago, Houston" - clearly gaming
+        # CAREFUL: Don't catch "San Francisco" (one city with space)
+        # CAREFUL: Don't catch "New York, NY" (city + state abbreviation)
+        MAJOR_US_CITIES = {
+            'new york', 'los angeles', 'chicago', 'houston', 'phoenix', 'philadelphia',
+            'san antonio', 'san diego', 'dallas', 'san jose', 'austin', 'jacksonville',
+            'fort worth', 'columbus', 'charlotte', 'san francisco', 'indianapolis',
+            'seattle', 'denver', 'washington', 'boston', 'el paso', 'nashville',
+            'detroit', 'oklahoma city', 'portland', 'las vegas', 'memphis', 'louisville',
+            'baltimore', 'milwaukee', 'albuquerque', 'tucson', 'fresno', 'sacramento',
+            'kansas city', 'mesa', 'atlanta', 'omaha', 'colorado springs', 'raleigh',
+            'miami', 'cleveland', 'tulsa', 'oakland', 'minneapolis', 'wichita',
+            'arlington', 'tampa', 'new orleans', 'bakersfield', 'honolulu', 'anaheim',
+            'aurora', 'santa ana', 'st louis', 'riverside', 'pittsburgh', 'cincinnati'
+        }
+        
+        cities_found = set()
+        for city in MAJOR_US_CITIES:
+            # Use word boundary to avoid "Portland" matching in "Portlandville"
+            if re.search(rf'\b{re.escape(city)}\b', claimed_lower):
+                cities_found.add(city)
+        
+        # Only fail if 2+ DIFFERENT major cities found (gaming pattern)
+        # This catches: "Los Angeles, Chicago, Houston"
+        # But allows: "New York, NY" (only 1 city)
+        if len(cities_found) >= 2 and not result.get("region_hard_fail"):
+            result["region_verified"] = False
+            result["region_hard_fail"] = True
+            result["region_confidence"] = 0.0
+            result["region_reason"] = f"HARD FAIL: Multiple major cities in claimed region: {cities_found}"
+            result["region_extracted"] = "REJECTED - multiple cities detected"
+            print(f"   ❌ ANTI-GAMING HARD FAIL: Multiple cities detected in region: {cities_found}")
+            print(f"      Claimed region contains {len(cities_found)} different major cities - HARD FAIL")
+            print(f"      This lead will FAIL regardless of LLM verification")
+            region_search_results = None
+    
+    # If role_only mode, skip region GSE-based matching and industry checks
+    # (Anti-gaming check above still runs for early exit detection)
+    if role_only:
+        return result
+    
+    # REGION FUZZY MATCHING
+    if region_search_results and claimed_region:
+        company_lower = company.lower() if company else ""
+        extracted_region = None
+        
+        # DEBUG: Show what we're trying to extract from
+        print(f"   🔍 DEBUG REGION: Attempting to extract location from {len(region_search_results)} search results")
+        print(f"      Claimed region: '{claimed_region}'")
+        
+        for idx, r in enumerate(region_search_results[:5], 1):
+            link = r.get("href", r.get("link", ""))
+            
+            # Filter out LinkedIn posts for region extraction too
+            if "/posts/" in link or "/feed/" in link or "/pulse/" in link:
+                print(f"      Result {idx}: SKIPPED (LinkedIn post/feed)")
+                continue
+            
+            title = r.get("title", "")
+            snippet = r.get("snippet", r.get("body", ""))
+            combined = title + " " + snippet
+            
+            # DEBUG: Show what text we're extracting from
+            print(f"      Result {idx}: Title: '{title[:80]}{'...' if len(title) > 80 else ''}'")
+            print(f"                Snippet: '{snippet[:80]}{'...' if len(snippet) > 80 else ''}'")
+            
+            if company_lower and company_lower not in combined.lower():
+                print(f"                SKIPPED (company '{company}' not in text)")
+                continue
+            
+            loc = extract_location_from_text(combined)
+            if loc:
+                print(f"                ✅ EXTRACTED: '{loc}'")
+                extracted_region = loc
+                break
+            else:
+                print(f"                ❌ NO LOCATION extracted (filters rejected or no location found)")
+        
+        if extracted_region:
+            geo_match, geo_reason = locations_match_geopy(claimed_region, extracted_region)
+            
+            result["region_extracted"] = extracted_region
+            result["region_confidence"] = 0.95 if geo_match else 0.3
+            result["region_reason"] = geo_reason
+            
+            if geo_match:
+                result["region_verified"] = True
+                print(f"   ✅ FUZZY REGION MATCH: '{claimed_region}' ≈ '{extracted_region}'")
+                print(f"      Reason: {geo_reason}")
+            else:
+                if not result.get("region_hard_fail"):
+                    result["needs_llm"].append("region")
+                    print(f"   ⚠️ FUZZY REGION: GeoPy says no match, sending to LLM for verification")
+                    print(f"      Claimed: {claimed_region} | Extracted: {extracted_region}")
+        else:
+            if not result.get("region_hard_fail"):
+                result["needs_llm"].append("region")
+                result["region_reason"] = "Could not extract region from ScrapingDog results"
+                print(f"   ⚠️ FUZZY REGION: Could not extract location, sending to LLM")
+    else:
+        if not result.get("region_hard_fail"):
+            result["needs_llm"].append("region")
+            if not region_search_results and claimed_region:
+                print(f"   ℹ️  FUZZY REGION: Skipped (no search results available)")
+            elif not claimed_region:
+                print(f"   ℹ️  FUZZY REGION: Skipped (no region claimed by miner)")
+            else:
+                print(f"   ⚠️ FUZZY REGION: No ScrapingDog results")
+    
+    print(f"   🤖 INDUSTRY: Always verified by LLM (too subjective for fuzzy match)")
+    
+    return result
+
+
+# ========================================================================
+# Employee Count Verification Functions
+# ========================================================================
+
+# LinkedIn employee count ranges (standardized)
+LINKEDIN_EMPLOYEE_RANGES = [
+    (0, 1, "0-1"),
+    (2, 10, "2-10"),
+    (11, 50, "11-50"),
+    (51, 200, "51-200"),
+    (201, 500, "201-500"),
+    (501, 1000, "501-1,000"),
+    (1001, 5000, "1,001-5,000"),
+    (5001, 10000, "5,001-10,000"),
+    (10001, float('inf'), "10,001+"),
+]
+
+
+# LINKEDIN_EMPLOYEE_RANGES itself is never scanned; only these three patterns run per call
+_EMPLOYEE_PLUS_RE = compile_pattern("employee_count.plus", r'(\d+)\+')
+_EMPLOYEE_RANGE_RE = compile_pattern("employee_count.range", r'(\d+)\s*[-–—]\s*(\d+)')
+_EMPLOYEE_NUMBER_RE = compile_pattern("employee_count.number", r'(\d+)')
+
+
+def parse_employee_count(text: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse employee count from various text formats.
+    
+    Returns (min, max) tuple or None if not parseable.
+    
+    Handles formats like:
+    - "2-10 employees"
+    - "11-50"
+    - "Company size: 51-200 employees"
+    - "1,001-5,000"
+    - "10001+"
+    - "500+"
+    - "Self-employed"
+    - "50"
+    """
+    if not text:
+        return None
+    
+    text = text.strip().lower()
+    
+    # Handle "self-employed"
+    if "self-employed" in text or "self employed" in text:
+        return (1, 1)
+    
+    # Remove commas from numbers
+    text = text.replace(",", "")
+    
+    # Handle "10001+" or "500+" format
+    plus_match = _EMPLOYEE_PLUS_RE.search(text)
+    if plus_match:
+        min_val = int(plus_match.group(1))
+        return (min_val, 100000)  # Assume large upper bound
+    
+    # Handle range format: "X-Y" or "X - Y"
+    range_match = _EMPLOYEE_RANGE_RE.search(text)
+    if range_match:
+        min_val = int(range_match.group(1))
+        max_val = int(range_match.group(2))
+        return (min_val, max_val)
+    
+    # Handle single number
+    single_match = _EMPLOYEE_NUMBER_RE.search(text)
+    if single_match:
+        val = int(single_match.group(1))
+        # If it's a single number, treat it as exact
+        return (val, val)
+    
+    return None
+
+
+def is_valid_employee_count_extraction(extracted: str) -> bool:
+    """
+    Post-extraction validation to filter out invalid employee counts.
+    
+    This prevents bugs where regex patterns partially match numbers and extract
+    invalid values like "000" from "2000 employees" or years like "2024".
+    
+    Rejects:
+    - "000" or "00" (partial matches from years like 2000)
+    - Single years like "2000", "2024" (not employee counts)
+    - "0" or values that would parse to 0
+    
+    Accepts:
+    - "2,000" (comma indicates it's a formatted number, not a year)
+    - "51-200" (ranges are valid)
+    - "500", "5000", "10000+" (counts outside year range or with + suffix)
+    """
+    if not extracted or not extracted.strip():
+        return False
+    
+    extracted = extracted.strip()
+    
+    # Remove commas for parsing
+    clean = extracted.replace(",", "").replace("+", "").strip()
+    
+    # Handle ranges like "51-200"
+    if "-" in clean or "–" in clean:
+        parts = re.split(r'[-–]', clean)
+        if len(parts) == 2:
+            try:
+                min_val = int(parts[0].strip())
+                max_val = int(parts[1].strip())
+                # Valid if both parts are reasonable employee counts (not zero)
+                return min_val > 0 and max_val >= min_val
+            except ValueError:
+                return False
+    
+    # Single value
+    try:
+        val = int(clean)
+        
+        # Reject 0 or values like "000"
+        if val == 0:
+            return False
+        
+        # Reject partial matches like "001" or "001+" (from "10,001+")
+        # These are clearly partial extractions when regex doesn't handle commas
+        # Real employee counts with "+" are always >= 10,001 (LinkedIn's largest bucket)
+        if "+" in extracted and val < 1000:
+            return False
+        
+        # Reject numbers with leading zeros (e.g., "001" parsed as 1)
+        # Unless it's a single digit (which is valid like "2" from "2-10")
+        if clean.startswith("0") and len(clean) > 1:
+            return False
+        
+        # Reject likely years (1900-2099) UNLESS formatted with comma
+        # Employee counts of 1900-2099 are valid only if written as "1,900" or "2,000"
+        if 1900 <= val <= 2099:
+            # If original has comma (like "2,000"), it's employee count
+            if "," in extracted:
+                return True
+            # If original is 4 digits without comma, likely a year
+            if len(clean) == 4:
+                return False
+        
+        return True
+    except ValueError:
+        return False
+
+
+def extract_employee_count_from_results(search_results: List[Dict], company: str = "", company_slug: str = "") -> Optional[str]:
+    """
+    Extract employee count from LinkedIn company page search results.
+    
+    IMPORTANT: Only extracts from results that match the EXACT company slug to prevent
+    false positives from subsidiaries or wrong companies.
+    
+    Looks for patterns like:
+    - "Company size: 2-10 employees"
+    - "11-50 employees"
+    - "Company size: 51-200"
+    
+    Args:
+        search_results: List of search result dicts with 'title', 'body/snippet', 'href'
+        company: Company name for validation
+        company_slug: The LinkedIn company slug (e.g., "bp") to verify exact page match
+        
+    Returns:
+        Extracted employee range string (e.g., "11-50") or None
+    """
+    if not search_results:
+        return None
+    
+    company_lower = company.lower() if company else ""
+    
+    # Patterns to look for (ordered by specificity)
+    patterns = [
+        # "Company size: 2-10 employees" or "Company size: 1,001-5,000 employees"
+        r'company\s*size[:\s]+(\d{1,3}(?:,\d{3})*[\s,-–—]+\d{1,3}(?:,\d{3})*)\s*employees?',
+        # "Company size: 10,001+" or "Company size: 2-10"
+        r'company\s*size[:\s]+(\d{1,3}(?:,\d{3})*[\s,-–—]+\d{1,3}(?:,\d{3})*|\d+\+)',
+        # "1,001-5,000 employees" with commas
+        r'(\d{1,3}(?:,\d{3})*[\s,-–—]+\d{1,3}(?:,\d{3})*)\s*employees?',
+        # "2-10 employees" simple range
+        r'(\d+[\s,-–—]+\d+)\s*employees?',
+        # "10,001+ employees" with comma
+        r'(\d{1,3}(?:,\d{3})*\+)\s*employees?',
+        # "10001+ employees" or "2-10 employees"
+        r'(\d+\+|\d+[\s,-–—]+\d+)\s*employees?',
+        # "· 2-10 employees" (after followers on LinkedIn)
+        r'·\s*(\d{1,2}[\s,-–—]+\d{1,3}(?:,\d{3})*)\s*employees?',
+        # International: German "Mitarbeiter"
+        r'(\d{1,3}(?:,\d{3})*[\s,-–—]+\d{1,3}(?:,\d{3})*)\s*mitarbeiter',
+        r'(\d+[\s,-–—]+\d+)\s*mitarbeiter',
+        # International: French "employés"
+        r'(\d{1,3}(?:,\d{3})*[\s,-–—]+\d{1,3}(?:,\d{3})*)\s*employés',
+        # International: Spanish "empleados"
+        r'(\d{1,3}(?:,\d{3})*[\s,-–—]+\d{1,3}(?:,\d{3})*)\s*empleados',
+        # International: Italian "dipendenti"
+        r'(\d{1,3}(?:,\d{3})*[\s,-–—]+\d{1,3}(?:,\d{3})*)\s*dipendenti',
+        # International: Dutch "werknemers" / "medewerkers"
+        r'(\d{1,3}(?:,\d{3})*[\s,-–—]+\d{1,3}(?:,\d{3})*)\s*(?:werknemers|medewerkers)',
+        # International: Portuguese "funcionários"
+        r'(\d{1,3}(?:,\d{3})*[\s,-–—]+\d{1,3}(?:,\d{3})*)\s*funcionários',
+        # LinkedIn standard ranges after separator (match exact standard ranges)
+        r'·\s*(2[-–]10|11[-–]50|51[-–]200|201[-–]500|501[-–]1,?000|1,?001[-–]5,?000|5,?001[-–]10,?000|10,?001\+)',
+    ]
+    
+    for result in search_results:
+        title = result.get("title", "")
+        snippet = result.get("body", result.get("snippet", ""))
+        href = result.get("href", "").lower()
+        
+        combined = f"{title} {snippet}".lower()
+        
+        # Only consider LinkedIn company pages
+        if "linkedin.com" not in href:
+            continue
+        
+        # CRITICAL: Verify this result is from the EXACT company slug
+        # e.g., for slug "bp", accept "/company/bp/" but NOT "/company/bp-america/"
+        if company_slug:
+            expected_url_patterns = [
+                f'/company/{company_slug}/',  # With trailing slash
+                f'/company/{company_slug}?',  # With query params
+                f'/company/{company_slug}#',  # With hash
+            ]
+            
+            is_exact_match = False
+            if f'/company/{company_slug}' in href:
+                for pattern in expected_url_patterns:
+                    if pattern in href:
+                        is_exact_match = True
+                        break
+                
+                # Also accept if it ends with the slug
+                if href.endswith(f'/company/{company_slug}'):
+                    is_exact_match = True
+            
+            if not is_exact_match:
+                continue  # Skip - not from exact company page
+        
+        # Verify it's about the right company (if company name provided)
+        if company_lower:
+            company_words = [word for word in company_lower.split()[:2] if len(word) > 3]
+            company_match = company_lower in combined or any(word in combined for word in company_words)
+            if not company_match:
+                continue
+        
+        # Try each pattern
+        for pattern in patterns:
+            match = re.search(pattern, combined, re.IGNORECASE)
+            if match:
+                extracted = match.group(1).strip()
+                # Normalize the range format
+                extracted = re.sub(r'[\s]+', '', extracted)  # Remove spaces
+                extracted = re.sub(r'[–—]', '-', extracted)  # Normalize dashes
+                # Validate extraction to prevent bugs like "2000 employees" -> "000"
+                if is_valid_employee_count_extraction(extracted):
+                    return extracted
+                # Invalid extraction - try next pattern
+    
+    return None
+
+
+def normalize_to_linkedin_range(min_val: int, max_val: int) -> Optional[str]:
+    """
+    Normalize a parsed (min, max) range to the standard LinkedIn range string.
+    
+    LinkedIn has these standard ranges:
+    - 0-1, 2-10, 11-50, 51-200, 201-500, 501-1,000, 1,001-5,000, 5,001-10,000, 10,001+
+    """
+    # Standard LinkedIn ranges with their boundaries
+    LINKEDIN_RANGES = [
+        ((0, 1), "0-1"),
+        ((2, 10), "2-10"),
+        ((11, 50), "11-50"),
+        ((51, 200), "51-200"),
+        ((201, 500), "201-500"),
+        ((501, 1000), "501-1,000"),
+        ((1001, 5000), "1,001-5,000"),
+        ((5001, 10000), "5,001-10,000"),
+        ((10001, 100000), "10,001+"),  # 10,001+ uses high upper bound
+    ]
+    
+    # Check if the range falls within a standard LinkedIn range
+    for (range_min, range_max), range_str in LINKEDIN_RANGES:
+        # For exact match of range boundaries
+        if min_val == range_min and (max_val == range_max or (range_str == "10,001+" and max_val >= 10001)):
+            return range_str
+        # For single values (min == max), check if they fall within a range
+        if min_val == max_val:
+            if range_min <= min_val <= range_max:
+                return range_str
+    
+    return None
+
+
+def fuzzy_match_employee_count(claimed: str, extracted: str) -> Tuple[bool, str]:
+    """
+    STRICT match employee count ranges - requires exact LinkedIn range match.
+    
+    Args:
+        claimed: Miner's claimed employee count (e.g., "51-200")
+        extracted: Extracted from company LinkedIn (e.g., "51-200")
+    
+    Returns:
+        (match: bool, reason: str)
+    """
+    if not claimed or not extracted:
+        return False, "Missing data for comparison"
+    
+    claimed_range = parse_employee_count(claimed)
+    extracted_range = parse_employee_count(extracted)
+    
+    if not claimed_range:
+        return False, f"Could not parse claimed employee count: '{claimed}'"
+    
+    if not extracted_range:
+        return False, f"Could not parse extracted employee count: '{extracted}'"
+    
+    claimed_min, claimed_max = claimed_range
+    extracted_min, extracted_max = extracted_range
+    
+    # Normalize both to standard LinkedIn ranges
+    claimed_linkedin = normalize_to_linkedin_range(claimed_min, claimed_max)
+    extracted_linkedin = normalize_to_linkedin_range(extracted_min, extracted_max)
+    
+    if not claimed_linkedin:
+        return False, f"Claimed value '{claimed}' doesn't map to standard LinkedIn range"
+    
+    if not extracted_linkedin:
+        return False, f"Extracted value '{extracted}' doesn't map to standard LinkedIn range"
+    
+    # STRICT: Require same LinkedIn range
+    if claimed_linkedin == extracted_linkedin:
+        return True, f"LinkedIn range match: '{claimed_linkedin}'"
+    
+    # No match - different LinkedIn ranges
+    return False, f"Different LinkedIn ranges: claimed '{claimed_linkedin}' vs extracted '{extracted_linkedin}'"
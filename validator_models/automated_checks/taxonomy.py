@@ -0,0 +1,254 @@
+"""
+Industry / sub-industry matching against INDUSTRY_TAXONOMY (fuzzy, exact and LLM-assisted).
+"""
+
+import json
+from typing import Dict, Tuple, List, Optional
+from validator_models.industry_taxonomy import INDUSTRY_TAXONOMY
+from validator_models.taxonomy_index import TAXONOMY_INDEX
+from validator_models.llm_service import complete as llm_complete, strip_code_fences
+
+
+# ========================================================================
+# INDUSTRY TAXONOMY VALIDATION HELPERS
+# ========================================================================
+
+def get_all_valid_industries() -> set:
+    """
+    Get all valid industry names from industry taxonomy.
+    These are the unique industry_groups across all sub-industries.
+    
+    Returns:
+        Set of valid industry names (case-preserved)
+    """
+    return set(TAXONOMY_INDEX.industries)
+
+
+def get_all_valid_sub_industries() -> set:
+    """
+    Get all valid sub-industry names from industry taxonomy.
+    These are the keys of the INDUSTRY_TAXONOMY dictionary.
+    
+    Returns:
+        Set of valid sub-industry names (case-preserved)
+    """
+    return set(TAXONOMY_INDEX.sub_industries)
+
+
+def validate_exact_industry_match(claimed_industry: str) -> Tuple[bool, str, Optional[str]]:
+    """
+    Validate that the claimed industry EXACTLY matches a valid industry.
+    
+    Args:
+        claimed_industry: The industry submitted by the miner
+        
+    Returns:
+        (is_valid, reason, matched_industry)
+    """
+    if not claimed_industry or not claimed_industry.strip():
+        return False, "Industry is empty or missing", None
+    
+    claimed_clean = claimed_industry.strip()
+    
+    # Check exact match (case-insensitive, precomputed map)
+    valid = TAXONOMY_INDEX.match_industry(claimed_clean)
+    if valid:
+        return True, f"Industry '{valid}' is valid (exact match)", valid
+    
+    # Not found - provide helpful error with valid options
+    return False, f"Industry '{claimed_clean}' is NOT in industry taxonomy. Valid industries: {TAXONOMY_INDEX.industries_sorted}", None
+
+
+def validate_exact_sub_industry_match(claimed_sub_industry: str) -> Tuple[bool, str, Optional[str], Optional[Dict]]:
+    """
+    Validate that the claimed sub_industry EXACTLY matches a valid sub-industry.
+    
+    Args:
+        claimed_sub_industry: The sub_industry submitted by the miner
+        
+    Returns:
+        (is_valid, reason, matched_sub_industry, taxonomy_entry)
+    """
+    if not claimed_sub_industry or not claimed_sub_industry.strip():
+        return False, "Sub-industry is empty or missing", None, None
+    
+    claimed_clean = claimed_sub_industry.strip()
+    
+    # Check exact match (case-insensitive, precomputed map)
+    sub_ind = TAXONOMY_INDEX.match_sub_industry(claimed_clean)
+    if sub_ind:
+        return True, f"Sub-industry '{sub_ind}' is valid (exact match)", sub_ind, INDUSTRY_TAXONOMY[sub_ind]
+    
+    # Not found - provide helpful error
+    return False, f"Sub-industry '{claimed_clean}' is NOT in industry taxonomy", None, None
+
+
+def validate_industry_sub_industry_exact_pairing(matched_industry: str, matched_sub_industry: str) -> Tuple[bool, str]:
+    """
+    Validate that the industry is a valid industry_group for the sub_industry.
+    Both must have already been validated as exact matches.
+    
+    Args:
+        matched_industry: The validated industry name
+        matched_sub_industry: The validated sub_industry name
+        
+    Returns:
+        (is_valid, reason)
+    """
+    if not matched_sub_industry or matched_sub_industry not in INDUSTRY_TAXONOMY:
+        return False, f"Sub-industry '{matched_sub_industry}' not found in taxonomy"
+    
+    valid_groups = INDUSTRY_TAXONOMY[matched_sub_industry].get("industries", [])
+    
+    if not valid_groups:
+        # Some entries have empty industry_groups - allow any industry
+        return True, f"Sub-industry '{matched_sub_industry}' has no specific industry restrictions"
+    
+    # Check if matched_industry is in the valid groups (case-insensitive)
+    for group in valid_groups:
+        if group.lower() == matched_industry.lower():
+            return True, f"Industry '{matched_industry}' is valid for sub-industry '{matched_sub_industry}'"
+    
+    return False, f"Industry '{matched_industry}' is NOT valid for sub-industry '{matched_sub_industry}'. Valid: {valid_groups}"
+
+
+# ========================================================================
+# SUB-INDUSTRY VERIFICATION HELPERS (Using Industry Taxonomy) - LEGACY
+# ========================================================================
+
+def fuzzy_match_sub_industry(claimed_sub_industry: str) -> Tuple[Optional[str], Optional[Dict], float]:
+    """
+    LEGACY: Fuzzy match the miner's claimed sub_industry against the industry taxonomy.
+    NOTE: Use validate_exact_sub_industry_match() for strict validation instead.
+    
+    Returns:
+        (matched_key, taxonomy_entry, confidence) where:
+        - matched_key: The exact key in INDUSTRY_TAXONOMY (or None if no match)
+        - taxonomy_entry: Dict with 'industry_groups' and 'definition' (or None)
+        - confidence: 0.0 to 1.0
+    """
+    if not claimed_sub_industry:
+        return None, None, 0.0
+    
+    # Exact, containment and word-overlap matching over the precomputed index
+    best_match, best_confidence = TAXONOMY_INDEX.fuzzy_sub_industry(claimed_sub_industry)
+    if best_match:
+        return best_match, INDUSTRY_TAXONOMY[best_match], best_confidence
+    
+    return None, None, 0.0
+
+
+def validate_industry_sub_industry_pairing(claimed_industry: str, matched_sub_industry: str) -> Tuple[bool, str]:
+    """
+    Validate that the miner's claimed industry is a valid industry_group for the sub_industry.
+    
+    Returns:
+        (is_valid, reason)
+    """
+    if not matched_sub_industry or matched_sub_industry not in INDUSTRY_TAXONOMY:
+        return False, f"Sub-industry '{matched_sub_industry}' not found in industry taxonomy"
+    
+    valid_groups = INDUSTRY_TAXONOMY[matched_sub_industry].get("industries", [])
+    
+    if not valid_groups:
+        # Some entries have empty industry_groups (like "Association", "Commercial")
+        return True, f"Sub-industry '{matched_sub_industry}' has no specific industry group requirements"
+    
+    # Normalize claimed industry for comparison
+    claimed_lower = claimed_industry.strip().lower()
+    
+    for group in valid_groups:
+        if group.lower() == claimed_lower:
+            return True, f"Industry '{claimed_industry}' is valid for sub-industry '{matched_sub_industry}'"
+        # Allow partial matches (e.g., "Technology" matches "Information Technology")
+        if claimed_lower in group.lower() or group.lower() in claimed_lower:
+            return True, f"Industry '{claimed_industry}' loosely matches valid group '{group}' for sub-industry '{matched_sub_industry}'"
+    
+    return False, f"Industry '{claimed_industry}' is NOT valid for sub-industry '{matched_sub_industry}'. Valid groups: {valid_groups}"
+
+
+async def verify_sub_industry_with_llm(
+    company: str,
+    claimed_sub_industry: str,
+    matched_sub_industry: str,
+    definition: str,
+    industry_search_results: List[Dict],
+    openrouter_key: str
+) -> Tuple[bool, str, float]:
+    """
+    Use LLM to verify that the company actually matches the claimed sub_industry,
+    using the industry definition as the ground truth.
+    
+    Args:
+        company: Company name
+        claimed_sub_industry: What the miner claimed
+        matched_sub_industry: The matched industry taxonomy key
+        definition: sub-industry definition of the sub_industry
+        industry_search_results: GSE search results about the company's industry
+        openrouter_key: API key for OpenRouter
+    
+    Returns:
+        (is_match, reasoning, confidence)
+    """
+    if not industry_search_results:
+        return False, "No industry search results to verify against", 0.0
+    
+    # Build context from search results
+    search_context = ""
+    for i, result in enumerate(industry_search_results[:5], 1):
+        title = result.get("title", "")
+        snippet = result.get("snippet", result.get("body", ""))
+        search_context += f"{i}. {title}\n   {snippet[:200]}\n"
+    
+    prompt = f"""You are verifying if a company matches a specific sub-industry classification.
+
+COMPANY: {company}
+
+CLAIMED SUB-INDUSTRY: {claimed_sub_industry}
+MATCHED SUB-INDUSTRY CATEGORY: {matched_sub_industry}
+
+SUB-INDUSTRY DEFINITION FOR THIS SUB-INDUSTRY:
+"{definition}"
+
+SEARCH RESULTS ABOUT THE COMPANY:
+{search_context}
+
+TASK: Based on the search results, does this company match the sub-industry definition above?
+
+RULES:
+1. The company's actual business must match the industry definition
+2. Be STRICT - the company must genuinely fit the sub-industry category
+3. If search results don't clearly show what the company does, return false
+4. If the company operates in a DIFFERENT industry than claimed, return false
+
+RESPOND WITH JSON ONLY:
+{{
+    "sub_industry_match": true/false,
+    "extracted_business_type": "what the company actually does based on search results",
+    "confidence": 0.0-1.0,
+    "reasoning": "Brief explanation"
+}}"""
+
+    try:
+        llm_response, error = await llm_complete(
+            "sub_industry", prompt, max_tokens=300, timeout=20, api_key=openrouter_key
+        )
+        if error:
+            return False, error, 0.0
+        llm_response = strip_code_fences(llm_response)
+        
+        result = json.loads(llm_response)
+        
+        is_match = result.get("sub_industry_match", False)
+        reasoning = result.get("reasoning", "No reasoning provided")
+        confidence = float(result.get("confidence", 0.0))
+        extracted_type = result.get("extracted_business_type", "Unknown")
+        
+        full_reasoning = f"{reasoning} (Detected: {extracted_type})"
+        
+        return is_match, full_reasoning, confidence
+                
+    except json.JSONDecodeError as e:
+        return False, f"Failed to parse LLM response: {str(e)}", 0.0
+    except Exception as e:
+        return False, f"LLM verification failed: {str(e)}", 0.0
@@ -0,0 +1,326 @@
+"""
+Input-fingerprinted check evidence for incremental re-validation.
+
+A miner may resubmit a lead the subnet denied (Step 6.5 in gateway/api/submit.py),
+usually with one or two fields corrected. The validator used to re-run every
+check from scratch, including the paid Stage 4 LinkedIn/GSE and Stage 5
+role/region/industry searches whose inputs had not changed. Each expensive
+check now declares the lead fields it reads (CHECK_INPUT_FIELDS) and the lead
+fields it writes (CHECK_OUTPUT_FIELDS, as DOMAIN_CHECK_SIDE_FIELDS does for the
+domain plan):
+
+- fingerprint: sha256 of the check name, the automated_checks code version, the
+  declared input fields and the incoming values of the output fields (only
+  fields present on the lead; check_domain_age also includes the UTC date,
+  since it reports ages in days)
+- evidence: the check's (passed, rejection_reason) and the output fields it
+  changed, kept only for passing checks whose evidence survives a JSON round
+  trip unchanged and that wrote no undeclared fields
+- reuse: a fresh entry restores the output fields and returns the stored result,
+  so the lead and the merged automated_checks_data are the same as after
+  running the check; a changed input or an expired entry (CHECK_EVIDENCE_TTL_HOURS)
+  runs the check again
+
+Failures are never stored: a resubmitted lead re-runs the check that denied it.
+Rep Score API checks already reuse evidence through the reputation store;
+the Stage 0 instant and provenance checks are pure and sub-millisecond and
+always run.
+
+    python -m validator_models.check_evidence stats
+    python -m validator_models.check_evidence fingerprint --leads lead.json
+
+Storage is a SharedCache (SQLite, WAL) at CHECK_EVIDENCE_PATH shared by every
+container on the host; CHECK_EVIDENCE_ENABLED=false turns reuse off.
+"""
+
+import argparse
+import asyncio
+import copy
+import glob
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from validator_models.domain_plan import DOMAIN_CHECK_SIDE_FIELDS
+from validator_models.pipeline_metrics import record_cache
+from validator_models.shared_cache import SharedCache
+
+# ════════════════════════════════════════════════════════════════════
+# Configuration
+# ════════════════════════════════════════════════════════════════════
+CHECK_EVIDENCE_ENABLED = os.getenv("CHECK_EVIDENCE_ENABLED", "true").lower() == "true"
+CHECK_EVIDENCE_PATH = os.getenv(
+    "CHECK_EVIDENCE_PATH",
+    str(Path("validator_weights") / "check_evidence.sqlite"),
+)
+CHECK_EVIDENCE_MAX_ENTRIES = int(os.getenv("CHECK_EVIDENCE_MAX_ENTRIES", "200000"))
+CHECK_EVIDENCE_MAX_BYTES = int(os.getenv("CHECK_EVIDENCE_MAX_BYTES", str(512 * 1024 * 1024)))
+# Bump to invalidate all stored evidence without a code change (e.g. after changing model env vars)
+CHECK_EVIDENCE_VERSION = os.getenv("CHECK_EVIDENCE_VERSION", "1")
+EVIDENCE_NAMESPACE = "evidence"
+
+# Lead field aliases read by the Leadpoet.utils.utils_lead_extraction getters
+EMAIL_FIELDS = ("email", "Email 1")
+WEBSITE_FIELDS = ("website", "Website")
+COMPANY_FIELDS = ("business", "Business", "Company")
+FULL_NAME_FIELDS = ("full_name", "Full_name", "Full Name")
+LINKEDIN_FIELDS = ("linkedin", "LinkedIn")
+ROLE_FIELDS = ("role", "Role")
+LOCATION_FIELDS = ("region", "Region", "location")
+INDUSTRY_FIELDS = ("industry", "Industry")
+SUB_INDUSTRY_FIELDS = ("sub_industry", "Sub-industry", "Sub_industry")
+EMPLOYEE_COUNT_FIELDS = ("employee_count", "Employee Count", "company_size", "headcount")
+
+# lead[...] fields each check reads
+CHECK_INPUT_FIELDS = {
+    "check_domain_age": WEBSITE_FIELDS,
+    "check_mx_record": WEBSITE_FIELDS,
+    "check_head_request": WEBSITE_FIELDS,
+    "check_spf_dmarc": EMAIL_FIELDS,
+    "check_dnsbl": EMAIL_FIELDS,
+    "check_linkedin_gse": FULL_NAME_FIELDS + COMPANY_FIELDS + LINKEDIN_FIELDS + ("company_linkedin",),
+    "check_stage5_unified": (
+        FULL_NAME_FIELDS + COMPANY_FIELDS + LINKEDIN_FIELDS + WEBSITE_FIELDS + ROLE_FIELDS
+        + LOCATION_FIELDS + INDUSTRY_FIELDS + SUB_INDUSTRY_FIELDS + EMPLOYEE_COUNT_FIELDS
+        + ("city", "state", "country", "description", "company_linkedin")
+        # Written by Stage 4
+        + ("company_linkedin_verified", "company_linkedin_data", "company_linkedin_from_cache",
+           "stage4_extracted_role", "stage4_extracted_location")
+    ),
+}
+
+# lead[...] fields each check writes (restored on reuse)
+CHECK_OUTPUT_FIELDS = {
+    "check_domain_age": DOMAIN_CHECK_SIDE_FIELDS["check_domain_age"],
+    "check_mx_record": [],
+    "check_head_request": [],
+    "check_spf_dmarc": DOMAIN_CHECK_SIDE_FIELDS["check_spf_dmarc"],
+    "check_dnsbl": DOMAIN_CHECK_SIDE_FIELDS["check_dnsbl"],
+    "check_linkedin_gse": [
+        "gse_search_count", "llm_confidence", "stage4_extracted_role", "stage4_extracted_location",
+        "company_linkedin_verified", "company_linkedin_slug", "company_linkedin_data",
+        "company_linkedin_from_cache",
+    ],
+    "check_stage5_unified": [
+        "_stage5_search_results", "region_city", "region_country", "region_state",
+        "stage5_role_match", "stage5_region_match", "stage5_industry_match",
+        "stage5_extracted_role", "stage5_extracted_region", "stage5_extracted_industry",
+        "stage5_claimed_employee_count", "stage5_employee_count_match", "stage5_extracted_employee_count",
+        "stage5_claimed_sub_industry", "stage5_sub_industry_match", "stage5_sub_industry_reason",
+        "stage5_matched_sub_industry", "stage5_description_match", "stage5_description_coherent",
+        "stage5_description_reasoning", "stage5_coherence_issue",
+        "taxonomy_industry_valid", "taxonomy_sub_industry_valid", "taxonomy_pairing_valid",
+        "taxonomy_matched_industry", "taxonomy_matched_sub_industry",
+    ],
+}
+
+# Checks whose result depends on the current date (ages in days)
+DATE_KEYED_CHECKS = {"check_domain_age"}
+
+# Evidence lifetime in hours (override with CHECK_EVIDENCE_TTL_HOURS_<CHECK>)
+CHECK_EVIDENCE_TTL_HOURS = {
+    name: float(os.getenv(f"CHECK_EVIDENCE_TTL_HOURS_{name.upper()}", default))
+    for name, default in {
+        "check_domain_age": "24",      # Also keyed by date
+        "check_mx_record": "24",
+        "check_head_request": "24",
+        "check_spf_dmarc": "24",
+        "check_dnsbl": "24",
+        "check_linkedin_gse": "72",    # Paid GSE searches + LLM
+        "check_stage5_unified": "72",  # Paid searches + LLM
+    }.items()
+}
+
+_ALL_OUTPUT_FIELDS = {field for fields in CHECK_OUTPUT_FIELDS.values() for field in fields}
+
+_store: Optional[SharedCache] = None
+_code_version: Optional[str] = None
+_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = {
+    name: {"reused": 0, "ran": 0, "stored": 0, "not_stored": 0} for name in CHECK_INPUT_FIELDS
+}
+_warned_undeclared = set()
+
+
+def get_evidence_store() -> SharedCache:
+    """Process-wide evidence SharedCache (opened lazily)."""
+    global _store
+    if _store is None:
+        _store = SharedCache(path=CHECK_EVIDENCE_PATH if CHECK_EVIDENCE_ENABLED else "",
+                             max_entries=CHECK_EVIDENCE_MAX_ENTRIES, max_bytes=CHECK_EVIDENCE_MAX_BYTES)
+    return _store
+
+
+def code_version() -> str:
+    """Digest of the automated_checks sources: any change to a check invalidates its evidence."""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256(CHECK_EVIDENCE_VERSION.encode())
+        package = Path(__file__).parent / "automated_checks"
+        for path in sorted(glob.glob(str(package / "*.py"))):
+            with open(path, "rb") as f:
+                digest.update(os.path.basename(path).encode() + b"\0" + f.read())
+        _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+
+def _encode(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def input_fingerprint(check_name: str, lead: dict) -> str:
+    """Content address of everything a check's outcome depends on."""
+    fields = tuple(CHECK_INPUT_FIELDS[check_name]) + tuple(CHECK_OUTPUT_FIELDS[check_name])
+    present = [[field, lead[field]] for field in dict.fromkeys(fields) if field in lead]
+    parts = [check_name, code_version(), present]
+    if check_name in DATE_KEYED_CHECKS:
+        parts.append(datetime.utcnow().date().isoformat())
+    return hashlib.sha256(_encode(parts).encode()).hexdigest()
+
+
+def _count(check_name: str, counter: str):
+    with _lock:
+        _stats[check_name][counter] += 1
+
+
+def _apply(entry: Dict[str, Any], lead: dict):
+    for field, value in entry["fields"].items():
+        lead[field] = value
+    for field in entry["removed"]:
+        lead.pop(field, None)
+
+
+def _build_entry(check_name: str, result: Any, before: Dict[str, str], lead: dict) -> Optional[Dict[str, Any]]:
+    """The evidence for a completed run, or None when it must not be reused."""
+    if not (isinstance(result, tuple) and len(result) == 2 and result[0] is True):
+        return None  # Only passing (bool, dict) results are stored
+    after = {field: _encode(value) for field, value in lead.items()}
+    changed = {field for field in after if before.get(field) != after[field]} | (set(before) - set(after))
+    undeclared = changed - _ALL_OUTPUT_FIELDS
+    if undeclared:
+        if check_name not in _warned_undeclared:
+            _warned_undeclared.add(check_name)
+            print(f"⚠️ Check evidence: {check_name} wrote undeclared lead fields {sorted(undeclared)} - not stored")
+        return None
+    outputs = CHECK_OUTPUT_FIELDS[check_name]
+    entry = {
+        "result": [result[0], result[1]],
+        # Lead order, so reuse inserts new keys in the order the check did
+        "fields": {field: value for field, value in lead.items() if field in changed and field in outputs},
+        "removed": [field for field in outputs if field in changed and field not in lead],
+    }
+    # Reuse must reproduce the run exactly: no tuples, datetimes or other non-JSON values
+    try:
+        if json.loads(json.dumps(entry)) != entry:
+            return None
+    except (TypeError, ValueError):
+        return None
+    return entry
+
+
+async def run_with_evidence(check_func: Callable[[dict], Awaitable[Any]], lead: dict,
+                            runner: Optional[Callable[[Callable, dict], Awaitable[Any]]] = None) -> Any:
+    """
+    Run check_func(lead) (through runner(check_func, lead) if given, e.g. run_domain_check),
+    or reproduce it from stored evidence when its inputs are unchanged.
+    """
+    check_name = check_func.__name__
+    if not CHECK_EVIDENCE_ENABLED or check_name not in CHECK_INPUT_FIELDS:
+        return await (runner(check_func, lead) if runner else check_func(lead))
+
+    # SQLite runs in a thread: a locked database waits up to busy_timeout, not on the event loop
+    store = get_evidence_store()
+    key = f"{check_name}:{input_fingerprint(check_name, lead)}"
+    entry = await asyncio.to_thread(store.get, EVIDENCE_NAMESPACE, key)
+    if entry is not None:
+        _apply(entry, lead)
+        _count(check_name, "reused")
+        record_cache("checks", check_name, hit=True)
+        return entry["result"][0], entry["result"][1]
+
+    before = {field: _encode(value) for field, value in lead.items()}
+    result = await (runner(check_func, lead) if runner else check_func(lead))
+    _count(check_name, "ran")
+    record_cache("checks", check_name, hit=False)
+    entry = _build_entry(check_name, result, before, lead)
+    if entry is None:
+        _count(check_name, "not_stored")
+    else:
+        # Stored copies must not share objects with the lead (later checks mutate it)
+        await asyncio.to_thread(store.set, EVIDENCE_NAMESPACE, key, copy.deepcopy(entry),
+                                ttl_hours=CHECK_EVIDENCE_TTL_HOURS[check_name])
+        _count(check_name, "stored")
+    return result
+
+
+# ════════════════════════════════════════════════════════════════════
+# Reporting
+# ════════════════════════════════════════════════════════════════════
+def get_check_evidence_stats(since: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Evidence counters for this process (minus a previous snapshot, if given).
+
+    Returns:
+        {"checks": {name: {"reused", "ran", "stored", "not_stored"}}, "reused", "ran", "skipped_fraction"}
+    """
+    with _lock:
+        checks = {name: dict(counters) for name, counters in _stats.items()}
+    if since:
+        for name, counters in checks.items():
+            for counter in counters:
+                counters[counter] -= since.get("checks", {}).get(name, {}).get(counter, 0)
+    reused = sum(c["reused"] for c in checks.values())
+    ran = sum(c["ran"] for c in checks.values())
+    return {
+        "checks": checks,
+        "reused": reused,
+        "ran": ran,
+        "skipped_fraction": round(reused / (reused + ran), 3) if reused + ran else 0.0,
+        "enabled": CHECK_EVIDENCE_ENABLED,
+    }
+
+
+def log_check_evidence_stats(since: Optional[Dict[str, Any]] = None):
+    """Print the fraction of fingerprinted checks answered from evidence (for one batch with `since`)."""
+    report = get_check_evidence_stats(since)
+    if not report["reused"] + report["ran"]:
+        return
+    print(f"   ♻️ Check evidence: {report['reused']} of {report['reused'] + report['ran']} checks "
+          f"skipped ({report['skipped_fraction']:.0%}) - inputs unchanged since a previous run")
+    for name, counters in report["checks"].items():
+        if counters["reused"]:
+            print(f"      {name}: {counters['reused']} reused / {counters['ran']} run")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check evidence store for incremental re-validation")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("stats", help="Stored evidence entries and size")
+    fingerprint = subparsers.add_parser("fingerprint", help="Show each check's input fingerprint for leads")
+    fingerprint.add_argument("--leads", required=True, help="JSON lead or list of leads (lead_blob accepted)")
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        summary = get_evidence_store().summary()
+        entry = summary["namespaces"].get(EVIDENCE_NAMESPACE, {"entries": 0, "bytes": 0})
+        print(f"♻️ {CHECK_EVIDENCE_PATH}: {entry['entries']} evidence entries, "
+              f"{entry['bytes'] / 1024 / 1024:.1f} MB, code version {code_version()}")
+    elif args.command == "fingerprint":
+        with open(args.leads) as f:
+            data = json.load(f)
+        for lead in data if isinstance(data, list) else [data]:
+            lead = lead.get("lead_blob", lead)
+            print(f"{lead.get('email', '?')}:")
+            store = get_evidence_store()
+            for name in CHECK_INPUT_FIELDS:
+                key = f"{name}:{input_fingerprint(name, lead)}"
+                stored = "stored" if store.get(EVIDENCE_NAMESPACE, key) is not None else "-"
+                print(f"   {name:<22} {key.split(':', 1)[1][:16]}  {stored}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+Cost-aware ordering of the free Stage 0 checks, used to screen TrueList submissions.
+
+The coordinator submitted every lead's email to TrueList (paid per email)
+while the workers were still running Stage 0-2, so leads that were always
+going to be rejected by a free, local Stage 0 check (bad regex, free or
+disposable domain, general-purpose inbox, ...) still paid for Stage 3.
+
+Verdicts are part of consensus, so the canonical check order (and therefore
+the reported rejection reason) cannot change: when a canonically later check
+fails, every earlier one still has to run to find the first failure, so
+reordering a single lead's checks can only add work. What reordering can do
+is answer "does this lead fail *some* check before Stage 3?" as cheaply as
+possible, and that answer is all the coordinator needs to skip a TrueList
+lookup:
+
+- history:   per-check latency and fail rate from the last few epochs'
+             pipeline_metrics reports (validator_weights/container_*_epoch_*_metrics.json)
+- ordering:  the screen runs checks in ascending cost / P(fail) order,
+             stopping at the first failure (any failure means the canonical
+             run rejects the lead at that check or an earlier one)
+- screening: an email is skipped only when every lead using it fails the
+             screen; those leads are rejected in Stage 0 by the workers with
+             the same reason as before and never look up an email result
+- savings:   expected (from history, before the batch) and observed TrueList
+             dollars and screen milliseconds, logged with the TrueList summary
+             and served on /status
+
+Only deterministic checks that need nothing but the lead itself are screened:
+source provenance (WHOIS + HEAD) and the Stage 1/2 network checks are left to
+the workers. CHECK_SCHEDULER=false submits every email, as before.
+"""
+
+import glob
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from validator_models.pipeline_metrics import FAIL, PIPELINE_METRICS_DIR
+
+CHECK_SCHEDULER = os.getenv("CHECK_SCHEDULER", "true").lower() == "true"
+CHECK_SCHEDULER_HISTORY_EPOCHS = int(os.getenv("CHECK_SCHEDULER_HISTORY_EPOCHS", "3"))
+# Approximate price of one TrueList email verification (USD)
+TRUELIST_COST_PER_EMAIL = float(os.getenv("TRUELIST_COST_PER_EMAIL", "0.002"))
+
+# Used until a check has history: an "instant" local check, and a Laplace prior on failures
+DEFAULT_CHECK_MS = 0.5
+
+_REPORT_RE = re.compile(r"container_(\d+)_epoch_(\d+)_metrics\.json$")
+
+_lock = threading.Lock()
+_last_screen: Dict[str, Any] = {}  # Most recent screen (one per epoch on the coordinator)
+_totals = {"screens": 0, "emails_skipped": 0}
+
+
+# ════════════════════════════════════════════════════════════════════
+# History and ordering
+# ════════════════════════════════════════════════════════════════════
+def load_check_history(directory: Optional[str] = None,
+                       epochs: int = CHECK_SCHEDULER_HISTORY_EPOCHS) -> Dict[str, Dict[str, float]]:
+    """
+    Aggregate the "checks" group of the most recent `epochs` epoch reports (all containers).
+
+    Returns:
+        {check_name: {"calls", "fails", "avg_ms", "fail_rate"}}
+    """
+    reports = []
+    for path in glob.glob(os.path.join(directory or PIPELINE_METRICS_DIR, "container_*_epoch_*_metrics.json")):
+        match = _REPORT_RE.search(path)
+        if match:
+            reports.append((int(match.group(2)), path))
+    recent = sorted({epoch for epoch, _ in reports})[-epochs:] if epochs > 0 else []
+
+    totals: Dict[str, Dict[str, float]] = {}
+    for epoch, path in reports:
+        if epoch not in recent:
+            continue
+        try:
+            with open(path) as f:
+                checks = json.load(f).get("checks", {})
+        except (OSError, ValueError):
+            continue
+        for name, entry in checks.items():
+            total = totals.setdefault(name, {"calls": 0, "fails": 0, "total_ms": 0.0})
+            total["calls"] += entry.get("count", 0)
+            total["fails"] += entry.get("outcomes", {}).get(FAIL, 0)
+            total["total_ms"] += entry.get("total_ms", 0.0)
+
+    history = {}
+    for name, total in totals.items():
+        calls = total["calls"]
+        history[name] = {
+            "calls": calls,
+            "fails": total["fails"],
+            "avg_ms": total["total_ms"] / calls if calls else DEFAULT_CHECK_MS,
+            # Laplace-smoothed so a check with little history is neither "never" nor "always" failing
+            "fail_rate": (total["fails"] + 1) / (calls + 2),
+        }
+    return history
+
+
+def _cost(name: str, history: Dict[str, Dict[str, float]]) -> Tuple[float, float]:
+    entry = history.get(name)
+    if entry is None:
+        return DEFAULT_CHECK_MS, 0.5
+    return max(entry["avg_ms"], 0.001), entry["fail_rate"]
+
+
+def plan_order(names: Sequence[str], history: Dict[str, Dict[str, float]]) -> List[str]:
+    """
+    Order independent checks to minimize the expected cost of finding the first failure.
+
+    Ascending cost / P(fail) is optimal for independent checks (each check's
+    cost is paid only if all checks before it passed). Ties keep the canonical order.
+    """
+    def ratio(name: str) -> float:
+        cost_ms, fail_rate = _cost(name, history)
+        return cost_ms / fail_rate
+
+    return sorted(names, key=lambda name: (ratio(name), list(names).index(name)))
+
+
+def expected_cost(order: Sequence[str], history: Dict[str, Dict[str, float]]) -> Tuple[float, float]:
+    """(expected ms until the first failure or the end, P(at least one check fails)) for this order."""
+    total_ms = 0.0
+    p_all_pass = 1.0
+    for name in order:
+        cost_ms, fail_rate = _cost(name, history)
+        total_ms += p_all_pass * cost_ms
+        p_all_pass *= 1.0 - fail_rate
+    return total_ms, 1.0 - p_all_pass
+
+
+# ════════════════════════════════════════════════════════════════════
+# Screening
+# ════════════════════════════════════════════════════════════════════
+CheckFunc = Callable[[dict], Awaitable[Tuple[bool, dict]]]
+
+
+async def first_failure(lead: dict, checks: Sequence[CheckFunc]) -> Optional[str]:
+    """
+    Run checks in the given order and return the name of the first one that fails.
+
+    Exceptions propagate; screen_truelist_emails() treats them as "keep the
+    email", since the screen must only report leads the canonical run rejects.
+    """
+    for check_func in checks:
+        # Bypass @instrumented_check so screening does not skew the per-check histograms
+        passed, _ = await getattr(check_func, "__wrapped__", check_func)(lead)
+        if not passed:
+            return check_func.__name__
+    return None
+
+
+async def screen_truelist_emails(leads: List[dict], checks: Sequence[CheckFunc],
+                                 get_email: Callable[[dict], Optional[str]]) -> Dict[str, str]:
+    """
+    Emails (lowercase) whose leads all fail one of `checks`, mapped to the first failing check.
+
+    `checks` must be deterministic functions of the lead that run before Stage 3
+    in the canonical order; leads may be flat dicts or {"lead_blob": {...}}.
+    """
+    if not CHECK_SCHEDULER or not leads:
+        return {}
+
+    history = load_check_history()
+    by_name = {check_func.__name__: check_func for check_func in checks}
+    canonical = [check_func.__name__ for check_func in checks]
+    order = plan_order(canonical, history)
+    planned_ms, p_reject = expected_cost(order, history)
+    canonical_ms, _ = expected_cost(canonical, history)
+    ordered_checks = [by_name[name] for name in order]
+
+    rejected_by: Dict[str, Optional[str]] = {}  # email -> failing check (None once any lead passes)
+    screened = 0
+    rejected = 0
+    start = time.perf_counter()
+    for lead in leads:
+        lead_blob = lead.get("lead_blob", lead) if isinstance(lead, dict) else lead
+        email = get_email(lead_blob)
+        if not email or "@" not in email:
+            continue
+        email_lower = email.lower()
+        screened += 1
+        try:
+            failed = await first_failure(dict(lead_blob), ordered_checks)
+        except Exception:
+            failed = None
+        if failed:
+            rejected += 1
+            rejected_by.setdefault(email_lower, failed)
+        else:
+            rejected_by[email_lower] = None
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    skipped = {email: check for email, check in rejected_by.items() if check}
+    by_check: Dict[str, int] = {}
+    for check in skipped.values():
+        by_check[check] = by_check.get(check, 0) + 1
+    with _lock:
+        _totals["screens"] += 1
+        _totals["emails_skipped"] += len(skipped)
+        _last_screen.clear()
+        _last_screen.update({
+            "leads": screened,
+            "leads_rejected": rejected,
+            "emails": len(rejected_by),
+            "emails_skipped": len(skipped),
+            "skipped_by_check": by_check,
+            "expected_emails_skipped": round(p_reject * len(rejected_by), 1),
+            "screen_ms": round(elapsed_ms, 2),
+            "expected_screen_ms": round(planned_ms * screened, 2),
+            "canonical_screen_ms": round(canonical_ms * screened, 2),
+            "order": order,
+            "canonical_order": canonical,
+            "history_checks": sum(1 for name in canonical if name in history),
+        })
+    return skipped
+
+
+# ════════════════════════════════════════════════════════════════════
+# Reporting
+# ════════════════════════════════════════════════════════════════════
+def get_check_scheduler_stats() -> Dict[str, Any]:
+    """
+    The most recent TrueList screen, with expected vs observed savings.
+
+    Returns:
+        {"enabled", "screens", "total_emails_skipped", "total_dollars_saved"} plus, once a
+        screen has run: "leads", "leads_rejected", "emails", "emails_skipped",
+        "skipped_by_check", "expected_emails_skipped", "dollars_saved",
+        "expected_dollars_saved", "screen_ms", "expected_screen_ms",
+        "canonical_screen_ms", "order", "canonical_order", "history_checks"
+    """
+    with _lock:
+        report = dict(_last_screen)
+        totals = dict(_totals)
+    report["enabled"] = CHECK_SCHEDULER
+    report["screens"] = totals["screens"]
+    report["total_emails_skipped"] = totals["emails_skipped"]
+    report["total_dollars_saved"] = round(totals["emails_skipped"] * TRUELIST_COST_PER_EMAIL, 4)
+    if "emails" in report:
+        report["dollars_saved"] = round(report["emails_skipped"] * TRUELIST_COST_PER_EMAIL, 4)
+        report["expected_dollars_saved"] = round(report["expected_emails_skipped"] * TRUELIST_COST_PER_EMAIL, 4)
+    return report
+
+
+def log_check_scheduler_stats():
+    """Print the most recent TrueList screen: skipped emails, savings and check order."""
+    report = get_check_scheduler_stats()
+    if not report.get("leads"):
+        return
+    print(
+        f"   🧮 TrueList screen: {report['emails_skipped']}/{report['emails']} emails skipped "
+        f"({report['leads_rejected']} leads fail Stage 0), ~${report['dollars_saved']:.2f} saved "
+        f"(expected {report['expected_emails_skipped']:.0f} / ~${report['expected_dollars_saved']:.2f})"
+    )
+    print(
+        f"      Order: {' → '.join(report['order'])} - {report['screen_ms']:.1f}ms observed, "
+        f"{report['expected_screen_ms']:.1f}ms expected vs {report['canonical_screen_ms']:.1f}ms "
+        f"in canonical order ({report['history_checks']}/{len(report['canonical_order'])} checks with history)"
+    )
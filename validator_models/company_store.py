@@ -0,0 +1,446 @@
+"""
+Company-identity store: standardized company names and company LinkedIn data, keyed by slug.
+
+get_standardized_company_name / set_standardized_company_name re-read and
+re-parsed the whole company_name_cache.json on every Stage 5 lookup, and the
+setter rewrote the whole file (indent=2), so each lookup cost O(cache size);
+the file also lived in the code tree, so containers never saw each other's
+names. Company LinkedIn profiles sat in a separate per-process TTL cache that
+was lost on restart. Both now live in one store:
+
+- in memory: one record per slug {"name", "linkedin", "linkedin_at"}, loaded
+  once per process; lookups never touch the disk (records are replaced, never
+  mutated, so a lookup only holds the memory lock for a dict access)
+- write-behind: changes apply to memory at once and are appended to a journal
+  in batches by a background thread (COMPANY_STORE_FLUSH_BATCH ops or
+  COMPANY_STORE_FLUSH_SECONDS, and at exit)
+- snapshot + journal under the shared validator_weights/ directory; appends
+  and compaction hold an exclusive flock on a sidecar .lock file, so every
+  container on the host sees one total order of writes (last write wins)
+- other containers' writes are picked up by tailing the journal on a background
+  thread, started by a lookup at most every COMPANY_STORE_REFRESH_SECONDS
+- compaction (journal over COMPANY_STORE_COMPACT_BYTES) writes a new snapshot
+  atomically (tmp file + os.replace), drops LinkedIn data older than
+  COMPANY_STORE_LINKEDIN_RETENTION_HOURS and starts a new journal generation
+- the first load seeds names from the legacy company_name_cache.json
+
+    python -m validator_models.company_store stats
+    python -m validator_models.company_store get 23andme
+    python -m validator_models.company_store compact
+
+Set VALIDATOR_COMPANY_STORE_PATH="" to keep the store in memory only. Like the
+shared cache, persistence is best-effort: I/O errors are reported, the
+in-memory copy keeps serving.
+"""
+
+import argparse
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Non-POSIX dev machines: no cross-process locking
+    fcntl = None
+
+# ════════════════════════════════════════════════════════════════════
+# Configuration
+# ════════════════════════════════════════════════════════════════════
+COMPANY_STORE_PATH = os.getenv(
+    "VALIDATOR_COMPANY_STORE_PATH",
+    str(Path("validator_weights") / "company_identity.json"),
+)
+COMPANY_STORE_FLUSH_SECONDS = float(os.getenv("VALIDATOR_COMPANY_STORE_FLUSH_SECONDS", "2"))
+COMPANY_STORE_FLUSH_BATCH = int(os.getenv("VALIDATOR_COMPANY_STORE_FLUSH_BATCH", "64"))
+COMPANY_STORE_REFRESH_SECONDS = float(os.getenv("VALIDATOR_COMPANY_STORE_REFRESH_SECONDS", "5"))
+COMPANY_STORE_COMPACT_BYTES = int(os.getenv("VALIDATOR_COMPANY_STORE_COMPACT_BYTES", str(8 * 1024 * 1024)))
+COMPANY_STORE_LINKEDIN_RETENTION_HOURS = float(os.getenv("VALIDATOR_COMPANY_STORE_LINKEDIN_RETENTION_HOURS", "24"))
+
+# Names written by the previous file-backed cache (imported on first load)
+LEGACY_COMPANY_NAME_CACHE_FILE = str(Path(__file__).parent / "company_name_cache.json")
+
+_SNAPSHOT_FORMAT = 1
+
+
+def normalize_slug(company_slug: str) -> str:
+    return (company_slug or "").lower().strip()
+
+
+class CompanyStore:
+    """In-memory company records with a journaled, host-shared copy on disk. Thread-safe."""
+
+    def __init__(self, path: str = COMPANY_STORE_PATH,
+                 legacy_names_path: Optional[str] = LEGACY_COMPANY_NAME_CACHE_FILE):
+        self.path = path
+        self.journal_path = f"{path}.journal" if path else ""
+        self.lock_path = f"{path}.lock" if path else ""
+        self.legacy_names_path = legacy_names_path
+        self._companies: Dict[str, Dict[str, Any]] = {}
+        self._pending: List[Dict[str, Any]] = []
+        self._flushing: List[Dict[str, Any]] = []   # Taken by a flush, not yet in the journal
+        # _io_lock serializes disk work (flushes, refreshes); _lock only guards memory and is
+        # never held across I/O. Order: _io_lock, then _lock.
+        self._io_lock = threading.RLock()
+        self._lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._refreshing = False
+        self._generation = 0
+        self._journal_pos = 0
+        self._last_refresh = 0.0
+        self.stats = {
+            "name_hits": 0, "name_misses": 0, "linkedin_hits": 0, "linkedin_misses": 0,
+            "writes": 0, "flushes": 0, "flushed_ops": 0, "refreshes": 0, "reloads": 0,
+            "compactions": 0, "errors": 0,
+        }
+        if self.path:
+            try:
+                self._load()
+            except Exception as e:
+                self.stats["errors"] += 1
+                print(f"⚠️ Company store unavailable at {self.path} ({e}) - keeping it in memory")
+                self.path = self.journal_path = self.lock_path = ""
+        elif legacy_names_path:
+            self._seed_legacy_names()
+
+    # ── Disk ──────────────────────────────────────────────────────────
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.lock_path, "a") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _apply(companies: Dict[str, Dict[str, Any]], op: Dict[str, Any]) -> None:
+        # A new record per write: records handed out by get() (or being snapshotted) never change
+        record = dict(companies.get(op["slug"], {}))
+        for field in ("name", "linkedin", "linkedin_at"):
+            if field in op:
+                record[field] = op[field]
+        companies[op["slug"]] = record
+
+    def _apply_local(self, companies: Dict[str, Dict[str, Any]]) -> None:
+        """Re-apply this process's unflushed writes on top (they still win locally; _lock held)."""
+        for op in self._flushing + self._pending:
+            self._apply(companies, op)
+
+    def _read_journal(self, start: int) -> List[Dict[str, Any]]:
+        """Complete journal ops from `start`; a torn last line is left for the next read."""
+        ops = []
+        with open(self.journal_path, "rb") as f:
+            if start == 0:
+                header = json.loads(f.readline())
+                self._generation = header["generation"]
+            else:
+                f.seek(start)
+            pos = f.tell()
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    op = json.loads(line)
+                    op["slug"]
+                    ops.append(op)
+                except (ValueError, KeyError, TypeError):
+                    pass  # Skip a corrupt line rather than the rest of the journal
+                pos += len(line)
+            self._journal_pos = pos
+        return ops
+
+    def _journal_header(self) -> Optional[int]:
+        try:
+            with open(self.journal_path, "rb") as f:
+                return json.loads(f.readline())["generation"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _reload_locked(self) -> None:
+        companies = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                companies = json.load(f).get("companies", {})
+        except FileNotFoundError:
+            pass
+        if os.path.exists(self.journal_path):
+            for op in self._read_journal(0):
+                self._apply(companies, op)
+        with self._lock:
+            self._apply_local(companies)
+            self._companies = companies
+        self.stats["reloads"] += 1
+
+    def _refresh_locked(self) -> None:
+        """Catch up with other processes' writes (full reload after a compaction)."""
+        generation = self._journal_header()
+        try:
+            size = os.path.getsize(self.journal_path)
+        except OSError:
+            size = 0
+        if generation != self._generation or size < self._journal_pos:
+            self._reload_locked()
+        elif size > self._journal_pos:
+            ops = self._read_journal(self._journal_pos)
+            with self._lock:
+                for op in ops:
+                    self._apply(self._companies, op)
+                self._apply_local(self._companies)
+        self._last_refresh = time.time()
+        self.stats["refreshes"] += 1
+
+    def _load(self) -> None:
+        with self._file_lock(exclusive=False):
+            initialized = os.path.exists(self.path) or os.path.exists(self.journal_path)
+            if initialized:
+                self._reload_locked()
+        if not initialized:
+            with self._file_lock(exclusive=True):
+                if os.path.exists(self.path) or os.path.exists(self.journal_path):
+                    self._reload_locked()  # Another container initialized it meanwhile
+                else:
+                    self._seed_legacy_names()
+                    self._compact_locked()
+        self._last_refresh = time.time()
+
+    def _seed_legacy_names(self) -> None:
+        if not self.legacy_names_path or not os.path.exists(self.legacy_names_path):
+            return
+        try:
+            with open(self.legacy_names_path, "r") as f:
+                names = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading legacy company name cache: {e}")
+            return
+        for slug, name in names.items():
+            self._apply(self._companies, {"slug": normalize_slug(slug), "name": name})
+        print(f"🏢 Company store: imported {len(names)} names from {self.legacy_names_path}")
+
+    def _atomic_write(self, path: str, data: bytes) -> None:
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _compact_locked(self) -> None:
+        """Write everything to a new snapshot and start an empty journal (exclusive lock held)."""
+        cutoff = time.time() - COMPANY_STORE_LINKEDIN_RETENTION_HOURS * 3600
+        with self._lock:
+            companies = dict(self._companies)
+        for slug, record in list(companies.items()):
+            if record.get("linkedin_at", cutoff) < cutoff:
+                record = {field: value for field, value in record.items() if field not in ("linkedin", "linkedin_at")}
+                companies[slug] = record
+            if not record:
+                del companies[slug]
+        generation = self._generation + 1
+        snapshot = {"format": _SNAPSHOT_FORMAT, "generation": generation,
+                    "compacted_at": time.time(), "companies": companies}
+        # Snapshot first: a crash before the journal is replaced only replays ops already in it
+        self._atomic_write(self.path, json.dumps(snapshot, separators=(",", ":"), default=str).encode())
+        header = (json.dumps({"generation": generation}) + "\n").encode()
+        self._atomic_write(self.journal_path, header)
+        self._generation = generation
+        self._journal_pos = len(header)
+        with self._lock:
+            self._apply_local(companies)
+            self._companies = companies
+        self.stats["compactions"] += 1
+
+    def flush(self) -> None:
+        """Append pending writes to the journal (and compact it when it has grown too large)."""
+        with self._io_lock:
+            with self._lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if not self._pending or not self.path:
+                    self._pending = []
+                    return
+                ops, self._pending = self._pending, []
+                self._flushing = ops
+            try:
+                with self._file_lock(exclusive=True):
+                    # Other writers' entries first, ours on top - as the journal will order them
+                    self._refresh_locked()
+                    if not os.path.exists(self.journal_path):
+                        self._compact_locked()
+                    data = b"".join(json.dumps(op, separators=(",", ":"), default=str).encode() + b"\n" for op in ops)
+                    with open(self.journal_path, "ab") as f:
+                        f.write(data)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    self._journal_pos += len(data)
+                    self.stats["flushes"] += 1
+                    self.stats["flushed_ops"] += len(ops)
+                    with self._lock:
+                        self._flushing = []
+                    if self._journal_pos >= COMPANY_STORE_COMPACT_BYTES:
+                        self._compact_locked()
+            except Exception as e:
+                # Keep the writes in memory and retry with the next flush
+                with self._lock:
+                    if self._flushing:
+                        self._pending = ops + self._pending
+                        self._flushing = []
+                self.stats["errors"] += 1
+                print(f"⚠️ Company store flush failed: {e}")
+
+    def refresh(self) -> None:
+        """Catch up with other processes' writes."""
+        with self._io_lock:
+            try:
+                with self._file_lock(exclusive=False):
+                    self._refresh_locked()
+            except Exception as e:
+                self._last_refresh = time.time()
+                self.stats["errors"] += 1
+                print(f"⚠️ Company store refresh failed: {e}")
+
+    def compact(self) -> None:
+        with self._io_lock:
+            self.flush()
+            if self.path:
+                with self._file_lock(exclusive=True):
+                    self._refresh_locked()
+                    self._compact_locked()
+
+    # ── Background I/O ────────────────────────────────────────────────
+    def _schedule_flush(self, delay: float) -> None:
+        """Flush on a timer thread after `delay` seconds (_lock held)."""
+        if self._flush_timer is not None:
+            if delay > 0 or self._flush_timer.interval == 0:
+                return
+            self._flush_timer.cancel()   # A full batch: flush now instead of at the timer
+        self._flush_timer = threading.Timer(delay, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        finally:
+            self._refreshing = False
+
+    # ── Records ───────────────────────────────────────────────────────
+    def _maybe_refresh(self) -> None:
+        """Start a background refresh when one is due; the caller keeps reading memory."""
+        if not self.path or time.time() - self._last_refresh < COMPANY_STORE_REFRESH_SECONDS:
+            return
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, name="company-store-refresh", daemon=True).start()
+
+    def _write(self, op: Dict[str, Any]) -> None:
+        with self._lock:
+            self._apply(self._companies, op)
+            self.stats["writes"] += 1
+            if not self.path:
+                return
+            self._pending.append(op)
+            self._schedule_flush(0 if len(self._pending) >= COMPANY_STORE_FLUSH_BATCH else COMPANY_STORE_FLUSH_SECONDS)
+
+    def get(self, company_slug: str) -> Optional[Dict[str, Any]]:
+        self._maybe_refresh()
+        with self._lock:
+            return self._companies.get(normalize_slug(company_slug))
+
+    def get_name(self, company_slug: str) -> Optional[str]:
+        record = self.get(company_slug)
+        name = record.get("name") if record else None
+        self.stats["name_hits" if name else "name_misses"] += 1
+        return name
+
+    def set_name(self, company_slug: str, standardized_name: str) -> None:
+        self._write({"slug": normalize_slug(company_slug), "name": standardized_name})
+
+    def names(self) -> Dict[str, str]:
+        self._maybe_refresh()
+        with self._lock:
+            return {slug: record["name"] for slug, record in self._companies.items() if record.get("name")}
+
+    def get_linkedin(self, company_slug: str, max_age_seconds: float) -> Optional[Dict]:
+        record = self.get(company_slug)
+        data = None
+        if record and record.get("linkedin") is not None and time.time() - record.get("linkedin_at", 0) < max_age_seconds:
+            data = record["linkedin"]
+        self.stats["linkedin_hits" if data is not None else "linkedin_misses"] += 1
+        return data
+
+    def set_linkedin(self, company_slug: str, data: Dict) -> None:
+        self._write({"slug": normalize_slug(company_slug), "linkedin": data, "linkedin_at": time.time()})
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "companies": len(self._companies),
+                "names": sum(1 for record in self._companies.values() if record.get("name")),
+                "linkedin_profiles": sum(1 for record in self._companies.values() if record.get("linkedin") is not None),
+                "pending": len(self._pending),
+                "generation": self._generation,
+                "journal_bytes": self._journal_pos,
+                "path": self.path or None,
+            }
+
+
+_company_store: Optional[CompanyStore] = None
+_company_store_lock = threading.Lock()
+
+
+def get_company_store() -> CompanyStore:
+    """Process-wide store; loaded on first use and flushed at exit."""
+    global _company_store
+    if _company_store is None:
+        with _company_store_lock:
+            if _company_store is None:
+                _company_store = CompanyStore()
+                atexit.register(_company_store.flush)
+    return _company_store
+
+
+def get_company_store_stats() -> Dict[str, Any]:
+    """Store counters for /status (empty until the store is first used)."""
+    return _company_store.get_stats() if _company_store is not None else {}
+
+
+# ════════════════════════════════════════════════════════════════════
+# CLI
+# ════════════════════════════════════════════════════════════════════
+def main():
+    parser = argparse.ArgumentParser(description="Company-identity store")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("stats", help="Record counts and journal size")
+    get_parser = subparsers.add_parser("get", help="Show the records of company slugs")
+    get_parser.add_argument("slugs", nargs="+")
+    subparsers.add_parser("compact", help="Fold the journal into a new snapshot")
+    args = parser.parse_args()
+
+    store = get_company_store()
+    if args.command == "stats":
+        print(json.dumps(store.get_stats(), indent=2))
+    elif args.command == "get":
+        for slug in args.slugs:
+            print(f"{normalize_slug(slug)}: {json.dumps(store.get(slug), indent=2, default=str)}")
+    elif args.command == "compact":
+        before = store.get_stats()["journal_bytes"]
+        store.compact()
+        stats = store.get_stats()
+        print(f"🏢 Compacted {store.path}: journal {before} → {stats['journal_bytes']} bytes, "
+              f"{stats['companies']} companies, generation {stats['generation']}")
+
+
+if __name__ == "__main__":
+    main()
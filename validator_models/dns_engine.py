@@ -0,0 +1,285 @@
+"""
+Async DNS engine for validator automated checks.
+
+Replaces the blocking dns.resolver.resolve() calls that check_mx_record,
+check_spf_dmarc and check_dnsbl used to push into the default thread-pool
+executor. Queries run on dns.asyncresolver, so MX, TXT, _dmarc TXT and DNSBL A
+lookups for a lead run concurrently without occupying executor threads.
+
+- Positive answers are cached until the record TTL expires (Answer.expiration).
+- Negative answers (NXDOMAIN / NoAnswer) live in a separate cache, keyed the
+  same way, with the SOA negative TTL (falling back to DNS_NEGATIVE_TTL).
+- Timeouts and other transient errors are never cached.
+- Identical queries already in flight on the same event loop are coalesced.
+
+resolve() returns the same dns.resolver.Answer or raises the same dnspython
+exception the synchronous resolver would, so callers keep their exact
+except-branches and messages (results are identical to the old checks).
+
+Batch API: prefetch_leads_dns(leads) resolves every domain of an epoch in one
+pass so the per-lead checks read from cache.
+
+DNS_NAMESERVER="host[:port]" replaces the system resolvers (replay_bench points
+it at its stand-in DNS server).
+"""
+
+import asyncio
+import copy
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import dns.asyncresolver
+import dns.resolver
+
+# ════════════════════════════════════════════════════════════════════
+# Configuration
+# ════════════════════════════════════════════════════════════════════
+DNS_MAX_TTL = int(os.getenv("DNS_MAX_TTL", "3600"))                 # Cap for positive answers (seconds)
+DNS_NEGATIVE_TTL = int(os.getenv("DNS_NEGATIVE_TTL", "300"))        # Fallback TTL for NXDOMAIN/NoAnswer
+DNS_MAX_NEGATIVE_TTL = int(os.getenv("DNS_MAX_NEGATIVE_TTL", "900"))
+DNS_CACHE_MAX_ENTRIES = int(os.getenv("DNS_CACHE_MAX_ENTRIES", "20000"))
+DNS_BATCH_CONCURRENCY = int(os.getenv("DNS_BATCH_CONCURRENCY", "50"))
+DNS_NAMESERVER = os.getenv("DNS_NAMESERVER", "")
+
+DNSBL_ZONE = "dbl.cloudflare.com"
+
+# (qname, rdtype) -> (expires_at, Answer)
+_positive_cache: Dict[Tuple[str, str], Tuple[float, dns.resolver.Answer]] = {}
+# (qname, rdtype) -> (expires_at, NXDOMAIN | NoAnswer)
+_negative_cache: Dict[Tuple[str, str], Tuple[float, Exception]] = {}
+# (loop id, qname, rdtype) -> Future shared by coalesced callers
+_inflight: Dict[Tuple[int, str, str], asyncio.Future] = {}
+
+_resolver: Optional[dns.asyncresolver.Resolver] = None
+
+_stats = {
+    "queries": 0,
+    "positive_hits": 0,
+    "negative_hits": 0,
+    "coalesced": 0,
+    "misses": 0,
+    "errors": 0,
+}
+
+
+def _get_resolver() -> dns.asyncresolver.Resolver:
+    global _resolver
+    if _resolver is None:
+        if DNS_NAMESERVER:
+            host, _, port = DNS_NAMESERVER.partition(":")
+            _resolver = dns.asyncresolver.Resolver(configure=False)
+            _resolver.nameservers = [host]
+            _resolver.port = int(port or 53)
+        else:
+            _resolver = dns.asyncresolver.Resolver()
+    return _resolver
+
+
+def _negative_ttl(exc: Exception) -> float:
+    """Negative-caching TTL from the SOA in the response (RFC 2308), if present."""
+    try:
+        if isinstance(exc, dns.resolver.NXDOMAIN):
+            responses = list(exc.responses().values())
+        else:
+            responses = [exc.kwargs.get("response")]
+        ttls = [r.resolve_chaining().minimum_ttl for r in responses if r is not None]
+        if ttls:
+            return min(min(ttls), DNS_MAX_NEGATIVE_TTL)
+    except Exception:
+        pass
+    return DNS_NEGATIVE_TTL
+
+
+def _evict_if_full(cache: dict):
+    if len(cache) < DNS_CACHE_MAX_ENTRIES:
+        return
+    now = time.time()
+    for key in [k for k, (expires, _) in cache.items() if expires <= now]:
+        del cache[key]
+    # Still full: drop the oldest insertions
+    while len(cache) >= DNS_CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+
+
+def _cached(key: Tuple[str, str]):
+    """Return (hit, answer_or_exception) for a cache key."""
+    now = time.time()
+    entry = _positive_cache.get(key)
+    if entry is not None:
+        if entry[0] > now:
+            _stats["positive_hits"] += 1
+            return True, entry[1]
+        del _positive_cache[key]
+    entry = _negative_cache.get(key)
+    if entry is not None:
+        if entry[0] > now:
+            _stats["negative_hits"] += 1
+            return True, entry[1]
+        del _negative_cache[key]
+    return False, None
+
+
+async def _query(key: Tuple[str, str]):
+    """Run one real query and cache the outcome. Returns Answer or exception."""
+    qname, rdtype = key
+    _stats["misses"] += 1
+    try:
+        answer = await _get_resolver().resolve(qname, rdtype)
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+        _evict_if_full(_negative_cache)
+        _negative_cache[key] = (time.time() + _negative_ttl(e), e)
+        return e
+    except Exception as e:
+        # Timeouts / SERVFAIL / no nameservers: transient, never cached
+        _stats["errors"] += 1
+        return e
+    _evict_if_full(_positive_cache)
+    _positive_cache[key] = (min(answer.expiration, time.time() + DNS_MAX_TTL), answer)
+    return answer
+
+
+def _fresh_exception(exc: Exception) -> Exception:
+    """
+    Copy of a cached/shared exception with no traceback attached.
+
+    Negative-cache entries and coalesced futures hand the same instance to
+    every caller; raising it directly would chain each raise site onto one
+    shared __traceback__ for the life of the cache entry.
+    """
+    try:
+        fresh = copy.copy(exc)
+    except Exception:
+        # Exception types whose __init__ cannot be replayed from args
+        fresh = type(exc).__new__(type(exc))
+        fresh.args = exc.args
+        fresh.__dict__.update(exc.__dict__)
+    return fresh.with_traceback(None)
+
+
+async def _resolve_outcome(qname: str, rdtype: str):
+    """Answer or exception for a query, using cache and in-flight coalescing."""
+    outcome = await _resolve_shared(qname, rdtype)
+    if isinstance(outcome, Exception):
+        return _fresh_exception(outcome)
+    return outcome
+
+
+async def _resolve_shared(qname: str, rdtype: str):
+    """Cached or coalesced outcome; exception instances may be shared between callers."""
+    # Key on the name exactly as given so cached exception messages match the caller's query
+    key = (qname, rdtype.upper())
+    _stats["queries"] += 1
+
+    hit, outcome = _cached(key)
+    if hit:
+        return outcome
+
+    loop = asyncio.get_running_loop()
+    inflight_key = (id(loop), key[0], key[1])
+    future = _inflight.get(inflight_key)
+    if future is not None and not future.done():
+        _stats["coalesced"] += 1
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            # The task that owned the query was cancelled - run it ourselves
+            return await _query(key)
+
+    future = loop.create_future()
+    _inflight[inflight_key] = future
+    try:
+        outcome = await _query(key)
+        future.set_result(outcome)
+        return outcome
+    except BaseException:
+        # Cancelled mid-query: waiters notice and query for themselves
+        future.cancel()
+        raise
+    finally:
+        if _inflight.get(inflight_key) is future:
+            del _inflight[inflight_key]
+
+
+async def resolve(qname: str, rdtype: str) -> dns.resolver.Answer:
+    """
+    Async drop-in for dns.resolver.resolve(qname, rdtype).
+
+    Returns the dns.resolver.Answer, or raises the same exception
+    (NXDOMAIN, NoAnswer, Timeout, ...) the blocking resolver would raise.
+    """
+    outcome = await _resolve_outcome(qname, rdtype)
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
+
+
+async def resolve_many(queries: List[Tuple[str, str]], concurrency: int = DNS_BATCH_CONCURRENCY) -> Dict[Tuple[str, str], object]:
+    """
+    Resolve many (qname, rdtype) pairs in one pass with bounded concurrency.
+
+    Returns:
+        {(qname, rdtype): Answer | Exception} - never raises for DNS failures.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    unique = list(dict.fromkeys(queries))
+
+    async def _one(query):
+        async with semaphore:
+            return query, await _resolve_outcome(*query)
+
+    results = await asyncio.gather(*[_one(q) for q in unique])
+    return dict(results)
+
+
+def lead_dns_queries(website_domain: str, email_domain: str, email_root_domain: str) -> List[Tuple[str, str]]:
+    """
+    All queries Stage 1-2 will issue for a lead:
+    MX on the website root domain (check_mx_record), SPF TXT and _dmarc TXT on
+    the email domain (check_spf_dmarc), and the DNSBL A record for the email
+    root domain (check_dnsbl).
+    """
+    queries = []
+    if website_domain:
+        queries.append((website_domain, "MX"))
+    if email_domain:
+        queries.append((email_domain, "TXT"))
+        queries.append((f"_dmarc.{email_domain}", "TXT"))
+    if email_root_domain:
+        queries.append((f"{email_root_domain}.{DNSBL_ZONE}", "A"))
+    return queries
+
+
+async def prefetch_leads_dns(lead_domains: List[Tuple[str, str, str]]) -> Dict[str, int]:
+    """
+    Batch-resolve an epoch's domains ahead of the per-lead checks.
+
+    Args:
+        lead_domains: [(website_root_domain, email_domain, email_root_domain), ...]
+
+    Returns:
+        {"queries": n unique queries, "elapsed_ms": ...}
+    """
+    queries = []
+    for domains in lead_domains:
+        queries.extend(lead_dns_queries(*domains))
+    start = time.time()
+    results = await resolve_many(queries)
+    elapsed_ms = int((time.time() - start) * 1000)
+    print(f"   🌐 DNS prefetch: {len(results)} unique queries for {len(lead_domains)} leads in {elapsed_ms}ms")
+    return {"queries": len(results), "elapsed_ms": elapsed_ms}
+
+
+def get_dns_stats() -> Dict[str, int]:
+    """Query/cache counters plus current cache sizes."""
+    stats = dict(_stats)
+    stats["positive_entries"] = len(_positive_cache)
+    stats["negative_entries"] = len(_negative_cache)
+    return stats
+
+
+def clear_dns_cache():
+    _positive_cache.clear()
+    _negative_cache.clear()
@@ -0,0 +1,407 @@
+"""
+Compact domain-intelligence index for the Stage 0 email checks.
+
+check_disposable looked the email domain up in the disposable_email_domains
+blocklist (a ~10k-entry Python set held by every process), while
+check_free_email_domain and check_general_purpose_email each rebuilt their own
+list on every call, and none of them matched subdomains: user@x.mailinator.com
+passed the disposable check that user@mailinator.com failed. DomainIndex
+answers all three Stage 0 domain questions with one lookup:
+
+- disposable: the domain or a parent domain is on the disposable blocklist
+- free:       the domain or a parent domain is a free consumer mail domain
+- role:       the local part is a general-purpose inbox (info@, support@, ...)
+
+The index is a sorted array of reversed-label keys ("com.mailinator") with one
+flag byte per key, plus a sorted array of role local parts. It is written once
+to DOMAIN_INDEX_PATH under the shared validator_weights/ directory and
+memory-mapped read-only, so all containers on a host share one copy in the page
+cache. A parent-domain match is one binary search per label suffix. Lookups
+are memoized per process.
+
+The file rebuilds itself when it is missing, when its format or the free/role
+lists below change, or when the installed disposable_email_domains version
+differs from the one it was built from. `build` regenerates it, optionally
+from the upstream blocklist:
+
+    python -m validator_models.domain_index build
+    python -m validator_models.domain_index build --disposable-url <upstream disposable_email_blocklist.conf>
+    python -m validator_models.domain_index info
+    python -m validator_models.domain_index lookup someone@example.com
+    python -m validator_models.domain_index bench
+
+An index built from a URL or file is kept until `build` runs again. Stage 0
+verdicts are part of consensus, so only pin an upstream list the whole subnet
+ships at the same time.
+"""
+
+import functools
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+DOMAIN_INDEX_PATH = os.getenv(
+    "VALIDATOR_DOMAIN_INDEX_PATH",
+    str(Path("validator_weights") / "domain_index.bin"),
+)
+DOMAIN_INDEX_CACHE_SIZE = int(os.getenv("VALIDATOR_DOMAIN_INDEX_CACHE_SIZE", "50000"))
+
+# Common free email domains (must match calculate-rep-score exactly)
+FREE_EMAIL_DOMAINS = (
+    'gmail.com', 'googlemail.com', 'yahoo.com', 'yahoo.co.uk', 'yahoo.fr',
+    'outlook.com', 'hotmail.com', 'live.com', 'msn.com',
+    'aol.com', 'mail.com', 'protonmail.com', 'proton.me',
+    'icloud.com', 'me.com', 'mac.com',
+    'zoho.com', 'yandex.com', 'gmx.com', 'mail.ru',
+)
+
+# General-purpose inbox local parts (must match calculate-rep-score exactly)
+GENERAL_PURPOSE_LOCAL_PARTS = (
+    'info', 'hello', 'owner', 'ceo', 'founder', 'contact', 'support',
+    'team', 'admin', 'office', 'mail', 'connect', 'help', 'hi',
+    'welcome', 'inquiries', 'general', 'feedback', 'ask', 'outreach',
+    'communications', 'crew', 'staff', 'community', 'reachus', 'talk',
+    'service',
+)
+
+DISPOSABLE = 1
+FREE = 2
+
+_MAGIC = b"LPDI"
+_FORMAT_VERSION = 1
+# magic, format version, lists hash (free + role lists), source label, domain count, local-part count
+_HEADER = struct.Struct("<4sI32s64sII")
+_OFFSET_TYPECODE = "I"  # uint32 offsets into each section's key blob
+
+
+def _lists_hash() -> bytes:
+    """Digest of the in-code lists; a file built from other lists is rebuilt."""
+    payload = "\n".join(sorted(FREE_EMAIL_DOMAINS)) + "\0" + "\n".join(sorted(GENERAL_PURPOSE_LOCAL_PARTS))
+    return hashlib.sha256(payload.encode()).digest()
+
+
+def _reverse_labels(domain: str) -> str:
+    """'mail.example.co.uk' -> 'uk.co.example.mail' (parents sort next to their subdomains)."""
+    return ".".join(reversed(domain.split(".")))
+
+
+def package_source() -> str:
+    """Source label of the installed disposable_email_domains package."""
+    try:
+        from importlib.metadata import version
+        return f"package:disposable-email-domains=={version('disposable-email-domains')}"
+    except Exception:
+        return "package:disposable-email-domains"
+
+
+class DomainVerdict(NamedTuple):
+    domain: str                # lower-case email domain ("" when the email has no "@")
+    disposable: Optional[str]  # blocklist entry the domain matched (itself or a parent), else None
+    free: Optional[str]        # free-mail entry the domain matched (itself or a parent), else None
+    role: Optional[str]        # general-purpose local part ("info"), else None
+
+
+class _SortedKeys:
+    """Sorted byte-string keys stored as offsets + flags + one blob, all views of one buffer."""
+
+    def __init__(self, offsets: memoryview, flags: memoryview, blob: memoryview):
+        self._offsets = offsets
+        self._flags = flags
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._flags)
+
+    def __getitem__(self, i: int) -> bytes:
+        return self._blob[self._offsets[i]:self._offsets[i + 1]].tobytes()
+
+    def flags(self, key: bytes) -> int:
+        i = bisect_left(self, key)
+        if i < len(self._flags) and self[i] == key:
+            return self._flags[i]
+        return 0
+
+
+def _section(keys: List[Tuple[bytes, int]]) -> Tuple[bytes, bytes, bytes]:
+    offsets = array(_OFFSET_TYPECODE, [0])
+    blob = bytearray()
+    for key, _ in keys:
+        blob += key
+        offsets.append(len(blob))
+    return offsets.tobytes(), bytes(flags for _, flags in keys), bytes(blob)
+
+
+def build_index_bytes(disposable: Iterable[str], source: str) -> bytes:
+    """Serialize the index for the given disposable blocklist and the in-code free/role lists."""
+    domains: Dict[bytes, int] = {}
+    for domain in disposable:
+        domain = domain.strip().lower()
+        if domain and not domain.startswith("#"):
+            key = _reverse_labels(domain).encode()
+            domains[key] = domains.get(key, 0) | DISPOSABLE
+    for domain in FREE_EMAIL_DOMAINS:
+        key = _reverse_labels(domain).encode()
+        domains[key] = domains.get(key, 0) | FREE
+    domain_keys = sorted(domains.items())
+    local_keys = sorted((local.encode(), 1) for local in set(GENERAL_PURPOSE_LOCAL_PARTS))
+
+    header = _HEADER.pack(_MAGIC, _FORMAT_VERSION, _lists_hash(), source.encode()[:64],
+                          len(domain_keys), len(local_keys))
+    parts = [header]
+    for keys in (domain_keys, local_keys):
+        offsets, flags, blob = _section(keys)
+        parts += [struct.pack("<I", len(blob)), offsets, flags, blob]
+    return b"".join(parts)
+
+
+class DomainIndex:
+    """Read-only view over a serialized index (an mmap of DOMAIN_INDEX_PATH, or bytes)."""
+
+    def __init__(self, buffer, path: Optional[str] = None):
+        self.path = path
+        self.size = len(buffer)
+        view = memoryview(buffer)
+        magic, fmt, lists_hash, source, domain_count, local_count = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC or fmt != _FORMAT_VERSION:
+            raise ValueError(f"not a domain index (format {fmt})")
+        self.lists_hash = lists_hash
+        self.source = source.rstrip(b"\0").decode()
+        offset = _HEADER.size
+        sections = []
+        for count in (domain_count, local_count):
+            (blob_len,) = struct.unpack_from("<I", view, offset)
+            offset += 4
+            offsets_len = (count + 1) * array(_OFFSET_TYPECODE).itemsize
+            offsets = view[offset:offset + offsets_len].cast(_OFFSET_TYPECODE)
+            offset += offsets_len
+            flags = view[offset:offset + count]
+            offset += count
+            blob = view[offset:offset + blob_len]
+            offset += blob_len
+            sections.append(_SortedKeys(offsets, flags, blob))
+        self._domains, self._locals = sections
+        self._lookup_domain_cached = functools.lru_cache(maxsize=DOMAIN_INDEX_CACHE_SIZE)(self._lookup_domain)
+
+    @property
+    def domain_count(self) -> int:
+        return len(self._domains)
+
+    def _lookup_domain(self, domain: str) -> Tuple[Optional[str], Optional[str]]:
+        disposable = free = None
+        labels = domain.split(".")
+        # Most specific match first: the domain itself, then each parent domain
+        for i in range(len(labels)):
+            suffix = ".".join(labels[i:])
+            flags = self._domains.flags(_reverse_labels(suffix).encode())
+            if flags & DISPOSABLE and disposable is None:
+                disposable = suffix
+            if flags & FREE and free is None:
+                free = suffix
+        return disposable, free
+
+    def lookup_domain(self, domain: str) -> DomainVerdict:
+        domain = (domain or "").lower()
+        disposable, free = self._lookup_domain_cached(domain) if domain else (None, None)
+        return DomainVerdict(domain, disposable, free, None)
+
+    def lookup_email(self, email: str) -> DomainVerdict:
+        """
+        All Stage 0 domain answers for one email.
+
+        The domain is the part after the first "@" (up to a second one, as the
+        checks always split it) and the local part is everything before it.
+        """
+        email_lower = (email or "").lower()
+        if "@" not in email_lower:
+            return DomainVerdict("", None, None, None)
+        local, domain = email_lower.split("@")[:2]
+        disposable, free = self._lookup_domain_cached(domain) if domain else (None, None)
+        role = local if self._locals.flags(local.encode()) else None
+        return DomainVerdict(domain, disposable, free, role)
+
+    def cache_info(self):
+        return self._lookup_domain_cached.cache_info()
+
+
+def _load_package_blocklist() -> Iterable[str]:
+    from disposable_email_domains import blocklist
+    return blocklist
+
+
+def write_index(path: str, disposable: Iterable[str], source: str) -> int:
+    """Build and atomically replace the index at `path`; returns its size in bytes."""
+    data = build_index_bytes(disposable, source)
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)  # Readers keep their mapping of the old file
+    return len(data)
+
+
+def _open_mapped(path: str) -> Optional[DomainIndex]:
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return DomainIndex(mapped, path=path)
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def _is_current(index: DomainIndex) -> bool:
+    if index.lists_hash != _lists_hash():
+        return False
+    # Package builds follow the installed package; URL/file builds stay pinned until rebuilt
+    return not index.source.startswith("package:") or index.source == package_source()[:64]
+
+
+def load_domain_index(path: str = DOMAIN_INDEX_PATH) -> DomainIndex:
+    """
+    Map the host-shared index, (re)building it from the installed blocklist when needed.
+
+    Containers that start together may each rebuild; the writes are atomic and
+    identical, so the last one simply wins. Without a writable path the index
+    is built in memory.
+    """
+    if path:
+        index = _open_mapped(path)
+        if index is not None and _is_current(index):
+            return index
+        try:
+            write_index(path, _load_package_blocklist(), package_source())
+            index = _open_mapped(path)
+            if index is not None:
+                print(f"📇 Domain index built: {index.domain_count} domains → {path}")
+                return index
+        except OSError as e:
+            print(f"⚠️ Domain index not writable at {path} ({e}) - building in memory")
+    return DomainIndex(build_index_bytes(_load_package_blocklist(), package_source()))
+
+
+_domain_index: Optional[DomainIndex] = None
+_domain_index_lock = threading.Lock()
+
+
+def get_domain_index() -> DomainIndex:
+    """Process-wide index; mapped (or built) on first use, not at import."""
+    global _domain_index
+    if _domain_index is None:
+        with _domain_index_lock:
+            if _domain_index is None:
+                _domain_index = load_domain_index()
+    return _domain_index
+
+
+# ════════════════════════════════════════════════════════════════════
+# CLI
+# ════════════════════════════════════════════════════════════════════
+def _read_blocklist(url: Optional[str], file: Optional[str]) -> Tuple[List[str], str]:
+    if url:
+        import urllib.request
+        with urllib.request.urlopen(url, timeout=30) as response:
+            text = response.read().decode("utf-8")
+        digest = hashlib.sha256(text.encode()).hexdigest()[:12]
+        return text.splitlines(), f"url:{digest}:{url.rsplit('/', 1)[-1]}"
+    if file:
+        with open(file, encoding="utf-8") as f:
+            text = f.read()
+        digest = hashlib.sha256(text.encode()).hexdigest()[:12]
+        return text.splitlines(), f"file:{digest}:{os.path.basename(file)}"
+    return sorted(_load_package_blocklist()), package_source()
+
+
+def _legacy_lookup(email: str, blocklist, free_domains, prefixes) -> Tuple[bool, bool, bool]:
+    """Exact-match answers of the checks this index replaced (for bench only)."""
+    email_lower = email.lower()
+    domain = email_lower.split("@")[1] if "@" in email_lower else ""
+    return (domain in blocklist, domain in free_domains,
+            any(email_lower.startswith(prefix) for prefix in prefixes))
+
+
+def run_benchmark(index: DomainIndex) -> None:
+    """Compare the set/list checks with the index; answers for exact domains must be identical."""
+    import random
+
+    blocklist = _load_package_blocklist()
+    free_domains = set(FREE_EMAIL_DOMAINS)
+    prefixes = [f"{local}@" for local in GENERAL_PURPOSE_LOCAL_PARTS]
+    rng = random.Random(0)
+    emails = ([f"jane.doe@{d}" for d in rng.sample(sorted(blocklist), 300)]
+              + [f"info@{d}" for d in FREE_EMAIL_DOMAINS]
+              + [f"j{i}@corp{i % 700}.example.com" for i in range(1500)])
+    rng.shuffle(emails)
+
+    for email in emails:
+        verdict = index.lookup_email(email)
+        answers = (verdict.disposable is not None, verdict.free is not None, verdict.role is not None)
+        assert answers == _legacy_lookup(email, blocklist, free_domains, prefixes), email
+
+    # A fresh index per pass measures the binary searches; the shared one mostly hits its memo
+    unmemoized = DomainIndex(build_index_bytes(blocklist, package_source()))
+    domains = [email.split("@")[1] for email in emails]
+    cases = [
+        ("set + lists", lambda email: _legacy_lookup(email, blocklist, free_domains, prefixes), emails),
+        ("index (binary search)", unmemoized._lookup_domain, domains),
+        ("index (memoized)", index.lookup_email, emails),
+    ]
+    for name, func, inputs in cases:
+        calls = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < 0.5:
+            for value in inputs:
+                func(value)
+            calls += len(inputs)
+        rate = calls / (time.perf_counter() - start)
+        print(f"   {name:22s} {rate:>12,.0f} lookups/s")
+
+    import sys
+    blocklist_bytes = sys.getsizeof(blocklist) + sum(sys.getsizeof(domain) for domain in blocklist)
+    print(f"   memory: blocklist set ~{blocklist_bytes / 1024:.0f} KiB per process, "
+          f"index {index.size / 1024:.0f} KiB shared by every process (mmap)")
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Stage 0 domain-intelligence index")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="Regenerate the index (disposable list from the package, a URL or a file)")
+    source = build_parser.add_mutually_exclusive_group()
+    source.add_argument("--disposable-url", help="Upstream blocklist (one domain per line)")
+    source.add_argument("--disposable-file", help="Local blocklist (one domain per line)")
+    build_parser.add_argument("--out", default=DOMAIN_INDEX_PATH, help="Index path (default: %(default)s)")
+    subparsers.add_parser("info", help="Show the index source and sizes")
+    lookup_parser = subparsers.add_parser("lookup", help="Look up emails or domains")
+    lookup_parser.add_argument("values", nargs="+")
+    subparsers.add_parser("bench", help="Lookups per second and memory vs the set/list checks")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        domains, label = _read_blocklist(args.disposable_url, args.disposable_file)
+        size = write_index(args.out, domains, label)
+        index = _open_mapped(args.out)
+        print(f"📇 Domain index written: {index.domain_count} domains, "
+              f"{len(GENERAL_PURPOSE_LOCAL_PARTS)} role local parts, {size / 1024:.0f} KiB → {args.out} ({label})")
+        return
+
+    index = get_domain_index()
+    if args.command == "info":
+        print(f"📇 {index.path or '(in memory)'}: {index.domain_count} domains, {index.size / 1024:.0f} KiB, "
+              f"source {index.source}, current={_is_current(index)}")
+    elif args.command == "lookup":
+        for value in args.values:
+            verdict = index.lookup_email(value) if "@" in value else index.lookup_domain(value)
+            print(f"   {value}: disposable={verdict.disposable} free={verdict.free} role={verdict.role}")
+    elif args.command == "bench":
+        run_benchmark(index)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Domain-level check planning for batch validation.
+
+Many leads in an epoch share an email or website domain, but the domain-level
+checks (WHOIS age, MX, SPF/DMARC, HEAD, DNSBL, WHOIS/DNSBL reputation) used to
+run once per lead and only deduplicated by chance through validation_cache -
+and not at all when two leads of the same domain were in flight at once.
+
+DomainCheckPlan groups a batch by domain up front. During the batch each
+domain-level check runs once per unique domain (single-flight); every other
+lead of that domain receives a copy of the result plus the lead[...] side
+fields the check writes (whois_checked, dnsbl_blacklisted, has_spf, ...).
+
+The plan is activated for the batch through a context variable, so
+run_stage0_2_checks / run_stage4_5_repscore pick it up via run_domain_check()
+without changing their signatures. Outside a batch, checks run directly.
+"""
+
+import asyncio
+import contextvars
+import copy
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from validator_models.pipeline_metrics import record_cache
+
+# Which domain each check is keyed on. Domain tuple positions come from
+# get_lead_dns_domains(): (website_root_domain, email_domain, email_root_domain)
+DOMAIN_CHECK_KEYS = {
+    "check_domain_age": (0,),
+    "check_mx_record": (0,),
+    "check_head_request": (0,),
+    "check_spf_dmarc": (1,),
+    "check_dnsbl": (2,),
+    # Pure function of the WHOIS (website) and DNSBL (email root) side fields
+    "check_whois_dnsbl_reputation": (0, 2),
+}
+
+# lead[...] fields each check writes, fanned out to every lead of the domain
+DOMAIN_CHECK_SIDE_FIELDS = {
+    "check_domain_age": [
+        "whois_checked", "domain_age_days", "domain_creation_date", "domain_registrar",
+        "domain_nameservers", "whois_updated_date", "whois_updated_days_ago", "whois_error",
+    ],
+    "check_spf_dmarc": ["has_spf", "has_dmarc", "dmarc_policy_strict"],
+    "check_dnsbl": ["dnsbl_checked", "dnsbl_blacklisted", "dnsbl_list", "dnsbl_domain", "dnsbl_error"],
+}
+
+_active_plan: contextvars.ContextVar = contextvars.ContextVar("active_domain_plan", default=None)
+
+
+class DomainCheckPlan:
+    """Groups a batch by domain and runs each domain-level check once per domain."""
+
+    def __init__(self, leads: List[dict], domains_for_lead: Callable[[dict], Tuple[str, str, str]]):
+        self.domains_for_lead = domains_for_lead
+        self._outcomes: Dict[Tuple[str, tuple], asyncio.Future] = {}
+        self.requested = {name: 0 for name in DOMAIN_CHECK_KEYS}
+        self.executed = {name: 0 for name in DOMAIN_CHECK_KEYS}
+
+        # Planning: how many leads / unique domains each check covers
+        self.planned = {}
+        lead_domains = [domains_for_lead(lead) for lead in leads]
+        for name, positions in DOMAIN_CHECK_KEYS.items():
+            keys = [tuple(d[p] for p in positions) for d in lead_domains]
+            keys = [k for k in keys if all(k)]
+            self.planned[name] = {"leads": len(keys), "unique_domains": len(set(keys))}
+
+    def _key(self, check_name: str, lead: dict) -> Optional[tuple]:
+        domains = self.domains_for_lead(lead)
+        key = tuple(domains[p] for p in DOMAIN_CHECK_KEYS[check_name])
+        return key if all(key) else None
+
+    async def run(self, check_func: Callable[[dict], Awaitable[Any]], lead: dict) -> Any:
+        check_name = check_func.__name__
+        if check_name not in DOMAIN_CHECK_KEYS:
+            return await check_func(lead)
+        key = self._key(check_name, lead)
+        if key is None:
+            # Missing/invalid domain - let the check produce its own rejection
+            return await check_func(lead)
+
+        self.requested[check_name] += 1
+        side_fields = DOMAIN_CHECK_SIDE_FIELDS.get(check_name, [])
+        future = self._outcomes.get((check_name, key))
+
+        if future is None:
+            # First lead of this domain: run the real check and publish the outcome
+            future = asyncio.get_running_loop().create_future()
+            self._outcomes[(check_name, key)] = future
+            self.executed[check_name] += 1
+            record_cache("checks", check_name, hit=False)
+            try:
+                result = await check_func(lead)
+            except Exception as e:
+                future.set_exception(e)
+                future.exception()  # Followers re-raise it themselves
+                raise
+            except BaseException:
+                # Cancelled: let the next lead of this domain run the check itself
+                del self._outcomes[(check_name, key)]
+                future.cancel()
+                raise
+            fields = {f: copy.deepcopy(lead[f]) for f in side_fields if f in lead}
+            future.set_result((result, fields))
+            return result
+
+        # Follower: reuse the domain's outcome
+        record_cache("checks", check_name, hit=True)
+        try:
+            result, fields = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            return await self.run(check_func, lead)
+        for field, value in fields.items():
+            lead[field] = copy.deepcopy(value)
+        return copy.deepcopy(result)
+
+    def report(self) -> Dict[str, Any]:
+        """Per-check requested vs executed counts and the total checks saved."""
+        per_check = {}
+        for name in DOMAIN_CHECK_KEYS:
+            per_check[name] = {
+                **self.planned[name],
+                "requested": self.requested[name],
+                "executed": self.executed[name],
+                "saved": self.requested[name] - self.executed[name],
+            }
+        return {
+            "checks": per_check,
+            "planned_savings": sum(p["leads"] - p["unique_domains"] for p in self.planned.values()),
+            "saved": sum(c["saved"] for c in per_check.values()),
+        }
+
+    def log_report(self):
+        report = self.report()
+        print(f"   🧭 Domain plan: saved {report['saved']} domain-level checks "
+              f"(planned up to {report['planned_savings']})")
+        for name, stats in report["checks"].items():
+            if stats["requested"]:
+                print(f"      {name}: {stats['executed']} run / {stats['requested']} requested "
+                      f"({stats['unique_domains']} unique domains)")
+
+
+def activate_plan(plan: Optional[DomainCheckPlan]) -> contextvars.Token:
+    """Make plan the active domain plan for the current context (and tasks it spawns)."""
+    return _active_plan.set(plan)
+
+
+def deactivate_plan(token: contextvars.Token):
+    _active_plan.reset(token)
+
+
+async def run_domain_check(check_func: Callable[[dict], Awaitable[Any]], lead: dict) -> Any:
+    """Run a check through the active batch plan, or directly when there is none."""
+    plan = _active_plan.get()
+    if plan is None:
+        return await check_func(lead)
+    return await plan.run(check_func, lead)
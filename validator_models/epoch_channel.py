@@ -0,0 +1,333 @@
+"""
+Coordinator -> worker epoch channel over a Unix-domain socket.
+
+Workers used to find out about a new epoch by sleeping until
+validator_weights/epoch_{N}_leads.json existed, and then re-opening and
+json.load-ing the whole file every 5 seconds until the coordinator filled in
+truelist_results: hundreds of full-file parses per epoch across 30
+containers, and up to one poll interval of dead time per wait.
+
+The coordinator now runs an EpochChannelServer on a socket in the shared
+validator_weights/ directory (bind-mounted into every container) and pushes
+each message the moment it is ready:
+
+- EPOCH_LEADS    the leads file payload (leads, salt, max_leads_per_epoch, ...)
+- EMAIL_RESULTS  TrueList results as they resolve (partial updates, merged)
+- TRUELIST_DONE  the authoritative final result set; replaces every partial update
+
+Each frame is a 12-byte header (magic "LP", version, message type, epoch,
+payload length) followed by a JSON payload, serialized once per broadcast.
+Late subscribers get a snapshot of everything published for their epoch.
+
+The leads file is still written and stays the crash-recovery snapshot: a
+worker that cannot connect (or loses the coordinator mid-epoch) falls back to
+reading it exactly as before. Set EPOCH_CHANNEL_SOCKET="" to disable the channel.
+"""
+
+import asyncio
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+EPOCH_CHANNEL_SOCKET = os.getenv(
+    "EPOCH_CHANNEL_SOCKET",
+    str(Path("validator_weights") / "epoch_channel.sock"),
+)
+EPOCH_CHANNEL_KEEP_EPOCHS = 2  # Older epochs are dropped from the server's snapshot state
+
+# Header: magic, protocol version, message type, epoch, payload length
+_HEADER = struct.Struct("!2sBBII")
+_MAGIC = b"LP"
+_VERSION = 1
+
+SUBSCRIBE = 1
+EPOCH_LEADS = 2
+EMAIL_RESULTS = 3
+TRUELIST_DONE = 4
+
+
+def encode_frame(msg_type: int, epoch: int, payload=None) -> bytes:
+    body = json.dumps(payload, default=str).encode("utf-8") if payload is not None else b""
+    return _HEADER.pack(_MAGIC, _VERSION, msg_type, epoch, len(body)) + body
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[int, int, object]:
+    """(message type, epoch, decoded payload or None). Raises IncompleteReadError on EOF."""
+    magic, version, msg_type, epoch, length = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    if magic != _MAGIC or version != _VERSION:
+        raise ConnectionError(f"Bad epoch channel frame (magic={magic!r}, version={version})")
+    body = await reader.readexactly(length) if length else b""
+    return msg_type, epoch, json.loads(body) if body else None
+
+
+def _done_frame(epoch: int, results: Dict[str, dict]) -> bytes:
+    return encode_frame(TRUELIST_DONE, epoch, {"total": len(results), "results": results})
+
+
+class _EpochState:
+    def __init__(self):
+        self.leads_frame: Optional[bytes] = None
+        self.email_results: Dict[str, dict] = {}
+        self.done = False
+
+
+class EpochChannelServer:
+    """Coordinator side: accepts worker subscriptions and broadcasts epoch messages."""
+
+    def __init__(self, path: str = EPOCH_CHANNEL_SOCKET):
+        self.path = path
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._epochs: Dict[int, _EpochState] = {}
+        self._subscribers: Dict[int, Set[asyncio.StreamWriter]] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    async def start(self) -> bool:
+        """Bind the socket (replacing a stale one from a previous run). False if unavailable."""
+        if not self.path:
+            return False
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+            print(f"📡 Epoch channel listening on {self.path}")
+            return True
+        except Exception as e:
+            print(f"⚠️ Epoch channel unavailable ({self.path}): {e} - workers will read the leads file")
+            self._server = None
+            return False
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for writers in self._subscribers.values():
+            for writer in writers:
+                writer.close()
+        self._subscribers.clear()
+
+    def _state(self, epoch: int) -> _EpochState:
+        state = self._epochs.get(epoch)
+        if state is None:
+            state = _EpochState()
+            self._epochs[epoch] = state
+            for old in sorted(self._epochs)[:-EPOCH_CHANNEL_KEEP_EPOCHS]:
+                del self._epochs[old]
+                for writer in self._subscribers.pop(old, ()):
+                    writer.close()
+        return state
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        epoch = None
+        try:
+            msg_type, epoch, _ = await read_frame(reader)
+            if msg_type != SUBSCRIBE:
+                return
+            self._subscribers.setdefault(epoch, set()).add(writer)
+            # Snapshot of everything already published for this epoch
+            state = self._epochs.get(epoch)
+            if state is not None:
+                if state.leads_frame is not None:
+                    writer.write(state.leads_frame)
+                if state.done:
+                    writer.write(_done_frame(epoch, state.email_results))
+                elif state.email_results:
+                    writer.write(encode_frame(EMAIL_RESULTS, epoch, state.email_results))
+                await writer.drain()
+            await reader.read()  # Subscribers never send again; EOF = gone
+        except (asyncio.IncompleteReadError, asyncio.CancelledError, ConnectionError, OSError):
+            pass
+        finally:
+            if epoch is not None:
+                self._subscribers.get(epoch, set()).discard(writer)
+            writer.close()
+
+    async def _broadcast(self, epoch: int, frame: bytes):
+        writers = [w for w in self._subscribers.get(epoch, ()) if not w.is_closing()]
+        for writer in writers:
+            writer.write(frame)
+
+        async def _drain(writer):
+            try:
+                await asyncio.wait_for(writer.drain(), timeout=30)
+            except Exception:
+                self._subscribers.get(epoch, set()).discard(writer)
+                writer.close()
+
+        await asyncio.gather(*(_drain(w) for w in writers))
+
+    async def publish_leads(self, epoch: int, payload: dict):
+        """Push the leads file payload (same dict that is written to epoch_{N}_leads.json)."""
+        state = self._state(epoch)
+        state.leads_frame = encode_frame(EPOCH_LEADS, epoch, payload)
+        await self._broadcast(epoch, state.leads_frame)
+
+    async def publish_email_results(self, epoch: int, results: Dict[str, dict]):
+        """Push newly resolved (or changed) TrueList results."""
+        state = self._state(epoch)
+        delta = {email: result for email, result in results.items() if state.email_results.get(email) != result}
+        if not delta:
+            return
+        state.email_results.update(delta)
+        await self._broadcast(epoch, encode_frame(EMAIL_RESULTS, epoch, delta))
+
+    async def publish_truelist_done(self, epoch: int, results: Dict[str, dict]):
+        """
+        Mark TrueList complete with the final result set (the same dict written to the
+        leads file). It replaces every partial update: a failed batch publishes {} and
+        workers drop the partial results they already received.
+        """
+        state = self._state(epoch)
+        state.email_results = dict(results)
+        state.done = True
+        await self._broadcast(epoch, _done_frame(epoch, state.email_results))
+
+
+_server: Optional[EpochChannelServer] = None
+
+
+async def start_epoch_channel_server() -> EpochChannelServer:
+    """Process-wide coordinator server, started on first use (a failed bind is retried next epoch)."""
+    global _server
+    if _server is None:
+        _server = EpochChannelServer()
+    if not _server.running:
+        await _server.start()
+    return _server
+
+
+class EpochSubscriber:
+    """
+    Worker side: one subscription per epoch.
+
+        subscriber = EpochSubscriber(epoch)
+        if await subscriber.connect():
+            payload = await subscriber.wait_leads(timeout=5)      # leads file dict, or None
+            results = await subscriber.wait_truelist(timeout=1200)  # full results, or None
+    """
+
+    def __init__(self, epoch: int, path: str = EPOCH_CHANNEL_SOCKET):
+        self.epoch = epoch
+        self.path = path
+        self.leads_payload: Optional[dict] = None
+        self.email_results: Dict[str, dict] = {}
+        self.truelist_done = False
+        self.connected = False
+        self._listeners: List[Callable[[Dict[str, dict]], None]] = []
+        self._leads_event: Optional[asyncio.Event] = None
+        self._done_event: Optional[asyncio.Event] = None
+        self._closed_event: Optional[asyncio.Event] = None
+        self._update_event: Optional[asyncio.Event] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def on_email_results(self, callback: Callable[[Dict[str, dict]], None]):
+        """
+        Call callback(delta) for every partial TrueList update (including the snapshot)
+        and for the emails the final set adds or changes. Emails the final set drops
+        are not reported; compare against email_results once truelist_done is set.
+        """
+        self._listeners.append(callback)
+
+    async def connect(self, timeout: float = 2.0) -> bool:
+        if self.connected:
+            return True
+        if self._writer is not None:
+            await self.close()   # Coordinator went away: release the old socket before reconnecting
+        if not self.path or not os.path.exists(self.path):
+            return False
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_unix_connection(self.path), timeout=timeout)
+            writer.write(encode_frame(SUBSCRIBE, self.epoch))
+            await writer.drain()
+        except Exception:
+            return False
+        self._leads_event = asyncio.Event()
+        self._done_event = asyncio.Event()
+        self._closed_event = asyncio.Event()
+        self._update_event = asyncio.Event()
+        self._writer = writer
+        self.connected = True
+        self._task = asyncio.ensure_future(self._read_loop(reader))
+        return True
+
+    async def _read_loop(self, reader: asyncio.StreamReader):
+        try:
+            while True:
+                msg_type, epoch, payload = await read_frame(reader)
+                if epoch != self.epoch:
+                    continue
+                if msg_type == EPOCH_LEADS:
+                    self.leads_payload = payload
+                    self._leads_event.set()
+                elif msg_type == EMAIL_RESULTS:
+                    self.email_results.update(payload)
+                    for callback in self._listeners:
+                        callback(payload)
+                    self._update_event.set()
+                elif msg_type == TRUELIST_DONE:
+                    final = (payload or {}).get("results", {})
+                    delta = {email: result for email, result in final.items()
+                             if self.email_results.get(email) != result}
+                    self.email_results = dict(final)
+                    self.truelist_done = True
+                    if delta:
+                        for callback in self._listeners:
+                            callback(delta)
+                    self._done_event.set()
+                    self._update_event.set()
+        except (asyncio.IncompleteReadError, ConnectionError, OSError, ValueError):
+            pass
+        finally:
+            self.connected = False
+            self._closed_event.set()
+            self._update_event.set()
+
+    async def _wait(self, event: Optional[asyncio.Event], timeout: float) -> bool:
+        """True once event is set; False on timeout or when the coordinator goes away."""
+        if event is None:
+            return False
+        if event.is_set():
+            return True
+        waiters = [asyncio.ensure_future(event.wait()), asyncio.ensure_future(self._closed_event.wait())]
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        return event.is_set()
+
+    async def wait_leads(self, timeout: float) -> Optional[dict]:
+        """The epoch's leads payload, or None if it did not arrive within timeout."""
+        return self.leads_payload if await self._wait(self._leads_event, timeout) else None
+
+    async def wait_truelist(self, timeout: float) -> Optional[Dict[str, dict]]:
+        """The final TrueList results once the coordinator marks them done; None on timeout/disconnect."""
+        return dict(self.email_results) if await self._wait(self._done_event, timeout) else None
+
+    async def wait_update(self, timeout: float):
+        """Return on the next email-results / done message, disconnect, or timeout."""
+        if self._update_event is None or not self.connected or self.truelist_done:
+            return
+        self._update_event.clear()
+        try:
+            await asyncio.wait_for(self._update_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.connected = False
@@ -0,0 +1,424 @@
+"""
+Offline gazetteer geocoder for Stage 5 location matching.
+
+locations_match_geopy used to geocode both sides through Nominatim: a network
+round trip plus a blocking 1s sleep per uncached location, inside the async
+Stage 5 path. This module resolves "City, State, Country" strings in memory
+against gateway/utils/geo_lookup_fast.json (the gazetteer the gateway already
+normalizes submissions with) plus geo_coordinates.csv (approximate coordinates
+for country capitals, US state centroids and major cities):
+
+- normalized-key indexes (accent-folded, case- and period-insensitive) for
+  countries + aliases, US states + abbreviations, non-US provinces and every
+  gazetteer city name -> (country, state) candidates
+- haversine_km: NumPy-vectorized great-circle distance, so the max_distance_km
+  comparison is pure arithmetic (and nearby() scans the whole table at once)
+
+resolve() returns (status, result). AMBIGUOUS means the query names a city that
+exists in several countries (or contradicts its own region) and nothing in the
+query settles it; automated_checks only falls back to Nominatim for those, and
+only when VALIDATOR_GEOCODER_NOMINATIM_FALLBACK is enabled.
+
+    python -m validator_models.geocoder lookup "Austin, TX" "Lyon, France" "London"
+    python -m validator_models.geocoder nearby 40.71,-74.01 --km 150
+    python -m validator_models.geocoder compare --pairs recorded_regions.jsonl
+
+compare runs locations_match_geopy over recorded claimed/extracted pairs with
+and without the geocoder and lists every verdict that differs from the
+string-match path deployed validators ran before this module existed.
+"""
+
+import csv
+import functools
+import os
+import threading
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+GEO_COORDINATES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "geo_coordinates.csv")
+GEOCODER_CACHE_SIZE = int(os.getenv("VALIDATOR_GEOCODER_CACHE_SIZE", "20000"))
+
+RESOLVED = "resolved"
+AMBIGUOUS = "ambiguous"
+UNRESOLVED = "unresolved"
+
+# Mean earth radius (IUGG); within ~0.5% of geodesic, far below the 50km match radius
+EARTH_RADIUS_KM = 6371.0088
+
+US = "united states"
+
+_PUNCTUATION = str.maketrans({".": "", "’": "'", "`": "'"})
+# LinkedIn-style metro decorations around a city name
+_METRO_PREFIXES = ("greater ",)
+_METRO_SUFFIXES = (" metropolitan area", " metro area", " bay area", " area", " metro")
+
+
+def fold(text: str) -> str:
+    """Index key: accents dropped, lower-case, periods removed, whitespace collapsed."""
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.lower().translate(_PUNCTUATION).split())
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km; scalars or NumPy arrays (broadcast)."""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=float)) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2.0) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2.0) ** 2
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class _Place(NamedTuple):
+    country: str  # canonical lower-case country
+    state: str    # lower-case state/province, "" when the gazetteer has none
+    name: str     # lower-case gazetteer spelling
+
+
+def _proper(name: str) -> str:
+    return " ".join(w.capitalize() for w in name.split())
+
+
+class Geocoder:
+    """In-memory indexes over the gazetteer and coordinates table. Build via get_geocoder()."""
+
+    def __init__(self, coordinates_path: str = GEO_COORDINATES_PATH):
+        from gateway.utils import geo_normalize as gn
+
+        self._us_state_proper = gn.US_STATE_PROPER
+        self._country_city_key = gn.COUNTRY_CITY_KEY_MAP
+
+        # Countries: gazetteer names plus aliases, all mapped to one canonical key
+        self._countries: Dict[str, str] = {}
+        for country in gn.VALID_COUNTRIES_SET:
+            self._countries[fold(country)] = gn.COUNTRY_ALIASES.get(country, country)
+        for alias, country in gn.COUNTRY_ALIASES.items():
+            self._countries.setdefault(fold(alias), country)
+
+        # States: one key can name several (e.g. "wa" is only Washington, "georgia" is also a country)
+        self._states: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        for state in gn.US_CITIES_BY_STATE:
+            self._add(self._states, fold(state), (US, state))
+        for abbr, state in gn.STATE_ABBR_TO_NAME.items():
+            self._add(self._states, fold(abbr), (US, state))
+        for alias, proper in gn.US_STATE_ALIASES.items():
+            self._add(self._states, fold(alias), (US, proper.lower()))
+        for state, country in gn.NON_US_STATE_TO_COUNTRY.items():
+            self._add(self._states, fold(state), (self._canonical_country(country), state))
+        for abbr, proper in gn.INTERNATIONAL_STATES.items():
+            country = gn.NON_US_STATE_TO_COUNTRY.get(proper.lower())
+            if country:
+                self._add(self._states, fold(abbr), (self._canonical_country(country), proper.lower()))
+
+        # Cities: folded name -> every (country, state) the gazetteer lists it under
+        self._cities: Dict[str, List[_Place]] = defaultdict(list)
+        for state, cities in gn.US_CITIES_BY_STATE.items():
+            for city in cities:
+                self._add(self._cities, fold(city), _Place(US, state, city))
+        for country_key, cities in gn.CITIES_BY_COUNTRY.items():
+            country = self._canonical_country(country_key)
+            for city in cities:
+                self._add(self._cities, fold(city), _Place(country, "", city))
+        self._us_city_aliases = {fold(k): fold(v) for k, v in gn.US_CITY_ALIASES.items()}
+        self._intl_city_aliases = {fold(k): fold(v) for k, v in gn.INTERNATIONAL_CITY_ALIASES.items()}
+
+        self._country_codes: Dict[str, str] = {}
+        self._country_coords: Dict[str, Tuple[float, float]] = {}
+        self._state_coords: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._city_coords: Dict[Tuple[str, str, str], Tuple[float, float]] = {}
+        self._load_coordinates(coordinates_path)
+
+        self._resolve_cached = functools.lru_cache(maxsize=GEOCODER_CACHE_SIZE)(self._resolve_key)
+
+    @staticmethod
+    def _add(index: Dict, key: str, value) -> None:
+        if value not in index[key]:
+            index[key].append(value)
+
+    def _canonical_country(self, country: str) -> str:
+        country = country.lower()
+        return self._countries.get(fold(country), country)
+
+    def _load_coordinates(self, path: str) -> None:
+        labels, lats, lons = [], [], []
+        with open(path, encoding="utf-8") as f:
+            rows = csv.DictReader(line for line in f if not line.startswith("#"))
+            for row in rows:
+                country = self._canonical_country(row["country"])
+                name, state = row["name"].lower(), row["state"].lower()
+                lat, lon = float(row["lat"]), float(row["lon"])
+                if row["kind"] == "country":
+                    self._country_coords[country] = (lat, lon)
+                    self._country_codes[country] = row["code"]
+                    continue
+                if row["kind"] == "state":
+                    self._state_coords[(country, name)] = (lat, lon)
+                    continue
+                self._city_coords[(fold(name), country, state)] = (lat, lon)
+                # The table also covers exonyms / cities the gazetteer lacks (Geneva, Reykjavik)
+                self._add(self._cities, fold(name), _Place(country, state, name))
+                labels.append(self._display(name, state, country))
+                lats.append(lat)
+                lons.append(lon)
+        self._city_labels = labels
+        self._city_lats = np.array(lats, dtype=float)
+        self._city_lons = np.array(lons, dtype=float)
+
+    # ------------------------------------------------------------------
+    # Parsing
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _strip_metro(part: str) -> str:
+        for prefix in _METRO_PREFIXES:
+            if part.startswith(prefix):
+                part = part[len(prefix):]
+        for suffix in _METRO_SUFFIXES:
+            if part.endswith(suffix) and len(part) > len(suffix):
+                part = part[:-len(suffix)]
+                break
+        return part.strip()
+
+    def _city_candidates(self, key: str) -> List[_Place]:
+        candidates = list(self._cities.get(key, ()))
+        us_alias = self._us_city_aliases.get(key)
+        if us_alias:
+            candidates += [p for p in self._cities.get(us_alias, ()) if p.country == US and p not in candidates]
+        intl_alias = self._intl_city_aliases.get(key)
+        if intl_alias:
+            candidates += [p for p in self._cities.get(intl_alias, ()) if p.country != US and p not in candidates]
+        return candidates
+
+    def _located_first(self, places: List[_Place]) -> List[_Place]:
+        """Spellings with coordinates first ("munich" and "münchen" are both gazetteer entries)."""
+        return sorted(places, key=lambda p: self._coords_for_city(p.name, p.state, p.country) is None)
+
+    def _match_city(self, key: str, country: str, state: Optional[str]) -> Optional[_Place]:
+        """The city within (country, state); state is inferred when the name is unique in the country."""
+        in_country = self._located_first([p for p in self._city_candidates(key) if p.country == country])
+        if state:
+            in_state = [p for p in in_country if p.state in (state, "")]
+            return _Place(country, state, in_state[0].name) if in_state else None
+        if not in_country:
+            return None
+        states = {p.state for p in in_country} - {""}
+        return _Place(country, states.pop() if len(states) == 1 else "", in_country[0].name)
+
+    def _resolve_key(self, text: str) -> Tuple[str, Optional[Dict]]:
+        parts = [self._strip_metro(p.strip()) for p in text.split(",")]
+        parts = [p for p in parts if p]
+        if not parts:
+            return UNRESOLVED, None
+
+        # Read qualifiers from the right: "City, State, Country" / "City, Country" / "City, ST"
+        interpretations: List[Tuple[str, str, Optional[str]]] = []
+        last, rest = parts[-1], parts[:-1]
+        country = self._countries.get(last)
+        if country:
+            state = ""
+            if rest:
+                states = [s for c, s in self._states.get(rest[-1], ()) if c == country]
+                if states:
+                    state, rest = states[0], rest[:-1]
+            interpretations.append((country, state, rest[0] if rest else None))
+        for state_country, state in self._states.get(last, ()):
+            interpretations.append((state_country, state, rest[0] if rest else None))
+        if not interpretations:
+            return self._resolve_city(parts[0])
+
+        found, regions, misplaced = [], [], False
+        for country, state, city_key in interpretations:
+            place = self._match_city(city_key, country, state) if city_key else None
+            if place:
+                found.append(place)
+            else:
+                regions.append(_Place(country, state, ""))
+                # The city exists, just not in the named region ("Chennai, IN" = Indiana?)
+                misplaced = misplaced or bool(city_key and self._city_candidates(city_key))
+        if not found and misplaced:
+            return AMBIGUOUS, None
+        chosen = found or regions
+        if len({p.country for p in chosen}) > 1:
+            return AMBIGUOUS, None
+        place = chosen[0]
+        return RESOLVED, self._result(place.name, place.state, place.country)
+
+    def _resolve_city(self, key: str) -> Tuple[str, Optional[Dict]]:
+        """Bare city name: unique country wins, else the one major city the table knows."""
+        candidates = self._city_candidates(key)
+        if not candidates:
+            return UNRESOLVED, None
+        if len({p.country for p in candidates}) > 1:
+            candidates = [p for p in candidates if self._coords_for_city(p.name, p.state, p.country)]
+            if len({p.country for p in candidates}) != 1:
+                return AMBIGUOUS, None
+        candidates = self._located_first(candidates)
+        country = candidates[0].country
+        states = {p.state for p in candidates} - {""}
+        return RESOLVED, self._result(candidates[0].name, states.pop() if len(states) == 1 else "", country)
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+    def _coords_for_city(self, name: str, state: str, country: str) -> Optional[Tuple[float, float]]:
+        key = fold(name)
+        coords = self._city_coords.get((key, country, state)) or self._city_coords.get((key, country, ""))
+        if coords or state:
+            return coords
+        matches = [c for (k, ctry, _), c in self._city_coords.items() if k == key and ctry == country]
+        return matches[0] if len(matches) == 1 else None
+
+    def _display(self, city: str, state: str, country: str) -> str:
+        state_name = self._us_state_proper.get(state, _proper(state)) if country == US else _proper(state)
+        return ", ".join(p for p in (_proper(city), state_name, _proper(country)) if p)
+
+    def _result(self, city: str, state: str, country: str) -> Dict:
+        if city:
+            coords = self._coords_for_city(city, state, country)
+        elif state:
+            coords = self._state_coords.get((country, state))
+        else:
+            coords = self._country_coords.get(country)
+        state_name = self._us_state_proper.get(state, _proper(state)) if country == US else _proper(state)
+        return {
+            "city": _proper(city),
+            "state": state_name,
+            "country": _proper(country),
+            "country_code": self._country_codes.get(country, country.upper()),
+            "lat": coords[0] if coords else None,
+            "lon": coords[1] if coords else None,
+            "display": self._display(city, state, country),
+        }
+
+    def resolve(self, location: str) -> Tuple[str, Optional[Dict]]:
+        """(RESOLVED | AMBIGUOUS | UNRESOLVED, result dict or None). No network, no sleeps."""
+        status, result = self._resolve_cached(fold(location))
+        return status, dict(result) if result else None
+
+    def nearby(self, lat: float, lon: float, max_distance_km: float, limit: int = 10) -> List[Tuple[str, float]]:
+        """Table cities within max_distance_km of a point, nearest first (one vectorized pass)."""
+        distances = haversine_km(lat, lon, self._city_lats, self._city_lons)
+        order = np.argsort(distances)
+        return [(self._city_labels[i], float(distances[i])) for i in order[:limit] if distances[i] <= max_distance_km]
+
+    def cache_info(self):
+        return self._resolve_cached.cache_info()
+
+
+_geocoder: Optional[Geocoder] = None
+_geocoder_lock = threading.Lock()
+
+
+def get_geocoder() -> Geocoder:
+    """Process-wide geocoder; indexes are built on first use (~1s), not at import."""
+    global _geocoder
+    if _geocoder is None:
+        with _geocoder_lock:
+            if _geocoder is None:
+                _geocoder = Geocoder()
+    return _geocoder
+
+
+def _record_pair(record) -> Optional[Tuple[str, str]]:
+    """(claimed, extracted) from a [claimed, extracted] pair or a lead-like dict; None if malformed."""
+    if isinstance(record, list):
+        if len(record) != 2:
+            return None
+        claimed, extracted = record
+    elif isinstance(record, dict):
+        lead = record.get("lead_blob", record)
+        if not isinstance(lead, dict):
+            return None
+        claimed = lead.get("claimed") or lead.get("region") or lead.get("Region") or lead.get("location")
+        extracted = lead.get("extracted") or lead.get("stage5_extracted_region") or lead.get("region_extracted")
+    else:
+        return None
+    if not (isinstance(claimed, str) and isinstance(extracted, str) and claimed and extracted):
+        return None
+    return claimed, extracted
+
+
+def _load_pairs(path: str) -> List[Tuple[str, str]]:
+    import json
+    with open(path) as f:
+        text = f.read()
+    try:
+        records = json.loads(text)
+        records = records if isinstance(records, list) and records and isinstance(records[0], (list, dict)) else [records]
+    except ValueError:
+        records = []
+        for line in text.splitlines():
+            if line.strip():
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    records.append(None)
+    pairs = [pair for pair in (_record_pair(record) for record in records) if pair]
+    if len(pairs) < len(records):
+        print(f"⚠️ Skipped {len(records) - len(pairs)} malformed or incomplete records in {path}")
+    return pairs
+
+
+def _compare(path: str) -> int:
+    """Print verdicts that differ from the string-match path; 1 if any verdict got stricter or looser otherwise."""
+    from validator_models.automated_checks.stage5_matching import locations_match_geopy
+
+    pairs = _load_pairs(path)
+    confirmed, unexpected = [], []
+    for claimed, extracted in pairs:
+        before = locations_match_geopy(claimed, extracted, geocode=False)
+        after = locations_match_geopy(claimed, extracted)
+        if before[0] == after[0]:
+            continue
+        # Expected: a string-match "needs LLM verification" confirmed by same state / nearby cities
+        expected = not before[0] and after[1].startswith(("Same state", "Nearby cities"))
+        (confirmed if expected else unexpected).append((claimed, extracted, before, after))
+
+    print(f"🗺️  {len(pairs)} recorded pairs: {len(pairs) - len(confirmed) - len(unexpected)} unchanged, "
+          f"{len(confirmed)} confirmed by the geocoder (skip LLM), {len(unexpected)} unexpected")
+    for label, rows in (("confirmed", confirmed), ("UNEXPECTED", unexpected)):
+        for claimed, extracted, before, after in rows:
+            print(f"   {label}: {claimed!r} vs {extracted!r}")
+            print(f"      before: {before[0]} - {before[1]}")
+            print(f"      after:  {after[0]} - {after[1]}")
+    return 1 if unexpected else 0
+
+
+def main():
+    import argparse
+    import time
+    parser = argparse.ArgumentParser(description="Offline gazetteer geocoder")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    lookup_parser = subparsers.add_parser("lookup", help="Resolve location strings")
+    lookup_parser.add_argument("locations", nargs="+")
+    nearby_parser = subparsers.add_parser("nearby", help="Table cities near a lat,lon point")
+    nearby_parser.add_argument("point", help="lat,lon")
+    nearby_parser.add_argument("--km", type=float, default=50.0)
+    compare_parser = subparsers.add_parser("compare", help="Region verdicts with vs without the geocoder")
+    compare_parser.add_argument("--pairs", required=True,
+                                help="JSON list or JSONL of {claimed, extracted} pairs or leads "
+                                     "(region + stage5_extracted_region; lead_blob accepted)")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        raise SystemExit(_compare(args.pairs))
+
+    start = time.perf_counter()
+    geocoder = get_geocoder()
+    print(f"🗺️  Geocoder indexes built in {time.perf_counter() - start:.2f}s")
+    if args.command == "lookup":
+        for location in args.locations:
+            status, result = geocoder.resolve(location)
+            if result:
+                print(f"   {location!r:40s} {status:10s} {result['display']} "
+                      f"[{result['country_code']}] ({result['lat']}, {result['lon']})")
+            else:
+                print(f"   {location!r:40s} {status}")
+    elif args.command == "nearby":
+        lat, lon = (float(v) for v in args.point.split(","))
+        for label, distance in geocoder.nearby(lat, lon, args.km):
+            print(f"   {distance:7.1f}km  {label}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,493 @@
+"""
+Shared pooled HTTP client for validator automated checks.
+
+Every outbound call made by automated_checks (OpenRouter, TrueList, ScrapingDog,
+Wayback, SEC EDGAR, GDELT, Companies House, company websites) goes through the
+sessions managed here instead of opening a fresh aiohttp.ClientSession or calling
+requests.get() per request. This keeps TCP/TLS connections alive per host and
+caches DNS lookups, so a lead no longer pays connection setup dozens of times.
+
+- Async callers:  async with pooled_session("truelist") as session: ...
+- Thread callers: get_sync_session("scrapingdog").get(url, params=..., ...)
+
+aiohttp sessions are bound to the event loop that created them, so one session
+is kept per (event loop, provider). Sessions belonging to a loop that has since
+been closed (e.g. a finished asyncio.run()) are discarded on the next lookup,
+on close_http_sessions() and at exit. Pooled sessions never keep cookies
+(DummyCookieJar): a provider's session is shared by unrelated leads, and the
+per-call sessions it replaced never carried cookies from one call to the next.
+
+Proxying stays per-request, exactly as before: aiohttp calls pass
+proxy=HTTP_PROXY_URL and requests calls pass proxies=PROXY_CONFIG.
+
+NOTE: aiohttp and requests only speak HTTP/1.1. Persistent keep-alive pools give
+the connection-reuse win; HTTP/2 multiplexing is not used.
+
+Requests to providers in rate_governor.RATE_LIMITS wait for a token from the
+host-wide rate governor before they are sent (the wait is not counted as call
+latency) and report 429s and timeouts back to it.
+
+HTTP_REPLAY_TARGET (set by replay_bench) sends every request to a local
+stand-in server instead: https://host/path becomes
+{HTTP_REPLAY_TARGET}/{provider}/https/host/path, with proxies dropped.
+"""
+
+import asyncio
+import atexit
+import os
+import ssl
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from validator_models.pipeline_metrics import ERROR, FAIL, PASS, PIPELINE_METRICS, record_call
+from validator_models.rate_governor import (
+    OK,
+    THROTTLED,
+    TIMEOUT,
+    acquire as governor_acquire,
+    acquire_sync as governor_acquire_sync,
+    is_governed,
+    parse_retry_after,
+    report_outcome,
+)
+
+# ════════════════════════════════════════════════════════════════════
+# Pool configuration
+# ════════════════════════════════════════════════════════════════════
+# A request waiting for a free socket is already inside its aiohttp timeout, so a pool
+# smaller than the calls in flight turns pool waits into check timeouts. Most provider
+# sessions talk to a single host: the per-host cap defaults to the session total, which
+# stays above STAGE0_2_CONCURRENCY leads x the parallel calls each lead makes. Pacing
+# is the rate governor's job, not the pool's.
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "100"))                  # Total sockets per provider session
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", str(HTTP_POOL_LIMIT)))  # Sockets per host
+HTTP_KEEPALIVE_TIMEOUT = int(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "60"))      # Seconds an idle socket is kept
+HTTP_DNS_CACHE_TTL = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))            # Seconds a resolved host is cached
+HTTP_REPLAY_TARGET = os.getenv("HTTP_REPLAY_TARGET", "").rstrip("/")         # Benchmark stand-in server (empty = real hosts)
+
+# Known providers (anything else is still pooled, just reported under its own name)
+PROVIDERS = (
+    "openrouter",
+    "truelist",
+    "truelist_csv",
+    "scrapingdog",
+    "wayback",
+    "sec_edgar",
+    "gdelt",
+    "companies_house",
+    "company_site",
+)
+
+# Browser User-Agent used when probing company websites (anti-bot friendly)
+COMPANY_SITE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+_lock = threading.Lock()
+_async_sessions: Dict[Tuple[int, str], Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = {}
+_sync_sessions: Dict[str, requests.Session] = {}
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def _provider_stats(provider: str) -> Dict[str, int]:
+    stats = _stats.get(provider)
+    if stats is None:
+        stats = {
+            "requests": 0,
+            "new_connections": 0,
+            "reused_connections": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+            "errors": 0,
+        }
+        _stats[provider] = stats
+    return stats
+
+
+def _report_status(provider: str, status: int, retry_after: str = None):
+    """Rate governor feedback for a response: 429 cuts the provider's rate, other non-5xx raise it."""
+    if status == 429:
+        report_outcome(provider, THROTTLED, parse_retry_after(retry_after))
+    elif status < 500:
+        report_outcome(provider, OK)
+
+
+def _company_site_ssl_context() -> ssl.SSLContext:
+    """
+    SSL context with broader cipher support for enterprise sites.
+
+    Some enterprise sites (Hartford, etc.) have strict SSL configs that reject
+    the default ciphers, so allow SECLEVEL=1 while still verifying certificates.
+    """
+    ssl_context = ssl.create_default_context()
+    ssl_context.set_ciphers('DEFAULT:@SECLEVEL=1')
+    ssl_context.check_hostname = True
+    ssl_context.verify_mode = ssl.CERT_REQUIRED
+    return ssl_context
+
+
+def _build_trace_config(provider: str) -> aiohttp.TraceConfig:
+    """Trace hooks that feed the per-provider reuse counters, call latencies and rate governor."""
+    trace_config = aiohttp.TraceConfig()
+    governed = is_governed(provider)
+
+    async def on_request_start(session, ctx, params):
+        _provider_stats(provider)["requests"] += 1
+        ctx.started = time.perf_counter()
+
+    async def on_request_end(session, ctx, params):
+        status = params.response.status
+        if governed:
+            await asyncio.to_thread(_report_status, provider, status, params.response.headers.get("Retry-After"))
+        if PIPELINE_METRICS:
+            record_call(provider, (time.perf_counter() - ctx.started) * 1000, PASS if status < 400 else FAIL)
+
+    async def on_request_exception(session, ctx, params):
+        _provider_stats(provider)["errors"] += 1
+        if governed and isinstance(params.exception, (asyncio.TimeoutError, TimeoutError)):
+            await asyncio.to_thread(report_outcome, provider, TIMEOUT)
+        if PIPELINE_METRICS and hasattr(ctx, "started"):
+            record_call(provider, (time.perf_counter() - ctx.started) * 1000, ERROR)
+
+    async def on_connection_create_end(session, ctx, params):
+        _provider_stats(provider)["new_connections"] += 1
+
+    async def on_connection_reuseconn(session, ctx, params):
+        _provider_stats(provider)["reused_connections"] += 1
+
+    async def on_dns_cache_hit(session, ctx, params):
+        _provider_stats(provider)["dns_cache_hits"] += 1
+
+    async def on_dns_cache_miss(session, ctx, params):
+        _provider_stats(provider)["dns_cache_misses"] += 1
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_exception.append(on_request_exception)
+    if PIPELINE_METRICS or governed:
+        trace_config.on_request_end.append(on_request_end)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+    trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+    return trace_config
+
+
+def _create_async_session(provider: str) -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_LIMIT,
+        limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        ssl=_company_site_ssl_context() if provider == "company_site" else True,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=aiohttp.DummyCookieJar(),
+        trace_configs=[_build_trace_config(provider)],
+    )
+
+
+def _discard_session(session: aiohttp.ClientSession):
+    """Drop a session whose event loop is gone (it can no longer be awaited)."""
+    connector = session.connector
+    session.detach()
+    if connector is not None:
+        try:
+            # Public close() schedules a task on the connector's loop, which is closed;
+            # _close() is its synchronous part (drops the pooled transports)
+            connector._close()
+        except Exception:
+            pass
+
+
+def _discard_closed_loop_sessions():
+    """Drop the sessions of event loops that have been closed. Caller holds _lock."""
+    for stale_key, (stale_loop, stale_session) in list(_async_sessions.items()):
+        if stale_loop.is_closed():
+            _discard_session(stale_session)
+            del _async_sessions[stale_key]
+
+
+def get_session(provider: str) -> aiohttp.ClientSession:
+    """
+    Return the shared aiohttp session for a provider on the running event loop.
+
+    Must be called from inside a coroutine. The session must NOT be closed by
+    the caller - use close_http_sessions() on shutdown instead.
+    """
+    loop = asyncio.get_running_loop()
+    key = (id(loop), provider)
+
+    with _lock:
+        # Forget sessions whose loop has finished (asyncio.run() per lead, etc.)
+        _discard_closed_loop_sessions()
+
+        entry = _async_sessions.get(key)
+        if entry is not None and entry[0] is loop and not entry[1].closed:
+            return entry[1]
+
+        session = _create_async_session(provider)
+        _async_sessions[key] = (loop, session)
+        return session
+
+
+def replay_url(provider: str, url) -> str:
+    """Stand-in server URL for a real request URL (see HTTP_REPLAY_TARGET)."""
+    parts = urlsplit(str(url))
+    target = f"{HTTP_REPLAY_TARGET}/{provider}/{parts.scheme}/{parts.netloc}{parts.path or '/'}"
+    return f"{target}?{parts.query}" if parts.query else target
+
+
+class _GovernedRequest:
+    """
+    A session request that first waits for a rate governor token.
+
+    The wait happens before aiohttp starts the request, so it never counts
+    against the request's own timeout. Works with `async with` and `await`.
+    """
+
+    def __init__(self, provider: str, start):
+        self._provider = provider
+        self._start = start
+        self._request = None
+
+    async def _send(self):
+        await governor_acquire(self._provider)
+        return await self._start()
+
+    def __await__(self):
+        return self._send().__await__()
+
+    async def __aenter__(self):
+        await governor_acquire(self._provider)
+        self._request = self._start()
+        return await self._request.__aenter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return await self._request.__aexit__(exc_type, exc, tb)
+
+
+class _ProviderSession:
+    """
+    aiohttp session wrapper for governed providers and replay runs: requests wait
+    for a rate governor token, and with HTTP_REPLAY_TARGET set they are pointed
+    at the stand-in server.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, provider: str):
+        self._session = session
+        self._provider = provider
+        self._governed = is_governed(provider)
+
+    def request(self, method: str, url, **kwargs):
+        if HTTP_REPLAY_TARGET:
+            kwargs.pop("proxy", None)
+            kwargs.pop("ssl", None)
+            url = replay_url(self._provider, url)
+        if not self._governed:
+            return self._session.request(method, url, **kwargs)
+        return _GovernedRequest(self._provider, lambda: self._session.request(method, url, **kwargs))
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+
+class _GovernedAdapter(HTTPAdapter):
+    """requests adapter that waits for a rate governor token and reports 429s / timeouts."""
+
+    def __init__(self, provider: str, **kwargs):
+        self._provider = provider
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        governor_acquire_sync(self._provider)
+        try:
+            response = super().send(request, **kwargs)
+        except requests.exceptions.Timeout:
+            report_outcome(self._provider, TIMEOUT)
+            raise
+        _report_status(self._provider, response.status_code, response.headers.get("Retry-After"))
+        return response
+
+
+class _ReplayAdapter(_GovernedAdapter):
+    """requests adapter that points every request at HTTP_REPLAY_TARGET."""
+
+    def send(self, request, **kwargs):
+        request.url = replay_url(self._provider, request.url)
+        kwargs["proxies"] = {}
+        return super().send(request, **kwargs)
+
+
+@asynccontextmanager
+async def pooled_session(provider: str):
+    """
+    Drop-in replacement for `async with aiohttp.ClientSession() as session:`.
+
+    Yields the shared pooled session (wrapped for rate-governed providers) and
+    leaves it open on exit so the underlying keep-alive connections are reused
+    by the next call.
+    """
+    session = get_session(provider)
+    yield _ProviderSession(session, provider) if HTTP_REPLAY_TARGET or is_governed(provider) else session
+
+
+def get_sync_session(provider: str) -> requests.Session:
+    """
+    Return the shared requests.Session for a provider (thread-safe).
+
+    Used by the ScrapingDog helpers that run in asyncio.to_thread(). The urllib3
+    pool is sized to HTTP_POOL_LIMIT_PER_HOST so concurrent threads each get a
+    kept-alive socket instead of opening a new one.
+    """
+    with _lock:
+        session = _sync_sessions.get(provider)
+        if session is None:
+            session = requests.Session()
+            pool_sizes = dict(pool_connections=HTTP_POOL_LIMIT_PER_HOST, pool_maxsize=HTTP_POOL_LIMIT_PER_HOST)
+            if HTTP_REPLAY_TARGET:
+                adapter = _ReplayAdapter(provider, **pool_sizes)
+            elif is_governed(provider):
+                adapter = _GovernedAdapter(provider, **pool_sizes)
+            else:
+                adapter = HTTPAdapter(**pool_sizes)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+            def _count_response(response, *args, **kwargs):
+                _provider_stats(provider)["requests"] += 1
+                record_call(provider, response.elapsed.total_seconds() * 1000,
+                            PASS if response.status_code < 400 else FAIL)
+
+            session.hooks["response"].append(_count_response)
+            _sync_sessions[provider] = session
+        return session
+
+
+def _sync_connection_count(session: requests.Session) -> int:
+    """Number of sockets urllib3 has opened for a session's pools."""
+    total = 0
+    # The same adapter is mounted for http:// and https:// - count it once
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        pools = adapter.poolmanager.pools
+        for pool_key in list(pools.keys()):
+            pool = pools.get(pool_key)
+            if pool is not None:
+                total += getattr(pool, "num_connections", 0)
+    return total
+
+
+def get_http_client_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Per-provider connection reuse statistics.
+
+    Returns:
+        {provider: {"requests", "new_connections", "reused_connections",
+                    "dns_cache_hits", "dns_cache_misses", "errors", "reuse_rate"}}
+    """
+    with _lock:
+        report = {provider: dict(stats) for provider, stats in _stats.items()}
+        for provider, session in _sync_sessions.items():
+            stats = report.setdefault(provider, dict(_provider_stats(provider)))
+            # Sockets from already-closed sessions were folded into _stats on close
+            opened = stats["new_connections"] + _sync_connection_count(session)
+            stats["new_connections"] = opened
+            stats["reused_connections"] = max(0, stats["requests"] - opened)
+
+    for stats in report.values():
+        connections = stats["new_connections"] + stats["reused_connections"]
+        stats["reuse_rate"] = round(stats["reused_connections"] / connections, 3) if connections else 0.0
+    return report
+
+
+def log_http_client_stats():
+    """Print a one-line connection reuse summary per provider."""
+    report = get_http_client_stats()
+    if not report:
+        return
+    print(f"   🔌 HTTP connection reuse:")
+    for provider in sorted(report):
+        stats = report[provider]
+        print(
+            f"      {provider}: {stats['requests']} requests, "
+            f"{stats['new_connections']} new / {stats['reused_connections']} reused "
+            f"({stats['reuse_rate']:.0%} reuse)"
+        )
+
+
+def reset_http_client_stats():
+    """Clear the per-provider counters (sessions stay open)."""
+    with _lock:
+        _stats.clear()
+
+
+async def close_http_sessions():
+    """
+    Close the pooled sessions of the running event loop and the requests sessions
+    (call once on validator shutdown).
+
+    Sessions of already-closed loops are discarded as well. Sessions of other
+    loops that are still running are left open: aiohttp can only close a session
+    on its own loop, so each of those loops must call close_http_sessions() itself.
+    """
+    loop = asyncio.get_running_loop()
+
+    with _lock:
+        _discard_closed_loop_sessions()
+        own = [key for key, (session_loop, _) in _async_sessions.items() if session_loop is loop]
+        sessions = [_async_sessions.pop(key)[1] for key in own]
+
+    for session in sessions:
+        if not session.closed:
+            try:
+                await session.close()
+            except Exception:
+                pass
+
+    close_sync_sessions()
+
+
+def close_sync_sessions():
+    """Close the pooled requests sessions."""
+    with _lock:
+        sessions = list(_sync_sessions.values())
+        for provider, session in _sync_sessions.items():
+            stats = _provider_stats(provider)
+            stats["new_connections"] += _sync_connection_count(session)
+            stats["reused_connections"] = max(0, stats["requests"] - stats["new_connections"])
+        _sync_sessions.clear()
+    for session in sessions:
+        try:
+            session.close()
+        except Exception:
+            pass
+
+
+def _discard_sessions_at_exit():
+    with _lock:
+        _discard_closed_loop_sessions()
+
+
+atexit.register(close_sync_sessions)
+atexit.register(_discard_sessions_at_exit)
@@ -0,0 +1,433 @@
+"""
+OpenRouter LLM verification service for Stage 4/5.
+
+verify_linkedin_with_llm, check_stage5_unified and verify_sub_industry_with_llm
+each posted their own single-lead prompt, so identical questions were re-asked
+across leads and epochs. They now go through complete(), which adds:
+
+- Prompt-hash response cache: sha256(model, max_tokens, prompt) -> response
+  text, in memory and in the shared SQLite cache (namespace "llm"), so a
+  repeated question gets the exact same answer on every container and epoch
+  (replay determinism) and costs nothing. Only responses that parse as JSON
+  are cached, so a garbled answer is never pinned.
+- Micro-batching: a question whose check has no request in flight on its event
+  loop is sent at once. Questions that arrive while one is in flight wait up to
+  LLM_BATCH_WINDOW_MS and are packed into one structured request (at most
+  LLM_BATCH_MAX), so a lead-at-a-time caller never pays the window. Each answer is returned to its caller as if it came from
+  its own prompt. If the batched response does not parse, or a task is
+  missing from it, those tasks are re-asked with their single-lead prompt.
+- Per-model concurrency limits (LLM_MODEL_CONCURRENCY) instead of unbounded
+  ad hoc calls.
+- Per-check counters: tasks, requests, cache hits, batched tasks, fallbacks,
+  errors, prompt/completion tokens (OpenRouter usage block) and latency.
+
+LLM_BATCH_MAX=1 (or LLM_BATCH_WINDOW_MS=0) turns batching off.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from validator_models.http_client import pooled_session
+from validator_models.pipeline_metrics import record_cache
+from validator_models.shared_cache import get_shared_cache
+from validator_models.ttl_cache import TTLCache
+
+# ════════════════════════════════════════════════════════════════════
+# Configuration
+# ════════════════════════════════════════════════════════════════════
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+DEFAULT_MODEL = "openai/gpt-4o-mini"
+
+LLM_BATCH_WINDOW_MS = float(os.getenv("LLM_BATCH_WINDOW_MS", "25"))
+LLM_BATCH_MAX = int(os.getenv("LLM_BATCH_MAX", "4"))
+LLM_BATCH_TASK_TOKENS = 400  # Answer budget per task when the caller set no max_tokens
+LLM_DEFAULT_CONCURRENCY = int(os.getenv("LLM_DEFAULT_CONCURRENCY", "8"))
+# "openai/gpt-4o-mini=8,anthropic/claude-3-haiku=4"
+LLM_MODEL_CONCURRENCY = {
+    model.strip(): int(limit)
+    for model, _, limit in (
+        item.partition("=") for item in os.getenv("LLM_MODEL_CONCURRENCY", "").split(",") if "=" in item
+    )
+}
+LLM_CACHE_NAMESPACE = "llm"
+
+_response_cache = TTLCache(max_entries=5000, max_bytes=64 * 1024 * 1024,
+                           default_ttl_seconds=24 * 3600, name="llm_responses")
+
+_lock = threading.Lock()
+_stats: Dict[str, Dict[str, float]] = {}
+_loop_states: Dict[int, "_LoopState"] = {}
+
+_BATCH_HEADER = """You will answer {n} INDEPENDENT verification tasks. Each task is self-contained: judge it only from its own text and never use information from another task.
+
+"""
+_BATCH_FOOTER = """RESPOND WITH JSON ONLY, one entry per task, where "answer" is exactly the JSON object that task asks for:
+{{"results": [{{"task": 1, "answer": {{...}}}}, {{"task": 2, "answer": {{...}}}}]}}"""
+
+
+def _check_stats(check: str) -> Dict[str, float]:
+    stats = _stats.get(check)
+    if stats is None:
+        stats = {
+            "tasks": 0,
+            "requests": 0,
+            "cache_hits": 0,
+            "batches": 0,
+            "batched_tasks": 0,
+            "fallbacks": 0,
+            "errors": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "latency_ms_total": 0.0,
+            "latency_ms_max": 0.0,
+        }
+        _stats[check] = stats
+    return stats
+
+
+def strip_code_fences(text: str) -> str:
+    """Remove a ```json ... ``` wrapper (the LLM sometimes adds one)."""
+    text = text.strip()
+    if text.startswith("```"):
+        lines = text.split("\n")
+        if lines[0].startswith("```"):
+            lines = lines[1:]
+        if lines and lines[-1].strip() == "```":
+            lines = lines[:-1]
+        text = "\n".join(lines).strip()
+    return text
+
+
+def _parses(text: str) -> bool:
+    try:
+        json.loads(strip_code_fences(text))
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def prompt_hash(model: str, max_tokens: Optional[int], prompt: str) -> str:
+    """Cache key for one single-lead question (temperature is always 0)."""
+    return hashlib.sha256(f"{model}\n{max_tokens}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+async def _cached(key: str) -> Optional[str]:
+    text = _response_cache.get(key)
+    if text is None:
+        text = await asyncio.to_thread(get_shared_cache().get, LLM_CACHE_NAMESPACE, key)
+        if text is not None:
+            _response_cache[key] = text
+    return text
+
+
+async def _store(key: str, text: str):
+    if not _parses(text):
+        return
+    _response_cache[key] = text
+    await asyncio.to_thread(get_shared_cache().set, LLM_CACHE_NAMESPACE, key, text)
+
+
+class _Task:
+    __slots__ = ("check", "prompt", "model", "max_tokens", "timeout", "api_key", "key", "future")
+
+    def __init__(self, check, prompt, model, max_tokens, timeout, api_key, key, future):
+        self.check = check
+        self.prompt = prompt
+        self.model = model
+        self.max_tokens = max_tokens
+        self.timeout = timeout
+        self.api_key = api_key
+        self.key = key
+        self.future = future
+
+
+class _LoopState:
+    """asyncio primitives are loop-bound, so batching state is kept per event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.pending: Dict[Tuple[str, str, str], List[_Task]] = {}
+        self.timers: Dict[Tuple[str, str, str], asyncio.TimerHandle] = {}
+        self.active: Dict[Tuple[str, str, str], int] = {}  # group -> requests in flight
+        self.inflight: Dict[str, asyncio.Future] = {}  # prompt hash -> future (identical concurrent prompts)
+        self.batch_tasks = set()
+
+    def model_limit(self, model: str) -> asyncio.Semaphore:
+        semaphore = self.semaphores.get(model)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(LLM_MODEL_CONCURRENCY.get(model, LLM_DEFAULT_CONCURRENCY))
+            self.semaphores[model] = semaphore
+        return semaphore
+
+
+def _loop_state() -> _LoopState:
+    loop = asyncio.get_running_loop()
+    with _lock:
+        for loop_id, state in list(_loop_states.items()):
+            if state.loop.is_closed():
+                del _loop_states[loop_id]
+        state = _loop_states.get(id(loop))
+        if state is None or state.loop is not loop:
+            state = _LoopState(loop)
+            _loop_states[id(loop)] = state
+        return state
+
+
+# ════════════════════════════════════════════════════════════════════
+# Requests
+# ════════════════════════════════════════════════════════════════════
+async def _post(state: _LoopState, check: str, prompt: str, model: str, max_tokens: Optional[int],
+                timeout: float, api_key: str) -> Tuple[Optional[str], Optional[str]]:
+    """One chat completion under the model's concurrency limit: (text, None) or (None, error)."""
+    payload = {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0,  # Zero temperature for deterministic results
+    }
+    if max_tokens:
+        payload["max_tokens"] = max_tokens
+    stats = _check_stats(check)
+
+    async with state.model_limit(model):
+        start = time.perf_counter()
+        try:
+            async with pooled_session("openrouter") as session:
+                async with session.post(
+                    OPENROUTER_URL,
+                    headers={
+                        "Authorization": f"Bearer {api_key}",
+                        "Content-Type": "application/json"
+                    },
+                    json=payload,
+                    timeout=timeout
+                ) as response:
+                    stats["requests"] += 1
+                    if response.status != 200:
+                        stats["errors"] += 1
+                        return None, f"LLM API error: HTTP {response.status}"
+                    data = await response.json()
+        except Exception:
+            stats["errors"] += 1
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            stats["latency_ms_total"] += elapsed_ms
+            stats["latency_ms_max"] = max(stats["latency_ms_max"], elapsed_ms)
+
+    usage = data.get("usage") or {}
+    stats["prompt_tokens"] += usage.get("prompt_tokens", 0) or 0
+    stats["completion_tokens"] += usage.get("completion_tokens", 0) or 0
+    return data["choices"][0]["message"]["content"], None
+
+
+async def _single(state: _LoopState, task: _Task) -> Tuple[Optional[str], Optional[str]]:
+    text, error = await _post(state, task.check, task.prompt, task.model, task.max_tokens,
+                              task.timeout, task.api_key)
+    if text is not None:
+        await _store(task.key, text)
+    return text, error
+
+
+def _resolve(task: _Task, result=None, exception: Optional[BaseException] = None):
+    if task.future.done():
+        return
+    if exception is not None:
+        task.future.set_exception(exception)
+    else:
+        task.future.set_result(result)
+
+
+async def _run_single(state: _LoopState, task: _Task):
+    try:
+        _resolve(task, await _single(state, task))
+    except Exception as e:
+        _resolve(task, exception=e)
+
+
+def _parse_batch(text: str, count: int) -> Dict[int, str]:
+    """task number -> answer JSON text; tasks missing or malformed are simply absent."""
+    try:
+        parsed = json.loads(strip_code_fences(text))
+    except (ValueError, TypeError):
+        return {}
+    results = parsed.get("results") if isinstance(parsed, dict) else parsed
+    answers = {}
+    for entry in results if isinstance(results, list) else []:
+        if not isinstance(entry, dict) or not isinstance(entry.get("answer"), dict):
+            continue
+        try:
+            number = int(entry.get("task"))
+        except (TypeError, ValueError):
+            continue
+        if 1 <= number <= count and number not in answers:
+            answers[number] = json.dumps(entry["answer"])
+    return answers
+
+
+async def _run_batch(state: _LoopState, tasks: List[_Task]):
+    if len(tasks) == 1:
+        await _run_single(state, tasks[0])
+        return
+
+    first = tasks[0]
+    stats = _check_stats(first.check)
+    sections = [f"=== TASK {i} ===\n{task.prompt}\n=== END TASK {i} ===\n" for i, task in enumerate(tasks, 1)]
+    prompt = _BATCH_HEADER.format(n=len(tasks)) + "\n".join(sections) + "\n" + _BATCH_FOOTER
+    max_tokens = sum(task.max_tokens or LLM_BATCH_TASK_TOKENS for task in tasks) + 20 * len(tasks)
+    answers: Dict[int, str] = {}
+    try:
+        text, error = await _post(state, first.check, prompt, first.model, max_tokens,
+                                  max(task.timeout for task in tasks) * 2, first.api_key)
+        if text is not None:
+            answers = _parse_batch(text, len(tasks))
+        stats["batches"] += 1
+    except Exception as e:
+        print(f"   ⚠️ Batched LLM request failed for {first.check} ({len(tasks)} tasks): {e}")
+
+    fallback = []
+    for i, task in enumerate(tasks, 1):
+        answer = answers.get(i)
+        if answer is None:
+            fallback.append(task)
+            continue
+        stats["batched_tasks"] += 1
+        await _store(task.key, answer)
+        _resolve(task, (answer, None))
+    if fallback:
+        stats["fallbacks"] += len(fallback)
+        await asyncio.gather(*(_run_single(state, task) for task in fallback))
+
+
+def _flush(state: _LoopState, group: Tuple[str, str, str]):
+    timer = state.timers.pop(group, None)
+    if timer is not None:
+        timer.cancel()
+    tasks = state.pending.pop(group, [])
+    if tasks:
+        batch_task = state.loop.create_task(_run_batch(state, tasks))
+        state.batch_tasks.add(batch_task)
+        state.active[group] = state.active.get(group, 0) + 1
+        batch_task.add_done_callback(lambda t: _batch_done(state, group, t))
+
+
+def _batch_done(state: _LoopState, group: Tuple[str, str, str], batch_task: asyncio.Task):
+    state.batch_tasks.discard(batch_task)
+    remaining = state.active.get(group, 0) - 1
+    if remaining > 0:
+        state.active[group] = remaining
+    else:
+        state.active.pop(group, None)
+
+
+async def complete(
+    check: str,
+    prompt: str,
+    model: str = DEFAULT_MODEL,
+    max_tokens: Optional[int] = None,
+    timeout: float = 20,
+    api_key: Optional[str] = None,
+    batchable: bool = True
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Answer one single-lead verification prompt.
+
+    Args:
+        check: Name the tokens/latency are reported under (e.g. "stage4_linkedin")
+        prompt: The full single-lead prompt; it must ask for a JSON object
+        model: OpenRouter model id
+        max_tokens: Completion budget for this prompt (None = provider default)
+        timeout: Request timeout in seconds
+        api_key: OpenRouter key (defaults to OPENROUTER_KEY)
+        batchable: False always sends the prompt on its own
+
+    Returns:
+        (response_text, None) on success, (None, "LLM API error: HTTP <status>") on
+        an HTTP error. Network errors raise, as the direct aiohttp calls did.
+    """
+    stats = _check_stats(check)
+    stats["tasks"] += 1
+    key = prompt_hash(model, max_tokens, prompt)
+    cached = await _cached(key)
+    if cached is not None:
+        stats["cache_hits"] += 1
+        record_cache("providers", "openrouter", hit=True)
+        return cached, None
+
+    state = _loop_state()
+    inflight = state.inflight.get(key)
+    if inflight is not None:
+        # Identical question already being asked on this loop - share its answer
+        stats["cache_hits"] += 1
+        record_cache("providers", "openrouter", hit=True)
+        return await asyncio.shield(inflight)
+
+    record_cache("providers", "openrouter", hit=False)
+    task = _Task(check, prompt, model, max_tokens, timeout,
+                 api_key if api_key is not None else os.getenv("OPENROUTER_KEY", ""),
+                 key, state.loop.create_future())
+    state.inflight[key] = task.future
+    task.future.add_done_callback(lambda f: state.inflight.pop(key) if state.inflight.get(key) is f else None)
+
+    if batchable and LLM_BATCH_MAX > 1 and LLM_BATCH_WINDOW_MS > 0:
+        group = (check, model, task.api_key)
+        pending = state.pending.setdefault(group, [])
+        pending.append(task)
+        if len(pending) >= LLM_BATCH_MAX or not state.active.get(group):
+            # Nothing in flight for this check: no one to batch with, send now
+            _flush(state, group)
+        elif len(pending) == 1:
+            state.timers[group] = state.loop.call_later(LLM_BATCH_WINDOW_MS / 1000.0, _flush, state, group)
+    else:
+        await _run_single(state, task)
+    return await asyncio.shield(task.future)
+
+
+# ════════════════════════════════════════════════════════════════════
+# Reporting
+# ════════════════════════════════════════════════════════════════════
+def get_llm_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Per-check LLM usage.
+
+    Returns:
+        {check: {"tasks", "requests", "cache_hits", "batches", "batched_tasks",
+                 "fallbacks", "errors", "prompt_tokens", "completion_tokens",
+                 "latency_ms_avg", "latency_ms_max", "cache_hit_rate"}}
+    """
+    with _lock:
+        report = {check: dict(stats) for check, stats in _stats.items()}
+    for stats in report.values():
+        total_ms = stats.pop("latency_ms_total")
+        stats["latency_ms_avg"] = round(total_ms / stats["requests"], 1) if stats["requests"] else 0.0
+        stats["latency_ms_max"] = round(stats["latency_ms_max"], 1)
+        stats["cache_hit_rate"] = round(stats["cache_hits"] / stats["tasks"], 3) if stats["tasks"] else 0.0
+    return report
+
+
+def log_llm_stats():
+    """Print a one-line usage summary per LLM check."""
+    report = get_llm_stats()
+    if not report:
+        return
+    print(f"   🤖 LLM verification usage:")
+    for check in sorted(report):
+        stats = report[check]
+        print(
+            f"      {check}: {stats['tasks']} tasks, {stats['requests']} requests "
+            f"({stats['batched_tasks']} batched, {stats['fallbacks']} fallbacks), "
+            f"{stats['cache_hit_rate']:.0%} cached, "
+            f"{stats['prompt_tokens']}+{stats['completion_tokens']} tokens, "
+            f"avg {stats['latency_ms_avg']:.0f}ms / max {stats['latency_ms_max']:.0f}ms"
+        )
+
+
+def reset_llm_stats():
+    """Clear the per-check counters."""
+    with _lock:
+        _stats.clear()
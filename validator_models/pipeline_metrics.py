@@ -0,0 +1,318 @@
+"""
+Per-check latency and external-call instrumentation for the validation pipeline.
+
+run_automated_checks / run_stage0_2_checks / run_stage4_5_repscore only
+printed progress, so there was no way to tell which checks dominate an
+epoch. This module records, per epoch:
+
+- checks:    every check_* coroutine (and the three stage runners), via the
+             @instrumented_check decorator: wall time, queue wait (time spent
+             blocked on dependency_limit()/executor semaphores while the check
+             ran), pass / fail / error, and domain-plan reuse as cache hits
+- providers: every outbound HTTP call made through http_client (aiohttp trace
+             hooks and requests response hooks): wall time and pass / fail /
+             error, plus cache hits/misses reported by serp_cache and llm_service
+- queues:    wait time per semaphore (whois, dns, head, stage0_2_executor)
+
+Latencies go into fixed log-spaced histograms (no per-sample storage), and at
+the end of each batch a compact JSON report is written to
+validator_weights/container_{id}_epoch_{N}_metrics.json. Reports older than
+the last PIPELINE_METRICS_KEEP_EPOCHS epochs are pruned on each write. The
+same report is served by the validator's /status route.
+
+PIPELINE_METRICS=false disables everything at import time: the decorator
+returns the original function and dependency_limit() hands back the bare
+semaphore, so there is no per-call overhead.
+"""
+
+import asyncio
+import contextvars
+import functools
+import glob
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+PIPELINE_METRICS = os.getenv("PIPELINE_METRICS", "true").lower() == "true"
+PIPELINE_METRICS_DIR = os.getenv("PIPELINE_METRICS_DIR", "validator_weights")
+# Epochs of reports kept on disk (all containers); check_scheduler reads the most recent few
+PIPELINE_METRICS_KEEP_EPOCHS = int(os.getenv("PIPELINE_METRICS_KEEP_EPOCHS", "24"))
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+PASS = "pass"
+FAIL = "fail"
+ERROR = "error"
+
+_lock = threading.Lock()
+_groups: Dict[str, Dict[str, "_Histogram"]] = {"checks": {}, "providers": {}, "queues": {}}
+_epoch: Dict[str, Any] = {"epoch": None, "container_id": None, "started_at": None}
+_queue_wait: contextvars.ContextVar = contextvars.ContextVar("pipeline_metrics_queue_wait", default=None)
+_REPORT_RE = re.compile(r"container_\d+_epoch_(\d+)_metrics\.json$")
+
+
+class _Histogram:
+    __slots__ = ("count", "total_ms", "max_ms", "buckets", "outcomes", "cache_hits", "cache_misses",
+                 "queue_ms_total", "queue_ms_max")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+        self.outcomes = {PASS: 0, FAIL: 0, ERROR: 0}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.queue_ms_total = 0.0
+        self.queue_ms_max = 0.0
+
+    def add(self, elapsed_ms: float, outcome: Optional[str] = None, queue_ms: float = 0.0):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        for i, bound in enumerate(BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+        if outcome is not None:
+            self.outcomes[outcome] += 1
+        if queue_ms:
+            self.queue_ms_total += queue_ms
+            self.queue_ms_max = max(self.queue_ms_max, queue_ms)
+
+    def _percentile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th sample, capped at the observed max."""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target and i < len(BUCKETS_MS):
+                return round(min(float(BUCKETS_MS[i]), self.max_ms), 1)
+        return round(self.max_ms, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        report = {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 1),
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+            "p50_ms": self._percentile(0.50),
+            "p95_ms": self._percentile(0.95),
+            "p99_ms": self._percentile(0.99),
+            "max_ms": round(self.max_ms, 1),
+            # Sparse: only non-empty buckets, keyed by upper bound ("inf" = above the last)
+            "buckets": {str(BUCKETS_MS[i]) if i < len(BUCKETS_MS) else "inf": n
+                        for i, n in enumerate(self.buckets) if n},
+        }
+        if any(self.outcomes.values()):
+            report["outcomes"] = dict(self.outcomes)
+        if self.cache_hits or self.cache_misses:
+            report["cache_hits"] = self.cache_hits
+            report["cache_misses"] = self.cache_misses
+        if self.queue_ms_total:
+            report["queue_wait_ms_total"] = round(self.queue_ms_total, 1)
+            report["queue_wait_ms_max"] = round(self.queue_ms_max, 1)
+        return report
+
+
+def _histogram(group: str, name: str) -> _Histogram:
+    histograms = _groups[group]
+    histogram = histograms.get(name)
+    if histogram is None:
+        histogram = _Histogram()
+        histograms[name] = histogram
+    return histogram
+
+
+# ════════════════════════════════════════════════════════════════════
+# Recording
+# ════════════════════════════════════════════════════════════════════
+def record_call(provider: str, elapsed_ms: float, outcome: str):
+    """One outbound provider request (thread-safe; called from http_client hooks)."""
+    if not PIPELINE_METRICS:
+        return
+    with _lock:
+        _histogram("providers", provider).add(elapsed_ms, outcome)
+
+
+def record_cache(group: str, name: str, hit: bool):
+    """A cache lookup that saved (hit) or led to (miss) a check execution or provider call."""
+    if not PIPELINE_METRICS:
+        return
+    with _lock:
+        histogram = _histogram(group, name)
+        if hit:
+            histogram.cache_hits += 1
+        else:
+            histogram.cache_misses += 1
+
+
+def _outcome(result: Any) -> str:
+    # (bool, dict) checks fail on False; (score, dict) rep-score checks always "pass"
+    if isinstance(result, tuple) and result and result[0] is False:
+        return FAIL
+    return PASS
+
+
+def instrumented_check(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Decorator for check coroutines: wall time, queue wait and outcome per call."""
+    if not PIPELINE_METRICS:
+        return func
+    name = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        parent = _queue_wait.get()
+        waits = [0.0]
+        token = _queue_wait.set(waits)
+        start = time.perf_counter()
+        outcome = ERROR
+        try:
+            result = await func(*args, **kwargs)
+            outcome = _outcome(result)
+            return result
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            _queue_wait.reset(token)
+            if parent is not None:
+                parent[0] += waits[0]  # Stage runners include their checks' queue wait
+            with _lock:
+                _histogram("checks", name).add(elapsed_ms, outcome, waits[0])
+
+    return wrapper
+
+
+class _MeteredSemaphore:
+    """async with wrapper around a semaphore that records how long acquiring it took."""
+
+    __slots__ = ("semaphore", "name")
+
+    def __init__(self, semaphore: asyncio.Semaphore, name: str):
+        self.semaphore = semaphore
+        self.name = name
+
+    async def __aenter__(self):
+        start = time.perf_counter()
+        await self.semaphore.acquire()
+        waited_ms = (time.perf_counter() - start) * 1000
+        waits = _queue_wait.get()
+        if waits is not None:
+            waits[0] += waited_ms
+        with _lock:
+            _histogram("queues", self.name).add(waited_ms)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.semaphore.release()
+        return False
+
+
+def metered(semaphore: asyncio.Semaphore, name: str):
+    """Wrap a semaphore so its queue wait is recorded (the bare semaphore when disabled)."""
+    if not PIPELINE_METRICS:
+        return semaphore
+    return _MeteredSemaphore(semaphore, name)
+
+
+# ════════════════════════════════════════════════════════════════════
+# Per-epoch reports
+# ════════════════════════════════════════════════════════════════════
+def start_epoch(epoch: int, container_id: int = 0):
+    """Start a fresh set of histograms for this epoch (call before the batch)."""
+    with _lock:
+        for histograms in _groups.values():
+            histograms.clear()
+        _epoch.update({
+            "epoch": epoch,
+            "container_id": container_id,
+            "started_at": datetime.utcnow().isoformat() + "Z",
+        })
+
+
+def get_pipeline_metrics() -> Dict[str, Any]:
+    """
+    Histograms recorded since start_epoch().
+
+    Returns:
+        {"enabled", "epoch", "container_id", "started_at",
+         "checks": {name: {...}}, "providers": {name: {...}}, "queues": {name: {...}}}
+        Each entry has count, total/avg/p50/p95/p99/max ms, sparse buckets and,
+        where recorded, outcomes, cache hits/misses and queue wait.
+    """
+    with _lock:
+        report = {"enabled": PIPELINE_METRICS, **_epoch}
+        for group, histograms in _groups.items():
+            report[group] = {name: histograms[name].to_dict() for name in sorted(histograms)}
+    return report
+
+
+def write_epoch_report(directory: Optional[str] = None) -> Optional[str]:
+    """Write the current report as compact JSON; returns the path (None if disabled/failed)."""
+    if not PIPELINE_METRICS:
+        return None
+    report = get_pipeline_metrics()
+    report["written_at"] = datetime.utcnow().isoformat() + "Z"
+    path = Path(directory or PIPELINE_METRICS_DIR) / (
+        f"container_{report['container_id'] or 0}_epoch_{report['epoch']}_metrics.json"
+    )
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(report, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"⚠️ Could not write pipeline metrics report {path}: {e}")
+        return None
+    if isinstance(report["epoch"], int):
+        prune_epoch_reports(report["epoch"], directory)
+    return str(path)
+
+
+def prune_epoch_reports(current_epoch: int, directory: Optional[str] = None,
+                        keep_epochs: Optional[int] = None) -> int:
+    """Delete every container's reports for epochs before the last keep_epochs. Returns files removed."""
+    keep = PIPELINE_METRICS_KEEP_EPOCHS if keep_epochs is None else keep_epochs
+    if keep <= 0:
+        return 0
+    removed = 0
+    for path in glob.glob(os.path.join(directory or PIPELINE_METRICS_DIR, "container_*_epoch_*_metrics.json")):
+        match = _REPORT_RE.search(path)
+        if match and int(match.group(1)) <= current_epoch - keep:
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass   # Another container pruned it first
+            except OSError as e:
+                print(f"⚠️ Could not prune pipeline metrics report {path}: {e}")
+    return removed
+
+
+def log_pipeline_metrics(top: int = 8):
+    """Print the checks and providers that took the most total time."""
+    if not PIPELINE_METRICS:
+        return
+    report = get_pipeline_metrics()
+    for group, label in (("checks", "Slowest checks"), ("providers", "Slowest providers")):
+        entries = sorted(report[group].items(), key=lambda item: item[1]["total_ms"], reverse=True)[:top]
+        if not entries:
+            continue
+        print(f"   ⏱️ {label} (total time):")
+        for name, stats in entries:
+            queue = f", {stats['queue_wait_ms_total'] / 1000:.1f}s queued" if stats.get("queue_wait_ms_total") else ""
+            errors = stats.get("outcomes", {}).get(ERROR, 0)
+            print(
+                f"      {name}: {stats['count']} calls, {stats['total_ms'] / 1000:.1f}s, "
+                f"p50 {stats['p50_ms']}ms / p95 {stats['p95_ms']}ms{queue}"
+                + (f", {errors} errors" if errors else "")
+            )
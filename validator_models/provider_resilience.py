@@ -0,0 +1,452 @@
+"""
+Hedged requests and circuit breakers for Stage 4/5 provider calls.
+
+One slow Wayback or GDELT response, or a stalled ScrapingDog search, held a
+lead for the full 15-30s request timeout in check_wayback_machine,
+check_gdelt_mentions and search_linkedin_gse, pushing the epoch's tail far past
+its median. Call sites now run the request through guarded_call() /
+guarded_call_sync():
+
+- hedging (idempotent calls only, HEDGE_PROVIDERS): when the first request has
+  not answered after the provider's recent p95 latency (HEDGE_QUANTILE over the
+  last HEDGE_WINDOW successful requests, clamped to HEDGE_MIN/MAX_DELAY_MS), an
+  identical second request is sent and whichever succeeds first is used. Both
+  requests return the same response, so verdicts do not change. Hedges are
+  capped at HEDGE_BUDGET of a provider's calls (ScrapingDog hedges are paid
+  searches) and no hedging happens until HEDGE_MIN_SAMPLES latencies are known.
+  When the hedge wins, the first request is left to finish in the background
+  so its latency - what the call would have cost without hedging - is measured.
+- circuit breakers (BREAKER_PROVIDERS): when BREAKER_ERROR_RATE of the last
+  BREAKER_WINDOW calls failed (exceptions, timeouts or caller-declared failures
+  such as 5xx), the provider is skipped for BREAKER_OPEN_SECONDS:
+  guarded_call raises ProviderUnavailableError immediately and the check takes
+  its existing "checked": False soft-score path. One probe call then decides
+  whether the circuit closes again. Only providers with such a soft path are
+  listed: a Stage 4 search failure rejects the lead, so ScrapingDog is hedged
+  but never fails fast.
+
+State is per process. get_provider_resilience_stats() (served on /status) and
+log_provider_resilience_stats() (end of every batch) report, per provider, the
+latency callers saw next to the latency without hedging, hedges sent and won,
+breaker state and the time fast failures saved.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait as wait_futures
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+# ════════════════════════════════════════════════════════════════════
+# Configuration
+# ════════════════════════════════════════════════════════════════════
+HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "true").lower() == "true"
+HEDGE_PROVIDERS = set(filter(None, os.getenv("HEDGE_PROVIDERS", "wayback,gdelt,scrapingdog").split(",")))
+HEDGE_QUANTILE = float(os.getenv("HEDGE_QUANTILE", "0.95"))
+HEDGE_WINDOW = int(os.getenv("HEDGE_WINDOW", "500"))                # Recent successful latencies kept
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+HEDGE_MIN_DELAY_MS = float(os.getenv("HEDGE_MIN_DELAY_MS", "250"))
+HEDGE_MAX_DELAY_MS = float(os.getenv("HEDGE_MAX_DELAY_MS", "10000"))
+HEDGE_BUDGET = float(os.getenv("HEDGE_BUDGET", "0.1"))              # Max fraction of calls hedged
+HEDGE_SYNC_WORKERS = int(os.getenv("HEDGE_SYNC_WORKERS", "32"))     # Threads for hedged thread callers
+
+BREAKER_ENABLED = os.getenv("BREAKER_ENABLED", "true").lower() == "true"
+BREAKER_PROVIDERS = set(filter(None, os.getenv("BREAKER_PROVIDERS", "wayback,gdelt").split(",")))
+BREAKER_WINDOW = int(os.getenv("BREAKER_WINDOW", "20"))             # Recent call outcomes considered
+BREAKER_MIN_CALLS = int(os.getenv("BREAKER_MIN_CALLS", "10"))
+BREAKER_ERROR_RATE = float(os.getenv("BREAKER_ERROR_RATE", "0.5"))
+BREAKER_OPEN_SECONDS = float(os.getenv("BREAKER_OPEN_SECONDS", "30"))
+
+LATENCY_WINDOW = 1000   # Calls kept per provider for the tail-latency report
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ProviderUnavailableError(Exception):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+
+def _quantile(values, q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class CircuitBreaker:
+    """Closed -> open on a spike in the recent error rate -> half-open probe -> closed."""
+
+    def __init__(self, provider: str):
+        self.provider = provider
+        self.state = CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=BREAKER_WINDOW)   # True = failed
+        self.opened_at = 0.0
+        self.opens = 0
+        self.probing = False
+
+    def allow(self) -> bool:
+        """Whether a call may go out now (lock held by the caller)."""
+        if self.state == OPEN and time.time() - self.opened_at >= BREAKER_OPEN_SECONDS:
+            self.state = HALF_OPEN
+            self.probing = False
+        if self.state == HALF_OPEN:
+            if self.probing:
+                return False
+            self.probing = True
+        return self.state != OPEN
+
+    def record(self, failed: bool):
+        if self.state == HALF_OPEN:
+            self.probing = False
+            if failed:
+                self._open()
+            else:
+                self.state = CLOSED
+                self.outcomes.clear()
+                print(f"   🛡️ Circuit breaker: {self.provider} recovered - closed")
+            return
+        self.outcomes.append(failed)
+        if (self.state == CLOSED and len(self.outcomes) >= BREAKER_MIN_CALLS
+                and sum(self.outcomes) / len(self.outcomes) >= BREAKER_ERROR_RATE):
+            self._open()
+            print(f"   🛡️ Circuit breaker: {self.provider} failing "
+                  f"({sum(self.outcomes)}/{len(self.outcomes)} recent calls) - open for {BREAKER_OPEN_SECONDS:g}s")
+
+    def release(self):
+        """A probe that ended without an outcome (cancelled) frees the half-open slot."""
+        if self.state == HALF_OPEN:
+            self.probing = False
+
+    def _open(self):
+        self.state = OPEN
+        self.opened_at = time.time()
+        self.opens += 1
+
+    def error_rate(self) -> float:
+        return round(sum(self.outcomes) / len(self.outcomes), 3) if self.outcomes else 0.0
+
+
+class _ProviderState:
+    def __init__(self, provider: str):
+        self.provider = provider
+        self.lock = threading.Lock()
+        self.breaker = CircuitBreaker(provider)
+        self.successes: Deque[float] = deque(maxlen=HEDGE_WINDOW)     # Seconds per successful request
+        self.observed: Deque[float] = deque(maxlen=LATENCY_WINDOW)    # Seconds the caller waited
+        self.unhedged: Deque[float] = deque(maxlen=LATENCY_WINDOW)    # Seconds the first request took
+        self.counters = {"calls": 0, "failures": 0, "hedged": 0, "hedge_wins": 0, "fast_fails": 0}
+        self.failed_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None while too few latencies are known."""
+        with self.lock:
+            if len(self.successes) < HEDGE_MIN_SAMPLES:
+                return None
+            delay_ms = _quantile(self.successes, HEDGE_QUANTILE) * 1000
+        return min(max(delay_ms, HEDGE_MIN_DELAY_MS), HEDGE_MAX_DELAY_MS) / 1000
+
+    def take_hedge(self) -> bool:
+        """Claim one hedge from the HEDGE_BUDGET share of calls."""
+        with self.lock:
+            if self.counters["hedged"] >= HEDGE_BUDGET * self.counters["calls"]:
+                return False
+            self.counters["hedged"] += 1
+            return True
+
+    def count(self, counter: str):
+        with self.lock:
+            self.counters[counter] += 1
+
+    def record(self, observed: float, failed: bool, attempt: Optional[float], unhedged: Optional[float]):
+        """
+        One finished call: caller wait, outcome, winning request latency and first-request
+        latency (None while a losing first request is still running - see record_primary).
+        """
+        with self.lock:
+            if unhedged is not None:
+                # Both windows hold the same calls, so their percentiles compare
+                self.observed.append(observed)
+                self.unhedged.append(unhedged)
+            if failed:
+                self.counters["failures"] += 1
+                self.failed_seconds += observed
+            elif attempt is not None:
+                self.successes.append(attempt)
+
+    def record_primary(self, primary: float, observed: float):
+        """The first request of a call the hedge won has finished (in the background)."""
+        with self.lock:
+            self.observed.append(observed)
+            self.unhedged.append(primary)
+            self.saved_seconds += max(0.0, primary - observed)
+
+
+_lock = threading.Lock()
+_states: Dict[str, _ProviderState] = {}
+_executor: Optional[ThreadPoolExecutor] = None
+_background = set()
+
+
+def _state(provider: str) -> _ProviderState:
+    state = _states.get(provider)
+    if state is None:
+        with _lock:
+            state = _states.setdefault(provider, _ProviderState(provider))
+    return state
+
+
+def _hedge_delay(state: _ProviderState, hedge: bool) -> Optional[float]:
+    if not (hedge and HEDGE_ENABLED and state.provider in HEDGE_PROVIDERS):
+        return None
+    return state.hedge_delay()
+
+
+def _admit(state: _ProviderState) -> Optional[CircuitBreaker]:
+    """Count the call and consult the provider's breaker (raises when it is open)."""
+    state.count("calls")
+    if not (BREAKER_ENABLED and state.provider in BREAKER_PROVIDERS):
+        return None
+    with state.lock:
+        allowed = state.breaker.allow()
+    if not allowed:
+        state.count("fast_fails")
+        raise ProviderUnavailableError(f"{state.provider} unavailable (circuit breaker open)")
+    return state.breaker
+
+
+def _finish(state: _ProviderState, breaker: Optional[CircuitBreaker], failed: Optional[bool]):
+    if breaker is None:
+        return
+    with state.lock:
+        if failed is None:
+            breaker.release()
+        else:
+            breaker.record(failed)
+
+
+# ════════════════════════════════════════════════════════════════════
+# Async callers
+# ════════════════════════════════════════════════════════════════════
+async def guarded_call(provider: str, call: Callable[[], Awaitable[Any]], hedge: bool = False,
+                       failed: Optional[Callable[[Any], bool]] = None) -> Any:
+    """
+    Run `await call()` behind the provider's circuit breaker, hedged when `hedge`
+    is True (only for idempotent requests: call() may run twice).
+
+    `failed(result)` marks results that count as provider failures (e.g. HTTP 5xx);
+    exceptions always do. Raises ProviderUnavailableError while the breaker is open.
+    """
+    state = _state(provider)
+    breaker = _admit(state)
+    started = time.perf_counter()
+    outcome = None
+    try:
+        delay = _hedge_delay(state, hedge)
+        if delay is None:
+            try:
+                result = await call()
+            except Exception:
+                outcome = True
+                elapsed = time.perf_counter() - started
+                state.record(elapsed, True, None, elapsed)
+                raise
+            elapsed = time.perf_counter() - started
+            outcome = bool(failed and failed(result))
+            state.record(elapsed, outcome, elapsed, elapsed)
+            return result
+        winner, outcome = await _race(state, call, delay, failed, started)
+        return winner.result()   # Raises the winning request's exception (outcome already set)
+    finally:
+        _finish(state, breaker, outcome)
+
+
+def _succeeded(task, failed) -> bool:
+    return not task.cancelled() and task.exception() is None and not (failed and failed(task.result()))
+
+
+async def _race(state: _ProviderState, call, delay: float, failed, started: float):
+    """First request, plus an identical hedge after `delay`; returns (winning task, failed)."""
+    primary = asyncio.ensure_future(call())
+    tasks = {primary: started}
+    finished: Dict[asyncio.Future, float] = {}
+    winner = None
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not state.take_hedge():
+            await asyncio.wait({primary})
+            winner = primary
+        else:
+            hedge = asyncio.ensure_future(call())
+            tasks[hedge] = time.perf_counter()
+            pending = {primary, hedge}
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=FIRST_COMPLETED)
+                for task in done:
+                    finished[task] = time.perf_counter()
+                # Prefer the first request when both finished in the same tick
+                winner = next((task for task in (primary, hedge) if task in done and _succeeded(task, failed)), None)
+            if winner is None:
+                winner = primary   # Both failed: report the first request's outcome
+    finally:
+        for task in tasks:
+            if task.done() and not task.cancelled():
+                task.exception()   # Mark a losing request's error as retrieved
+            elif task is not primary:
+                task.cancel()
+        if winner is None and not primary.done():
+            primary.cancel()   # Caller cancelled
+
+    now = time.perf_counter()
+    observed = now - started
+    outcome = not _succeeded(winner, failed)
+    attempt = finished.get(winner, now) - tasks[winner]
+    if winner is primary:
+        state.record(observed, outcome, None if outcome else attempt, observed)
+    else:
+        # The hedge won: let the first request finish to measure what it would have cost
+        state.count("hedge_wins")
+        state.record(observed, outcome, None if outcome else attempt, None)
+
+        def _primary_done(task):
+            _background.discard(task)
+            if task.cancelled():
+                return   # Event loop shut down: no measurement
+            task.exception()   # Retrieved: nobody else awaits it
+            state.record_primary(time.perf_counter() - started, observed)
+        _background.add(primary)
+        primary.add_done_callback(_primary_done)
+    return winner, outcome
+
+
+# ════════════════════════════════════════════════════════════════════
+# Thread callers (requests sessions run in asyncio.to_thread)
+# ════════════════════════════════════════════════════════════════════
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=HEDGE_SYNC_WORKERS, thread_name_prefix="hedge")
+    return _executor
+
+
+def _future_succeeded(future: Future, failed) -> bool:
+    return future.exception() is None and not (failed and failed(future.result()))
+
+
+def guarded_call_sync(provider: str, call: Callable[[], Any], hedge: bool = False,
+                      failed: Optional[Callable[[Any], bool]] = None) -> Any:
+    """guarded_call() for blocking calls; a losing request finishes in the background."""
+    state = _state(provider)
+    breaker = _admit(state)
+    started = time.perf_counter()
+    outcome = None
+    try:
+        delay = _hedge_delay(state, hedge)
+        if delay is None:
+            try:
+                result = call()
+            except Exception:
+                outcome = True
+                elapsed = time.perf_counter() - started
+                state.record(elapsed, True, None, elapsed)
+                raise
+            elapsed = time.perf_counter() - started
+            outcome = bool(failed and failed(result))
+            state.record(elapsed, outcome, elapsed, elapsed)
+            return result
+
+        executor = _get_executor()
+        primary = executor.submit(call)
+        done, _ = wait_futures({primary}, timeout=delay)
+        winner = primary if done or not state.take_hedge() else None
+        if winner is primary:
+            wait_futures({primary})
+        else:
+            hedge_started = time.perf_counter()
+            hedge_future = executor.submit(call)
+            pending = {primary, hedge_future}
+            while pending and winner is None:
+                done, pending = wait_futures(pending, return_when=FIRST_COMPLETED)
+                winner = next((f for f in (primary, hedge_future) if f in done and _future_succeeded(f, failed)), None)
+            if winner is None:
+                winner = primary
+        observed = time.perf_counter() - started
+        outcome = not _future_succeeded(winner, failed)
+        if winner is primary:
+            state.record(observed, outcome, None if outcome else observed, observed)
+        else:
+            # Threads cannot be cancelled: the first request finishes anyway and is measured
+            state.count("hedge_wins")
+            state.record(observed, outcome, None if outcome else time.perf_counter() - hedge_started, None)
+            primary.add_done_callback(lambda future: state.record_primary(time.perf_counter() - started, observed))
+        return winner.result()
+    finally:
+        _finish(state, breaker, outcome)
+
+
+# ════════════════════════════════════════════════════════════════════
+# Reporting
+# ════════════════════════════════════════════════════════════════════
+def _latency_ms(values) -> Dict[str, Optional[float]]:
+    return {f"p{int(q * 100)}": (round(v * 1000, 1) if v is not None else None)
+            for q, v in ((q, _quantile(values, q)) for q in (0.5, 0.95, 0.99))}
+
+
+def get_provider_resilience_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Tail-latency dashboard per provider (this process, last LATENCY_WINDOW calls).
+
+    Returns:
+        {provider: {"calls", "failures", "hedged", "hedge_wins", "fast_fails",
+                    "latency_ms": {"p50", "p95", "p99"},            # what callers waited
+                    "unhedged_latency_ms": {"p50", "p95", "p99"},   # the first request alone
+                    "hedge_delay_ms", "hedging_saved_s", "fast_fail_saved_s",
+                    "breaker": {"state", "opens", "error_rate"}}}
+    """
+    report = {}
+    with _lock:
+        states = dict(_states)
+    for provider, state in sorted(states.items()):
+        delay = _hedge_delay(state, True)
+        with state.lock:
+            counters = dict(state.counters)
+            failures = counters["failures"]
+            mean_failure = state.failed_seconds / failures if failures else 0.0
+            report[provider] = {
+                **counters,
+                "latency_ms": _latency_ms(state.observed),
+                "unhedged_latency_ms": _latency_ms(state.unhedged),
+                "hedge_delay_ms": round(delay * 1000, 1) if delay is not None else None,
+                "hedging_saved_s": round(state.saved_seconds, 1),
+                # Each fast failure skipped a call that, recently, failed after this long on average
+                "fast_fail_saved_s": round(counters["fast_fails"] * mean_failure, 1),
+                "breaker": {
+                    "enabled": BREAKER_ENABLED and provider in BREAKER_PROVIDERS,
+                    "state": state.breaker.state,
+                    "opens": state.breaker.opens,
+                    "error_rate": state.breaker.error_rate(),
+                },
+            }
+    return report
+
+
+def log_provider_resilience_stats():
+    """Print per-provider caller vs. unhedged tail latency, hedges and breaker activity."""
+    report = get_provider_resilience_stats()
+    if not report:
+        return
+    print("   🛡️ Provider tail latency (caller wait vs. first request alone):")
+    for provider, stats in report.items():
+        latency, unhedged = stats["latency_ms"], stats["unhedged_latency_ms"]
+        breaker = stats["breaker"]
+        breaker_text = (f", breaker {breaker['state']} ({breaker['opens']} opens, {stats['fast_fails']} fast fails, "
+                        f"~{stats['fast_fail_saved_s']}s saved)" if breaker["enabled"] else "")
+        print(f"      {provider}: {stats['calls']} calls, p50 {latency['p50']}ms, "
+              f"p95 {latency['p95']}ms (unhedged {unhedged['p95']}ms), p99 {latency['p99']}ms (unhedged {unhedged['p99']}ms); "
+              f"{stats['hedged']} hedged / {stats['hedge_wins']} won, ~{stats['hedging_saved_s']}s saved{breaker_text}")
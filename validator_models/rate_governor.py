@@ -0,0 +1,422 @@
+"""
+Host-wide adaptive rate governor for external providers.
+
+Outbound pacing used to be a mix of a module-global API_SEMAPHORE, fixed sleeps
+between requests (TrueList inline verification), a container_id * 8s WHOIS
+stagger before Stage 0-2 and Nominatim's 1s sleep. All of it was per process,
+so the 30 containers on a host hit providers with 30x the intended rate at peak
+(429s) and left capacity unused the rest of the time. RateGovernor keeps one
+token bucket per provider in a small memory-mapped file under the shared
+validator_weights/ directory, so every container on the host draws from the
+same buckets:
+
+- acquire: refill the bucket at its current rate (burst = one second of
+  tokens) and take a token; when none is left the caller reserves the next one
+  and sleeps until it is due, so waiters are served in order across processes
+  without polling. Outstanding reservations are the provider's queue depth.
+- AIMD: a 429 or a timeout multiplies the rate by RATE_GOVERNOR_DECREASE_FACTOR
+  (at most once per RATE_GOVERNOR_DECREASE_COOLDOWN_SECONDS, never below the
+  provider's minimum); each success adds RATE_GOVERNOR_INCREASE_FRACTION of the
+  maximum divided by the rate, i.e. the rate climbs by that fraction of the
+  maximum per second of sustained success. A Retry-After header on a 429 also
+  pauses the bucket.
+- Every update is a few microseconds under an flock on the file (plus a thread
+  lock). Async callers take it in a worker thread (asyncio.to_thread), so a
+  contended lock never stalls the event loop.
+- A caller never waits more than RATE_GOVERNOR_MAX_WAIT_SECONDS - past that it
+  proceeds without a token (counted as overflow), so a collapsed rate cannot
+  stall an epoch.
+
+http_client acquires a token in its request hooks for every provider in
+RATE_LIMITS (pooled_session and get_sync_session alike) and reports 429s and
+timeouts back; WHOIS and Nominatim, which do not go through http_client, call
+acquire() / acquire_sync() and report_outcome() directly. Providers not in
+RATE_LIMITS (company websites, the TrueList CSV download) are not paced.
+Limits are requests per second for the whole host; override one provider with
+RATE_LIMIT_<PROVIDER>="initial,min,max".
+
+    python -m validator_models.rate_governor status
+    python -m validator_models.rate_governor reset [--provider scrapingdog]
+
+RATE_GOVERNOR_PATH="" keeps the buckets in process memory (per-container pacing).
+Replace the file with `reset`, not by deleting it, while validators are running.
+"""
+
+import argparse
+import asyncio
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+# ════════════════════════════════════════════════════════════════════
+# Configuration
+# ════════════════════════════════════════════════════════════════════
+RATE_GOVERNOR_PATH = os.getenv(
+    "RATE_GOVERNOR_PATH",
+    str(Path("validator_weights") / "rate_governor.bin"),
+)
+RATE_GOVERNOR_MAX_WAIT_SECONDS = float(os.getenv("RATE_GOVERNOR_MAX_WAIT_SECONDS", "30"))
+RATE_GOVERNOR_DECREASE_FACTOR = float(os.getenv("RATE_GOVERNOR_DECREASE_FACTOR", "0.5"))
+RATE_GOVERNOR_INCREASE_FRACTION = float(os.getenv("RATE_GOVERNOR_INCREASE_FRACTION", "0.01"))
+RATE_GOVERNOR_DECREASE_COOLDOWN_SECONDS = float(os.getenv("RATE_GOVERNOR_DECREASE_COOLDOWN_SECONDS", "2"))
+RATE_GOVERNOR_MAX_RETRY_AFTER_SECONDS = 60
+
+# Outcomes reported back by callers
+OK = "ok"
+THROTTLED = "throttled"   # HTTP 429 (or a WHOIS server dropping the connection)
+TIMEOUT = "timeout"
+
+
+class RateLimit(NamedTuple):
+    initial: float   # Requests/second for a fresh bucket
+    minimum: float   # AIMD floor
+    maximum: float   # AIMD ceiling (provider policy or plan limit)
+
+
+def _rate_limit(provider: str, initial: float, minimum: float, maximum: float) -> RateLimit:
+    override = os.getenv(f"RATE_LIMIT_{provider.upper()}")
+    if override:
+        initial, minimum, maximum = (float(value) for value in override.split(","))
+    return RateLimit(initial, minimum, maximum)
+
+
+# Host-wide requests/second per provider (keys match http_client provider names)
+RATE_LIMITS: Dict[str, RateLimit] = {
+    "truelist": _rate_limit("truelist", 8, 1, 20),
+    "scrapingdog": _rate_limit("scrapingdog", 10, 1, 50),
+    "openrouter": _rate_limit("openrouter", 20, 2, 100),
+    "whois": _rate_limit("whois", 2, 0.2, 8),                   # WHOIS servers reset connections when hammered
+    "wayback": _rate_limit("wayback", 4, 0.5, 15),
+    "sec_edgar": _rate_limit("sec_edgar", 5, 1, 10),            # SEC fair-access policy: 10 req/s
+    "gdelt": _rate_limit("gdelt", 1, 0.2, 5),
+    "companies_house": _rate_limit("companies_house", 2, 0.5, 2),  # 600 requests / 5 minutes per key
+    "nominatim": _rate_limit("nominatim", 1, 1, 1),             # OSM usage policy: 1 req/s, fixed
+}
+
+_MAGIC = b"LPRG"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sI")
+# name, rate, tokens, updated, blocked_until, last_decrease,
+# acquired, waited, overflow, throttled, timeouts, decreases
+_SLOT = struct.Struct("<32s5d6Q")
+_SLOT_SIZE = 128
+_MAX_SLOTS = 64
+_FILE_SIZE = _SLOT_SIZE * (_MAX_SLOTS + 1)   # Slot 0 holds the header
+_COUNTERS = ("acquired", "waited", "overflow", "throttled", "timeouts", "decreases")
+
+
+class RateGovernor:
+    """
+    Token buckets with AIMD rates, shared through a memory-mapped file.
+
+    path="" keeps the buckets in an anonymous mapping (this process only).
+    """
+
+    def __init__(self, path: str = RATE_GOVERNOR_PATH, limits: Optional[Dict[str, RateLimit]] = None):
+        self.path = path
+        self.limits = RATE_LIMITS if limits is None else limits
+        self._thread_lock = threading.Lock()
+        self._pid = None
+        self._fd = None
+        self._map = None
+        self._slots: Dict[str, int] = {}
+        self._local: Dict[str, Dict[str, float]] = {}
+        self.shared = False
+
+    # ── storage ──────────────────────────────────────────────────────
+    def _open(self):
+        if self._map is not None and self._pid == os.getpid():
+            return
+        # Forked child: the parent's descriptor shares its flock, so open our own
+        self._map = self._fd = None
+        self._slots = {}
+        self._pid = os.getpid()
+        if self.path:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                    header = os.pread(fd, _HEADER.size, 0)
+                    if (os.fstat(fd).st_size < _FILE_SIZE or len(header) < _HEADER.size
+                            or _HEADER.unpack(header) != (_MAGIC, _FORMAT_VERSION)):
+                        os.ftruncate(fd, 0)
+                        os.ftruncate(fd, _FILE_SIZE)
+                        os.pwrite(fd, _HEADER.pack(_MAGIC, _FORMAT_VERSION), 0)
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                self._map = mmap.mmap(fd, _FILE_SIZE)
+                self._fd = fd
+                self.shared = True
+                return
+            except OSError as e:
+                print(f"⚠️ Rate governor: cannot share {self.path} ({e}) - pacing this process only")
+        self._map = mmap.mmap(-1, _FILE_SIZE)
+        self._map[:_HEADER.size] = _HEADER.pack(_MAGIC, _FORMAT_VERSION)
+        self.shared = False
+
+    @contextmanager
+    def _locked(self):
+        """Exclusive access to the buckets (threads of this process + every process on the host)."""
+        with self._thread_lock:
+            self._open()
+            if self._fd is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if self._fd is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _read(self, index: int) -> Dict[str, Any]:
+        values = _SLOT.unpack_from(self._map, index * _SLOT_SIZE)
+        slot = dict(zip(("name", "rate", "tokens", "updated", "blocked_until", "last_decrease") + _COUNTERS, values))
+        slot["name"] = slot["name"].rstrip(b"\0").decode()
+        return slot
+
+    def _write(self, index: int, slot: Dict[str, Any]):
+        _SLOT.pack_into(self._map, index * _SLOT_SIZE, slot["name"].encode()[:32], slot["rate"], slot["tokens"],
+                        slot["updated"], slot["blocked_until"], slot["last_decrease"],
+                        *(int(slot[counter]) for counter in _COUNTERS))
+
+    def _fresh_slot(self, provider: str, now: float) -> Dict[str, Any]:
+        rate = self.limits[provider].initial
+        slot = {"name": provider, "rate": rate, "tokens": max(1.0, rate), "updated": now,
+                "blocked_until": 0.0, "last_decrease": 0.0}
+        slot.update({counter: 0 for counter in _COUNTERS})
+        return slot
+
+    def _slot(self, provider: str, now: float) -> Optional[int]:
+        """Slot index of a provider's bucket, claiming a free slot on first use (lock held)."""
+        index = self._slots.get(provider)
+        if index is not None:
+            return index
+        for index in range(1, _MAX_SLOTS + 1):
+            name = self._read(index)["name"]
+            if name == provider:
+                break
+            if not name:
+                self._write(index, self._fresh_slot(provider, now))
+                break
+        else:
+            return None
+        self._slots[provider] = index
+        return index
+
+    def _refill(self, slot: Dict[str, Any], limit: RateLimit, now: float):
+        # Limits may differ between container versions: clamp to ours
+        slot["rate"] = min(max(slot["rate"], limit.minimum), limit.maximum)
+        elapsed = max(0.0, now - slot["updated"])
+        slot["tokens"] = min(max(1.0, slot["rate"]), slot["tokens"] + elapsed * slot["rate"])
+        slot["updated"] = now
+
+    # ── pacing ───────────────────────────────────────────────────────
+    def reserve(self, provider: str) -> float:
+        """Take (or reserve) one token; returns the seconds to wait before sending."""
+        limit = self.limits.get(provider)
+        if limit is None:
+            return 0.0
+        with self._locked():
+            now = time.time()
+            index = self._slot(provider, now)
+            if index is None:
+                return 0.0
+            slot = self._read(index)
+            self._refill(slot, limit, now)
+            slot["tokens"] -= 1
+            wait = max(0.0, -slot["tokens"] / slot["rate"], slot["blocked_until"] - now)
+            overflow = wait > RATE_GOVERNOR_MAX_WAIT_SECONDS
+            if overflow:
+                slot["tokens"] += 1   # Don't hold a reservation we will not wait for
+                slot["overflow"] += 1
+                wait = RATE_GOVERNOR_MAX_WAIT_SECONDS
+            slot["acquired"] += 1
+            if wait > 0:
+                slot["waited"] += 1
+            self._write(index, slot)
+
+            local = self._local.setdefault(provider, {"acquired": 0, "waited": 0, "wait_s": 0.0, "overflow": 0})
+            local["acquired"] += 1
+            local["waited"] += 1 if wait > 0 else 0
+            local["wait_s"] += wait
+            local["overflow"] += 1 if overflow else 0
+        return wait
+
+    async def acquire(self, provider: str):
+        """Wait (without blocking the event loop) until a request to provider may be sent."""
+        wait = await asyncio.to_thread(self.reserve, provider)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, provider: str):
+        """acquire() for thread callers (requests sessions, WHOIS and Nominatim helpers)."""
+        wait = self.reserve(provider)
+        if wait > 0:
+            time.sleep(wait)
+
+    def report_outcome(self, provider: str, outcome: str, retry_after: Optional[float] = None):
+        """AIMD feedback: OK raises the rate additively, THROTTLED / TIMEOUT cut it multiplicatively."""
+        limit = self.limits.get(provider)
+        if limit is None:
+            return
+        with self._locked():
+            now = time.time()
+            index = self._slot(provider, now)
+            if index is None:
+                return
+            slot = self._read(index)
+            self._refill(slot, limit, now)
+            if outcome == OK:
+                slot["rate"] = min(limit.maximum,
+                                   slot["rate"] + RATE_GOVERNOR_INCREASE_FRACTION * limit.maximum / slot["rate"])
+            else:
+                slot["throttled" if outcome == THROTTLED else "timeouts"] += 1
+                if now - slot["last_decrease"] >= RATE_GOVERNOR_DECREASE_COOLDOWN_SECONDS:
+                    slot["rate"] = max(limit.minimum, slot["rate"] * RATE_GOVERNOR_DECREASE_FACTOR)
+                    slot["tokens"] = min(slot["tokens"], max(1.0, slot["rate"]))
+                    slot["last_decrease"] = now
+                    slot["decreases"] += 1
+                if retry_after:
+                    slot["blocked_until"] = max(slot["blocked_until"],
+                                                now + min(retry_after, RATE_GOVERNOR_MAX_RETRY_AFTER_SECONDS))
+            self._write(index, slot)
+
+    def reset(self, provider: Optional[str] = None):
+        """Put one provider's bucket (or all of them) back to its initial rate and clear its counters."""
+        with self._locked():
+            now = time.time()
+            for name in ([provider] if provider else list(self.limits)):
+                if name in self.limits:
+                    index = self._slot(name, now)
+                    if index is not None:
+                        self._write(index, self._fresh_slot(name, now))
+            for name in ([provider] if provider else list(self._local)):
+                self._local.pop(name, None)
+
+    # ── reporting ────────────────────────────────────────────────────
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Current host-wide state of every bucket, plus this process's waits."""
+        report = {}
+        with self._locked():
+            now = time.time()
+            for provider, limit in self.limits.items():
+                index = self._slot(provider, now)
+                if index is None:
+                    continue
+                slot = self._read(index)
+                self._refill(slot, limit, now)   # Not written back: reporting must not move the bucket
+                local = self._local.get(provider, {"acquired": 0, "waited": 0, "wait_s": 0.0, "overflow": 0})
+                report[provider] = {
+                    "rate": round(slot["rate"], 3),
+                    "min": limit.minimum,
+                    "max": limit.maximum,
+                    "tokens": round(max(slot["tokens"], 0.0), 2),
+                    "queue_depth": int(-slot["tokens"] + 0.999) if slot["tokens"] < 0 else 0,
+                    "paused_s": round(max(0.0, slot["blocked_until"] - now), 1),
+                    **{counter: slot[counter] for counter in _COUNTERS},
+                    "local": {
+                        "acquired": local["acquired"],
+                        "waited": local["waited"],
+                        "overflow": local["overflow"],
+                        "mean_wait_ms": round(local["wait_s"] * 1000 / local["acquired"], 1) if local["acquired"] else 0.0,
+                    },
+                }
+        return report
+
+
+_governor: Optional[RateGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_rate_governor() -> RateGovernor:
+    """Process-wide governor over RATE_GOVERNOR_PATH (opened lazily)."""
+    global _governor
+    if _governor is None:
+        with _governor_lock:
+            if _governor is None:
+                _governor = RateGovernor()
+    return _governor
+
+
+def is_governed(provider: str) -> bool:
+    return provider in RATE_LIMITS
+
+
+async def acquire(provider: str):
+    await get_rate_governor().acquire(provider)
+
+
+def acquire_sync(provider: str):
+    get_rate_governor().acquire_sync(provider)
+
+
+def report_outcome(provider: str, outcome: str, retry_after: Optional[float] = None):
+    get_rate_governor().report_outcome(provider, outcome, retry_after)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header (HTTP-date values are ignored)."""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def get_rate_governor_stats() -> Dict[str, Any]:
+    """
+    Host-wide bucket state for /status.
+
+    Returns:
+        {"path", "shared", "providers": {provider: {"rate", "min", "max", "tokens", "queue_depth",
+         "paused_s", "acquired", "waited", "overflow", "throttled", "timeouts", "decreases", "local"}}}
+    """
+    governor = get_rate_governor()
+    providers = governor.snapshot()
+    return {"path": governor.path, "shared": governor.shared, "providers": providers}
+
+
+def log_rate_governor_stats():
+    """Print the current rate and queue of every provider this process sent requests to."""
+    providers = get_rate_governor_stats()["providers"]
+    active = {name: stats for name, stats in providers.items() if stats["local"]["acquired"]}
+    if not active:
+        return
+    print(f"   🚦 Rate governor (host-wide req/s):")
+    for name, stats in active.items():
+        local = stats["local"]
+        print(f"      {name}: {stats['rate']:.2f}/s (max {stats['max']:g}), queue {stats['queue_depth']}, "
+              f"{stats['throttled']} throttled / {stats['timeouts']} timeouts host-wide; "
+              f"{local['acquired']} requests here, {local['waited']} waited (mean {local['mean_wait_ms']}ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Host-wide adaptive rate governor for external providers")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("status", help="Current rate, tokens and queue depth per provider")
+    reset = subparsers.add_parser("reset", help="Reset buckets to their initial rates")
+    reset.add_argument("--provider", choices=sorted(RATE_LIMITS), help="Only this provider")
+    args = parser.parse_args()
+
+    if args.command == "status":
+        report = get_rate_governor_stats()
+        print(f"🚦 {report['path'] or '(process memory)'}{'' if report['shared'] else ' (not shared)'}")
+        print(f"   {'provider':<16} {'rate/s':>8} {'min':>6} {'max':>6} {'tokens':>7} {'queue':>6} "
+              f"{'acquired':>9} {'waited':>7} {'429s':>6} {'timeouts':>8} {'cuts':>5}")
+        for name, stats in report["providers"].items():
+            paused = f"  paused {stats['paused_s']}s" if stats["paused_s"] else ""
+            print(f"   {name:<16} {stats['rate']:>8.2f} {stats['min']:>6g} {stats['max']:>6g} {stats['tokens']:>7.2f} "
+                  f"{stats['queue_depth']:>6} {stats['acquired']:>9} {stats['waited']:>7} {stats['throttled']:>6} "
+                  f"{stats['timeouts']:>8} {stats['decreases']:>5}{paused}")
+    elif args.command == "reset":
+        get_rate_governor().reset(args.provider)
+        print(f"🚦 Reset {args.provider or 'all providers'} to initial rates")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,541 @@
+"""
+Offline replay benchmark for the automated checks pipeline.
+
+Optimizing automated_checks needed live TrueList, ScrapingDog, OpenRouter,
+Wayback, SEC EDGAR, GDELT and Companies House, so nothing could be measured
+reproducibly. This harness records an epoch once and then replays it offline:
+
+    python -m validator_models.replay_bench record \\
+        --leads validator_weights/epoch_1234_leads.json --limit 200 --out bench_fixtures/epoch_1234
+    python -m validator_models.replay_bench run bench_fixtures/epoch_1234 \\
+        --latency-ms 40 --latency openrouter=900,scrapingdog=1500 --jitter 0.25 --report bench.json
+
+record runs run_batch_automated_checks against the real providers through a
+local recording stand-in (HTTP_REPLAY_TARGET for http_client, DNS_NAMESERVER
+for dns_engine). The archive directory then holds:
+
+- leads.json / email_results.json  input epoch and its TrueList results
+  (taken from the leads file, or from a recorded centralized TrueList run)
+- http.jsonl.gz   one response per (provider, method, URL minus API keys, body hash)
+- dns.jsonl.gz    one wire-format response per (qname, rdtype)
+- whois.sqlite    the WHOIS rows of the shared cache (WHOIS is port 43, not
+  HTTP; a domain missing from it is still looked up live during replay)
+- baseline.json   approve / deny / skip per lead
+
+run replays the archive with configurable per-provider latency, jitter and
+deterministic error injection, and reports leads/s, p50/p95/p99 per check
+(pipeline_metrics) and peak memory. It exits non-zero when any decision
+differs from the baseline (error injection makes the comparison advisory).
+With --revalidate the same leads are then resubmitted: checks with unchanged
+inputs are answered from check evidence, and every lead's result must be
+identical to the full run.
+
+Each mode runs in a scratch working directory, so validator_weights/ caches
+and artifacts of the real validator are never read or written. LLM
+micro-batching is turned off (LLM_BATCH_MAX=1) in both modes: batch
+composition depends on arrival timing and could not be replayed byte for byte.
+Checks that compare against "today" (domain age, filing dates) can drift when
+an archive is replayed long after it was recorded - re-record it.
+"""
+
+import argparse
+import asyncio
+import base64
+import copy
+import gzip
+import hashlib
+import json
+import os
+import resource
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import aiohttp
+import yarl
+from aiohttp import web
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Query parameters that carry credentials and are left out of fixture keys
+SECRET_PARAMS = {"api_key", "apikey", "key", "token", "access_token"}
+REPLAY_MISS_STATUS = 599
+
+
+# ════════════════════════════════════════════════════════════════════
+# Fixtures
+# ════════════════════════════════════════════════════════════════════
+def sanitize_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k.lower() not in SECRET_PARAMS]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(sorted(query)), ""))
+
+
+def fixture_key(provider: str, method: str, url: str, body: bytes) -> str:
+    digest = hashlib.sha256(body or b"").hexdigest()
+    return hashlib.sha256(f"{provider}\n{method}\n{sanitize_url(url)}\n{digest}".encode("utf-8")).hexdigest()
+
+
+def _unit(seed: int, *parts: str) -> float:
+    """Deterministic [0, 1) value for a request (independent of arrival order)."""
+    digest = hashlib.sha256(":".join((str(seed),) + parts).encode("utf-8")).hexdigest()
+    return int(digest[:8], 16) / 2 ** 32
+
+
+def _read_jsonl(path: Path) -> List[dict]:
+    if not path.exists():
+        return []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _write_jsonl(path: Path, entries: List[dict]):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+
+def _encode_body(body: bytes) -> dict:
+    try:
+        return {"body": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_b64": base64.b64encode(body).decode("ascii")}
+
+
+def _decode_body(entry: dict) -> bytes:
+    if "body_b64" in entry:
+        return base64.b64decode(entry["body_b64"])
+    return entry.get("body", "").encode("utf-8")
+
+
+def _parse_latency(default_ms: float, spec: str) -> Dict[str, float]:
+    """"openrouter=900,scrapingdog=1500" -> {provider: ms} plus the "*" default."""
+    latency = {"*": default_ms}
+    for item in (spec or "").split(","):
+        provider, _, ms = item.partition("=")
+        if provider.strip() and ms.strip():
+            latency[provider.strip()] = float(ms)
+    return latency
+
+
+# ════════════════════════════════════════════════════════════════════
+# Stand-in servers
+# ════════════════════════════════════════════════════════════════════
+class HttpStandIn:
+    """
+    Local HTTP server behind HTTP_REPLAY_TARGET.
+
+    record: forwards each request to the real host and stores the response.
+    replay: serves the stored response after the configured latency, or a
+            503 for injected errors, or 599 when no fixture exists.
+    """
+
+    def __init__(self, mode: str, fixtures: Optional[Dict[str, dict]] = None,
+                 latency_ms: Optional[Dict[str, float]] = None, jitter: float = 0.0,
+                 error_rate: float = 0.0, seed: int = 0):
+        self.mode = mode
+        self.fixtures: Dict[str, dict] = fixtures or {}
+        self.latency_ms = latency_ms or {"*": 0.0}
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.seed = seed
+        self.stats = {"requests": 0, "served": 0, "misses": 0, "injected_errors": 0, "forwarded": 0}
+        self._runner: Optional[web.AppRunner] = None
+        self._client: Optional[aiohttp.ClientSession] = None
+
+    async def start(self) -> str:
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_route("*", "/{provider}/{scheme}/{host}/{path:.*}", self._handle)
+        app.router.add_route("*", "/{provider}/{scheme}/{host}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        if self.mode == "record":
+            self._client = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=120))
+        return f"http://127.0.0.1:{port}"
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        # raw_path keeps the original percent-encoding of the real URL
+        path, _, query = request.raw_path.partition("?")
+        _, provider, scheme, host, *rest = path.split("/", 4)
+        url = f"{scheme}://{host}/{rest[0] if rest else ''}" + (f"?{query}" if query else "")
+        body = await request.read()
+        key = fixture_key(provider, request.method, url, body)
+        self.stats["requests"] += 1
+        if self.mode == "record":
+            return await self._forward(request, provider, url, body, key)
+
+        delay = self.latency_ms.get(provider, self.latency_ms["*"])
+        if self.jitter:
+            delay *= 1 + self.jitter * (2 * _unit(self.seed, "jitter", key) - 1)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if self.error_rate and _unit(self.seed, "error", key) < self.error_rate:
+            self.stats["injected_errors"] += 1
+            return web.Response(status=503, text="Injected error (replay_bench --error-rate)")
+        entry = self.fixtures.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return web.Response(status=REPLAY_MISS_STATUS, text=f"No replay fixture for {request.method} {sanitize_url(url)}")
+        self.stats["served"] += 1
+        return web.Response(status=entry["status"], body=_decode_body(entry),
+                            headers={"Content-Type": entry.get("content_type") or "application/octet-stream"})
+
+    async def _forward(self, request: web.Request, provider: str, url: str, body: bytes, key: str) -> web.Response:
+        headers = {k: v for k, v in request.headers.items()
+                   if k.lower() not in ("host", "content-length", "accept-encoding", "connection")}
+        try:
+            async with self._client.request(request.method, yarl.URL(url, encoded=True), headers=headers, data=body or None,
+                                            allow_redirects=True) as response:
+                content = await response.read()
+                status = response.status
+                content_type = response.headers.get("Content-Type", "")
+        except Exception as e:
+            # Network failures are not recorded - replay reports them as misses
+            return web.Response(status=502, text=f"Upstream error: {e}")
+        self.stats["forwarded"] += 1
+        self.fixtures[key] = {"key": key, "provider": provider, "method": request.method,
+                              "url": sanitize_url(url), "status": status, "content_type": content_type,
+                              **_encode_body(content)}
+        return web.Response(status=status, body=content,
+                            headers={"Content-Type": content_type or "application/octet-stream"})
+
+
+class DnsStandIn(asyncio.DatagramProtocol):
+    """Local UDP DNS server behind DNS_NAMESERVER (record: forward + store; replay: serve)."""
+
+    def __init__(self, mode: str, fixtures: Optional[Dict[Tuple[str, str], bytes]] = None):
+        self.mode = mode
+        self.fixtures: Dict[Tuple[str, str], bytes] = fixtures or {}
+        self.stats = {"queries": 0, "served": 0, "misses": 0}
+        self._transport = None
+        self._upstream = None
+
+    async def start(self) -> str:
+        import dns.resolver
+        if self.mode == "record":
+            self._upstream = dns.resolver.Resolver().nameservers[0]
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(lambda: self, local_addr=("127.0.0.1", 0))
+        return "127.0.0.1:%d" % self._transport.get_extra_info("sockname")[1]
+
+    def close(self):
+        if self._transport is not None:
+            self._transport.close()
+
+    def datagram_received(self, data: bytes, addr):
+        asyncio.ensure_future(self._answer(data, addr))
+
+    async def _answer(self, data: bytes, addr):
+        import dns.asyncquery
+        import dns.message
+        import dns.rcode
+        import dns.rdatatype
+        query = dns.message.from_wire(data)
+        question = query.question[0]
+        key = (question.name.to_text().lower(), dns.rdatatype.to_text(question.rdtype))
+        self.stats["queries"] += 1
+        wire = self.fixtures.get(key)
+        if wire is None and self.mode == "record":
+            try:
+                wire = (await dns.asyncquery.udp(query, self._upstream, timeout=5)).to_wire()
+                self.fixtures[key] = wire
+            except Exception:
+                wire = None
+        if wire is None:
+            self.stats["misses"] += 1
+            response = dns.message.make_response(query)
+            response.set_rcode(dns.rcode.SERVFAIL)
+        else:
+            self.stats["served"] += 1
+            response = dns.message.from_wire(wire)
+            response.id = query.id
+        self._transport.sendto(response.to_wire(), addr)
+
+
+# ════════════════════════════════════════════════════════════════════
+# Runs
+# ════════════════════════════════════════════════════════════════════
+def _load_leads(path: str, limit: Optional[int]) -> Tuple[List[dict], Optional[Dict[str, dict]]]:
+    """Lead blobs (+ TrueList results, if present) from an epoch leads file or a plain list."""
+    with open(path, "r") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        leads = [lead.get("lead_blob", lead) for lead in data.get("leads") or []]
+        email_results = data.get("truelist_results")
+    else:
+        leads = [lead.get("lead_blob", lead) for lead in data]
+        email_results = None
+    return (leads[:limit] if limit else leads), email_results
+
+
+def _decision(result) -> str:
+    passed = result[0] if result else None
+    return "approve" if passed is True else "deny" if passed is False else "skip"
+
+
+def _prepare_environment(workdir: Path, http_target: str, dns_target: str):
+    """Point the pipeline at the stand-ins and a scratch directory BEFORE it is imported."""
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    os.chdir(workdir)
+    os.environ["HTTP_REPLAY_TARGET"] = http_target
+    os.environ["DNS_NAMESERVER"] = dns_target
+    os.environ["LLM_BATCH_MAX"] = "1"
+    os.environ["PIPELINE_METRICS"] = "true"
+    # Replay never reaches a real provider, but the checks refuse to run without keys
+    for name in ("SCRAPINGDOG_API_KEY", "OPENROUTER_KEY", "TRUELIST_API_KEY", "COMPANIES_HOUSE_API_KEY"):
+        os.environ.setdefault(name, "replay")
+
+
+async def _record(args) -> int:
+    source = Path(args.leads).resolve()
+    leads, email_results = _load_leads(str(source), args.limit)
+    if not leads:
+        print(f"❌ No leads in {args.leads}")
+        return 1
+    out = Path(args.out).resolve()
+    out.mkdir(parents=True, exist_ok=True)
+    workdir = Path(tempfile.mkdtemp(prefix="replay_bench_record_"))
+
+    http = HttpStandIn("record")
+    dns_server = DnsStandIn("record")
+    _prepare_environment(workdir, await http.start(), await dns_server.start())
+    from validator_models.automated_checks import run_batch_automated_checks, run_centralized_truelist_batch
+
+    print(f"🎙️ Recording {len(leads)} leads into {out}")
+    try:
+        emails = {lead.get("email", "").lower() for lead in leads}
+        if email_results is None:
+            print("   TrueList results not in leads file - running centralized TrueList batch (recorded)")
+            email_results = await run_centralized_truelist_batch([{"lead_blob": lead} for lead in leads])
+        email_results = {email: result for email, result in email_results.items() if email in emails}
+
+        started = time.perf_counter()
+        results = await run_batch_automated_checks(leads, container_id=0, precomputed_email_results=email_results)
+        elapsed = time.perf_counter() - started
+    finally:
+        from validator_models.http_client import close_http_sessions
+        await close_http_sessions()
+        await http.close()
+        dns_server.close()
+
+    with open(out / "leads.json", "w") as f:
+        json.dump(leads, f)
+    with open(out / "email_results.json", "w") as f:
+        json.dump(email_results, f)
+    with open(out / "baseline.json", "w") as f:
+        json.dump([{"email": lead.get("email"), "decision": _decision(result)}
+                   for lead, result in zip(leads, results)], f, indent=1)
+    _write_jsonl(out / "http.jsonl.gz", sorted(http.fixtures.values(), key=lambda e: e["key"]))
+    _write_jsonl(out / "dns.jsonl.gz", [
+        {"qname": qname, "rdtype": rdtype, "wire": base64.b64encode(wire).decode("ascii")}
+        for (qname, rdtype), wire in sorted(dns_server.fixtures.items())
+    ])
+
+    # WHOIS (port 43) is not HTTP: keep the shared-cache rows the run wrote, without expiry
+    whois_path = out / "whois.sqlite"
+    shared_cache = workdir / "validator_weights" / "validation_cache.sqlite"
+    if whois_path.exists():
+        whois_path.unlink()
+    if shared_cache.exists():
+        source = sqlite3.connect(str(shared_cache))
+        target = sqlite3.connect(str(whois_path))
+        source.backup(target)
+        source.close()
+        target.execute("DELETE FROM cache_entries WHERE namespace != 'whois'")
+        target.execute("UPDATE cache_entries SET expires_at = 1e12")
+        target.commit()
+        target.execute("VACUUM")
+        target.close()
+
+    with open(out / "manifest.json", "w") as f:
+        json.dump({
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "source": str(source),
+            "leads": len(leads),
+            "http_fixtures": len(http.fixtures),
+            "dns_fixtures": len(dns_server.fixtures),
+            "live_seconds": round(elapsed, 1),
+        }, f, indent=1)
+    shutil.rmtree(workdir, ignore_errors=True)
+    print(f"✅ Recorded {len(http.fixtures)} HTTP + {len(dns_server.fixtures)} DNS fixtures, "
+          f"baseline for {len(leads)} leads ({elapsed:.1f}s live)")
+    return 0
+
+
+async def _run(args) -> int:
+    archive = Path(args.archive).resolve()
+    report_path = Path(args.report).resolve() if args.report else None
+    with open(archive / "leads.json") as f:
+        leads = json.load(f)
+    with open(archive / "email_results.json") as f:
+        email_results = json.load(f)
+    with open(archive / "baseline.json") as f:
+        baseline = json.load(f)
+    if args.limit:
+        leads, baseline = leads[:args.limit], baseline[:args.limit]
+
+    fixtures = {entry["key"]: entry for entry in _read_jsonl(archive / "http.jsonl.gz")}
+    dns_fixtures = {(e["qname"], e["rdtype"]): base64.b64decode(e["wire"]) for e in _read_jsonl(archive / "dns.jsonl.gz")}
+    workdir = Path(tempfile.mkdtemp(prefix="replay_bench_run_"))
+    (workdir / "validator_weights").mkdir()
+    if (archive / "whois.sqlite").exists():
+        shutil.copy(archive / "whois.sqlite", workdir / "validator_weights" / "validation_cache.sqlite")
+
+    http = HttpStandIn("replay", fixtures, _parse_latency(args.latency_ms, args.latency),
+                       args.jitter, args.error_rate, args.seed)
+    dns_server = DnsStandIn("replay", dns_fixtures)
+    _prepare_environment(workdir, await http.start(), await dns_server.start())
+    from validator_models import pipeline_metrics
+    from validator_models.automated_checks import run_batch_automated_checks
+
+    print(f"▶️ Replaying {len(leads)} leads from {archive} (latency {args.latency_ms:g}ms"
+          f"{', ' + args.latency if args.latency else ''}, jitter {args.jitter:g}, error rate {args.error_rate:g})")
+    pipeline_metrics.start_epoch(0, 0)
+    if args.tracemalloc:
+        tracemalloc.start()
+    submitted = copy.deepcopy(leads) if args.revalidate else None
+    revalidation = None
+    try:
+        started = time.perf_counter()
+        results = await run_batch_automated_checks(leads, container_id=0, precomputed_email_results=email_results)
+        elapsed = time.perf_counter() - started
+        if args.revalidate:
+            revalidation = await _revalidate(submitted, email_results, results)
+    finally:
+        from validator_models.http_client import close_http_sessions
+        await close_http_sessions()
+        await http.close()
+        dns_server.close()
+    traced_peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024 if args.tracemalloc else None
+    if args.tracemalloc:
+        tracemalloc.stop()
+
+    decisions = [_decision(result) for result in results]
+    mismatches = [
+        {"index": i, "email": expected["email"], "baseline": expected["decision"], "replay": decision}
+        for i, (expected, decision) in enumerate(zip(baseline, decisions))
+        if expected["decision"] != decision
+    ]
+    metrics = pipeline_metrics.get_pipeline_metrics()
+    report = {
+        "archive": str(archive),
+        "leads": len(leads),
+        "seconds": round(elapsed, 2),
+        "leads_per_second": round(len(leads) / elapsed, 2) if elapsed else None,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "peak_traced_mb": round(traced_peak_mb, 1) if traced_peak_mb is not None else None,
+        "checks": {name: {k: stats[k] for k in ("count", "p50_ms", "p95_ms", "p99_ms", "max_ms")}
+                   for name, stats in metrics["checks"].items()},
+        "http": http.stats,
+        "dns": dns_server.stats,
+        "decision_mismatches": mismatches,
+        "revalidation": revalidation,
+    }
+    shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\n📊 {len(leads)} leads in {elapsed:.1f}s = {report['leads_per_second']} leads/s, "
+          f"peak RSS {report['peak_rss_mb']} MB"
+          + (f", peak traced {report['peak_traced_mb']} MB" if traced_peak_mb is not None else ""))
+    print(f"   {'check':<34} {'calls':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, stats in sorted(report["checks"].items(), key=lambda item: -(item[1]["p95_ms"] or 0)):
+        print(f"   {name:<34} {stats['count']:>6} {stats['p50_ms']:>9} {stats['p95_ms']:>9} {stats['p99_ms']:>9}")
+    print(f"   HTTP: {http.stats['served']} served, {http.stats['misses']} missing fixtures, "
+          f"{http.stats['injected_errors']} injected errors; DNS: {dns_server.stats['served']} served, "
+          f"{dns_server.stats['misses']} missing")
+
+    if report_path:
+        with open(report_path, "w") as f:
+            json.dump(report, f, indent=1)
+        print(f"   Report written to {report_path}")
+
+    if revalidation is not None:
+        print(f"   ♻️ Revalidation: {revalidation['skipped_fraction']:.0%} of fingerprinted checks skipped, "
+              f"{revalidation['seconds']}s vs {report['seconds']}s for the full run, "
+              f"{len(revalidation['differences'])} leads with different automated_checks_data")
+        for difference in revalidation["differences"][:20]:
+            print(f"      #{difference['index']} {difference['email']}")
+        if revalidation["differences"] and not args.error_rate:
+            return 1
+
+    if mismatches:
+        print(f"{'⚠️' if args.error_rate else '❌'} {len(mismatches)} decisions differ from the baseline:")
+        for mismatch in mismatches[:20]:
+            print(f"      #{mismatch['index']} {mismatch['email']}: {mismatch['baseline']} -> {mismatch['replay']}")
+        if not args.error_rate:
+            return 1
+    else:
+        print("✅ All decisions match the recorded baseline")
+    return 0
+
+
+async def _revalidate(leads: List[dict], email_results, full_results: list) -> dict:
+    """
+    Resubmit the same leads and compare with the full run: every check whose inputs
+    are unchanged is answered from check evidence, and the results must be identical.
+    """
+    from validator_models.check_evidence import get_check_evidence_stats
+    from validator_models.automated_checks import run_batch_automated_checks
+
+    print(f"\n♻️ Revalidating the same {len(leads)} leads from check evidence")
+    evidence_start = get_check_evidence_stats()
+    started = time.perf_counter()
+    results = await run_batch_automated_checks(leads, container_id=0, precomputed_email_results=email_results)
+    elapsed = time.perf_counter() - started
+    differences = [
+        {"index": i, "email": lead.get("email", "")}
+        for i, (lead, full, incremental) in enumerate(zip(leads, full_results, results))
+        if json.dumps(full, default=str) != json.dumps(incremental, default=str)
+    ]
+    evidence = get_check_evidence_stats(since=evidence_start)
+    return {
+        "seconds": round(elapsed, 2),
+        "skipped_fraction": evidence["skipped_fraction"],
+        "checks": evidence["checks"],
+        "differences": differences,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline record/replay benchmark for run_batch_automated_checks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record = subparsers.add_parser("record", help="Run an epoch against the real providers and archive every response")
+    record.add_argument("--leads", required=True, help="Epoch leads file (epoch_N_leads.json) or a JSON list of leads")
+    record.add_argument("--limit", type=int, help="Record only the first N leads (50-1000 is typical)")
+    record.add_argument("--out", required=True, help="Archive directory")
+
+    run = subparsers.add_parser("run", help="Replay an archive offline and report throughput and latency")
+    run.add_argument("archive", help="Archive directory written by `record`")
+    run.add_argument("--limit", type=int, help="Replay only the first N leads")
+    run.add_argument("--latency-ms", type=float, default=0.0, help="Default stand-in latency per request")
+    run.add_argument("--latency", default="", help="Per-provider latency, e.g. openrouter=900,scrapingdog=1500")
+    run.add_argument("--jitter", type=float, default=0.0, help="Latency jitter as a fraction (0.25 = +/-25%%)")
+    run.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 503")
+    run.add_argument("--seed", type=int, default=0, help="Seed for jitter and error injection")
+    run.add_argument("--tracemalloc", action="store_true", help="Also report the peak of Python allocations")
+    run.add_argument("--report", help="Write the JSON report to this file")
+    run.add_argument("--revalidate", action="store_true",
+                     help="Replay the leads a second time from check evidence and require identical results")
+
+    args = parser.parse_args()
+    sys.exit(asyncio.run(_record(args) if args.command == "record" else _run(args)))
+
+
+if __name__ == "__main__":
+    main()
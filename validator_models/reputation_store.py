@@ -0,0 +1,403 @@
+"""
+Durable reputation-signal store for the Rep Score checks (SQLite, WAL mode).
+
+check_wayback_machine, check_sec_edgar, check_gdelt_mentions and
+check_companies_house used to query their public APIs every time a company
+appeared, although archive history, SEC filings, press coverage and registry
+entries change slowly. This store keeps each sub-score with its raw evidence
+(the check's metadata dict) so run_stage4_5_repscore can read it first.
+
+- Keyed by (source, subject): subject is the normalized company name, or the
+  root domain for Wayback
+- Per-source freshness window (REPUTATION_FRESHNESS_HOURS, hours); stale
+  entries are misses but stay in the store for the refresher
+- Lookup counts per entry, so the background refresher re-scores the most
+  popular stale entries first while the validator idles between epochs (at
+  most one pass per REPUTATION_REFRESH_INTERVAL_SECONDS; an entry whose
+  refresh fails is skipped for REPUTATION_REFRESH_RETRY_SECONDS); they
+  are counted in memory and written in batches (REPUTATION_HIT_FLUSH_BATCH
+  lookups), so a lookup stays a read and never takes the SQLite write lock
+- Only completed checks (metadata["checked"] is True) are stored - timeouts
+  and API errors are retried live
+
+WHOIS/DNSBL reputation is not stored here: it is computed from Stage 1-2 lead
+fields, which already persist in the shared validation cache.
+
+    python -m validator_models.reputation_store refresh --limit 50
+    python -m validator_models.reputation_store stats
+
+Set VALIDATOR_REPUTATION_STORE_PATH="" to disable it. Like the shared cache,
+every operation is best-effort: database errors are reported and treated as misses.
+"""
+
+import argparse
+import asyncio
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# ════════════════════════════════════════════════════════════════════
+# Configuration
+# ════════════════════════════════════════════════════════════════════
+REPUTATION_STORE_PATH = os.getenv(
+    "VALIDATOR_REPUTATION_STORE_PATH",
+    str(Path("validator_weights") / "reputation_signals.sqlite"),
+)
+REPUTATION_STORE_MAX_ENTRIES = int(os.getenv("VALIDATOR_REPUTATION_STORE_MAX_ENTRIES", "200000"))
+
+# Freshness window per source in hours (override with REPUTATION_FRESHNESS_HOURS_<SOURCE>)
+REPUTATION_FRESHNESS_HOURS = {
+    source: float(os.getenv(f"REPUTATION_FRESHNESS_HOURS_{source.upper()}", default))
+    for source, default in {
+        "wayback": "720",           # Archive history only grows - 30 days
+        "sec_edgar": "168",         # Filings - 7 days
+        "gdelt": "24",              # Rolling 3-month press window - 1 day
+        "companies_house": "720",   # Registry entries - 30 days
+    }.items()
+}
+
+# Background refresher: entries re-scored per idle pass, and minimum lookups to qualify
+REPUTATION_REFRESH_BATCH = int(os.getenv("REPUTATION_REFRESH_BATCH", "20"))
+REPUTATION_REFRESH_MIN_HITS = int(os.getenv("REPUTATION_REFRESH_MIN_HITS", "2"))
+REPUTATION_REFRESH_CONCURRENCY = int(os.getenv("REPUTATION_REFRESH_CONCURRENCY", "2"))
+# Minimum time between idle refresh passes, and how long a failed refresh keeps an entry out of them
+REPUTATION_REFRESH_INTERVAL_SECONDS = float(os.getenv("REPUTATION_REFRESH_INTERVAL_SECONDS", "600"))
+REPUTATION_REFRESH_RETRY_SECONDS = float(os.getenv("REPUTATION_REFRESH_RETRY_SECONDS", "21600"))
+# Lookups counted in memory before their hit counts are written in one transaction
+REPUTATION_HIT_FLUSH_BATCH = int(os.getenv("REPUTATION_HIT_FLUSH_BATCH", "200"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reputation_signals (
+    source      TEXT    NOT NULL,
+    subject     TEXT    NOT NULL,
+    score       REAL    NOT NULL,
+    evidence    TEXT    NOT NULL,
+    inputs      TEXT    NOT NULL,
+    checked_at  REAL    NOT NULL,
+    hits        INTEGER NOT NULL DEFAULT 0,
+    last_hit_at REAL,
+    refresh_failed_at REAL,
+    PRIMARY KEY (source, subject)
+);
+CREATE INDEX IF NOT EXISTS idx_reputation_signals_checked ON reputation_signals (checked_at);
+"""
+
+
+def normalize_company_name(company: str) -> str:
+    """Case- and whitespace-insensitive company key."""
+    return " ".join((company or "").lower().split())
+
+
+class ReputationStore:
+    """
+    SQLite-backed store of Rep Score sub-scores shared by every process on the host.
+
+    Rows hold the score, the check's metadata as evidence, and the lead inputs
+    (company / website) needed to re-run the check without the original lead.
+    """
+
+    def __init__(self, path: str = REPUTATION_STORE_PATH,
+                 max_entries: int = REPUTATION_STORE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._disabled = not path  # VALIDATOR_REPUTATION_STORE_PATH="" turns the store off
+        self._hits_lock = threading.Lock()
+        self._pending_hits: Dict[Tuple[str, str], List[float]] = {}   # (source, subject) -> [hits, last_hit_at]
+        self._pending_hit_count = 0
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "writes": 0, "refreshed": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Connection handling (one connection per thread)
+    # ------------------------------------------------------------------
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.executescript(_SCHEMA)
+            self._migrate(conn)
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection):
+        """Add columns introduced after a store file was created."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(reputation_signals)")}
+        if "refresh_failed_at" not in columns:
+            try:
+                conn.execute("ALTER TABLE reputation_signals ADD COLUMN refresh_failed_at REAL")
+            except sqlite3.OperationalError as e:
+                if "duplicate column" not in str(e).lower():   # Another process migrated first
+                    raise
+
+    def _error(self, op: str, e: Exception):
+        self.stats["errors"] += 1
+        print(f"⚠️ Reputation store {op} failed ({self.path}): {e}")
+        if isinstance(e, sqlite3.DatabaseError) and "malformed" in str(e).lower():
+            self._disabled = True
+
+    @staticmethod
+    def freshness_seconds(source: str) -> float:
+        return REPUTATION_FRESHNESS_HOURS.get(source, 24) * 3600
+
+    # ------------------------------------------------------------------
+    # Reads / writes
+    # ------------------------------------------------------------------
+    def get(self, source: str, subject: str) -> Optional[Tuple[float, dict]]:
+        """
+        Return (score, evidence) if a fresh entry exists, else None.
+        Every lookup of an existing entry (fresh or stale) counts towards its popularity
+        (see flush_hits).
+        """
+        if self._disabled:
+            return None
+        now = time.time()
+        try:
+            row = self._conn().execute(
+                "SELECT score, evidence, checked_at FROM reputation_signals WHERE source=? AND subject=?",
+                (source, subject),
+            ).fetchone()
+        except Exception as e:
+            self._error("read", e)
+            return None
+
+        if row is not None:
+            with self._hits_lock:
+                pending = self._pending_hits.setdefault((source, subject), [0, now])
+                pending[0] += 1
+                pending[1] = now
+                self._pending_hit_count += 1
+                flush = self._pending_hit_count >= REPUTATION_HIT_FLUSH_BATCH
+            if flush:
+                self.flush_hits()
+
+        if row is None:
+            self.stats["misses"] += 1
+            return None
+        if now - row[2] > self.freshness_seconds(source):
+            self.stats["stale"] += 1
+            return None
+        self.stats["hits"] += 1
+        return row[0], json.loads(row[1])
+
+    def put(self, source: str, subject: str, score: float, evidence: dict, inputs: dict) -> bool:
+        """Insert or refresh an entry (lookup counts are preserved). Returns False on error."""
+        if self._disabled:
+            return False
+        try:
+            self._conn().execute(
+                "INSERT INTO reputation_signals (source, subject, score, evidence, inputs, checked_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(source, subject) DO UPDATE SET score=excluded.score, "
+                "evidence=excluded.evidence, inputs=excluded.inputs, checked_at=excluded.checked_at, "
+                "refresh_failed_at=NULL",
+                (source, subject, float(score), json.dumps(evidence, default=str),
+                 json.dumps(inputs, default=str), time.time()),
+            )
+        except Exception as e:
+            self._error("write", e)
+            return False
+        self.stats["writes"] += 1
+        if self.stats["writes"] % 500 == 0:
+            self.evict()
+        return True
+
+    def flush_hits(self) -> int:
+        """Write the lookup counts gathered in memory in one transaction. Returns entries updated."""
+        with self._hits_lock:
+            pending, self._pending_hits = self._pending_hits, {}
+            self._pending_hit_count = 0
+        if not pending or self._disabled:
+            return 0
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    "UPDATE reputation_signals SET hits=hits+?, last_hit_at=? WHERE source=? AND subject=?",
+                    [(hits, last_hit_at, source, subject) for (source, subject), (hits, last_hit_at) in pending.items()],
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except Exception as e:
+            # Counts only order the refresher's work: drop them rather than retry
+            self._error("hit count flush", e)
+            return 0
+        return len(pending)
+
+    def mark_refresh_failed(self, source: str, subject: str):
+        """Keep an entry out of stale_entries() for REPUTATION_REFRESH_RETRY_SECONDS."""
+        if self._disabled:
+            return
+        try:
+            self._conn().execute(
+                "UPDATE reputation_signals SET refresh_failed_at=? WHERE source=? AND subject=?",
+                (time.time(), source, subject),
+            )
+        except Exception as e:
+            self._error("refresh failure write", e)
+
+    def stale_entries(self, limit: int = REPUTATION_REFRESH_BATCH,
+                      min_hits: int = REPUTATION_REFRESH_MIN_HITS) -> List[Dict[str, Any]]:
+        """Most-looked-up entries past their source's freshness window (failed refreshes cool down first)."""
+        if self._disabled:
+            return []
+        self.flush_hits()
+        now = time.time()
+        clauses = " OR ".join("(source=? AND checked_at < ?)" for _ in REPUTATION_FRESHNESS_HOURS)
+        params: List[Any] = []
+        for source in REPUTATION_FRESHNESS_HOURS:
+            params.extend([source, now - self.freshness_seconds(source)])
+        try:
+            rows = self._conn().execute(
+                f"SELECT source, subject, inputs, hits FROM reputation_signals "
+                f"WHERE hits >= ? AND (refresh_failed_at IS NULL OR refresh_failed_at < ?) AND ({clauses}) "
+                f"ORDER BY hits DESC LIMIT ?",
+                [min_hits, now - REPUTATION_REFRESH_RETRY_SECONDS, *params, limit],
+            ).fetchall()
+        except Exception as e:
+            self._error("stale scan", e)
+            return []
+        return [
+            {"source": source, "subject": subject, "inputs": json.loads(inputs), "hits": hits}
+            for source, subject, inputs, hits in rows
+        ]
+
+    def evict(self) -> int:
+        """Trim to 90% of max_entries, dropping least-looked-up, oldest entries first."""
+        if self._disabled:
+            return 0
+        self.flush_hits()
+        try:
+            conn = self._conn()
+            count = conn.execute("SELECT COUNT(*) FROM reputation_signals").fetchone()[0]
+            if count <= self.max_entries:
+                return 0
+            return conn.execute(
+                "DELETE FROM reputation_signals WHERE rowid IN "
+                "(SELECT rowid FROM reputation_signals ORDER BY hits, checked_at LIMIT ?)",
+                (count - int(self.max_entries * 0.9),),
+            ).rowcount
+        except Exception as e:
+            self._error("evict", e)
+            return 0
+
+    def summary(self) -> Dict[str, Any]:
+        """Entry counts per source (fresh / stale) plus this process's counters."""
+        sources = {}
+        if not self._disabled:
+            now = time.time()
+            try:
+                for source, count, checked_at_min in self._conn().execute(
+                    "SELECT source, COUNT(*), MIN(checked_at) FROM reputation_signals GROUP BY source"
+                ):
+                    stale = self._conn().execute(
+                        "SELECT COUNT(*) FROM reputation_signals WHERE source=? AND checked_at < ?",
+                        (source, now - self.freshness_seconds(source)),
+                    ).fetchone()[0]
+                    sources[source] = {"entries": count, "stale": stale}
+            except Exception as e:
+                self._error("summary", e)
+        return {"path": self.path, "sources": sources, **self.stats}
+
+
+_reputation_store: Optional[ReputationStore] = None
+
+
+def get_reputation_store() -> ReputationStore:
+    """Process-wide ReputationStore instance (opened lazily; lookup counts flushed at exit)."""
+    global _reputation_store
+    if _reputation_store is None:
+        _reputation_store = ReputationStore()
+        atexit.register(_reputation_store.flush_hits)
+    return _reputation_store
+
+
+# ════════════════════════════════════════════════════════════════════
+# Background refresher
+# ════════════════════════════════════════════════════════════════════
+async def refresh_stale_signals(limit: int = REPUTATION_REFRESH_BATCH,
+                                min_hits: int = REPUTATION_REFRESH_MIN_HITS,
+                                concurrency: int = REPUTATION_REFRESH_CONCURRENCY) -> int:
+    """
+    Re-score the most popular stale entries so live validation mostly hits fresh ones.
+
+    Meant for idle time (the validator runs it while waiting for the next
+    epoch). Each entry re-runs its check on a minimal lead built from the
+    stored inputs; a failed check leaves the stale entry in place and keeps it
+    out of the next passes for REPUTATION_REFRESH_RETRY_SECONDS.
+
+    Returns:
+        Number of entries refreshed
+    """
+    from validator_models.automated_checks import REPUTATION_SOURCES
+
+    store = get_reputation_store()
+    entries = [e for e in await asyncio.to_thread(store.stale_entries, limit, min_hits)
+               if e["source"] in REPUTATION_SOURCES]
+    if not entries:
+        return 0
+
+    semaphore = asyncio.Semaphore(concurrency)
+    start = time.time()
+
+    async def _refresh(entry) -> bool:
+        async with semaphore:
+            try:
+                score, evidence = await REPUTATION_SOURCES[entry["source"]](dict(entry["inputs"]))
+            except Exception as e:
+                print(f"   ⚠️ Reputation refresh failed for {entry['source']}:{entry['subject']}: {e}")
+                evidence = {}
+            if not evidence.get("checked"):
+                await asyncio.to_thread(store.mark_refresh_failed, entry["source"], entry["subject"])
+                return False
+            return await asyncio.to_thread(store.put, entry["source"], entry["subject"], score, evidence,
+                                           entry["inputs"])
+
+    refreshed = sum(await asyncio.gather(*[_refresh(e) for e in entries]))
+    store.stats["refreshed"] += refreshed
+    print(f"🔄 Reputation store: refreshed {refreshed}/{len(entries)} stale entries in {time.time() - start:.1f}s")
+    return refreshed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reputation-signal store maintenance")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    refresh = subparsers.add_parser("refresh", help="Re-score the most popular stale entries")
+    refresh.add_argument("--limit", type=int, default=REPUTATION_REFRESH_BATCH, help="Entries to refresh")
+    refresh.add_argument("--min-hits", type=int, default=REPUTATION_REFRESH_MIN_HITS, help="Minimum lookups")
+    refresh.add_argument("--concurrency", type=int, default=REPUTATION_REFRESH_CONCURRENCY)
+
+    subparsers.add_parser("stats", help="Show entry counts per source")
+    subparsers.add_parser("evict", help="Enforce the entry limit")
+
+    args = parser.parse_args()
+    # Use the importable module's instance (see shared_cache.main)
+    from validator_models.reputation_store import get_reputation_store as get_checks_reputation_store
+    store = get_checks_reputation_store()
+
+    if args.command == "refresh":
+        from validator_models.reputation_store import refresh_stale_signals as refresh_checks_signals
+        asyncio.run(refresh_checks_signals(args.limit, args.min_hits, args.concurrency))
+    elif args.command == "evict":
+        print(f"🧹 Evicted {store.evict()} entries")
+
+    print(json.dumps(store.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Persistent ScrapingDog Google search cache shared by every container on a host.
+
+search_linkedin_gse, _gse_search_employee_count_sync, _gse_search_stage5_sync
+and _scrape_company_linkedin_gse_sync each paid for a fresh ScrapingDog query
+per lead, even when another lead (or the previous epoch, or the container next
+door) had just asked the exact same thing. They now call scrapingdog_get(),
+which is content-addressed: the key is a hash of the endpoint plus the
+normalized query parameters (api_key excluded, query whitespace/case folded).
+
+- Storage: a SharedCache (SQLite, WAL) at SERP_CACHE_PATH under
+  validator_weights/, separate from validation_cache.sqlite so SERP bodies
+  get their own TTL (SERP_CACHE_TTL_HOURS) and size limits
+- Only HTTP 200 responses are stored; errors are always retried
+- Identical in-flight queries within a process share one request; that
+  request is hedged after ScrapingDog's recent p95 latency (provider_resilience)
+- SERP_CACHE_MODE=replay serves only from the cache, expired entries included
+  (a miss returns a non-200 response, exactly like an API error), so an epoch
+  can be re-run offline; SERP_CACHE_MODE=off bypasses the cache entirely
+- Hit rate and estimated dollars saved (SCRAPINGDOG_COST_PER_REQUEST) are
+  logged at the end of every batch
+
+    python -m validator_models.serp_cache stats
+    python -m validator_models.serp_cache evict
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, Optional
+
+from validator_models.http_client import get_sync_session
+from validator_models.pipeline_metrics import record_cache
+from validator_models.provider_resilience import guarded_call_sync
+from validator_models.shared_cache import SharedCache
+
+# ════════════════════════════════════════════════════════════════════
+# Configuration
+# ════════════════════════════════════════════════════════════════════
+SCRAPINGDOG_GOOGLE_URL = "https://api.scrapingdog.com/google"
+
+SERP_CACHE_PATH = os.getenv(
+    "SERP_CACHE_PATH",
+    str(Path("validator_weights") / "serp_cache.sqlite"),
+)
+SERP_CACHE_MODE = os.getenv("SERP_CACHE_MODE", "readwrite").lower()  # readwrite | replay | off
+SERP_CACHE_TTL_HOURS = float(os.getenv("SERP_CACHE_TTL_HOURS", "72"))
+SERP_CACHE_MAX_ENTRIES = int(os.getenv("SERP_CACHE_MAX_ENTRIES", "300000"))
+SERP_CACHE_MAX_BYTES = int(os.getenv("SERP_CACHE_MAX_BYTES", str(1024 * 1024 * 1024)))
+# Approximate price of one Google search request on a ScrapingDog plan (USD)
+SCRAPINGDOG_COST_PER_REQUEST = float(os.getenv("SCRAPINGDOG_COST_PER_REQUEST", "0.0005"))
+SERP_NAMESPACE = "scrapingdog_google"
+
+REPLAY_MISS_STATUS = 599
+
+_lock = threading.Lock()
+_inflight: Dict[str, Future] = {}
+_stats = {"lookups": 0, "hits": 0, "misses": 0, "coalesced": 0, "requests": 0, "errors": 0, "replay_misses": 0}
+_store: Optional[SharedCache] = None
+
+
+class SerpResponse:
+    """The parts of requests.Response the ScrapingDog call sites use."""
+
+    def __init__(self, status_code: int, text: str, from_cache: bool = False):
+        self.status_code = status_code
+        self.text = text
+        self.from_cache = from_cache
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def get_serp_store() -> SharedCache:
+    """Process-wide SERP SharedCache (opened lazily)."""
+    global _store
+    if _store is None:
+        _store = SharedCache(path=SERP_CACHE_PATH if SERP_CACHE_MODE != "off" else "",
+                             max_entries=SERP_CACHE_MAX_ENTRIES, max_bytes=SERP_CACHE_MAX_BYTES)
+    return _store
+
+
+def serp_key(url: str, params: Dict) -> str:
+    """Content address of a search: endpoint + normalized params, without the API key."""
+    normalized = {}
+    for name, value in params.items():
+        if name == "api_key" or value is None:
+            continue
+        if name == "query":
+            value = " ".join(str(value).lower().split())
+        normalized[name] = str(value)
+    canonical = json.dumps({"url": url, "params": normalized}, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _count(name: str, amount: int = 1):
+    with _lock:
+        _stats[name] += amount
+
+
+def scrapingdog_get(params: Dict, timeout: float = 30, proxies: Optional[Dict] = None,
+                    url: str = SCRAPINGDOG_GOOGLE_URL) -> SerpResponse:
+    """
+    Cached drop-in for get_sync_session("scrapingdog").get(url, params=params, ...).
+
+    Thread-safe (callers run in asyncio.to_thread). Network errors raise, as before.
+    """
+    key = serp_key(url, params)
+    _count("lookups")
+    if SERP_CACHE_MODE != "off":
+        cached = get_serp_store().get(SERP_NAMESPACE, key, allow_expired=SERP_CACHE_MODE == "replay")
+        if cached is not None:
+            _count("hits")
+            record_cache("providers", "scrapingdog", hit=True)
+            return SerpResponse(200, cached, from_cache=True)
+    if SERP_CACHE_MODE == "replay":
+        _count("replay_misses")
+        return SerpResponse(REPLAY_MISS_STATUS, "SERP cache miss in replay mode (SERP_CACHE_MODE=replay)")
+
+    with _lock:
+        pending = _inflight.get(key)
+        owner = pending is None
+        if owner:
+            pending = Future()
+            _inflight[key] = pending
+        else:
+            _stats["coalesced"] += 1
+    if not owner:
+        return pending.result()
+
+    _count("misses")
+    record_cache("providers", "scrapingdog", hit=False)
+    try:
+        # Hedged (provider_resilience): a stalled search gets a second identical request
+        response = guarded_call_sync(
+            "scrapingdog",
+            lambda: get_sync_session("scrapingdog").get(url, params=params, timeout=timeout, proxies=proxies),
+            hedge=True,
+            failed=lambda response: response.status_code >= 500,
+        )
+        result = SerpResponse(response.status_code, response.text)
+        _count("requests")
+        if response.status_code == 200 and SERP_CACHE_MODE != "off":
+            get_serp_store().set(SERP_NAMESPACE, key, response.text, ttl_hours=SERP_CACHE_TTL_HOURS)
+        elif response.status_code != 200:
+            _count("errors")
+        pending.set_result(result)
+        return result
+    except Exception as e:
+        _count("errors")
+        pending.set_exception(e)
+        raise
+    finally:
+        with _lock:
+            _inflight.pop(key, None)
+
+
+# ════════════════════════════════════════════════════════════════════
+# Reporting
+# ════════════════════════════════════════════════════════════════════
+def get_serp_cache_stats(since: Optional[Dict[str, int]] = None) -> Dict[str, float]:
+    """
+    SERP cache counters for this process (minus a previous snapshot, if given).
+
+    Returns:
+        {"lookups", "hits", "misses", "coalesced", "requests", "errors",
+         "replay_misses", "hit_rate", "dollars_saved", "mode"}
+    """
+    with _lock:
+        report = dict(_stats)
+    if since:
+        for name in report:
+            report[name] -= since.get(name, 0)
+    saved = report["hits"] + report["coalesced"]
+    report["hit_rate"] = round(saved / report["lookups"], 3) if report["lookups"] else 0.0
+    report["dollars_saved"] = round(saved * SCRAPINGDOG_COST_PER_REQUEST, 4)
+    report["mode"] = SERP_CACHE_MODE
+    return report
+
+
+def log_serp_cache_stats(since: Optional[Dict[str, int]] = None):
+    """Print a one-line SERP cache summary (for one batch when `since` is its start snapshot)."""
+    report = get_serp_cache_stats(since)
+    if not report["lookups"]:
+        return
+    print(
+        f"   🔎 SERP cache ({report['mode']}): {report['lookups']} lookups, "
+        f"{report['hits']} hits + {report['coalesced']} coalesced ({report['hit_rate']:.0%}), "
+        f"{report['requests']} paid requests, ~${report['dollars_saved']:.2f} saved"
+        + (f", {report['replay_misses']} replay misses" if report["replay_misses"] else "")
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ScrapingDog SERP cache maintenance")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("stats", help="Show stored entries and size")
+    subparsers.add_parser("evict", help="Drop expired entries and enforce size limits")
+    args = parser.parse_args()
+
+    store = get_serp_store()
+    if args.command == "stats":
+        summary = store.summary()
+        entry = summary["namespaces"].get(SERP_NAMESPACE, {"entries": 0, "bytes": 0})
+        print(f"📊 SERP cache {summary['path']}: {entry['entries']} searches, {entry['bytes'] / 1024 / 1024:.1f} MB "
+              f"(TTL {SERP_CACHE_TTL_HOURS:g}h, mode {SERP_CACHE_MODE})")
+    elif args.command == "evict":
+        removed = store.evict()
+        print(f"🧹 Evicted {removed} SERP cache entries")
+
+
+if __name__ == "__main__":
+    main()
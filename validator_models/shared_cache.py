@@ -0,0 +1,373 @@
+"""
+Persistent cross-container validation cache (SQLite, WAL mode).
+
+validation_cache in automated_checks lives in process memory, so WHOIS / MX /
+DNSBL / SPF-DMARC results are lost on every restart and each of the 30
+coordinator/worker containers repeats the same lookups for the same domains.
+This module keeps those results in one SQLite file under the shared
+validator_weights/ directory that every container on the host can read and write.
+
+- Per-namespace TTLs (SHARED_CACHE_TTLS, hours - same units as CACHE_TTLS)
+- Size-bounded eviction (entry count and total bytes, oldest writes first)
+- Atomic compare-and-set on a per-entry version counter
+- Cache warming from validator_weights/epoch_{N}_leads.json:
+
+    python -m validator_models.shared_cache warm --epoch 1234
+    python -m validator_models.shared_cache stats
+
+Set VALIDATOR_SHARED_CACHE_PATH="" to disable it. Every operation is
+best-effort: a locked or corrupt database is reported and treated as a cache
+miss, never as a check failure.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# ════════════════════════════════════════════════════════════════════
+# Configuration
+# ════════════════════════════════════════════════════════════════════
+SHARED_CACHE_PATH = os.getenv(
+    "VALIDATOR_SHARED_CACHE_PATH",
+    str(Path("validator_weights") / "validation_cache.sqlite"),
+)
+SHARED_CACHE_MAX_ENTRIES = int(os.getenv("VALIDATOR_SHARED_CACHE_MAX_ENTRIES", "200000"))
+SHARED_CACHE_MAX_BYTES = int(os.getenv("VALIDATOR_SHARED_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+SHARED_CACHE_EVICT_EVERY = 500  # Run eviction once every N writes (per process)
+
+# TTL per namespace in hours (mirrors CACHE_TTLS in automated_checks)
+SHARED_CACHE_TTLS = {
+    "whois": 90,       # check_domain_age
+    "mx": 24,          # check_mx_record
+    "dnsbl": 24,       # check_dnsbl
+    "spf_dmarc": 24,   # check_spf_dmarc
+    "llm": 168,        # llm_service prompt-hash responses
+}
+DEFAULT_TTL_HOURS = 24
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace  TEXT    NOT NULL,
+    key        TEXT    NOT NULL,
+    value      TEXT    NOT NULL,
+    version    INTEGER NOT NULL DEFAULT 1,
+    size       INTEGER NOT NULL,
+    created_at REAL    NOT NULL,
+    expires_at REAL    NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_created ON cache_entries (created_at);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_expires ON cache_entries (expires_at);
+"""
+
+
+class SharedCache:
+    """
+    SQLite-backed key/value cache shared by every process on the host.
+
+    Values are JSON-serialized. Each (namespace, key) carries a version that
+    increments on every write, which compare_and_set() uses for atomic updates.
+    """
+
+    def __init__(self, path: str = SHARED_CACHE_PATH,
+                 max_entries: int = SHARED_CACHE_MAX_ENTRIES,
+                 max_bytes: int = SHARED_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._writes = 0
+        self._disabled = not path  # VALIDATOR_SHARED_CACHE_PATH="" turns the shared cache off
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "cas_conflicts": 0, "evictions": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Connection handling (one connection per thread)
+    # ------------------------------------------------------------------
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def _error(self, op: str, e: Exception):
+        self.stats["errors"] += 1
+        print(f"⚠️ Shared cache {op} failed ({self.path}): {e}")
+        if isinstance(e, sqlite3.DatabaseError) and "malformed" in str(e).lower():
+            # Corrupt file - stop using it for the rest of this process
+            self._disabled = True
+
+    @staticmethod
+    def _ttl_seconds(namespace: str, ttl_hours: Optional[float]) -> float:
+        if ttl_hours is None:
+            ttl_hours = SHARED_CACHE_TTLS.get(namespace, DEFAULT_TTL_HOURS)
+        return ttl_hours * 3600
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def _read_row(self, namespace: str, key: str, allow_expired: bool) -> Tuple[Optional[tuple], int]:
+        """(row, version) where row is (value, created_at, expires_at) of a live entry, else None."""
+        if self._disabled:
+            return None, 0
+        try:
+            row = self._conn().execute(
+                "SELECT value, version, created_at, expires_at FROM cache_entries WHERE namespace=? AND key=?",
+                (namespace, key),
+            ).fetchone()
+        except Exception as e:
+            self._error("read", e)
+            return None, 0
+
+        if row is None or (row[3] <= time.time() and not allow_expired):
+            # Expired rows are left for eviction; their version is still returned for CAS
+            self.stats["misses"] += 1
+            return None, 0 if row is None else row[1]
+        self.stats["hits"] += 1
+        return (json.loads(row[0]), row[2], row[3]), row[1]
+
+    def get_with_version(self, namespace: str, key: str, allow_expired: bool = False) -> Tuple[Optional[Any], int]:
+        """
+        Return (value, version). Missing entries return (None, 0); expired
+        entries return (None, stored_version) so compare_and_set can replace them,
+        unless allow_expired (offline replay) asks for them anyway.
+        """
+        row, version = self._read_row(namespace, key, allow_expired)
+        return (row[0] if row else None), version
+
+    def get_entry(self, namespace: str, key: str) -> Optional[Tuple[Any, float, float]]:
+        """(value, created_at, expires_at) of a live entry, so copies can keep its age."""
+        return self._read_row(namespace, key, False)[0]
+
+    def get(self, namespace: str, key: str, allow_expired: bool = False) -> Optional[Any]:
+        return self.get_with_version(namespace, key, allow_expired)[0]
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def set(self, namespace: str, key: str, value: Any, ttl_hours: Optional[float] = None) -> bool:
+        """Unconditional write (last writer wins). Returns False on error."""
+        if self._disabled:
+            return False
+        payload = json.dumps(value, default=str)
+        now = time.time()
+        try:
+            self._conn().execute(
+                "INSERT INTO cache_entries (namespace, key, value, version, size, created_at, expires_at) "
+                "VALUES (?, ?, ?, 1, ?, ?, ?) "
+                "ON CONFLICT(namespace, key) DO UPDATE SET value=excluded.value, version=version+1, "
+                "size=excluded.size, created_at=excluded.created_at, expires_at=excluded.expires_at",
+                (namespace, key, payload, len(payload), now, now + self._ttl_seconds(namespace, ttl_hours)),
+            )
+        except Exception as e:
+            self._error("write", e)
+            return False
+        self._after_write()
+        return True
+
+    def compare_and_set(self, namespace: str, key: str, expected_version: int, value: Any,
+                        ttl_hours: Optional[float] = None) -> bool:
+        """
+        Atomically write value only if the stored version equals expected_version.
+
+        expected_version=0 means "only if absent". Returns True if the write won,
+        False on a version conflict (another container wrote first) or error.
+        """
+        if self._disabled:
+            return False
+        payload = json.dumps(value, default=str)
+        now = time.time()
+        expires_at = now + self._ttl_seconds(namespace, ttl_hours)
+        conn = self._conn()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT version FROM cache_entries WHERE namespace=? AND key=?",
+                    (namespace, key),
+                ).fetchone()
+                current = row[0] if row else 0
+                if current != expected_version:
+                    conn.execute("ROLLBACK")
+                    self.stats["cas_conflicts"] += 1
+                    return False
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (namespace, key, value, version, size, created_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (namespace, key, payload, current + 1, len(payload), now, expires_at),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except Exception as e:
+            self._error("compare_and_set", e)
+            return False
+        self._after_write()
+        return True
+
+    def delete(self, namespace: str, key: str):
+        if self._disabled:
+            return
+        try:
+            self._conn().execute("DELETE FROM cache_entries WHERE namespace=? AND key=?", (namespace, key))
+        except Exception as e:
+            self._error("delete", e)
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+    def _after_write(self):
+        self.stats["writes"] += 1
+        self._writes += 1
+        if self._writes % SHARED_CACHE_EVICT_EVERY == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Drop expired rows, then the oldest writes until both the entry-count
+        and byte budgets are met. Returns the number of rows removed.
+        """
+        if self._disabled:
+            return 0
+        removed = 0
+        try:
+            conn = self._conn()
+            removed += conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),)).rowcount
+
+            count, total_bytes = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries").fetchone()
+            if count > self.max_entries or total_bytes > self.max_bytes:
+                # Trim to 90% of the budget so eviction doesn't run on every write
+                target_count = int(self.max_entries * 0.9)
+                target_bytes = int(self.max_bytes * 0.9)
+                excess_rows = max(0, count - target_count)
+                if total_bytes > target_bytes and count:
+                    avg = total_bytes / count
+                    excess_rows = max(excess_rows, int((total_bytes - target_bytes) / avg) + 1)
+                removed += conn.execute(
+                    "DELETE FROM cache_entries WHERE rowid IN "
+                    "(SELECT rowid FROM cache_entries ORDER BY created_at LIMIT ?)",
+                    (excess_rows,),
+                ).rowcount
+        except Exception as e:
+            self._error("evict", e)
+        self.stats["evictions"] += removed
+        return removed
+
+    def summary(self) -> Dict[str, Any]:
+        """Row counts per namespace plus this process's counters."""
+        namespaces = {}
+        if not self._disabled:
+            try:
+                for namespace, count, size in self._conn().execute(
+                    "SELECT namespace, COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries GROUP BY namespace"
+                ):
+                    namespaces[namespace] = {"entries": count, "bytes": size}
+            except Exception as e:
+                self._error("summary", e)
+        return {"path": self.path, "namespaces": namespaces, **self.stats}
+
+
+_shared_cache: Optional[SharedCache] = None
+
+
+def get_shared_cache() -> SharedCache:
+    """Process-wide SharedCache instance (opened lazily)."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = SharedCache()
+    return _shared_cache
+
+
+# ════════════════════════════════════════════════════════════════════
+# Cache warming
+# ════════════════════════════════════════════════════════════════════
+async def warm_from_leads_file(leads_file: str, concurrency: int = 10) -> Dict[str, int]:
+    """
+    Preload WHOIS / MX / SPF-DMARC / DNSBL results for every domain in an
+    epoch leads file. One representative lead per (website, email domain) is
+    run through the Stage 1-2 domain checks, which write through to this cache.
+    """
+    from validator_models.automated_checks import (
+        check_domain_age,
+        check_mx_record,
+        check_spf_dmarc,
+        check_dnsbl,
+        get_lead_dns_domains,
+    )
+
+    with open(leads_file, "r") as f:
+        leads = json.load(f).get("leads") or []
+
+    # One lead per unique domain tuple (copies - warming must not mutate the file's leads)
+    representatives = {}
+    for lead in leads:
+        domains = get_lead_dns_domains(lead)
+        if any(domains) and domains not in representatives:
+            representatives[domains] = dict(lead)
+
+    print(f"🔥 Warming shared cache from {leads_file}: {len(leads)} leads, {len(representatives)} unique domains")
+    semaphore = asyncio.Semaphore(concurrency)
+    start = time.time()
+
+    async def _warm(lead):
+        async with semaphore:
+            await asyncio.gather(
+                check_domain_age(lead),
+                check_mx_record(lead),
+                check_spf_dmarc(lead),
+                check_dnsbl(lead),
+                return_exceptions=True,
+            )
+
+    await asyncio.gather(*[_warm(lead) for lead in representatives.values()])
+    elapsed = time.time() - start
+    print(f"✅ Shared cache warmed: {len(representatives)} domains in {elapsed:.1f}s")
+    return {"leads": len(leads), "domains": len(representatives)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared validation cache maintenance")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    warm = subparsers.add_parser("warm", help="Preload domains from an epoch leads file")
+    source = warm.add_mutually_exclusive_group(required=True)
+    source.add_argument("--epoch", type=int, help="Epoch number (reads validator_weights/epoch_{N}_leads.json)")
+    source.add_argument("--leads-file", help="Explicit path to a leads JSON file")
+    warm.add_argument("--concurrency", type=int, default=10, help="Domains warmed in parallel")
+
+    subparsers.add_parser("stats", help="Show entry counts per namespace")
+    subparsers.add_parser("evict", help="Drop expired entries and enforce size limits")
+
+    args = parser.parse_args()
+    # Use the importable module's instance - under `python -m` the checks write
+    # through validator_models.shared_cache, not through this __main__ copy
+    from validator_models.shared_cache import get_shared_cache as get_checks_shared_cache
+    cache = get_checks_shared_cache()
+
+    if args.command == "warm":
+        leads_file = args.leads_file or str(Path("validator_weights") / f"epoch_{args.epoch}_leads.json")
+        if not os.path.exists(leads_file):
+            parser.error(f"Leads file not found: {leads_file}")
+        asyncio.run(warm_from_leads_file(leads_file, args.concurrency))
+    elif args.command == "evict":
+        print(f"🧹 Evicted {cache.evict()} entries")
+
+    print(json.dumps(cache.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
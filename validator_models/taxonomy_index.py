@@ -0,0 +1,331 @@
+"""
+Precomputed index over INDUSTRY_TAXONOMY, shared by validator and miner code.
+
+The taxonomy helpers used to rebuild or rescan all 723 entries on every call:
+validate_exact_industry_match rebuilt the industry set and scanned it,
+validate_exact_sub_industry_match / fuzzy_match_sub_industry scanned and
+re-tokenized every key, and the miner's _best_subindustry re-split every
+definition with a regex for every page it scored. TAXONOMY_INDEX is built once
+at import and holds:
+
+- lower-cased exact maps for industries and sub-industries
+- the parent-industry lookup per sub-industry
+- a word inverted index over sub-industry names (fuzzy candidate pruning)
+- a token inverted index over "sub-industry + definition" with IDF weights
+  (free-text -> sub-industry matching)
+- batch variants of the lookups
+
+Validator lookups return exactly what the old linear scans returned (same
+matches, same tie-breaking by taxonomy order, same messages).
+
+    python -m validator_models.taxonomy_index bench
+"""
+
+import math
+import re
+import time
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from validator_models.industry_taxonomy import INDUSTRY_TAXONOMY
+
+# Definition tokens: alphanumeric runs of 4+ characters (as _best_subindustry used)
+_TOKEN_SPLIT = re.compile(r"[^a-z0-9]+")
+MIN_TOKEN_LENGTH = 4
+
+
+def _definition_tokens(text: str) -> List[str]:
+    return [t for t in _TOKEN_SPLIT.split(text.lower()) if len(t) >= MIN_TOKEN_LENGTH]
+
+
+def _name_words(name: str) -> FrozenSet[str]:
+    """Word set used by fuzzy sub-industry matching."""
+    return frozenset(name.lower().replace('-', ' ').replace('/', ' ').split())
+
+
+class TaxonomyIndex:
+    """Read-only lookup structures derived from a taxonomy dict (built once)."""
+
+    def __init__(self, taxonomy: Dict[str, Dict]):
+        self.taxonomy = taxonomy
+        self.sub_industries: Tuple[str, ...] = tuple(taxonomy.keys())
+
+        # Exact maps (first entry wins on case-insensitive duplicates, like the old scans)
+        industries = {}
+        for data in taxonomy.values():
+            for group in data.get("industries", []):
+                industries.setdefault(group, None)
+        self.industries: FrozenSet[str] = frozenset(industries)
+        self.industries_sorted: List[str] = sorted(self.industries)
+        self.industry_by_lower: Dict[str, str] = {}
+        for industry in industries:
+            self.industry_by_lower.setdefault(industry.lower(), industry)
+        self.sub_industry_by_lower: Dict[str, str] = {}
+        for sub in self.sub_industries:
+            self.sub_industry_by_lower.setdefault(sub.lower(), sub)
+
+        # Parent-industry lookup: sub_industry -> (industries, lower-cased industries)
+        self.parent_industries: Dict[str, Tuple[str, ...]] = {
+            sub: tuple(data.get("industries", [])) for sub, data in taxonomy.items()
+        }
+        self._parent_lower: Dict[str, FrozenSet[str]] = {
+            sub: frozenset(g.lower() for g in groups) for sub, groups in self.parent_industries.items()
+        }
+
+        # Fuzzy matching: precomputed lower-cased names and word sets, plus word -> positions
+        self._sub_lower: List[str] = [sub.lower() for sub in self.sub_industries]
+        self._sub_words: List[FrozenSet[str]] = [_name_words(sub) for sub in self.sub_industries]
+        self._word_postings: Dict[str, List[int]] = defaultdict(list)
+        for pos, words in enumerate(self._sub_words):
+            for word in words:
+                self._word_postings[word].append(pos)
+
+        # Definition matching: token -> positions, with IDF weights
+        self._token_postings: Dict[str, List[int]] = defaultdict(list)
+        for pos, sub in enumerate(self.sub_industries):
+            definition = taxonomy[sub].get("definition") or ""
+            for token in set(_definition_tokens(f"{sub} {definition}")):
+                self._token_postings[token].append(pos)
+        n_docs = len(self.sub_industries) or 1
+        self.idf: Dict[str, float] = {
+            token: math.log(n_docs / len(postings)) for token, postings in self._token_postings.items()
+        }
+        # Per-entry vector norms, so long definitions don't win on length alone
+        self._doc_norm: List[float] = [0.0] * len(self.sub_industries)
+        for token, postings in self._token_postings.items():
+            for pos in postings:
+                self._doc_norm[pos] += self.idf[token] ** 2
+        self._doc_norm = [math.sqrt(norm) for norm in self._doc_norm]
+
+    # ------------------------------------------------------------------
+    # Exact lookups
+    # ------------------------------------------------------------------
+    def match_industry(self, claimed: str) -> Optional[str]:
+        """Canonical industry name for a case-insensitive exact match, else None."""
+        if not claimed:
+            return None
+        return self.industry_by_lower.get(claimed.strip().lower())
+
+    def match_sub_industry(self, claimed: str) -> Optional[str]:
+        """Canonical sub-industry key for a case-insensitive exact match, else None."""
+        if not claimed:
+            return None
+        return self.sub_industry_by_lower.get(claimed.strip().lower())
+
+    def is_valid_pairing(self, industry: str, sub_industry: str) -> bool:
+        """True if industry (case-insensitive) is a parent of sub_industry, or it has none."""
+        parents = self._parent_lower.get(sub_industry)
+        if parents is None:
+            return False
+        return not parents or industry.lower() in parents
+
+    # ------------------------------------------------------------------
+    # Fuzzy / free-text matching
+    # ------------------------------------------------------------------
+    def fuzzy_sub_industry(self, claimed: str, min_confidence: float = 0.5) -> Tuple[Optional[str], float]:
+        """
+        Containment / word-overlap match of a claimed sub-industry name.
+
+        Same scoring as the legacy scan: containment confidence is the length
+        ratio, word confidence is the Jaccard overlap, the best score wins and
+        ties go to the earlier taxonomy entry. Word overlap is only computed for
+        entries sharing at least one word (others score 0).
+        """
+        if not claimed:
+            return None, 0.0
+        claimed_lower = claimed.strip().lower()
+        exact = self.sub_industry_by_lower.get(claimed_lower)
+        if exact is not None:
+            return exact, 1.0
+
+        claimed_words = _name_words(claimed_lower)
+        shares_word = set()
+        for word in claimed_words:
+            shares_word.update(self._word_postings.get(word, ()))
+
+        best_pos, best_confidence = None, 0.0
+        for pos, key_lower in enumerate(self._sub_lower):
+            if claimed_lower in key_lower or key_lower in claimed_lower:
+                longer = max(len(claimed_lower), len(key_lower))
+                shorter = min(len(claimed_lower), len(key_lower))
+                confidence = shorter / longer
+                if confidence > best_confidence:
+                    best_pos, best_confidence = pos, confidence
+
+            if pos in shares_word:
+                key_words = self._sub_words[pos]
+                word_confidence = len(claimed_words & key_words) / len(claimed_words | key_words)
+                if word_confidence > best_confidence:
+                    best_pos, best_confidence = pos, word_confidence
+
+        if best_pos is not None and best_confidence >= min_confidence:
+            return self.sub_industries[best_pos], best_confidence
+        return None, 0.0
+
+    def search_definitions(self, text: str, top_k: int = 1) -> List[Tuple[str, float]]:
+        """
+        Rank sub-industries by IDF-weighted overlap between the text's tokens and
+        each entry's "sub-industry + definition" tokens, normalized by the entry's
+        vector length. Tokens found in every definition ("companies") weigh
+        nothing; ties keep taxonomy order.
+        """
+        if not text:
+            return []
+        scores: Dict[int, float] = defaultdict(float)
+        for token in set(_definition_tokens(text)):
+            weight = self.idf.get(token)
+            if not weight:
+                continue
+            for pos in self._token_postings[token]:
+                scores[pos] += weight * weight
+        for pos in scores:
+            scores[pos] /= self._doc_norm[pos]
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:top_k]
+        return [(self.sub_industries[pos], score) for pos, score in ranked if score > 0]
+
+    def best_industry_pair(self, text: str) -> Tuple[Optional[str], Optional[str]]:
+        """(first parent industry, sub_industry) for the best definition match, else (None, None)."""
+        best = self.search_definitions(text, top_k=1)
+        if not best:
+            return None, None
+        sub = best[0][0]
+        parents = self.parent_industries.get(sub) or ()
+        return (parents[0] if parents else None), sub
+
+    # ------------------------------------------------------------------
+    # Batch API
+    # ------------------------------------------------------------------
+    def match_industries(self, claims: Iterable[str]) -> List[Optional[str]]:
+        return [self.match_industry(c) for c in claims]
+
+    def match_sub_industries(self, claims: Iterable[str]) -> List[Optional[str]]:
+        return [self.match_sub_industry(c) for c in claims]
+
+    def best_industry_pairs(self, texts: Iterable[str]) -> List[Tuple[Optional[str], Optional[str]]]:
+        return [self.best_industry_pair(t) for t in texts]
+
+
+TAXONOMY_INDEX = TaxonomyIndex(INDUSTRY_TAXONOMY)
+
+
+# ════════════════════════════════════════════════════════════════════
+# Benchmark
+# ════════════════════════════════════════════════════════════════════
+def _legacy_industry_match(claimed: str) -> Optional[str]:
+    """Pre-index validate_exact_industry_match lookup (rebuild + linear scan)."""
+    industries = set()
+    for data in INDUSTRY_TAXONOMY.values():
+        for group in data.get("industries", []):
+            industries.add(group)
+    for valid in industries:
+        if valid.lower() == claimed.strip().lower():
+            return valid
+    return None
+
+
+def _legacy_sub_industry_match(claimed: str) -> Optional[str]:
+    """Pre-index validate_exact_sub_industry_match lookup (linear scan)."""
+    for sub in INDUSTRY_TAXONOMY:
+        if sub.lower() == claimed.strip().lower():
+            return sub
+    return None
+
+
+def _legacy_fuzzy(claimed: str) -> Tuple[Optional[str], float]:
+    """Pre-index fuzzy_match_sub_industry scoring (re-tokenizes every key)."""
+    claimed_lower = claimed.strip().lower()
+    for key in INDUSTRY_TAXONOMY:
+        if key.lower() == claimed_lower:
+            return key, 1.0
+    best_match, best_confidence = None, 0.0
+    for key in INDUSTRY_TAXONOMY:
+        key_lower = key.lower()
+        if claimed_lower in key_lower or key_lower in claimed_lower:
+            confidence = min(len(claimed_lower), len(key_lower)) / max(len(claimed_lower), len(key_lower))
+            if confidence > best_confidence:
+                best_match, best_confidence = key, confidence
+        claimed_words = set(claimed_lower.replace('-', ' ').replace('/', ' ').split())
+        key_words = set(key_lower.replace('-', ' ').replace('/', ' ').split())
+        if claimed_words and key_words:
+            total = len(claimed_words | key_words)
+            word_confidence = len(claimed_words & key_words) / total if total else 0
+            if word_confidence > best_confidence:
+                best_match, best_confidence = key, word_confidence
+    if best_match and best_confidence >= 0.5:
+        return best_match, best_confidence
+    return None, 0.0
+
+
+def _legacy_best_subindustry(text: str) -> Optional[str]:
+    """Pre-index miner _best_subindustry scan (regex split of every definition per call)."""
+    hay = re.sub(r"\s+", " ", text.lower())
+    best = (0, None)
+    for sub, meta in INDUSTRY_TAXONOMY.items():
+        tokens = [t for t in re.split(r"[^a-z0-9]+", f"{sub} {meta.get('definition') or ''}".lower()) if len(t) >= 4]
+        score = sum(1 for t in set(tokens) if t in hay)
+        if score > best[0]:
+            best = (score, sub)
+    return best[1]
+
+
+def _rate(func, inputs: List[str], min_seconds: float = 0.5) -> float:
+    """Lookups per second for func over inputs (repeated for at least min_seconds)."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        for value in inputs:
+            func(value)
+        calls += len(inputs)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return calls / elapsed
+
+
+def run_benchmark() -> Dict[str, Dict[str, float]]:
+    """Compare legacy scans with the index; exact/fuzzy results must be identical."""
+    index = TAXONOMY_INDEX
+    subs = list(index.sub_industries)
+    industry_claims = index.industries_sorted + [i.upper() for i in index.industries_sorted] + ["Not An Industry"]
+    sub_claims = subs[::7] + [s.lower() for s in subs[3::11]] + ["Unknown Sub Industry"]
+    fuzzy_claims = ["saas software", "3d print", "cloud", "data analytics platform", "b2b marketing",
+                    "medical device", "real estate", "crypto"] + [s.split()[0] for s in subs[::25]]
+    texts = [f"{sub} " + (INDUSTRY_TAXONOMY[sub].get("definition") or "") for sub in subs[::20]]
+
+    for claim in industry_claims:
+        assert index.match_industry(claim) == _legacy_industry_match(claim), claim
+    for claim in sub_claims:
+        assert index.match_sub_industry(claim) == _legacy_sub_industry_match(claim), claim
+    for claim in fuzzy_claims:
+        assert index.fuzzy_sub_industry(claim) == _legacy_fuzzy(claim), claim
+
+    cases = {
+        "industry_exact": (_legacy_industry_match, index.match_industry, industry_claims),
+        "sub_industry_exact": (_legacy_sub_industry_match, index.match_sub_industry, sub_claims),
+        "sub_industry_fuzzy": (_legacy_fuzzy, index.fuzzy_sub_industry, fuzzy_claims),
+        "definition_match": (_legacy_best_subindustry, index.best_industry_pair, texts),
+    }
+    report = {}
+    for name, (legacy, indexed, inputs) in cases.items():
+        before = _rate(legacy, inputs)
+        after = _rate(indexed, inputs)
+        report[name] = {"before_per_sec": round(before), "after_per_sec": round(after),
+                        "speedup": round(after / before, 1)}
+        print(f"   {name:20s} {before:>12,.0f}/s -> {after:>12,.0f}/s  ({after / before:.1f}x)")
+    return report
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Industry taxonomy index")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("bench", help="Lookups per second before/after the index")
+    args = parser.parse_args()
+
+    if args.command == "bench":
+        print(f"📚 Taxonomy index: {len(TAXONOMY_INDEX.sub_industries)} sub-industries, "
+              f"{len(TAXONOMY_INDEX.industries)} industries, {len(TAXONOMY_INDEX.idf)} definition tokens")
+        run_benchmark()
+
+
+if __name__ == "__main__":
+    main()
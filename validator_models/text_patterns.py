@@ -0,0 +1,363 @@
+"""
+Compiled pattern registry for Stage 4/5 role, location and employee-count extraction.
+
+The extraction helpers in automated_checks used to build their regexes inside
+every call: one re.search per keyword for ~90 role keywords (twice per snippet),
+one per city in MAJOR_CITIES, one re.sub per abbreviation in fuzzy_match_role,
+plus `any(kw in text ...)` scans over long keyword lists. Those patterns are
+now compiled once at import through the helpers below, and keyword-list scans
+are replaced by a single combined alternation.
+
+Where the old code returned the *first keyword in list order* that matched
+(not the leftmost match in the text), the combined alternation is only used as
+a gate: if it finds nothing no single-keyword pattern can match, otherwise the
+precompiled per-keyword patterns are tried in the original order. Results are
+byte-identical; the golden file records them.
+
+    python -m validator_models.text_patterns golden --check
+    python -m validator_models.text_patterns golden --record   # only before changing extraction behavior
+    python -m validator_models.text_patterns bench
+    python -m validator_models.text_patterns stats
+"""
+
+import json
+import os
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, List, Pattern, Tuple
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "text_patterns_golden.json")
+
+# name -> compiled pattern, for `stats` and to keep every precompiled pattern in one place
+REGISTRY: Dict[str, Pattern] = {}
+
+
+def compile_pattern(name: str, pattern: str, flags: int = 0) -> Pattern:
+    """Compile and register a pattern under name."""
+    compiled = re.compile(pattern, flags)
+    REGISTRY[name] = compiled
+    return compiled
+
+
+def substring_alternation(name: str, needles: Iterable[str], flags: int = 0) -> Pattern:
+    """
+    One pattern equivalent to `any(needle in text for needle in needles)`.
+
+    Needles are escaped and longest-first (irrelevant for a yes/no search, but
+    it keeps the alternation deterministic for set inputs).
+    """
+    ordered = sorted(set(needles), key=lambda s: (-len(s), s))
+    return compile_pattern(name, "|".join(re.escape(n) for n in ordered), flags)
+
+
+def compile_each(name: str, template: str, keywords: Iterable[str], flags: int = 0,
+                 escape: bool = False) -> Dict[str, Pattern]:
+    """
+    Compile template.format(kw=...) once per keyword, keeping the keyword order.
+
+    escape=False keeps keywords verbatim, like the old rf-strings did.
+    """
+    compiled = {}
+    for kw in keywords:
+        compiled[kw] = re.compile(template.format(kw=re.escape(kw) if escape else kw), flags)
+    REGISTRY[name] = compiled  # type: ignore[assignment]
+    return compiled
+
+
+def keyword_gate(name: str, template: str, keywords: Iterable[str], flags: int = 0,
+                 escape: bool = False) -> Pattern:
+    """
+    template with {kw} replaced by a non-capturing alternation of all keywords.
+
+    Matches somewhere iff template.format(kw=k) matches for at least one k, so
+    a miss lets callers skip their per-keyword loop entirely.
+    """
+    alternation = "|".join(re.escape(k) if escape else k for k in keywords)
+    return compile_pattern(name, template.format(kw=f"(?:{alternation})"), flags)
+
+
+# ════════════════════════════════════════════════════════════════════
+# Golden regression corpus
+# ════════════════════════════════════════════════════════════════════
+# Synthetic ScrapingDog-style titles/snippets covering every extraction branch.
+_NAMES = ["Sarah Johnson", "Michael Chen", "Priya Patel", "James O'Brien", "Ana Lima"]
+_COMPANIES = ["Acme Analytics", "J2 Health", "Wajer Yachts", "DISQO", "Eucalyptus", "Morgan Stanley"]
+_ROLES = [
+    "CEO", "VP", "Co-Founder & CEO", "President & Co-Founder", "Founder and CTO",
+    "Vice President of Sales", "VP of Sales, Ad Measurement", "Senior Software Engineer",
+    "Director of Partnerships and Growth", "Managing Director", "Head of People",
+    "Sr. Product Manager", "Chief Operating Officer", "Chief of Staff", "Account Executive",
+    "Associate Professor of Biology", "Customer Support", "Executive Assistant Human",
+    "Public Sector, Canada", "VP Sales, Canada", "Business Operations", "Marketing Team",
+    "Owner", "Product Owner", "Registered Nurse", "Data Scientist", "General Counsel",
+    "Assistant to the CEO", "HR Business Partner", "Regional Sales Manager - APAC",
+    "Country Manager - Vietnam, Cambodia", "CEO, CFO", "Managing Director, Chief Operating Officer",
+    "Director of Marketing, Analyst, Operations Manager", "Associate Director -",
+    "CEO. Unlocking the potential of AI for everyone", "Talent Acquisition Lead",
+    "SVP Engineering", "Mgr. Customer Success", "Eng. Lead",
+]
+_CITIES = [("San Francisco", "CA", "California"), ("New York", "NY", "New York"),
+           ("Austin", "TX", "Texas"), ("Media", "PA", "Pennsylvania")]
+_INTL = [("London", "United Kingdom"), ("Lyon", "France"), ("Toronto", "Canada")]
+
+_TITLE_TEMPLATES = [
+    "{name} - {role} @ {company} | LinkedIn",
+    "{name} - {role} at {company} | LinkedIn",
+    "{name} - {company} | LinkedIn",
+    "{name} - {role} - {company} | LinkedIn",
+    "{name} - {role} {company} ...",
+    "{company} hiring {role} in {city}, {st} | LinkedIn",
+    "{name} – {role} | LinkedIn",
+    "{role} at {company} - {name} - LinkedIn",
+]
+_SNIPPET_TEMPLATES = [
+    "{name} is currently a {role} at {company}. Experience: 10 years.",
+    "{first} serves as the {role} at {company}, leading global teams.",
+    "Founder and CEO {name} announced the launch today.",
+    "{name}. {role} @ {company}. {city}, {st}. 500+ connections.",
+    "Experience: {role} at {company} · Education: Stanford · Location: {city}",
+    "{company} CSO {name} said the deal closes next quarter.",
+    "Read more about {name} and the {company} team.",
+    "The board welcomed {name}, {role} at {company}, as a new member.",
+    "Interview by CEO {name} of {company}",
+    "{name} rose to the role of chief operating officer in 2019.",
+    "Dr. Lee was an Associate Professor of Biology at State University.",
+    "Hello, I work as {role} in a small team | {company}",
+    "{name} - Experience · {role} · {company}. {city}, {state}, United States.",
+]
+_LOCATION_SNIPPETS = [
+    "Sales leader at Acme. School of Business. {city}, {state}, United States.",
+    "Product lead. 10 months. {city}, {state}, United States · 500+ connections",
+    "{city}, {st}. Nasdaq, +3 more.",
+    "Location: {city} · 500+ connections on LinkedIn",
+    "Location: 600039",
+    "Greater {city} Area · Software engineer",
+    "{city} Bay Area · Marketing",
+    "Engineer at Acme. {intl_city}, {country}.",
+    "Experience at Acme. Education at MIT.",
+    "",
+]
+_COMPANY_TEXTS = [
+    "{company} is a software company headquartered in {city}, {st}.",
+    "{company} is based in {city}, {state} and serves enterprises.",
+    "A {intl_city}-based startup building analytics tools.",
+    "Offices in {intl_city} and Berlin. Hiring now.",
+    "HQ: {city}",
+    "{company} | {city}, {st}",
+    "{city}, {st} - {company} builds tools.",
+    "An American company founded by engineers.",
+    "A French multinational corporation.",
+    "We love the food in {intl_city} and our team meets in person.",
+    "{company} operates from downtown {city} with 200 staff.",
+    "Located in Media, PA. Family owned.",
+    "Located in York, New. Family owned.",
+    "Founded in 1998 by two brothers.",
+    "The company from {city}, {st} is growing quickly.",
+    "{company} Products, Competitors, Funding | Crunchbase",
+]
+_EMPLOYEE_TEXTS = [
+    "2-10 employees", "11-50", "Company size: 51-200 employees", "1,001-5,000", "10,001+",
+    "10001+", "500+", "Self-employed", "self employed", "50", "201 - 500 employees",
+    "5,001–10,000", "0-1 employees", "about 120 people", "n/a", "", "  1001-5000  ",
+    "501-1,000", "Size: 11 — 50",
+]
+
+
+def _fill(template: str, i: int) -> str:
+    name = _NAMES[i % len(_NAMES)]
+    city, st, state = _CITIES[i % len(_CITIES)]
+    intl_city, country = _INTL[i % len(_INTL)]
+    return template.format(
+        name=name, first=name.split()[0], role=_ROLES[i % len(_ROLES)],
+        company=_COMPANIES[i % len(_COMPANIES)], city=city, st=st, state=state,
+        intl_city=intl_city, country=country,
+    )
+
+
+def build_corpus() -> List[Tuple[str, List[Any]]]:
+    """
+    (function name, args) cases built from the fixed lists above, in list order.
+
+    The extraction functions sort every set they iterate or print, so the
+    recorded outputs compare equal under any PYTHONHASHSEED.
+    """
+    cases: List[Tuple[str, List[Any]]] = []
+    for t_idx, title_t in enumerate(_TITLE_TEMPLATES):
+        for i in range(len(_ROLES)):
+            k = i + t_idx * 7
+            title = _fill(title_t, k)
+            snippet = _fill(_SNIPPET_TEMPLATES[k % len(_SNIPPET_TEMPLATES)], k)
+            company = _COMPANIES[k % len(_COMPANIES)]
+            name = _NAMES[k % len(_NAMES)]
+            cases.append(("extract_role_from_search_title", [title, "", company, name]))
+            cases.append(("extract_role_from_search_title", ["", snippet, company, name]))
+            cases.append(("extract_role_from_search_title", [title, snippet, company, ""]))
+            cases.append(("extract_role_from_search_title", ["Profile | LinkedIn", snippet, company, "Zed Q. Unrelated"]))
+    for s_idx, snippet_t in enumerate(_SNIPPET_TEMPLATES):
+        for i in range(len(_NAMES) * 2):
+            k = i + s_idx * 3
+            cases.append(("extract_role_from_search_title", ["", _fill(snippet_t, k), _COMPANIES[k % len(_COMPANIES)], ""]))
+
+    for i, role in enumerate(_ROLES):
+        cases.append(("_is_valid_role_extraction", [role]))
+        cases.append(("_is_valid_role_extraction", [role.lower()]))
+        name = _NAMES[i % len(_NAMES)]
+        company = _COMPANIES[i % len(_COMPANIES)]
+        cases.append(("validate_role_format", [role, name, company]))
+        cases.append(("validate_role_format", [f"{role} at {company}", name, company]))
+        cases.append(("validate_role_format", [f"{role}, {company}", "", company]))
+        cases.append(("validate_role_format", [f"{name.split()[-1]} - {role}", name, ""]))
+    for garbage in ["Enthusiasm", "son", "the Director", "View profile", "Practice on the law",
+                    "ZoomInfo", "Licensed to practice law", "Healthcare Sector", "Public Sector Director",
+                    "Support", "Customer Support", "Cloud Services", "Human Resources", "md", "gm", "abc"]:
+        cases.append(("_is_valid_role_extraction", [garbage]))
+
+    for i, claimed in enumerate(_ROLES):
+        for j in (0, 1, 3, 7, 12, 19):
+            extracted = _ROLES[(i + j) % len(_ROLES)]
+            cases.append(("fuzzy_match_role", [claimed, extracted]))
+    for claimed, extracted in [
+        ("CEO", "Chief Executive Officer"), ("Sr. Dir. Sales", "Senior Director of Sales"),
+        ("VP Sales", "Vice President, Business Development"), ("CTO", "CFO"),
+        ("Owner", "Product Owner"), ("Founder", "Co-Founder & CTO"), ("HR Manager", "People Manager"),
+        ("VP of Risk", "VP of Treasury"), ("Customer Success Manager", "Client Success Manager"),
+        ("Mgr, Ops", "Operations Manager"), ("EVP Marketing", "Executive Vice President of Marketing"),
+        ("Technical Lead", "Lead"), ("Tech Lead", "Technician Lead"), ("PM", "Product Manager"),
+    ]:
+        cases.append(("fuzzy_match_role", [claimed, extracted]))
+
+    for l_idx, loc_t in enumerate(_LOCATION_SNIPPETS):
+        for i in range(len(_CITIES) * len(_INTL)):
+            cases.append(("extract_person_location_from_linkedin_snippet", [_fill(loc_t, i + l_idx)]))
+    for c_idx, text_t in enumerate(_COMPANY_TEXTS):
+        for i in range(len(_CITIES) * len(_INTL)):
+            cases.append(("extract_location_from_text", [_fill(text_t, i + c_idx)]))
+    for text in _EMPLOYEE_TEXTS:
+        cases.append(("parse_employee_count", [text]))
+    return cases
+
+
+def _functions() -> Dict[str, Callable]:
+    from validator_models import automated_checks
+    names = ["extract_role_from_search_title", "_is_valid_role_extraction", "validate_role_format",
+             "fuzzy_match_role", "extract_person_location_from_linkedin_snippet",
+             "extract_location_from_text", "parse_employee_count"]
+    return {name: getattr(automated_checks, name) for name in names}
+
+
+def _normalize(value: Any) -> Any:
+    """JSON-comparable form of a result (tuples -> lists)."""
+    return json.loads(json.dumps(value))
+
+
+def _run_corpus(cases: List[Tuple[str, List[Any]]]) -> List[Any]:
+    funcs = _functions()
+    return [_normalize(funcs[name](*args)) for name, args in cases]
+
+
+def _rate(func: Callable, arg_lists: List[List[Any]], min_seconds: float = 0.5) -> float:
+    """Calls per second for func over arg_lists (repeated for at least min_seconds)."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        for args in arg_lists:
+            func(*args)
+        calls += len(arg_lists)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return calls / elapsed
+
+
+def measure_rates(cases: List[Tuple[str, List[Any]]]) -> Dict[str, float]:
+    funcs = _functions()
+    by_func: Dict[str, List[List[Any]]] = {}
+    for name, args in cases:
+        by_func.setdefault(name, []).append(args)
+    return {name: _rate(funcs[name], arg_lists) for name, arg_lists in by_func.items()}
+
+
+def record_golden(path: str = GOLDEN_PATH) -> int:
+    """Record current outputs (and throughput as the benchmark baseline)."""
+    cases = build_corpus()
+    outputs = _run_corpus(cases)
+    payload = {
+        "cases": [{"func": name, "args": args, "expected": out} for (name, args), out in zip(cases, outputs)],
+        "baseline_per_sec": {name: round(rate) for name, rate in measure_rates(cases).items()},
+    }
+    # One case per line keeps the recording diffable
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"baseline_per_sec": ' + json.dumps(payload["baseline_per_sec"], sort_keys=True) + ',\n "cases": [\n')
+        f.write(",\n".join(json.dumps(case, ensure_ascii=False) for case in payload["cases"]))
+        f.write("\n]}\n")
+    return len(cases)
+
+
+def load_golden(path: str = GOLDEN_PATH) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check_golden(path: str = GOLDEN_PATH) -> List[Dict[str, Any]]:
+    """Re-run every recorded case; returns the mismatches (empty list = byte-identical)."""
+    golden = load_golden(path)
+    funcs = _functions()
+    mismatches = []
+    for case in golden["cases"]:
+        actual = _normalize(funcs[case["func"]](*case["args"]))
+        if actual != case["expected"]:
+            mismatches.append({**case, "actual": actual})
+    return mismatches
+
+
+def run_benchmark(path: str = GOLDEN_PATH) -> Dict[str, Dict[str, float]]:
+    """Calls/sec per extraction function over the golden corpus vs the recorded baseline."""
+    golden = load_golden(path)
+    baseline = golden.get("baseline_per_sec", {})
+    cases = [(case["func"], case["args"]) for case in golden["cases"]]
+    report = {}
+    for name, rate in measure_rates(cases).items():
+        before = baseline.get(name)
+        report[name] = {"before_per_sec": before, "after_per_sec": round(rate),
+                        "speedup": round(rate / before, 1) if before else None}
+        speedup = f"({rate / before:.1f}x)" if before else ""
+        print(f"   {name:46s} {before or 0:>10,.0f}/s -> {rate:>10,.0f}/s  {speedup}")
+    return report
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Stage 4/5 extraction pattern registry")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    golden_parser = subparsers.add_parser("golden", help="Golden-output regression over the extraction corpus")
+    mode = golden_parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--check", action="store_true", help="Fail if any output differs from the recording")
+    mode.add_argument("--record", action="store_true", help="Overwrite the recording with current outputs")
+    subparsers.add_parser("bench", help="Calls per second vs the recorded baseline")
+    subparsers.add_parser("stats", help="List registered compiled patterns")
+    args = parser.parse_args()
+
+    if args.command == "golden" and args.record:
+        count = record_golden()
+        print(f"📝 Recorded {count} golden cases to {GOLDEN_PATH}")
+    elif args.command == "golden":
+        mismatches = check_golden()
+        total = len(load_golden()["cases"])
+        if mismatches:
+            for m in mismatches[:20]:
+                print(f"❌ {m['func']}{tuple(m['args'])}\n     expected: {m['expected']!r}\n     actual:   {m['actual']!r}")
+            print(f"❌ {len(mismatches)}/{total} golden cases differ")
+            raise SystemExit(1)
+        print(f"✅ {total} golden cases byte-identical")
+    elif args.command == "bench":
+        run_benchmark()
+    elif args.command == "stats":
+        # Run as __main__, this module's REGISTRY is not the one automated_checks fills
+        from validator_models.automated_checks import stage5_matching  # noqa: F401
+        from validator_models.text_patterns import REGISTRY as registry
+        for name, pattern in sorted(registry.items()):
+            count = len(pattern) if isinstance(pattern, dict) else 1
+            print(f"   {name:40s} {count:>4} pattern(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+O(1) TTL-aware LRU cache used by the validator's in-memory caches.
+
+Replaces the list-based LRUCache (O(n) access_order.remove on every hit/insert)
+and the COMPANY_LINKEDIN_CACHE dict (O(n) oldest-timestamp scan on insert).
+
+- Constant-time get/put: recency is an OrderedDict (move_to_end / popitem)
+- Per-entry TTL with lazy expiry (checked on access, no background sweeps)
+- Eviction by entry count AND approximate byte size
+- Single-flight loading: concurrent get_or_load() calls for the same key share
+  one loader coroutine
+- Counters for hits / misses / evictions / expirations, collected for every
+  named instance by get_all_cache_stats() (served on the validator /status route)
+"""
+
+import asyncio
+import pickle
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+_MISSING = object()
+
+# Every named cache registers itself here so /status can report all of them
+_REGISTRY: "weakref.WeakValueDictionary[str, TTLCache]" = weakref.WeakValueDictionary()
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate in-memory footprint of a cached value (pickled length)."""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 1024
+
+
+class TTLCache:
+    """
+    LRU cache with per-entry TTL, entry/byte bounds and single-flight loads.
+
+    Entries are (value, expires_at, inserted_at, size). expires_at is None for
+    entries without a TTL. The dict-style API (in / [] / get) is kept so
+    existing callers continue to work unchanged.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: Optional[int] = None,
+                 default_ttl_seconds: Optional[float] = None, name: Optional[str] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl_seconds = default_ttl_seconds
+        self.name = name
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "loads": 0,
+            "coalesced_loads": 0,
+        }
+        if name:
+            _REGISTRY[name] = self
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry[3]
+
+    def _lookup(self, key):
+        """Return the live entry (refreshing recency) or None, expiring lazily."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at = entry[1]
+        if expires_at is not None and expires_at <= time.time():
+            self._remove(key)
+            self.stats["expirations"] += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _enforce_bounds(self):
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry[3]
+            self.stats["evictions"] += 1
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def set(self, key, value, ttl_seconds: Optional[float] = None, inserted_at: Optional[float] = None):
+        """
+        Insert/replace a value. ttl_seconds=None uses the cache default; inserted_at
+        backdates the entry (a copy of an older result keeps its age for is_expired).
+        """
+        if ttl_seconds is None:
+            ttl_seconds = self.default_ttl_seconds
+        now = time.time()
+        expires_at = now + ttl_seconds if ttl_seconds is not None else None
+        size = _estimate_size(value) if self.max_bytes is not None else 0
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, expires_at, now if inserted_at is None else inserted_at, size)
+        self._bytes += size
+        self._enforce_bounds()
+
+    def get(self, key, default: Any = None) -> Any:
+        entry = self._lookup(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return default
+        self.stats["hits"] += 1
+        return entry[0]
+
+    def pop(self, key, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        self._remove(key)
+        return entry[0]
+
+    def __contains__(self, key) -> bool:
+        if self._lookup(key) is None:
+            self.stats["misses"] += 1
+            return False
+        return True
+
+    def __getitem__(self, key) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def __delitem__(self, key):
+        if key not in self._entries:
+            raise KeyError(key)
+        self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def is_expired(self, key, ttl_hours: float) -> bool:
+        """
+        True if the key is missing or older than ttl_hours.
+
+        Kept for callers that apply their own TTL on top of the entry's TTL
+        (validation_cache uses CACHE_TTLS per check type).
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            return True
+        return (time.time() - entry[2]) > ttl_hours * 3600
+
+    def cleanup_expired(self, ttl_hours: Optional[float] = None) -> int:
+        """
+        Eagerly drop expired entries (and, if given, entries older than ttl_hours).
+        Not needed on the hot path - expiry is lazy - but useful before snapshots.
+        """
+        now = time.time()
+        max_age = ttl_hours * 3600 if ttl_hours is not None else None
+        stale = [
+            key for key, (_, expires_at, inserted_at, _) in self._entries.items()
+            if (expires_at is not None and expires_at <= now)
+            or (max_age is not None and now - inserted_at > max_age)
+        ]
+        for key in stale:
+            self._remove(key)
+        self.stats["expirations"] += len(stale)
+        return len(stale)
+
+    async def get_or_load(self, key, loader: Callable[[], Awaitable[Any]],
+                          ttl_seconds: Optional[float] = None, cache_none: bool = False) -> Any:
+        """
+        Return the cached value or run loader() exactly once per key.
+
+        Concurrent callers for the same key (on the same event loop) await the
+        first caller's load instead of starting their own. If the loader raises,
+        every waiter sees the exception and nothing is cached. If the caller
+        running the load is cancelled, waiters that were not cancelled
+        themselves retry the load. None results are not cached unless
+        cache_none=True.
+        """
+        loop = asyncio.get_running_loop()
+        inflight_key = (id(loop), key)
+        while True:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            future = self._inflight.get(inflight_key)
+            if future is None or future.done():
+                break
+            self.stats["coalesced_loads"] += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The caller that owned the load was cancelled - take it over
+
+        future = loop.create_future()
+        self._inflight[inflight_key] = future
+        self.stats["loads"] += 1
+        try:
+            value = await loader()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # Waiters re-raise it; silence "never retrieved"
+            raise
+        else:
+            if value is not None or cache_none:
+                self.set(key, value, ttl_seconds)
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(inflight_key) is future:
+                del self._inflight[inflight_key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+
+def get_all_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every named TTLCache in this process."""
+    return {name: cache.get_stats() for name, cache in list(_REGISTRY.items())}